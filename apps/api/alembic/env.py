@@ -49,6 +49,24 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+# PostgreSQL-only commit search and hash lookup objects managed by migrations, not mapped
+# on the models
+POSTGRES_ONLY_OBJECTS = {
+    "search_vector",
+    "ix_commits_search_vector",
+    "ix_commits_message_trgm",
+    "ix_commits_author_name_trgm",
+    "ix_commits_author_email_trgm",
+    "ix_commits_repository_hash_prefix",
+    "ix_commits_commit_hash_prefix",
+}
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """Keep autogenerate from dropping objects that exist only in the database."""
+    return not (reflected and compare_to is None and name in POSTGRES_ONLY_OBJECTS)
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -64,6 +82,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -74,7 +93,9 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection, target_metadata=target_metadata, include_object=include_object
+    )
 
     with context.begin_transaction():
         context.run_migrations()
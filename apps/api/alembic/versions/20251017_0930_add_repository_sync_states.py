@@ -0,0 +1,44 @@
+"""add_repository_sync_states
+
+Revision ID: 528242135963
+Revises: c598eca0cf8f
+Create Date: 2025-10-17 09:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '528242135963'
+down_revision: Union[str, None] = 'c598eca0cf8f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table(
+        'repository_sync_states',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('repository_id', sa.Integer(), nullable=False),
+        sa.Column('branch', sa.String(length=255), nullable=False),
+        sa.Column('tip_hash', sa.String(length=64), nullable=False),
+        sa.Column('synced_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['repository_id'], ['repositories.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('repository_id', 'branch', name='_repository_sync_branch_uc'),
+    )
+    op.create_index(op.f('ix_repository_sync_states_id'), 'repository_sync_states', ['id'], unique=False)
+    op.create_index(op.f('ix_repository_sync_states_repository_id'), 'repository_sync_states', ['repository_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index(op.f('ix_repository_sync_states_repository_id'), table_name='repository_sync_states')
+    op.drop_index(op.f('ix_repository_sync_states_id'), table_name='repository_sync_states')
+    op.drop_table('repository_sync_states')
@@ -0,0 +1,33 @@
+"""add_commit_keyset_index
+
+Revision ID: 3f1a9c2d7e44
+Revises: 67ed0fcd17ab
+Create Date: 2025-10-17 11:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1a9c2d7e44'
+down_revision: Union[str, None] = '67ed0fcd17ab'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        'ix_commits_repository_committed_at_id',
+        'commits',
+        ['repository_id', sa.text('committed_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_commits_repository_committed_at_id', table_name='commits')
@@ -0,0 +1,67 @@
+"""add_commit_search_indexes
+
+Revision ID: c4d7a1e9b352
+Revises: 8b2e6d4f1c90
+Create Date: 2025-10-17 12:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d7a1e9b352'
+down_revision: Union[str, None] = '8b2e6d4f1c90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Full-text and trigram search are PostgreSQL features; other databases keep ILIKE
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        """
+        ALTER TABLE commits ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(message, '')), 'A')
+            || setweight(
+                to_tsvector('english', coalesce(author_name, '') || ' ' || coalesce(author_email, '')),
+                'B'
+            )
+        ) STORED
+        """
+    )
+    op.create_index(
+        'ix_commits_search_vector', 'commits', ['search_vector'], postgresql_using='gin'
+    )
+    for column in ('message', 'author_name', 'author_email'):
+        op.create_index(
+            f'ix_commits_{column}_trgm',
+            'commits',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+    op.create_index(
+        'ix_commits_repository_hash_prefix',
+        'commits',
+        ['repository_id', sa.text('commit_hash text_pattern_ops')],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_commits_repository_hash_prefix', table_name='commits')
+    for column in ('message', 'author_name', 'author_email'):
+        op.drop_index(f'ix_commits_{column}_trgm', table_name='commits')
+    op.drop_index('ix_commits_search_vector', table_name='commits')
+    op.drop_column('commits', 'search_vector')
@@ -0,0 +1,33 @@
+"""add_commit_review_latest_index
+
+Revision ID: 5e9b3c7a2d18
+Revises: c4d7a1e9b352
+Create Date: 2025-10-17 12:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e9b3c7a2d18'
+down_revision: Union[str, None] = 'c4d7a1e9b352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        'ix_commit_reviews_commit_created_at_id',
+        'commit_reviews',
+        ['commit_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_commit_reviews_commit_created_at_id', table_name='commit_reviews')
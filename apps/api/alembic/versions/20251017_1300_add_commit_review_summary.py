@@ -0,0 +1,79 @@
+"""add_commit_review_summary
+
+Revision ID: 9d4f2a6b8e31
+Revises: 5e9b3c7a2d18
+Create Date: 2025-10-17 13:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4f2a6b8e31'
+down_revision: Union[str, None] = '5e9b3c7a2d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table(
+        'commit_review_summary',
+        sa.Column('commit_id', sa.Integer(), nullable=False),
+        sa.Column('repository_id', sa.Integer(), nullable=False),
+        sa.Column('committed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('latest_status', sa.String(length=50), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False),
+        sa.Column('last_reviewed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('is_pending', sa.Boolean(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['commit_id'], ['commits.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('commit_id'),
+    )
+    op.create_index(
+        'ix_commit_review_summary_repository_status',
+        'commit_review_summary',
+        ['repository_id', 'latest_status', sa.text('committed_at DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_commit_review_summary_repository_pending',
+        'commit_review_summary',
+        ['repository_id', 'is_pending', sa.text('committed_at DESC')],
+        unique=False,
+    )
+
+    # Backfill from existing reviews (`haven-cli reviews rebuild-summary` does the same)
+    op.execute(
+        """
+        INSERT INTO commit_review_summary (
+            commit_id, repository_id, committed_at, latest_status,
+            review_count, last_reviewed_at, is_pending
+        )
+        SELECT c.id, c.repository_id, c.committed_at, latest.status,
+               agg.review_count, agg.last_reviewed_at,
+               latest.status IN ('pending_review', 'pending')
+        FROM commits c
+        JOIN (
+            SELECT commit_id, count(*) AS review_count, max(reviewed_at) AS last_reviewed_at
+            FROM commit_reviews
+            GROUP BY commit_id
+        ) agg ON agg.commit_id = c.id
+        JOIN commit_reviews latest ON latest.id = (
+            SELECT r.id FROM commit_reviews r
+            WHERE r.commit_id = c.id
+            ORDER BY r.created_at DESC, r.id DESC
+            LIMIT 1
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_commit_review_summary_repository_pending', table_name='commit_review_summary')
+    op.drop_index('ix_commit_review_summary_repository_status', table_name='commit_review_summary')
+    op.drop_table('commit_review_summary')
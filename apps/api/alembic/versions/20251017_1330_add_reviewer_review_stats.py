@@ -0,0 +1,68 @@
+"""add_reviewer_review_stats
+
+Revision ID: 2b7e5c9f4a60
+Revises: 9d4f2a6b8e31
+Create Date: 2025-10-17 13:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b7e5c9f4a60'
+down_revision: Union[str, None] = '9d4f2a6b8e31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table(
+        'reviewer_review_stats',
+        sa.Column('reviewer_id', sa.Integer(), nullable=False),
+        sa.Column('draft_count', sa.Integer(), nullable=False),
+        sa.Column('pending_count', sa.Integer(), nullable=False),
+        sa.Column('approved_count', sa.Integer(), nullable=False),
+        sa.Column('needs_revision_count', sa.Integer(), nullable=False),
+        sa.Column('avg_review_seconds', sa.Float(), nullable=True),
+        sa.Column('p50_review_seconds', sa.Float(), nullable=True),
+        sa.Column('p90_review_seconds', sa.Float(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['reviewer_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('reviewer_id'),
+    )
+
+    # Backfill on PostgreSQL; elsewhere run `haven-cli reviews rebuild-summary`
+    if op.get_context().dialect.name == 'postgresql':
+        op.execute(
+            """
+            INSERT INTO reviewer_review_stats (
+                reviewer_id, draft_count, pending_count, approved_count, needs_revision_count,
+                avg_review_seconds, p50_review_seconds, p90_review_seconds
+            )
+            SELECT reviewer_id,
+                   count(*) FILTER (WHERE status = 'draft'),
+                   count(*) FILTER (WHERE status = 'pending'),
+                   count(*) FILTER (WHERE status = 'approved'),
+                   count(*) FILTER (WHERE status = 'needs_revision'),
+                   avg(seconds) FILTER (WHERE completed),
+                   percentile_cont(0.5) WITHIN GROUP (ORDER BY seconds) FILTER (WHERE completed),
+                   percentile_cont(0.9) WITHIN GROUP (ORDER BY seconds) FILTER (WHERE completed)
+            FROM (
+                SELECT reviewer_id, status,
+                       extract(epoch FROM reviewed_at - created_at) AS seconds,
+                       status IN ('approved', 'needs_revision') AND reviewed_at IS NOT NULL
+                           AS completed
+                FROM commit_reviews
+            ) reviews
+            GROUP BY reviewer_id
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_table('reviewer_review_stats')
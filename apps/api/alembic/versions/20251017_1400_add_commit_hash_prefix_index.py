@@ -0,0 +1,40 @@
+"""add_commit_hash_prefix_index
+
+Revision ID: 7c1e4b9d2a53
+Revises: 2b7e5c9f4a60
+Create Date: 2025-10-17 14:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4b9d2a53'
+down_revision: Union[str, None] = '2b7e5c9f4a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Serves abbreviated hash lookups across all repositories (LIKE 'abc%' needs
+    # pattern ops under non-C collations); other databases keep ix_commits_commit_hash
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.create_index(
+        'ix_commits_commit_hash_prefix',
+        'commits',
+        [sa.text('commit_hash text_pattern_ops')],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_commits_commit_hash_prefix', table_name='commits')
@@ -0,0 +1,78 @@
+"""add_reviewer_stats_running_totals
+
+Revision ID: 4f8a2d6c1e95
+Revises: 7c1e4b9d2a53
+Create Date: 2025-10-17 15:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f8a2d6c1e95'
+down_revision: Union[str, None] = '7c1e4b9d2a53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Review writes now move these counters instead of re-aggregating the reviewer;
+    # percentiles cannot be moved that way and are computed at read time
+    op.add_column(
+        'reviewer_review_stats',
+        sa.Column('review_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column(
+        'reviewer_review_stats',
+        sa.Column('completed_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column(
+        'reviewer_review_stats',
+        sa.Column('total_review_seconds', sa.Float(), server_default='0', nullable=False),
+    )
+    op.drop_column('reviewer_review_stats', 'p50_review_seconds')
+    op.drop_column('reviewer_review_stats', 'p90_review_seconds')
+
+    # Backfill on PostgreSQL; elsewhere run `haven-cli reviews rebuild-summary`
+    if op.get_context().dialect.name == 'postgresql':
+        op.execute(
+            """
+            UPDATE reviewer_review_stats AS stats
+            SET review_count = reviews.review_count,
+                completed_count = reviews.completed_count,
+                total_review_seconds = reviews.total_review_seconds
+            FROM (
+                SELECT reviewer_id,
+                       count(*) AS review_count,
+                       count(*) FILTER (WHERE completed) AS completed_count,
+                       coalesce(sum(seconds) FILTER (WHERE completed), 0)
+                           AS total_review_seconds
+                FROM (
+                    SELECT reviewer_id,
+                           extract(epoch FROM reviewed_at - created_at) AS seconds,
+                           status IN ('approved', 'needs_revision') AND reviewed_at IS NOT NULL
+                               AS completed
+                    FROM commit_reviews
+                ) completed_reviews
+                GROUP BY reviewer_id
+            ) reviews
+            WHERE stats.reviewer_id = reviews.reviewer_id
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.add_column(
+        'reviewer_review_stats', sa.Column('p90_review_seconds', sa.Float(), nullable=True)
+    )
+    op.add_column(
+        'reviewer_review_stats', sa.Column('p50_review_seconds', sa.Float(), nullable=True)
+    )
+    op.drop_column('reviewer_review_stats', 'total_review_seconds')
+    op.drop_column('reviewer_review_stats', 'completed_count')
+    op.drop_column('reviewer_review_stats', 'review_count')
@@ -1,35 +1,142 @@
-"""Service for generating JSON diffs using diff2html."""
+"""Service for generating JSON diffs in the diff2html format."""
 
 import asyncio
 import json
-import os
-import tempfile
-from datetime import datetime
+import shutil
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from haven.domain.entities.commit import Commit
+from haven.domain.entities.repository import Repository
 from haven.domain.repositories.commit_repository import CommitRepository
+from haven.infrastructure.git.diff_parser import (
+    DiffParseError,
+    iter_diff_files,
+    split_diff_lines,
+)
 from haven.infrastructure.git.git_client import GitClient
+from haven.infrastructure.storage.artifact_store import ArtifactStore
+from haven.infrastructure.storage.compression import Codec, default_codec
+from haven.infrastructure.storage.diff_artifacts import encode_diff_artifact
+
+DIFF2HTML_BIN = "diff2html"
+
+# Bump when the artifact layout or parser output changes to invalidate cached diffs
+NATIVE_RENDERER = "native/1"
+DIFF2HTML_RENDERER = "diff2html/1"
+
+
+def _display_path(path: Path) -> str:
+    """Path relative to the working directory when possible, as stored on commits."""
+    try:
+        return str(path.resolve().relative_to(Path.cwd()))
+    except ValueError:
+        return str(path.resolve())
+
+
+@dataclass(frozen=True)
+class DiffBatch:
+    """Commits of one repository whose diffs are rendered together."""
+
+    repository_id: int
+    repo_path: str
+    commits: list[Commit]
+
+
+@dataclass(frozen=True)
+class DiffBatchPlan:
+    """Commits grouped per repository for batch diff generation."""
+
+    batches: list[DiffBatch]
+    # Commits whose repository no longer exists
+    unresolved: list[Commit] = field(default_factory=list)
+
+
+def plan_diff_batches(
+    commits: Iterable[Commit], repositories: Iterable[Repository]
+) -> DiffBatchPlan:
+    """
+    Group commits by repository, resolving each repository path once.
+
+    Args:
+        commits: Commits to render, possibly from several repositories
+        repositories: The repositories the commits belong to
+
+    Returns:
+        One batch per repository in order of first appearance, plus the
+        commits whose repository is not among ``repositories``
+    """
+    paths = {repository.id: repository.url for repository in repositories}
+    grouped: dict[int, list[Commit]] = defaultdict(list)
+    unresolved = []
+    for commit in commits:
+        if commit.repository_id in paths:
+            grouped[commit.repository_id].append(commit)
+        else:
+            unresolved.append(commit)
+
+    return DiffBatchPlan(
+        batches=[
+            DiffBatch(repository_id=repository_id, repo_path=paths[repository_id], commits=group)
+            for repository_id, group in grouped.items()
+        ],
+        unresolved=unresolved,
+    )
 
 
 class DiffHtmlService:
-    """Service for generating diff data for commits using diff2html."""
+    """Service for generating diff data for commits in the diff2html JSON format."""
 
     def __init__(
         self,
         git_client: GitClient,
         commit_repository: CommitRepository,
         output_dir: str = "/app/diff-output",
+        use_diff2html: bool = False,
+        artifact_store: ArtifactStore | None = None,
+        codec: Codec | None = None,
     ):
-        """Initialize the diff service."""
+        """
+        Initialize the diff service.
+
+        Diffs are parsed in-process; set ``use_diff2html`` to shell out to
+        diff2html-cli instead. It is also used as a fallback for diffs the
+        native parser rejects, when installed. Artifacts are compressed with
+        ``codec`` (zstd when available, gzip otherwise).
+        """
         self.git_client = git_client
         self.commit_repository = commit_repository
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.use_diff2html = use_diff2html
+        self.codec = codec or default_codec()
+        self.artifact_store = artifact_store or ArtifactStore(
+            self.output_dir, suffix=".json" + self.codec.suffix
+        )
+
+    def _artifact_key(self, commit: Commit, repo_path: str) -> str:
+        """Content address of the rendered diff for a commit."""
+        renderer = DIFF2HTML_RENDERER if self.use_diff2html else NATIVE_RENDERER
+        # Without a local clone the git client serves mock diffs; never let those
+        # occupy the address of the real rendering.
+        options = {} if Path(repo_path).exists() else {"mock": True}
+        return self.artifact_store.key_for(commit.commit_hash, renderer, options)
+
+    def get_cached_diff(self, commit: Commit, repo_path: str = "/repo") -> str | None:
+        """
+        Return the path of an already rendered diff without doing any git work.
+
+        Returns:
+            Path to the JSON file, or None if it has not been generated
+        """
+        path = self.artifact_store.lookup(self._artifact_key(commit, repo_path))
+        return _display_path(path) if path else None
 
     async def generate_diff_html(self, commit: Commit, repo_path: str = "/repo") -> str:
         """
-        Generate JSON diff data for a commit using diff2html-cli.
+        Generate JSON diff data for a commit, reusing a cached artifact if present.
 
         Args:
             commit: The commit to generate diff for
@@ -38,106 +145,76 @@ class DiffHtmlService:
         Returns:
             Path to the generated JSON file
         """
-        # Create output directory for this repository
-        repo_dir = self.output_dir / f"repo_{commit.repository_id}"
-        repo_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate filename based on commit hash
-        json_filename = f"{commit.commit_hash}.json"
-        json_path = repo_dir / json_filename
+        key = self._artifact_key(commit, repo_path)
+        path = self.artifact_store.lookup(key)
+        if path is not None:
+            return _display_path(path)
 
         # Get the git diff for this commit
         diff_content = await self._get_commit_diff(commit, repo_path)
 
         if not diff_content:
             # No diff content (might be initial commit)
-            empty_diff_data = {
-                "commit": {
-                    "hash": commit.commit_hash,
-                    "short_hash": commit.short_hash,
-                    "summary": commit.summary,
-                    "message": commit.message,
-                    "author_name": commit.author_name,
-                    "author_email": commit.author_email,
-                    "committed_at": commit.committed_at.isoformat()
-                },
-                "files": []
-            }
-            json_path.write_text(json.dumps(empty_diff_data, indent=2))
+            files = []
+        elif self.use_diff2html:
+            files = json.loads(await self._run_diff2html_json(diff_content))
         else:
-            # Use diff2html-cli to generate JSON
-            await self._run_diff2html_json(diff_content, json_path, commit)
+            try:
+                files = list(iter_diff_files(split_diff_lines(diff_content)))
+            except DiffParseError as e:
+                if shutil.which(DIFF2HTML_BIN) is None:
+                    raise
+                print(f"Falling back to diff2html for commit {commit.commit_hash}: {e}")
+                files = json.loads(await self._run_diff2html_json(diff_content))
+
+        data, index = encode_diff_artifact(self._commit_metadata(commit), files, self.codec)
+        path = self.artifact_store.write(key, data, index)
 
         # Note: Commit update is handled by the caller to ensure proper transaction management
 
-        # Return relative path from project root
-        relative_path = json_path.relative_to(Path.cwd())
-        return str(relative_path)
+        return _display_path(path)
+
+    @staticmethod
+    def _commit_metadata(commit: Commit) -> dict:
+        """Commit fields embedded alongside the parsed diff."""
+        return {
+            "hash": commit.commit_hash,
+            "short_hash": commit.short_hash,
+            "summary": commit.summary,
+            "message": commit.message,
+            "author_name": commit.author_name,
+            "author_email": commit.author_email,
+            "committed_at": commit.committed_at.isoformat(),
+        }
 
     async def _get_commit_diff(self, commit: Commit, repo_path: str) -> str:
         """Get the diff content for a commit."""
-        try:
-            # Get diff between commit and its parent
-            return await self.git_client.get_commit_diff(repo_path, commit.commit_hash)
-        except Exception as e:
-            print(f"Error getting diff for commit {commit.commit_hash}: {e}")
-            return ""
-
-    async def _run_diff2html_json(self, diff_content: str, output_path: Path, commit: Commit) -> None:
-        """Run diff2html-cli to generate JSON from diff content."""
-        # Create temporary file with diff content
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".diff", delete=False) as tmp:
-            tmp.write(diff_content)
-            tmp_path = tmp.name
-
-        try:
-            # Run diff2html-cli command to generate JSON
-            cmd = [
-                "/usr/local/bin/diff2html",
-                "--input",
-                "file",
-                "--format",
-                "json",
-                "--output",
-                "stdout",
-                "--",
-                tmp_path,
-            ]
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+        # Failures must not be rendered into the content-addressed store
+        return await self.git_client.get_commit_diff(
+            repo_path, commit.commit_hash, mock_on_error=False
+        )
+
+    async def _run_diff2html_json(self, diff_content: str) -> bytes:
+        """Run diff2html-cli on the diff content and return its JSON output."""
+        process = await asyncio.create_subprocess_exec(
+            DIFF2HTML_BIN,
+            "--input",
+            "stdin",
+            "--format",
+            "json",
+            "--output",
+            "stdout",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
 
-            stdout, stderr = await process.communicate()
-
-            if process.returncode != 0:
-                raise Exception(f"diff2html-cli failed: {stderr.decode()}")
-
-            # Parse the JSON output
-            diff_data = json.loads(stdout.decode())
-            
-            # Enhance with commit metadata
-            enhanced_data = {
-                "commit": {
-                    "hash": commit.commit_hash,
-                    "short_hash": commit.short_hash,
-                    "summary": commit.summary,
-                    "message": commit.message,
-                    "author_name": commit.author_name,
-                    "author_email": commit.author_email,
-                    "committed_at": commit.committed_at.isoformat()
-                },
-                "files": diff_data
-            }
-            
-            # Write enhanced JSON to file
-            output_path.write_text(json.dumps(enhanced_data, indent=2))
-
-        finally:
-            # Clean up temporary file
-            os.unlink(tmp_path)
+        stdout, stderr = await process.communicate(diff_content.encode())
+
+        if process.returncode != 0:
+            raise Exception(f"diff2html-cli failed: {stderr.decode()}")
+
+        return stdout.strip()
 
     def _generate_empty_diff_html(self, commit: Commit) -> str:
         """Generate HTML for commits with no diff (e.g., initial commit)."""
@@ -231,3 +308,23 @@ class DiffHtmlService:
                 results[commit_id] = html_path
 
         return results
+
+    async def process_batch_plan(
+        self, plan: DiffBatchPlan, max_concurrent_per_repo: int = 5
+    ) -> dict[int, str]:
+        """
+        Generate diffs for every batch of a plan, repositories in parallel.
+
+        Each repository gets its own concurrency limit, so one large
+        repository cannot starve the others of git processes.
+
+        Returns:
+            Dictionary mapping commit IDs to diff file paths
+        """
+        completed = await asyncio.gather(
+            *(
+                self.process_commits_batch(batch.commits, batch.repo_path, max_concurrent_per_repo)
+                for batch in plan.batches
+            )
+        )
+        return {commit_id: path for results in completed for commit_id, path in results.items()}
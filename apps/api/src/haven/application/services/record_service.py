@@ -1,5 +1,6 @@
 """Application service for Record operations."""
 
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
@@ -71,6 +72,22 @@ class RecordService:
             total = await self._uow.records.count()
             return records, total
 
+    async def list_records_after(
+        self, limit: int = 100, after: tuple[datetime, UUID] | None = None
+    ) -> list[Record]:
+        """
+        List records newest first by keyset position, without counting them.
+
+        Args:
+            limit: Maximum number of records to return
+            after: ``(created_at, id)`` of the last record already seen
+
+        Returns:
+            List of Record entities
+        """
+        async with self._uow:
+            return await self._uow.records.get_after(limit=limit, after=after)
+
     async def update_record(self, record_id: UUID, data: dict[str, Any]) -> Record:
         """
         Update a record's data.
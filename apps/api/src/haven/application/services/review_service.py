@@ -1,7 +1,7 @@
 """Service layer for review management and workflows."""
 
 from haven.domain.entities.review_comment import CommitReview, ReviewComment
-from haven.domain.repositories.commit_repository import CommitRepository
+from haven.domain.repositories.commit_repository import BulkReviewOutcome, CommitRepository
 from haven.domain.repositories.review_repository import (
     CommitReviewRepository,
     ReviewCommentRepository,
@@ -184,8 +184,15 @@ class ReviewService:
     async def get_review_statistics(self, reviewer_id: int | None = None) -> dict:
         """Get review statistics."""
         stats = await self.commit_review_repo.get_review_stats(reviewer_id)
+        return self._add_rates(stats)
 
-        # Add computed metrics
+    async def get_reviewer_dashboard(self, from_rollup: bool = False) -> dict[int, dict]:
+        """Get review statistics for every reviewer with one query."""
+        stats = await self.commit_review_repo.get_reviewer_stats(from_rollup)
+        return {reviewer_id: self._add_rates(s) for reviewer_id, s in stats.items()}
+
+    def _add_rates(self, stats: dict) -> dict:
+        """Add completion and approval rates to review statistics."""
         total = stats["total_reviews"]
         if total > 0:
             stats["completion_rate"] = (
@@ -222,21 +229,22 @@ class ReviewService:
 
     async def bulk_approve_commits(
         self, commit_ids: list[int], reviewer_id: int
-    ) -> list[CommitReview]:
-        """Approve multiple commits in bulk."""
-        results = []
-        errors = []
-
-        for commit_id in commit_ids:
-            try:
-                review = await self.approve_commit(commit_id, reviewer_id)
-                results.append(review)
-            except Exception as e:
-                errors.append({"commit_id": commit_id, "error": str(e)})
-
-        if errors:
-            # Log errors but return successful results
-            # In a real application, you might want to use proper logging
-            print(f"Bulk approval errors: {errors}")
-
-        return results
+    ) -> dict[int, BulkReviewOutcome]:
+        """
+        Approve a reviewer's reviews on many commits in one set-based update.
+
+        Returns:
+            Outcome per requested commit; commits the reviewer has no review
+            on are reported as ``NO_REVIEW`` rather than failing the batch
+        """
+        return await self.commit_review_repo.bulk_update_status(
+            commit_ids, reviewer_id, CommitReview.ReviewStatus.APPROVED
+        )
+
+    async def bulk_request_changes(
+        self, commit_ids: list[int], reviewer_id: int
+    ) -> dict[int, BulkReviewOutcome]:
+        """Request changes on a reviewer's reviews of many commits in one set-based update."""
+        return await self.commit_review_repo.bulk_update_status(
+            commit_ids, reviewer_id, CommitReview.ReviewStatus.NEEDS_REVISION
+        )
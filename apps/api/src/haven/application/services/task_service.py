@@ -148,6 +148,31 @@ class TaskService:
         """Get overdue tasks."""
         return await self.task_repository.get_overdue_tasks(limit=limit, offset=offset)
 
+    async def list_tasks_after(
+        self,
+        limit: int = 100,
+        after: tuple[datetime, int] | None = None,
+        status: str | None = None,
+        assignee_id: int | None = None,
+        repository_id: int | None = None,
+        query: str | None = None,
+    ) -> list[Task]:
+        """List filtered tasks newest first, continuing after a ``(created_at, id)`` position."""
+        return await self.task_repository.get_after(
+            limit=limit,
+            after=after,
+            status=status,
+            assignee_id=assignee_id,
+            repository_id=repository_id,
+            query=query,
+        )
+
+    async def get_overdue_tasks_after(
+        self, limit: int = 100, after: tuple[datetime, int] | None = None
+    ) -> list[Task]:
+        """Get overdue tasks by due date, continuing after a ``(due_date, id)`` position."""
+        return await self.task_repository.get_overdue_after(limit=limit, after=after)
+
     async def get_task_metrics(self, repository_id: int | None = None) -> dict:
         """Get task metrics and statistics."""
         return await self.task_repository.get_task_metrics(repository_id=repository_id)
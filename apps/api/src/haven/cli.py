@@ -11,6 +11,9 @@ import click
 from rich.console import Console
 from rich.table import Table
 
+from haven.infrastructure.git.commit_log import iter_commit_log
+from haven.infrastructure.storage.artifact_store import ArtifactStore, default_artifact_root
+
 console = Console()
 
 
@@ -56,52 +59,25 @@ async def get_git_commits(
 ) -> list[GitCommit]:
     """Get list of commits from git repository."""
     # Check if we're in a git repository
-    stdout, stderr, returncode = await run_command(["git", "rev-parse", "--git-dir"], cwd=repo_path)
+    _, _, returncode = await run_command(["git", "rev-parse", "--git-dir"], cwd=repo_path)
     if returncode != 0:
         raise RuntimeError(f"Not a git repository: {repo_path}")
 
-    # Get commits from the specified branch (or current branch if base_branch is HEAD)
-    if base_branch == "HEAD":
-        # Use current branch
-        stdout, stderr, returncode = await run_command(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_path
-        )
-        if returncode != 0:
-            raise RuntimeError(f"Failed to get current branch: {stderr}")
-        target_branch = stdout.strip()
-    else:
-        target_branch = base_branch
-
-    # Get recent commits on the target branch in reverse chronological order (oldest first)
-    cmd = [
-        "git",
-        "log",
-        "--reverse",
-        f"--max-count={max_commits}",
-        "--pretty=format:%H|%s|%an|%ad",
-        "--date=short",
-        target_branch,
-    ]
-
-    stdout, stderr, returncode = await run_command(cmd, cwd=repo_path)
-    if returncode != 0:
-        raise RuntimeError(f"Failed to get commits: {stderr}")
-
-    commits: list[GitCommit] = []
-    for line in stdout.strip().split("\n"):
-        if line:
-            parts = line.split("|", 3)
-            if len(parts) == 4:
-                commits.append(
-                    GitCommit(
-                        hash=parts[0],
-                        message=parts[1],
-                        author=parts[2],
-                        date=parts[3],
-                    )
-                )
-
-    return commits
+    # Recent commits on the target branch, oldest first, read in a single git log pass
+    try:
+        return [
+            GitCommit(
+                hash=commit.hash,
+                message=commit.subject,
+                author=commit.author_name,
+                date=commit.date,
+            )
+            async for commit in iter_commit_log(
+                str(repo_path), base_branch, max_count=max_commits, reverse=True
+            )
+        ]
+    except RuntimeError as e:
+        raise RuntimeError(f"Failed to get commits: {e}") from e
 
 
 async def generate_diff_for_commit(
@@ -551,6 +527,95 @@ def list_commits(repo_path: Path, base_branch: str):
         sys.exit(1)
 
 
+def _parse_size(value: str) -> int:
+    """Parse a size such as ``512M`` or ``2G`` into bytes."""
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+    value = value.strip().upper().removesuffix("B")
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+@cli.group()
+def cache():
+    """Manage the diff artifact cache."""
+    pass
+
+
+@cache.command("gc")
+@click.option(
+    "--cache-dir",
+    "-d",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Diff artifact directory (default: /app/diff-output or ./diff-output)",
+)
+@click.option(
+    "--max-size",
+    "-s",
+    default="1G",
+    help="Evict least recently used artifacts until the cache fits (default: 1G)",
+)
+def cache_gc(cache_dir: Path | None, max_size: str):
+    """Evict least recently used diff artifacts."""
+    try:
+        store = ArtifactStore(cache_dir or default_artifact_root())
+        result = store.gc(_parse_size(max_size))
+
+        console.print(
+            f"[green]✅ Removed {result.removed} artifacts "
+            f"({result.freed_bytes / 1024**2:.1f} MiB)[/green]"
+        )
+        console.print(
+            f"[dim]Remaining: {result.remaining} artifacts "
+            f"({result.remaining_bytes / 1024**2:.1f} MiB) in {store.root}[/dim]"
+        )
+
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+        sys.exit(1)
+
+
+@cli.group()
+def reviews():
+    """Manage commit review data."""
+    pass
+
+
+@reviews.command("rebuild-summary")
+@click.option(
+    "--repository-id",
+    "-r",
+    type=int,
+    default=None,
+    help="Only rebuild commit summaries for this repository (default: all)",
+)
+def reviews_rebuild_summary(repository_id: int | None):
+    """Recompute commit review summaries and reviewer statistics from commit reviews."""
+    try:
+        commits, reviewers = asyncio.run(_rebuild_review_summaries_async(repository_id))
+        console.print(f"[green]✅ Rebuilt review summaries for {commits} commits[/green]")
+        if reviewers is not None:
+            console.print(f"[green]✅ Rebuilt review statistics for {reviewers} reviewers[/green]")
+
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+        sys.exit(1)
+
+
+async def _rebuild_review_summaries_async(repository_id: int | None) -> tuple[int, int | None]:
+    """Rebuild review projections in one transaction."""
+    from haven.infrastructure.database.review_stats import rebuild_reviewer_stats
+    from haven.infrastructure.database.review_summary import rebuild_review_summaries
+    from haven.infrastructure.database.session import get_db_session
+
+    async with get_db_session() as session:
+        commits = await rebuild_review_summaries(session, repository_id)
+        # Reviewer statistics span repositories, so only a full rebuild recomputes them
+        reviewers = await rebuild_reviewer_stats(session) if repository_id is None else None
+        return commits, reviewers
+
+
 def main():
     """Main entry point for the CLI."""
     cli()
@@ -1,7 +1,7 @@
 """Application settings using Pydantic and Hydra."""
 
 from functools import lru_cache
-from typing import Any
+from typing import Any, Literal
 
 from hydra import compose, initialize_config_dir
 from hydra.core.global_hydra import GlobalHydra
@@ -28,6 +28,9 @@ class DatabaseSettings(BaseModel):
     password: str
     dsn: str
 
+    # Read replica used for read-only sessions (the primary when unset)
+    replica_dsn: str | None = None
+
     class PoolSettings(BaseModel):
         """Connection pool settings."""
 
@@ -35,8 +38,14 @@ class DatabaseSettings(BaseModel):
         max_overflow: int = 10
         timeout: int = 30
         recycle: int = 3600
+        # Test connections on checkout so restarts and idle timeouts don't surface as errors
+        pre_ping: bool = True
+        # Connections opened in the background at startup
+        warmup: int = 0
 
     pool: PoolSettings = Field(default_factory=PoolSettings)
+    # Per-purpose pool settings ("api", "worker", "replica"); others use ``pool``
+    pools: dict[str, PoolSettings] = Field(default_factory=dict)
 
 
 class LoggingSettings(BaseModel):
@@ -84,6 +93,33 @@ class CorsSettings(BaseModel):
     allow_headers: list[str] = ["*"]
 
 
+class WorkerSettings(BaseModel):
+    """Background job worker configuration."""
+
+    processes: int = 2
+    concurrency: int = 4
+    poll_interval: float = 1.0
+    lease_seconds: float = 60.0
+    heartbeat_interval: float = 15.0
+    retry_backoff: float = 5.0
+
+
+class GraphQLSettings(BaseModel):
+    """GraphQL endpoint configuration."""
+
+    # "automatic": clients register documents by sha256 hash on first use;
+    # "allow_list": only the documents in allow_list_path run; "off": no persisted queries
+    persisted_queries: Literal["off", "automatic", "allow_list"] = "automatic"
+    # Automatically persisted documents kept, least recently used evicted first
+    persisted_query_cache_size: int = 1000
+    # JSON object mapping sha256 hashes to documents
+    allow_list_path: str | None = None
+    # Operations whose estimated cost exceeds this are rejected (see interface/graphql/cost.py)
+    max_query_cost: int = 5000
+    # Cost points a client may spend per minute; 0 disables throttling
+    cost_budget_per_minute: int = 0
+
+
 class AppInfo(BaseModel):
     """Application information."""
 
@@ -101,6 +137,8 @@ class AppSettings(BaseSettings):
     database: DatabaseSettings
     logging: LoggingSettings
     cors: CorsSettings
+    worker: WorkerSettings = Field(default_factory=WorkerSettings)
+    graphql: GraphQLSettings = Field(default_factory=GraphQLSettings)
 
     class Config:
         """Pydantic configuration."""
@@ -152,6 +190,8 @@ def get_settings() -> AppSettings:
         "database": cfg.get("database", {}).get("database", {}),
         "logging": cfg.get("logging", {}).get("logging", {}),
         "cors": env_cfg.get("cors", {}),
+        "worker": env_cfg.get("worker", {}),
+        "graphql": env_cfg.get("graphql", {}),
     }
 
     return AppSettings(**settings_dict)
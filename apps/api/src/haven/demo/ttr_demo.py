@@ -11,11 +11,11 @@ from haven.application.services.repository_service import RepositoryService
 from haven.application.services.user_service import UserService
 from haven.domain.entities.repository import Repository
 from haven.domain.entities.user import User
+from haven.infrastructure.database.engines import engine_registry
 from haven.infrastructure.database.repositories.repository_repository import (
     RepositoryRepositoryImpl,
 )
 from haven.infrastructure.database.repositories.user_repository import UserRepositoryImpl
-from haven.infrastructure.database.session import create_engine, create_session_factory
 
 
 async def demo_ttr_system():
@@ -25,8 +25,7 @@ async def demo_ttr_system():
     print("=" * 60)
 
     # Initialize database session
-    engine = create_engine()
-    session_factory = create_session_factory(engine)
+    session_factory = engine_registry.session_factory()
 
     async with session_factory() as session:
         # Initialize repositories and services
@@ -173,7 +172,7 @@ async def demo_ttr_system():
         print("✅ Demo data cleaned up")
 
     # Clean up database connection
-    await engine.dispose()
+    await engine_registry.dispose()
 
 
 if __name__ == "__main__":
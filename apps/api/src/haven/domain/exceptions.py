@@ -19,3 +19,11 @@ class InvalidRecordDataError(DomainError):
     """Raised when record data is invalid."""
 
     pass
+
+
+class AmbiguousCommitHashError(DomainError):
+    """Raised when an abbreviated commit hash matches several commits."""
+
+    def __init__(self, prefix: str) -> None:
+        super().__init__(f"Commit hash prefix {prefix} is ambiguous")
+        self.prefix = prefix
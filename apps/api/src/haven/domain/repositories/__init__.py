@@ -4,6 +4,7 @@ from haven.domain.repositories.comment_repository import CommentRepository
 from haven.domain.repositories.commit_repository import CommitRepository, CommitReviewRepository
 from haven.domain.repositories.record_repository import RecordRepository
 from haven.domain.repositories.repository_repository import RepositoryRepository
+from haven.domain.repositories.sync_state_repository import SyncStateRepository
 from haven.domain.repositories.task_repository import TaskRepository
 from haven.domain.repositories.time_log_repository import TimeLogRepository
 from haven.domain.repositories.user_repository import UserRepository
@@ -14,6 +15,7 @@ __all__ = [
     "CommitReviewRepository",
     "RecordRepository",
     "RepositoryRepository",
+    "SyncStateRepository",
     "TaskRepository",
     "TimeLogRepository",
     "UserRepository",
@@ -1,8 +1,53 @@
 """Repository interface for Commit entities."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
 
-from haven.domain.entities.commit import Commit, CommitReview
+from haven.domain.entities.commit import Commit, CommitReview, ReviewStatus
+
+
+@dataclass(frozen=True)
+class BulkInsertResult:
+    """Outcome of a bulk commit insert."""
+
+    inserted: int
+    skipped: int
+
+
+class BulkReviewOutcome(Enum):
+    """What a bulk review operation did to one requested commit."""
+
+    UPDATED = "updated"
+    ASSIGNED = "assigned"
+    ALREADY_ASSIGNED = "already_assigned"
+    # The reviewer has no review on the commit to update
+    NO_REVIEW = "no_review"
+    COMMIT_NOT_FOUND = "commit_not_found"
+
+
+@dataclass(frozen=True)
+class CommitKey:
+    """Position of a commit in newest-first ``(committed_at, id)`` order."""
+
+    committed_at: datetime
+    id: int
+
+    @classmethod
+    def of(cls, commit: Commit) -> "CommitKey":
+        """Key of a stored commit."""
+        return cls(committed_at=commit.committed_at, id=commit.id)
+
+
+@dataclass(frozen=True)
+class CommitPage:
+    """A keyset page of commits, newest first."""
+
+    items: list[Commit]
+    # Whether more commits exist beyond this page in the direction of travel
+    has_more: bool
 
 
 class CommitRepository(ABC):
@@ -13,16 +58,38 @@ class CommitRepository(ABC):
         """Create a new commit."""
         pass
 
+    @abstractmethod
+    async def bulk_insert(
+        self, commits: Iterable[Commit], batch_size: int = 1000
+    ) -> BulkInsertResult:
+        """Insert many commits, skipping ones that already exist in their repository."""
+        pass
+
     @abstractmethod
     async def get_by_id(self, commit_id: int) -> Commit | None:
         """Get a commit by ID."""
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, commit_ids: Iterable[int]) -> list[Commit]:
+        """Get the commits with the given IDs in one query, in request order."""
+        pass
+
     @abstractmethod
     async def get_by_hash(self, repository_id: int, commit_hash: str) -> Commit | None:
         """Get a commit by repository and hash."""
         pass
 
+    @abstractmethod
+    async def resolve_hash(self, commit_hash: str) -> Commit | None:
+        """
+        Find a commit by full or abbreviated hash across all repositories.
+
+        Raises:
+            AmbiguousCommitHashError: If the prefix matches several commits
+        """
+        pass
+
     @abstractmethod
     async def get_by_repository(
         self, repository_id: int, limit: int = 100, offset: int = 0
@@ -30,6 +97,21 @@ class CommitRepository(ABC):
         """Get commits for a repository."""
         pass
 
+    @abstractmethod
+    async def get_page(
+        self,
+        repository_id: int,
+        limit: int = 20,
+        after: CommitKey | None = None,
+        before: CommitKey | None = None,
+        search_query: str | None = None,
+        author_filter: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+    ) -> CommitPage:
+        """Get the commits immediately after or before a key, optionally filtered."""
+        pass
+
     @abstractmethod
     async def update(self, commit: Commit) -> Commit:
         """Update an existing commit."""
@@ -69,6 +151,11 @@ class CommitReviewRepository(ABC):
         """Get all reviews for a commit."""
         pass
 
+    @abstractmethod
+    async def get_by_commits(self, commit_ids: Iterable[int]) -> dict[int, list[CommitReview]]:
+        """Get the reviews of many commits, newest first per commit."""
+        pass
+
     @abstractmethod
     async def get_by_reviewer(
         self, reviewer_id: int, limit: int = 100, offset: int = 0
@@ -85,3 +172,21 @@ class CommitReviewRepository(ABC):
     async def delete(self, review_id: int) -> bool:
         """Delete a commit review."""
         pass
+
+    @abstractmethod
+    async def bulk_update_status(
+        self,
+        commit_ids: Iterable[int],
+        reviewer_id: int,
+        status: ReviewStatus,
+        notes: str | None = None,
+    ) -> dict[int, BulkReviewOutcome]:
+        """Set the status of a reviewer's reviews on many commits at once."""
+        pass
+
+    @abstractmethod
+    async def bulk_assign(
+        self, commit_ids: Iterable[int], reviewer_id: int
+    ) -> dict[int, BulkReviewOutcome]:
+        """Create pending reviews for a reviewer on many commits at once."""
+        pass
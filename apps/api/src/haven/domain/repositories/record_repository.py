@@ -1,6 +1,7 @@
 """Repository interface for Record entity."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from haven.domain.entities import Record
@@ -36,6 +37,22 @@ class RecordRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_after(
+        self, limit: int = 100, after: tuple[datetime, UUID] | None = None
+    ) -> list[Record]:
+        """
+        Get records newest first, continuing after a keyset position.
+
+        Args:
+            limit: Maximum number of records to return
+            after: ``(created_at, id)`` of the last record already seen
+
+        Returns:
+            List of Record entities
+        """
+        ...
+
     @abstractmethod
     async def save(self, record: Record) -> Record:
         """
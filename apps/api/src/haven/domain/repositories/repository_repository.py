@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from haven.domain.entities.repository import Repository
 
@@ -14,6 +15,11 @@ class RepositoryRepository(ABC):
         """Get repository by ID"""
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, repo_ids: Iterable[int]) -> list[Repository]:
+        """Get the repositories with the given IDs"""
+        pass
+
     @abstractmethod
     async def get_by_name(self, name: str) -> Repository | None:
         """Get repository by name"""
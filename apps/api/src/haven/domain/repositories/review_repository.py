@@ -1,8 +1,10 @@
 """Repository interfaces for review entities."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from haven.domain.entities.review_comment import CommitReview, ReviewComment
+from haven.domain.repositories.commit_repository import BulkReviewOutcome
 
 
 class ReviewCommentRepository(ABC):
@@ -115,11 +117,23 @@ class CommitReviewRepository(ABC):
         """Delete a commit review."""
         pass
 
+    @abstractmethod
+    async def bulk_update_status(
+        self, commit_ids: Iterable[int], reviewer_id: int, status: str
+    ) -> dict[int, BulkReviewOutcome]:
+        """Set the status of a reviewer's reviews on many commits at once."""
+        pass
+
     @abstractmethod
     async def get_review_stats(self, reviewer_id: int | None = None) -> dict:
         """Get review statistics (count by status, average time, etc.)."""
         pass
 
+    @abstractmethod
+    async def get_reviewer_stats(self, from_rollup: bool = False) -> dict[int, dict]:
+        """Get review statistics for every reviewer, keyed by reviewer ID."""
+        pass
+
     @abstractmethod
     async def get_commits_needing_review(
         self, repository_id: int | None = None, limit: int | None = None
@@ -0,0 +1,22 @@
+"""Repository interface for per-branch commit sync state."""
+
+from abc import ABC, abstractmethod
+
+
+class SyncStateRepository(ABC):
+    """Stores the last ingested tip commit of each repository branch."""
+
+    @abstractmethod
+    async def get_branch_tip(self, repository_id: int, branch: str) -> str | None:
+        """Get the last ingested tip hash of a branch, or None if never synced."""
+        pass
+
+    @abstractmethod
+    async def set_branch_tip(self, repository_id: int, branch: str, tip_hash: str) -> None:
+        """Record the tip hash up to which a branch has been ingested."""
+        pass
+
+    @abstractmethod
+    async def get_branch_tips(self, repository_id: int) -> dict[str, str]:
+        """Get the last ingested tip hash of every synced branch."""
+        pass
@@ -1,6 +1,8 @@
 """Task repository interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import datetime
 
 from haven.domain.entities.task import Task
 
@@ -18,6 +20,11 @@ class TaskRepository(ABC):
         """Get a task by its ID."""
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, task_ids: Iterable[int]) -> list[Task]:
+        """Get the tasks with the given IDs."""
+        pass
+
     @abstractmethod
     async def get_all(self, limit: int = 100, offset: int = 0) -> list[Task]:
         """Get all tasks with pagination."""
@@ -62,6 +69,26 @@ class TaskRepository(ABC):
         """Get overdue tasks."""
         pass
 
+    @abstractmethod
+    async def get_after(
+        self,
+        limit: int = 100,
+        after: tuple[datetime, int] | None = None,
+        status: str | None = None,
+        assignee_id: int | None = None,
+        repository_id: int | None = None,
+        query: str | None = None,
+    ) -> list[Task]:
+        """Get filtered tasks newest first, continuing after a ``(created_at, id)`` position."""
+        pass
+
+    @abstractmethod
+    async def get_overdue_after(
+        self, limit: int = 100, after: tuple[datetime, int] | None = None
+    ) -> list[Task]:
+        """Get overdue tasks by due date, continuing after a ``(due_date, id)`` position."""
+        pass
+
     @abstractmethod
     async def get_task_metrics(self, repository_id: int | None = None) -> dict:
         """Get task metrics and statistics."""
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from haven.domain.entities.user import User
 
@@ -14,6 +15,11 @@ class UserRepository(ABC):
         """Get user by ID"""
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, user_ids: Iterable[int]) -> list[User]:
+        """Get the users with the given IDs"""
+        pass
+
     @abstractmethod
     async def get_by_username(self, username: str) -> User | None:
         """Get user by username"""
@@ -0,0 +1,118 @@
+"""
+Commit search conditions.
+
+On PostgreSQL, searches use the indexes added by the commit search migration:
+
+- ``commits.search_vector``, a stored generated ``tsvector`` over the message
+  and author, with a GIN index for ranked word/prefix matching
+- ``pg_trgm`` GIN indexes on ``message``, ``author_name`` and ``author_email``
+  so substring ``ILIKE`` no longer needs a sequential scan
+- a ``(repository_id, commit_hash text_pattern_ops)`` btree that serves hash
+  prefix lookups within a repository, and a ``commit_hash text_pattern_ops``
+  btree for lookups across all repositories
+
+Other dialects (SQLite in tests and local runs) fall back to plain ``ILIKE``.
+"""
+
+import re
+
+from sqlalchemy import ColumnElement, func, literal_column, or_
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from haven.infrastructure.database.models import CommitModel
+
+# Text search configuration used by the generated column and queries
+TEXT_SEARCH_CONFIG = "english"
+# Shortest hex string treated as a commit hash prefix
+MIN_HASH_PREFIX = 4
+# Lengths of full SHA-1 and SHA-256 object names
+FULL_HASH_LENGTHS = (40, 64)
+
+_HEX_RE = re.compile(r"[0-9a-fA-F]+")
+_WORD_RE = re.compile(r"\w+")
+
+# Generated column that only exists on PostgreSQL, so it is not mapped on CommitModel
+search_vector = literal_column(f"{CommitModel.__tablename__}.search_vector", TSVECTOR)
+# Inline SQL rather than a bound REGCONFIG, so statements still render with literal_binds
+# (the row counter EXPLAINs them)
+_config = literal_column(f"'{TEXT_SEARCH_CONFIG}'")
+
+
+def is_hash_prefix(query: str) -> bool:
+    """Whether ``query`` looks like an abbreviated commit hash."""
+    return len(query) >= MIN_HASH_PREFIX and _HEX_RE.fullmatch(query) is not None
+
+
+def prefix_tsquery(query: str) -> str | None:
+    """
+    Build a ``to_tsquery`` string matching all words, the last one as a prefix.
+
+    Only word characters are kept, so user input cannot inject tsquery operators.
+    The prefix match lets search-as-you-type find "refactor" from "refac".
+
+    Returns:
+        The tsquery text, or None if the query has no words
+    """
+    words = [word.lower() for word in _WORD_RE.findall(query)]
+    if not words:
+        return None
+    return " & ".join([*words[:-1], f"{words[-1]}:*"])
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def hash_prefix_condition(prefix: str) -> ColumnElement[bool]:
+    """Match commits whose hash starts with ``prefix``."""
+    # Hashes are stored lowercase; the pattern-ops btrees serve LIKE 'abc%'
+    return CommitModel.commit_hash.like(f"{_escape_like(prefix.lower())}%")
+
+
+def message_condition(query: str, dialect: str) -> ColumnElement[bool]:
+    """
+    Match commits by message text or hash.
+
+    Args:
+        query: User search text
+        dialect: Name of the database dialect in use
+
+    Returns:
+        WHERE condition for the search
+    """
+    if dialect != "postgresql":
+        pattern = f"%{query}%"
+        return or_(CommitModel.message.ilike(pattern), CommitModel.commit_hash.ilike(pattern))
+
+    query = query.strip()
+    conditions = []
+    if is_hash_prefix(query):
+        # Hex strings are also words ("deadbeef", "accede"), so messages still match
+        conditions.append(hash_prefix_condition(query))
+
+    tsquery = prefix_tsquery(query)
+    if tsquery:
+        conditions.append(search_vector.op("@@")(func.to_tsquery(_config, tsquery)))
+    # Substring matches inside words keep the previous semantics, via the trigram index
+    conditions.append(CommitModel.message.ilike(f"%{_escape_like(query)}%"))
+    return or_(*conditions)
+
+
+def author_condition(author: str, dialect: str) -> ColumnElement[bool]:
+    """Match commits by author name or email substring (trigram-indexed on PostgreSQL)."""
+    pattern = f"%{author}%" if dialect != "postgresql" else f"%{_escape_like(author)}%"
+    return or_(CommitModel.author_name.ilike(pattern), CommitModel.author_email.ilike(pattern))
+
+
+def relevance(query: str, dialect: str) -> ColumnElement | None:
+    """
+    Ranking expression for a search, best match first when sorted descending.
+
+    Returns:
+        ``ts_rank_cd`` of the commit against the query, or None where ranking is
+        unavailable (non-PostgreSQL dialects or queries without words)
+    """
+    tsquery = prefix_tsquery(query)
+    if dialect != "postgresql" or tsquery is None:
+        return None
+    return func.ts_rank_cd(search_vector, func.to_tsquery(_config, tsquery))
@@ -0,0 +1,130 @@
+"""Row counts for paginated listings, estimated when exact counts get expensive."""
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+# Tables with fewer rows than this (per pg_class.reltuples) are always counted exactly
+DEFAULT_EXACT_THRESHOLD = 50_000
+# How long an exact count is reused for the same filter set
+DEFAULT_CACHE_TTL = 30.0
+DEFAULT_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class CountResult:
+    """Number of rows matched by a listing."""
+
+    total: int
+    # True when ``total`` is the query planner's estimate rather than an exact count
+    is_estimate: bool
+
+
+class RowCounter:
+    """
+    Counts the rows matched by a listing query.
+
+    Small tables are counted exactly. On PostgreSQL, tables whose
+    ``pg_class.reltuples`` exceeds ``exact_threshold`` get the planner's row
+    estimate for the query instead, which costs one EXPLAIN rather than a
+    second scan next to the page query. Exact counts are cached for
+    ``cache_ttl`` seconds under a caller-provided key of normalized filters.
+    """
+
+    def __init__(
+        self,
+        exact_threshold: int = DEFAULT_EXACT_THRESHOLD,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.exact_threshold = exact_threshold
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache: OrderedDict[Hashable, tuple[float, int]] = OrderedDict()
+
+    async def count(
+        self, session: AsyncSession, stmt: Select, table: str, cache_key: Hashable
+    ) -> CountResult:
+        """
+        Count the rows ``stmt`` would return.
+
+        Args:
+            session: Database session
+            stmt: Filtered SELECT over ``table`` (without ordering or limits)
+            table: Name of the table being listed, used for the size check
+            cache_key: Hashable key identifying the normalized filter set
+
+        Returns:
+            The count and whether it is a planner estimate
+        """
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return CountResult(total=cached, is_estimate=False)
+
+        connection = await session.connection()
+        if connection.dialect.name == "postgresql":
+            table_rows = await self._table_rows(connection, table)
+            if table_rows is not None and table_rows >= self.exact_threshold:
+                return CountResult(total=await self._estimate(connection, stmt), is_estimate=True)
+
+        result = await session.execute(select(func.count()).select_from(stmt.subquery()))
+        total = result.scalar() or 0
+        self._put_cached(cache_key, total)
+        return CountResult(total=total, is_estimate=False)
+
+    def invalidate(self, prefix: tuple = ()) -> None:
+        """Drop cached counts whose key tuple starts with ``prefix`` (all by default)."""
+        for key in list(self._cache):
+            if isinstance(key, tuple) and key[: len(prefix)] == prefix:
+                del self._cache[key]
+
+    def _get_cached(self, key: Hashable) -> int | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, total = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return total
+
+    def _put_cached(self, key: Hashable, total: int) -> None:
+        if self.cache_ttl <= 0:
+            return
+        self._cache[key] = (time.monotonic() + self.cache_ttl, total)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    async def _table_rows(connection: AsyncConnection, table: str) -> int | None:
+        """Approximate table size from planner statistics (None if never analyzed)."""
+        result = await connection.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": table},
+        )
+        rows = result.scalar()
+        # reltuples is -1 until the table has been vacuumed or analyzed
+        return rows if rows is not None and rows >= 0 else None
+
+    @staticmethod
+    async def _estimate(connection: AsyncConnection, stmt: Select) -> int:
+        """Planner row estimate for ``stmt``."""
+        # Rendered with inline literals and sent verbatim, since EXPLAIN cannot
+        # be wrapped around a statement with bound parameters by SQLAlchemy
+        sql = stmt.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+# Global row counter instance
+row_counter = RowCounter()
@@ -5,6 +5,7 @@ from collections.abc import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from haven.infrastructure.database.factory import db_factory
+from haven.infrastructure.jobs.queue import JobQueue
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -14,12 +15,27 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     This provides a raw AsyncSession for use in routes that need
     direct database access without the full unit of work pattern.
     """
-    factory = db_factory
-    factory._ensure_initialized()
+    async with db_factory.session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
 
-    assert factory._session_factory is not None
-    async with factory._session_factory() as session:
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get a read-only database session for FastAPI dependency injection.
+
+    Reads go to the replica unless this request has already written; any
+    write is sent to the primary.
+    """
+    async with db_factory.read_only_session_factory() as session:
         try:
             yield session
         finally:
             await session.close()
+
+
+def get_job_queue() -> JobQueue:
+    """Get the durable job queue for FastAPI dependency injection."""
+    return JobQueue(db_factory.session_factory)
@@ -0,0 +1,270 @@
+"""
+Process-wide registry of database engines.
+
+API requests, the unit of work factory, CLI commands and background workers
+all take their engine from ``engine_registry`` rather than creating (and
+disposing) one per use, so a one-off query reuses pooled connections instead
+of paying for pool setup and the connection handshake.
+
+Engines are created lazily, one per purpose, each with its own pool:
+
+- ``api``: request handling
+- ``worker``: background job workers
+- ``replica``: reads of read-only sessions, on ``database.replica_dsn`` when set
+
+Pool sizes come from ``database.pools.<purpose>``, falling back to
+``database.pool``. Queue pools record how long checkouts wait for a
+connection; ``pool_status`` reports those numbers with the pool occupancy.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import exc, make_url, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from haven.config import get_settings
+from haven.config.settings import AppSettings, DatabaseSettings
+from haven.infrastructure.database.routing import create_routing_session_factory
+from haven.infrastructure.database.session import create_session_factory
+
+API = "api"
+WORKER = "worker"
+REPLICA = "replica"
+PURPOSES = (API, WORKER, REPLICA)
+# Session factory key of read-only sessions routed between API and REPLICA
+READ_ONLY = "read_only"
+
+
+@dataclass
+class PoolMetrics:
+    """How long checkouts from one pool waited for a connection."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        """Record one checkout attempt."""
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Metrics with the average wait per checkout."""
+        attempts = self.checkouts + self.timeouts
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_avg": self.wait_seconds_total / attempts if attempts else 0.0,
+            "wait_seconds_max": self.wait_seconds_max,
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records checkout wait times."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        # Engine.dispose() swaps in a recreated pool; keep counting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - start)
+        return connection
+
+
+def pool_settings(database: DatabaseSettings, purpose: str) -> DatabaseSettings.PoolSettings:
+    """Pool settings for a purpose."""
+    return database.pools.get(purpose, database.pool)
+
+
+def create_engine(purpose: str = API, settings: AppSettings | None = None) -> AsyncEngine:
+    """
+    Create an engine for a purpose.
+
+    Prefer ``engine_registry.engine(purpose)``, which shares one engine per
+    purpose across the process.
+    """
+    if purpose not in PURPOSES:
+        raise ValueError(f"Unknown engine purpose: {purpose}")
+    settings = settings or get_settings()
+    database = settings.database
+    dsn = database.replica_dsn if purpose == REPLICA and database.replica_dsn else database.dsn
+    pool = pool_settings(database, purpose)
+
+    options: dict[str, Any] = {"echo": settings.app.debug, "pool_pre_ping": pool.pre_ping}
+    # SQLite picks its own pool (a single static connection for :memory:)
+    if make_url(dsn).get_backend_name() != "sqlite":
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool.size,
+            max_overflow=pool.max_overflow,
+            pool_timeout=pool.timeout,
+            pool_recycle=pool.recycle,
+        )
+    return create_async_engine(dsn, **options)
+
+
+class EngineRegistry:
+    """
+    One shared engine and session factory per purpose.
+
+    Pooled connections belong to the event loop that opened them, so engines
+    created under a loop that is no longer running are dropped and recreated
+    (as happens between ``asyncio.run`` calls of CLI commands).
+    """
+
+    def __init__(self, settings_provider: Callable[[], AppSettings] = get_settings):
+        """Initialize an empty registry."""
+        self._settings_provider = settings_provider
+        self._engines: dict[str, AsyncEngine] = {}
+        self._session_factories: dict[str, async_sessionmaker[AsyncSession]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def engine(self, purpose: str = API) -> AsyncEngine:
+        """Get the engine for a purpose, creating it on first use."""
+        self._bind_loop()
+        engine = self._engines.get(purpose)
+        if engine is None:
+            engine = create_engine(purpose, self._settings_provider())
+            self._engines[purpose] = engine
+        return engine
+
+    def session_factory(self, purpose: str = API) -> async_sessionmaker[AsyncSession]:
+        """Get the session factory bound to the engine for a purpose."""
+        engine = self.engine(purpose)
+        factory = self._session_factories.get(purpose)
+        if factory is None:
+            factory = create_session_factory(engine)
+            self._session_factories[purpose] = factory
+        return factory
+
+    def read_only_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """
+        Get the session factory for read-only work.
+
+        Its sessions read from the replica and write to the API engine (see
+        ``routing``). Without a configured replica it is the API factory.
+        """
+        if not self._settings_provider().database.replica_dsn:
+            return self.session_factory(API)
+        self._bind_loop()
+        factory = self._session_factories.get(READ_ONLY)
+        if factory is None:
+            factory = create_routing_session_factory(self.engine(API), self.engine(REPLICA))
+            self._session_factories[READ_ONLY] = factory
+        return factory
+
+    async def warm_up(self, purpose: str = API, connections: int | None = None) -> int:
+        """
+        Open pooled connections ahead of the first requests.
+
+        Best effort: connection failures stop the warm-up without raising.
+
+        Args:
+            purpose: Engine whose pool to fill
+            connections: Number of connections (``warmup`` from the pool settings by default)
+
+        Returns:
+            Number of connections opened and returned to the pool
+        """
+        if connections is None:
+            connections = pool_settings(self._settings_provider().database, purpose).warmup
+        if connections <= 0:
+            return 0
+
+        engine = self.engine(purpose)
+        opened = []
+        try:
+            results = await asyncio.gather(
+                *(engine.connect().start() for _ in range(connections)), return_exceptions=True
+            )
+            opened = [result for result in results if not isinstance(result, BaseException)]
+            for connection in opened:
+                await connection.execute(text("SELECT 1"))
+        except (OSError, exc.SQLAlchemyError):
+            pass
+        finally:
+            for connection in opened:
+                await connection.close()
+        return len(opened)
+
+    def pool_status(self) -> dict[str, dict[str, Any]]:
+        """
+        Occupancy and wait metrics of every engine created so far.
+
+        Returns:
+            Status per purpose: the pool class, and for queue pools the
+            configured size, idle and checked-out connections, overflow in
+            use, and checkout wait statistics
+        """
+        status = {}
+        for purpose, engine in self._engines.items():
+            pool = engine.pool
+            entry: dict[str, Any] = {"pool": type(pool).__name__}
+            if isinstance(pool, QueuePool):
+                entry.update(
+                    size=pool.size(),
+                    checked_in=pool.checkedin(),
+                    checked_out=pool.checkedout(),
+                    # QueuePool counts overflow from -size until the pool is full
+                    overflow=max(pool.overflow(), 0),
+                )
+            if isinstance(pool, InstrumentedQueuePool):
+                entry.update(pool.metrics.as_dict())
+            status[purpose] = entry
+        return status
+
+    async def dispose(self) -> None:
+        """Close every engine's pooled connections."""
+        engines = list(self._engines.values())
+        self._engines.clear()
+        self._session_factories.clear()
+        for engine in engines:
+            await engine.dispose()
+
+    def _bind_loop(self) -> None:
+        """Drop engines created under another event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._loop is not loop:
+            if self._loop is not None:
+                # Their connections cannot be closed from this loop; let them be collected
+                for engine in self._engines.values():
+                    with contextlib.suppress(Exception):
+                        engine.sync_engine.dispose(close=False)
+                self._engines.clear()
+                self._session_factories.clear()
+            self._loop = loop
+
+
+# Global engine registry instance
+engine_registry = EngineRegistry()
@@ -2,46 +2,58 @@
 
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from haven.domain.unit_of_work import UnitOfWork
-from haven.infrastructure.database.session import create_engine, create_session_factory
+from haven.infrastructure.database.engines import API, EngineRegistry, engine_registry
 from haven.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
 
 
 class DatabaseFactory:
     """Factory for database components."""
 
-    def __init__(self) -> None:
-        """Initialize database factory."""
-        self._engine: AsyncEngine | None = None
-        self._session_factory: async_sessionmaker | None = None
+    def __init__(self, registry: EngineRegistry = engine_registry, purpose: str = API) -> None:
+        """
+        Initialize database factory.
+
+        Args:
+            registry: Registry providing the shared engines
+            purpose: Engine purpose sessions are opened on
+        """
+        self.registry = registry
+        self.purpose = purpose
 
-    def _ensure_initialized(self) -> None:
-        """Ensure the factory is initialized."""
-        if self._engine is None:
-            self._engine = create_engine()
-            self._session_factory = create_session_factory(self._engine)
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Session factory on the shared engine for this factory's purpose."""
+        return self.registry.session_factory(self.purpose)
 
-    async def get_unit_of_work(self) -> AsyncGenerator[UnitOfWork, None]:
+    @property
+    def read_only_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Session factory reading from the replica, when one is configured."""
+        return self.registry.read_only_session_factory()
+
+    async def get_unit_of_work(self, read_only: bool = False) -> AsyncGenerator[UnitOfWork, None]:
         """
         Get unit of work instance.
 
+        Args:
+            read_only: Route reads to the replica; writes still go to the
+                primary and pin the unit of work (and request) to it
+
         Yields:
             UnitOfWork instance for the current request
         """
-        self._ensure_initialized()
-        assert self._session_factory is not None
+        session_factory = self.read_only_session_factory if read_only else self.session_factory
         async with (
-            self._session_factory() as session,
+            session_factory() as session,
             SQLAlchemyUnitOfWork(session) as uow,
         ):
             yield uow
 
     async def dispose(self) -> None:
         """Dispose of database connections."""
-        if self._engine is not None:
-            await self._engine.dispose()
+        await self.registry.dispose()
 
 
 # Global factory instance
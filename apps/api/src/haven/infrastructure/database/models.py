@@ -8,12 +8,15 @@ from sqlalchemy import (
     JSON,
     Boolean,
     DateTime,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -33,10 +36,14 @@ __all__ = [
     "CommentModel",
     "CommitModel",
     "CommitReviewModel",
+    "CommitReviewSummaryModel",
+    "JobModel",
     "MilestoneModel",
     "RecordModel",
     "RepositoryModel",
+    "RepositorySyncStateModel",
     "ReviewCommentModel",
+    "ReviewerStatsModel",
     "RoadmapModel",
     "TaskModel",
     "TimeLogModel",
@@ -65,6 +72,9 @@ class RecordModel(Base):
         onupdate=func.now(),
     )
 
+    # Serves newest-first keyset pagination on (created_at, id)
+    __table_args__ = (Index("ix_records_created_at_id", text("created_at DESC"), text("id DESC")),)
+
     def __repr__(self) -> str:
         """String representation of RecordModel."""
         return f"<RecordModel(id={self.id}, created_at={self.created_at})>"
@@ -103,7 +113,9 @@ class RepositoryModel(Base):
     __tablename__ = "repositories"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    repository_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, unique=True, index=True)
+    repository_hash: Mapped[str | None] = mapped_column(
+        String(64), nullable=True, unique=True, index=True
+    )
     slug: Mapped[str | None] = mapped_column(String(64), nullable=True, unique=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -171,6 +183,12 @@ class TaskModel(Base):
         onupdate=func.now(),
     )
 
+    # Serve keyset pagination of task listings and the overdue queue
+    __table_args__ = (
+        Index("ix_tasks_created_at_id", text("created_at DESC"), text("id DESC")),
+        Index("ix_tasks_due_date_id", "due_date", "id"),
+    )
+
     def __repr__(self) -> str:
         """String representation of TaskModel."""
         return f"<TaskModel(id={self.id}, title={self.title[:50]}, status={self.status})>"
@@ -377,6 +395,44 @@ class MilestoneModel(Base):
         return f"<MilestoneModel(id={self.id}, title={self.title[:50]}, progress={self.progress_percentage}%)>"
 
 
+class RepositorySyncStateModel(Base):
+    """SQLAlchemy model for the last ingested tip of a repository branch."""
+
+    __tablename__ = "repository_sync_states"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    repository_id: Mapped[int] = mapped_column(
+        ForeignKey("repositories.id"), nullable=False, index=True
+    )
+    branch: Mapped[str] = mapped_column(String(255), nullable=False)
+    tip_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    # Audit fields
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    __table_args__ = (
+        UniqueConstraint("repository_id", "branch", name="_repository_sync_branch_uc"),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of RepositorySyncStateModel."""
+        return (
+            f"<RepositorySyncStateModel(repository_id={self.repository_id}, "
+            f"branch={self.branch}, tip={self.tip_hash[:7]})>"
+        )
+
+
 class CommitModel(Base):
     """SQLAlchemy model for Commit entity."""
 
@@ -421,6 +477,13 @@ class CommitModel(Base):
     # Add unique constraint on repository_id + commit_hash
     __table_args__ = (
         UniqueConstraint("repository_id", "commit_hash", name="_repository_commit_hash_uc"),
+        # Serves newest-first keyset pagination on (committed_at, id)
+        Index(
+            "ix_commits_repository_committed_at_id",
+            "repository_id",
+            text("committed_at DESC"),
+            text("id DESC"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -457,6 +520,16 @@ class CommitReviewModel(Base):
         onupdate=func.now(),
     )
 
+    __table_args__ = (
+        # Serves the latest-review lookup per commit in commit listings
+        Index(
+            "ix_commit_reviews_commit_created_at_id",
+            "commit_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+    )
+
     def __repr__(self) -> str:
         """String representation of CommitReviewModel."""
         return (
@@ -464,6 +537,86 @@ class CommitReviewModel(Base):
         )
 
 
+class CommitReviewSummaryModel(Base):
+    """SQLAlchemy model for the review state of each reviewed commit."""
+
+    # Projection of commit_reviews, refreshed by the review repositories in the
+    # same transaction as every review write (see database.review_summary)
+    __tablename__ = "commit_review_summary"
+
+    commit_id: Mapped[int] = mapped_column(
+        ForeignKey("commits.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Copied from the commit so review queues are served by this table's indexes
+    repository_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    committed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    latest_status: Mapped[str] = mapped_column(String(50), nullable=False)
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_reviewed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Latest review is still waiting on the reviewer
+    is_pending: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_commit_review_summary_repository_status",
+            "repository_id",
+            "latest_status",
+            text("committed_at DESC"),
+        ),
+        Index(
+            "ix_commit_review_summary_repository_pending",
+            "repository_id",
+            "is_pending",
+            text("committed_at DESC"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of CommitReviewSummaryModel."""
+        return (
+            f"<CommitReviewSummaryModel(commit_id={self.commit_id}, "
+            f"status={self.latest_status}, reviews={self.review_count})>"
+        )
+
+
+class ReviewerStatsModel(Base):
+    """SQLAlchemy model for the rolled-up review statistics of each reviewer."""
+
+    # Moved by every review write of the reviewer (see database.review_stats)
+    __tablename__ = "reviewer_review_stats"
+
+    reviewer_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    draft_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pending_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    approved_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    needs_revision_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Running total of completed reviews' times, the average is derived from it
+    completed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_review_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    avg_review_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of ReviewerStatsModel."""
+        return f"<ReviewerStatsModel(reviewer_id={self.reviewer_id})>"
+
+
 class ReviewCommentModel(Base):
     """SQLAlchemy model for ReviewComment entity."""
 
@@ -492,3 +645,49 @@ class ReviewCommentModel(Base):
         """String representation of ReviewCommentModel."""
         comment_preview = self.content[:50] + "..." if len(self.content) > 50 else self.content
         return f"<ReviewCommentModel(id={self.id}, commit_id={self.commit_id}, content='{comment_preview}')>"
+
+
+class JobModel(Base):
+    """SQLAlchemy model for a background job in the durable job queue."""
+
+    __tablename__ = "jobs"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    run_after: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    # Lease held by the worker running the job; renewed by heartbeats
+    leased_by: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    result: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Audit fields
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    # Workers poll for runnable jobs by status and due time
+    __table_args__ = (Index("ix_jobs_status_run_after", "status", "run_after"),)
+
+    def __repr__(self) -> str:
+        """String representation of JobModel."""
+        return f"<JobModel(id={self.id}, kind={self.kind}, status={self.status})>"
@@ -13,6 +13,9 @@ from haven.infrastructure.database.repositories.record_repository import (
 from haven.infrastructure.database.repositories.repository_repository import (
     RepositoryRepositoryImpl,
 )
+from haven.infrastructure.database.repositories.sync_state_repository import (
+    SyncStateRepositoryImpl,
+)
 from haven.infrastructure.database.repositories.task_repository import (
     TaskRepositoryImpl,
 )
@@ -29,6 +32,7 @@ __all__ = [
     "SQLAlchemyCommitRepository",
     "SQLAlchemyCommitReviewRepository",
     "SQLAlchemyRecordRepository",
+    "SyncStateRepositoryImpl",
     "TaskRepositoryImpl",
     "TimeLogRepositoryImpl",
     "UserRepositoryImpl",
@@ -1,11 +1,40 @@
 """SQLAlchemy implementation of CommitRepository."""
 
-from sqlalchemy import select
+from collections.abc import Awaitable, Callable, Iterable
+from itertools import islice
+
+from sqlalchemy import Integer, Row, Select, any_, func, insert, literal, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from haven.domain.entities.commit import Commit, CommitReview, DiffStats, ReviewStatus
-from haven.domain.repositories.commit_repository import CommitRepository, CommitReviewRepository
-from haven.infrastructure.database.models import CommitModel, CommitReviewModel
+from haven.domain.exceptions import AmbiguousCommitHashError
+from haven.domain.repositories.commit_repository import (
+    BulkInsertResult,
+    BulkReviewOutcome,
+    CommitKey,
+    CommitPage,
+    CommitRepository,
+    CommitReviewRepository,
+)
+from haven.infrastructure.database import commit_search
+from haven.infrastructure.database.counting import CountResult, RowCounter, row_counter
+from haven.infrastructure.database.models import (
+    CommitModel,
+    CommitReviewModel,
+    CommitReviewSummaryModel,
+)
+from haven.infrastructure.database.review_bulk import (
+    bulk_assign_reviewer,
+    bulk_update_review_status,
+)
+from haven.infrastructure.database.review_stats import apply_reviewer_stats, reviewer_stats_rows
+from haven.infrastructure.database.review_summary import refresh_review_summary
+
+# SQLite builds without SQLITE_MAX_VARIABLE_NUMBER raised only allow 999 parameters
+_SQLITE_MAX_PARAMS = 999
+# Number of columns bound per row by bulk_insert
+_INSERT_COLUMNS = 11
 
 
 class SQLAlchemyCommitRepository(CommitRepository):
@@ -35,9 +64,85 @@ class SQLAlchemyCommitRepository(CommitRepository):
         self.session.add(model)
         await self.session.flush()
         await self.session.refresh(model)
+        self.invalidate_listing_counts(commit.repository_id)
 
         return self._model_to_entity(model)
 
+    async def bulk_insert(
+        self, commits: Iterable[Commit], batch_size: int = 1000
+    ) -> BulkInsertResult:
+        """
+        Insert many commits with one statement per batch.
+
+        Uses ``INSERT ... ON CONFLICT (repository_id, commit_hash) DO NOTHING`` on
+        PostgreSQL and SQLite, so existing commits are skipped without a lookup per
+        row. Other dialects filter out existing hashes with one query per batch.
+
+        Args:
+            commits: Commits to insert (consumed lazily, one batch at a time)
+            batch_size: Maximum rows per INSERT statement
+
+        Returns:
+            Number of inserted and skipped commits
+        """
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "sqlite":
+            batch_size = min(batch_size, _SQLITE_MAX_PARAMS // _INSERT_COLUMNS)
+
+        inserted = skipped = 0
+        iterator = iter(commits)
+        while batch := list(islice(iterator, batch_size)):
+            rows = list({(c.repository_id, c.commit_hash): self._to_row(c) for c in batch}.values())
+            count = await self._insert_batch(rows, dialect)
+            inserted += count
+            skipped += len(batch) - count
+            if count:
+                self.invalidate_listing_counts(*{row["repository_id"] for row in rows})
+
+        return BulkInsertResult(inserted=inserted, skipped=skipped)
+
+    @staticmethod
+    def _to_row(commit: Commit) -> dict:
+        """Column values for inserting a commit."""
+        return {
+            "repository_id": commit.repository_id,
+            "commit_hash": commit.commit_hash,
+            "message": commit.message,
+            "author_name": commit.author_name,
+            "author_email": commit.author_email,
+            "committer_name": commit.committer_name,
+            "committer_email": commit.committer_email,
+            "committed_at": commit.committed_at,
+            "files_changed": commit.diff_stats.files_changed,
+            "insertions": commit.diff_stats.insertions,
+            "deletions": commit.diff_stats.deletions,
+        }
+
+    async def _insert_batch(self, rows: list[dict], dialect: str) -> int:
+        """Insert one batch, returning the number of rows actually inserted."""
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = (
+                dialect_insert(CommitModel)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["repository_id", "commit_hash"])
+                .returning(CommitModel.id)
+            )
+            result = await self.session.execute(stmt)
+            return len(result.all())
+
+        keys = [(row["repository_id"], row["commit_hash"]) for row in rows]
+        existing = await self.session.execute(
+            select(CommitModel.repository_id, CommitModel.commit_hash).where(
+                tuple_(CommitModel.repository_id, CommitModel.commit_hash).in_(keys)
+            )
+        )
+        known = set(existing.tuples().all())
+        new_rows = [row for row, key in zip(rows, keys, strict=True) if key not in known]
+        if new_rows:
+            await self.session.execute(insert(CommitModel), new_rows)
+        return len(new_rows)
+
     async def get_by_id(self, commit_id: int) -> Commit | None:
         """Get a commit by ID."""
         stmt = select(CommitModel).where(CommitModel.id == commit_id)
@@ -46,6 +151,27 @@ class SQLAlchemyCommitRepository(CommitRepository):
 
         return self._model_to_entity(model) if model else None
 
+    async def get_many_by_ids(self, commit_ids: Iterable[int]) -> list[Commit]:
+        """
+        Get the commits with the given IDs in one query.
+
+        Returns:
+            Found commits in request order; unknown IDs are left out
+        """
+        ids = list(dict.fromkeys(commit_ids))
+        if not ids:
+            return []
+
+        if self.session.get_bind().dialect.name == "postgresql":
+            # A single array parameter keeps one prepared statement for any batch size
+            condition = CommitModel.id == any_(literal(ids, postgresql.ARRAY(Integer)))
+        else:
+            condition = CommitModel.id.in_(ids)
+        result = await self.session.execute(select(CommitModel).where(condition))
+        by_id = {model.id: model for model in result.scalars().all()}
+
+        return [self._model_to_entity(by_id[commit_id]) for commit_id in ids if commit_id in by_id]
+
     async def get_by_hash(self, repository_id: int, commit_hash: str) -> Commit | None:
         """Get a commit by repository and hash."""
         stmt = select(CommitModel).where(
@@ -56,21 +182,43 @@ class SQLAlchemyCommitRepository(CommitRepository):
 
         return self._model_to_entity(model) if model else None
 
-    async def get_by_repository(
-        self, repository_id: int, limit: int = 100, offset: int = 0
-    ) -> list[Commit]:
-        """Get commits for a repository."""
+    async def resolve_hash(self, commit_hash: str) -> Commit | None:
+        """
+        Find a commit by full or abbreviated hash across all repositories.
+
+        Served by the global ``commit_hash`` indexes in one query (a second
+        one checks abbreviated hashes for ambiguity). When forks share the
+        commit, the copy in the oldest repository is returned.
+
+        Raises:
+            AmbiguousCommitHashError: If the prefix matches several commits
+        """
+        commit_hash = commit_hash.lower()
+        if len(commit_hash) in commit_search.FULL_HASH_LENGTHS:
+            match = CommitModel.commit_hash == commit_hash
+        else:
+            match = commit_search.hash_prefix_condition(commit_hash)
         stmt = (
             select(CommitModel)
-            .where(CommitModel.repository_id == repository_id)
-            .order_by(CommitModel.committed_at.desc())
-            .limit(limit)
-            .offset(offset)
+            .where(match)
+            .order_by(CommitModel.commit_hash, CommitModel.repository_id)
+            .limit(1)
         )
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
+        model = (await self.session.execute(stmt)).scalar_one_or_none()
+        if model is None:
+            return None
+
+        if model.commit_hash != commit_hash:
+            other = select(CommitModel.id).where(match, CommitModel.commit_hash != model.commit_hash)
+            if (await self.session.execute(other.limit(1))).first() is not None:
+                raise AmbiguousCommitHashError(commit_hash)
+        return self._model_to_entity(model)
 
-        return [self._model_to_entity(model) for model in models]
+    async def get_by_repository(
+        self, repository_id: int, limit: int = 100, offset: int = 0
+    ) -> list[Commit]:
+        """Get commits for a repository."""
+        return await self.fetch_commits(self.listing_statement(repository_id, limit, offset))
 
     async def update(self, commit: Commit) -> Commit:
         """Update an existing commit."""
@@ -126,45 +274,160 @@ class SQLAlchemyCommitRepository(CommitRepository):
         result = await self.session.execute(stmt)
         return result.scalar() or 0
 
-    async def search_commits(
+    async def get_page(
         self,
         repository_id: int,
+        limit: int = 20,
+        after: CommitKey | None = None,
+        before: CommitKey | None = None,
         search_query: str | None = None,
         author_filter: str | None = None,
         date_from: str | None = None,
         date_to: str | None = None,
-        limit: int = 100,
-        offset: int = 0,
-    ) -> list[Commit]:
-        """Search commits with filters."""
-        from datetime import datetime
+        review_status: str | None = None,
+        fetch: Callable[[Select], Awaitable[list]] | None = None,
+    ) -> CommitPage:
+        """
+        Get a keyset page of commits, newest first.
+
+        Seeks on ``(committed_at, id)`` instead of skipping rows with OFFSET, so
+        with the ``(repository_id, committed_at DESC, id DESC)`` index every page
+        costs the same regardless of depth.
+
+        Args:
+            repository_id: Repository to list
+            limit: Page size
+            after: Return commits older than this key
+            before: Return commits newer than this key
+            search_query: Search in message and hash
+            author_filter: Filter by author name or email
+            date_from: Only commits at or after this ISO date
+            date_to: Only commits at or before this ISO date
+            review_status: Only commits whose latest review has this status
+            fetch: Runs the listing statement; defaults to ``fetch_commits``, or
+                pass ``fetch_with_latest_review`` to page over read-model rows
+
+        Returns:
+            The page and whether more commits follow in the direction of travel
+        """
+        stmt = self.listing_statement(
+            repository_id,
+            limit + 1,
+            after=after,
+            before=before,
+            search_query=search_query,
+            author_filter=author_filter,
+            date_from=date_from,
+            date_to=date_to,
+            review_status=review_status,
+        )
+        items = await (fetch or self.fetch_commits)(stmt)
+        has_more = len(items) > limit
+        items = items[:limit]
+        # Walking backwards from `before` reads in ascending order, so flip the page
+        if before is not None and after is None:
+            items.reverse()
 
-        from sqlalchemy import and_, or_
+        return CommitPage(items=items, has_more=has_more)
+
+    def listing_statement(
+        self,
+        repository_id: int,
+        limit: int,
+        offset: int = 0,
+        after: CommitKey | None = None,
+        before: CommitKey | None = None,
+        search_query: str | None = None,
+        author_filter: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        review_status: str | None = None,
+        order_by_relevance: bool = False,
+    ) -> Select:
+        """
+        Build the SELECT behind every commit listing, newest first.
+
+        Args:
+            order_by_relevance: Rank text matches best first (PostgreSQL only);
+                otherwise, and as a tiebreak, newest first
+
+        Returns:
+            Filtered, ordered and limited SELECT of ``CommitModel``, ascending
+            when only ``before`` is given
+        """
+        key = tuple_(CommitModel.committed_at, CommitModel.id)
+        stmt = select(CommitModel).where(
+            CommitModel.repository_id == repository_id,
+            *self._search_conditions(
+                search_query, author_filter, date_from, date_to, review_status
+            ),
+        )
+        if after is not None:
+            stmt = stmt.where(key < tuple_(literal(after.committed_at), literal(after.id)))
+        if before is not None:
+            stmt = stmt.where(key > tuple_(literal(before.committed_at), literal(before.id)))
+
+        rank = None
+        if order_by_relevance and search_query:
+            rank = commit_search.relevance(search_query, self.session.get_bind().dialect.name)
+        if rank is not None:
+            stmt = stmt.order_by(rank.desc())
+
+        if before is not None and after is None:
+            stmt = stmt.order_by(CommitModel.committed_at.asc(), CommitModel.id.asc())
+        else:
+            stmt = stmt.order_by(CommitModel.committed_at.desc(), CommitModel.id.desc())
+
+        return stmt.limit(limit).offset(offset or None)
+
+    async def fetch_commits(self, stmt: Select) -> list[Commit]:
+        """Run a ``listing_statement`` and convert the rows to entities."""
+        result = await self.session.execute(stmt)
+        return [self._model_to_entity(model) for model in result.scalars().all()]
+
+    async def fetch_with_latest_review(self, stmt: Select) -> list[Row]:
+        """
+        Run a ``listing_statement`` with each commit's review state attached.
+
+        The ``commit_review_summary`` projection is joined onto the page query on
+        its primary key, so commits and their review state come back in one round
+        trip as plain rows carrying the ``commits`` columns plus ``review_status``,
+        ``review_count`` and ``latest_review_at``.
+        """
+        summary = CommitReviewSummaryModel
+        stmt = stmt.outerjoin(summary, summary.commit_id == CommitModel.id).with_only_columns(
+            *CommitModel.__table__.columns,
+            summary.latest_status.label("review_status"),
+            func.coalesce(summary.review_count, 0).label("review_count"),
+            summary.last_reviewed_at.label("latest_review_at"),
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
 
-        stmt = select(CommitModel).where(CommitModel.repository_id == repository_id)
+    def _search_conditions(
+        self,
+        search_query: str | None = None,
+        author_filter: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        review_status: str | None = None,
+    ) -> list:
+        """Build WHERE conditions for commit search filters."""
+        from datetime import datetime
 
-        # Add search conditions
+        dialect = self.session.get_bind().dialect.name
         conditions = []
+        # Surrounding whitespace never matters; count_listing keys its cache on the same values
+        search_query = search_query.strip() if search_query else None
+        author_filter = author_filter.strip() if author_filter else None
 
         if search_query:
             # Search in message and commit hash
-            search_pattern = f"%{search_query}%"
-            conditions.append(
-                or_(
-                    CommitModel.message.ilike(search_pattern),
-                    CommitModel.commit_hash.ilike(search_pattern),
-                )
-            )
+            conditions.append(commit_search.message_condition(search_query, dialect))
 
         if author_filter:
             # Search in author name and email
-            author_pattern = f"%{author_filter}%"
-            conditions.append(
-                or_(
-                    CommitModel.author_name.ilike(author_pattern),
-                    CommitModel.author_email.ilike(author_pattern),
-                )
-            )
+            conditions.append(commit_search.author_condition(author_filter, dialect))
 
         if date_from:
             try:
@@ -180,16 +443,99 @@ class SQLAlchemyCommitRepository(CommitRepository):
             except ValueError:
                 pass  # Invalid date format, skip
 
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
+        if review_status:
+            # Semi-join on the review summary rather than scanning commit_reviews
+            summary = CommitReviewSummaryModel
+            conditions.append(
+                select(summary.commit_id)
+                .where(
+                    summary.commit_id == CommitModel.id,
+                    summary.repository_id == CommitModel.repository_id,
+                    summary.latest_status == review_status,
+                )
+                # Listings with reviews also join the summary table itself
+                .correlate(CommitModel)
+                .exists()
+            )
 
-        # Order by committed date descending
-        stmt = stmt.order_by(CommitModel.committed_at.desc()).limit(limit).offset(offset)
+        return conditions
 
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
+    async def count_listing(
+        self,
+        repository_id: int,
+        search_query: str | None = None,
+        author_filter: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        review_status: str | None = None,
+        counter: RowCounter = row_counter,
+    ) -> CountResult:
+        """
+        Count commits matching listing filters for pagination metadata.
+
+        Unlike ``count_search_results`` this may return a planner estimate for
+        large tables and reuses recent exact counts for the same filters.
+
+        Returns:
+            The count and whether it is an estimate
+        """
+        stmt = select(CommitModel.id).where(
+            CommitModel.repository_id == repository_id,
+            *self._search_conditions(
+                search_query, author_filter, date_from, date_to, review_status
+            ),
+        )
+        # Text filters are stripped by _search_conditions and matched case-insensitively,
+        # so filters differing only in case or surrounding whitespace share a count
+        cache_key = (
+            CommitModel.__tablename__,
+            repository_id,
+            *(
+                value.strip().lower() or None if value else None
+                for value in (search_query, author_filter)
+            ),
+            date_from or None,
+            date_to or None,
+            review_status,
+        )
+        return await counter.count(self.session, stmt, CommitModel.__tablename__, cache_key)
 
-        return [self._model_to_entity(model) for model in models]
+    @staticmethod
+    def invalidate_listing_counts(*repository_ids: int, counter: RowCounter = row_counter) -> None:
+        """Forget cached listing counts of repositories that gained commits."""
+        for repository_id in repository_ids:
+            counter.invalidate((CommitModel.__tablename__, repository_id))
+
+    async def search_commits(
+        self,
+        repository_id: int,
+        search_query: str | None = None,
+        author_filter: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        order_by_relevance: bool = False,
+    ) -> list[Commit]:
+        """
+        Search commits with filters.
+
+        Args:
+            order_by_relevance: Rank text matches best first (PostgreSQL only);
+                otherwise, and as a tiebreak, newest first
+        """
+        return await self.fetch_commits(
+            self.listing_statement(
+                repository_id,
+                limit,
+                offset,
+                search_query=search_query,
+                author_filter=author_filter,
+                date_from=date_from,
+                date_to=date_to,
+                order_by_relevance=order_by_relevance,
+            )
+        )
 
     async def count_search_results(
         self,
@@ -200,52 +546,13 @@ class SQLAlchemyCommitRepository(CommitRepository):
         date_to: str | None = None,
     ) -> int:
         """Count search results."""
-        from datetime import datetime
-
-        from sqlalchemy import and_, func, or_
+        from sqlalchemy import func
 
         stmt = select(func.count(CommitModel.id)).where(
-            CommitModel.repository_id == repository_id
+            CommitModel.repository_id == repository_id,
+            *self._search_conditions(search_query, author_filter, date_from, date_to),
         )
 
-        # Add same search conditions
-        conditions = []
-
-        if search_query:
-            search_pattern = f"%{search_query}%"
-            conditions.append(
-                or_(
-                    CommitModel.message.ilike(search_pattern),
-                    CommitModel.commit_hash.ilike(search_pattern),
-                )
-            )
-
-        if author_filter:
-            author_pattern = f"%{author_filter}%"
-            conditions.append(
-                or_(
-                    CommitModel.author_name.ilike(author_pattern),
-                    CommitModel.author_email.ilike(author_pattern),
-                )
-            )
-
-        if date_from:
-            try:
-                date_from_parsed = datetime.fromisoformat(date_from.replace('Z', '+00:00'))
-                conditions.append(CommitModel.committed_at >= date_from_parsed)
-            except ValueError:
-                pass
-
-        if date_to:
-            try:
-                date_to_parsed = datetime.fromisoformat(date_to.replace('Z', '+00:00'))
-                conditions.append(CommitModel.committed_at <= date_to_parsed)
-            except ValueError:
-                pass
-
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
-
         result = await self.session.execute(stmt)
         return result.scalar() or 0
 
@@ -291,6 +598,9 @@ class SQLAlchemyCommitReviewRepository(CommitReviewRepository):
 
         self.session.add(model)
         await self.session.flush()
+        await refresh_review_summary(self.session, [model.commit_id])
+        added = await reviewer_stats_rows(self.session, CommitReviewModel.id == model.id)
+        await apply_reviewer_stats(self.session, added=added)
         await self.session.refresh(model)
 
         return self._model_to_entity(model)
@@ -315,6 +625,28 @@ class SQLAlchemyCommitReviewRepository(CommitReviewRepository):
 
         return [self._model_to_entity(model) for model in models]
 
+    async def get_by_commits(self, commit_ids: Iterable[int]) -> dict[int, list[CommitReview]]:
+        """
+        Get the reviews of many commits in one query.
+
+        Returns:
+            Reviews per requested commit, newest first; commits without
+            reviews map to an empty list
+        """
+        reviews: dict[int, list[CommitReview]] = {commit_id: [] for commit_id in commit_ids}
+        if not reviews:
+            return reviews
+
+        stmt = (
+            select(CommitReviewModel)
+            .where(CommitReviewModel.commit_id.in_(reviews))
+            .order_by(CommitReviewModel.created_at.desc(), CommitReviewModel.id.desc())
+        )
+        result = await self.session.execute(stmt)
+        for model in result.scalars().all():
+            reviews[model.commit_id].append(self._model_to_entity(model))
+        return reviews
+
     async def get_by_reviewer(
         self, reviewer_id: int, limit: int = 100, offset: int = 0
     ) -> list[CommitReview]:
@@ -333,7 +665,9 @@ class SQLAlchemyCommitReviewRepository(CommitReviewRepository):
 
     async def update(self, review: CommitReview) -> CommitReview:
         """Update an existing commit review."""
-        stmt = select(CommitReviewModel).where(CommitReviewModel.id == review.id)
+        is_review = CommitReviewModel.id == review.id
+        removed = await reviewer_stats_rows(self.session, is_review, lock=True)
+        stmt = select(CommitReviewModel).where(is_review)
         result = await self.session.execute(stmt)
         model = result.scalar_one()
 
@@ -343,22 +677,49 @@ class SQLAlchemyCommitReviewRepository(CommitReviewRepository):
         model.reviewed_at = review.reviewed_at
 
         await self.session.flush()
+        await refresh_review_summary(self.session, [model.commit_id])
+        added = await reviewer_stats_rows(self.session, is_review)
+        await apply_reviewer_stats(self.session, removed, added)
         await self.session.refresh(model)
 
         return self._model_to_entity(model)
 
     async def delete(self, review_id: int) -> bool:
         """Delete a commit review."""
-        stmt = select(CommitReviewModel).where(CommitReviewModel.id == review_id)
+        is_review = CommitReviewModel.id == review_id
+        removed = await reviewer_stats_rows(self.session, is_review, lock=True)
+        stmt = select(CommitReviewModel).where(is_review)
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
 
         if model:
             await self.session.delete(model)
             await self.session.flush()
+            await refresh_review_summary(self.session, [model.commit_id])
+            await apply_reviewer_stats(self.session, removed=removed)
             return True
         return False
 
+    async def bulk_update_status(
+        self,
+        commit_ids: Iterable[int],
+        reviewer_id: int,
+        status: ReviewStatus,
+        notes: str | None = None,
+    ) -> dict[int, BulkReviewOutcome]:
+        """Set the status of a reviewer's reviews on many commits in one statement."""
+        return await bulk_update_review_status(
+            self.session, commit_ids, reviewer_id, status.value, notes
+        )
+
+    async def bulk_assign(
+        self, commit_ids: Iterable[int], reviewer_id: int
+    ) -> dict[int, BulkReviewOutcome]:
+        """Create pending reviews for a reviewer on many commits in one statement."""
+        return await bulk_assign_reviewer(
+            self.session, commit_ids, reviewer_id, ReviewStatus.PENDING_REVIEW.value
+        )
+
     def _model_to_entity(self, model: CommitReviewModel) -> CommitReview:
         """Convert CommitReviewModel to CommitReview entity."""
         return CommitReview(
@@ -1,8 +1,9 @@
 """SQLAlchemy implementation of RecordRepository."""
 
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from haven.domain.entities import Record
@@ -43,6 +44,24 @@ class SQLAlchemyRecordRepository(RecordRepository):
 
         return [self._model_to_entity(model) for model in models]
 
+    async def get_after(
+        self, limit: int = 100, after: tuple[datetime, UUID] | None = None
+    ) -> list[Record]:
+        """Get records newest first, seeking past ``after`` instead of using OFFSET."""
+        stmt = select(RecordModel)
+        if after is not None:
+            created_at, record_id = after
+            stmt = stmt.where(
+                tuple_(RecordModel.created_at, RecordModel.id)
+                < tuple_(literal(created_at), literal(str(record_id)))
+            )
+        result = await self._session.execute(
+            stmt.order_by(RecordModel.created_at.desc(), RecordModel.id.desc()).limit(limit)
+        )
+        models = result.scalars().all()
+
+        return [self._model_to_entity(model) for model in models]
+
     async def save(self, record: Record) -> Record:
         """Save a record (create or update)."""
         # Check if record exists
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -58,6 +60,12 @@ class RepositoryRepositoryImpl(RepositoryRepository):
         db_repository = result.scalar_one_or_none()
         return self._to_entity(db_repository) if db_repository else None
 
+    async def get_many_by_ids(self, repo_ids: Iterable[int]) -> list[Repository]:
+        """Get the repositories with the given IDs"""
+        stmt = select(RepositoryModel).where(RepositoryModel.id.in_(set(repo_ids)))
+        result = await self.session.execute(stmt)
+        return [self._to_entity(db_repo) for db_repo in result.scalars().all()]
+
     async def get_by_name(self, name: str) -> Repository | None:
         """Get repository by name"""
         stmt = select(RepositoryModel).where(RepositoryModel.name == name)
@@ -1,14 +1,31 @@
 """SQLAlchemy implementation of review repositories."""
 
-from sqlalchemy import and_, delete, distinct, func, select
+from collections.abc import Iterable
+
+from sqlalchemy import and_, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from haven.domain.entities.review_comment import CommitReview, ReviewComment
+from haven.domain.repositories.commit_repository import BulkReviewOutcome
 from haven.domain.repositories.review_repository import (
     CommitReviewRepository,
     ReviewCommentRepository,
 )
-from haven.infrastructure.database.models import CommitReviewModel, ReviewCommentModel
+from haven.infrastructure.database.models import (
+    CommitReviewModel,
+    CommitReviewSummaryModel,
+    ReviewCommentModel,
+    ReviewerStatsModel,
+)
+from haven.infrastructure.database.review_bulk import bulk_update_review_status
+from haven.infrastructure.database.review_stats import (
+    apply_reviewer_stats,
+    review_stats_columns,
+    reviewer_stats_rows,
+    stats_from_row,
+    stats_query,
+)
+from haven.infrastructure.database.review_summary import refresh_review_summary
 
 
 class SqlAlchemyReviewCommentRepository(ReviewCommentRepository):
@@ -185,6 +202,9 @@ class SqlAlchemyCommitReviewRepository(CommitReviewRepository):
 
         self.session.add(model)
         await self.session.flush()
+        await refresh_review_summary(self.session, [model.commit_id])
+        added = await reviewer_stats_rows(self.session, CommitReviewModel.id == model.id)
+        await apply_reviewer_stats(self.session, added=added)
         await self.session.refresh(model)
 
         return self._model_to_entity(model)
@@ -289,7 +309,9 @@ class SqlAlchemyCommitReviewRepository(CommitReviewRepository):
 
     async def update(self, commit_review: CommitReview) -> CommitReview:
         """Update an existing commit review."""
-        stmt = select(CommitReviewModel).where(CommitReviewModel.id == commit_review.id)
+        is_review = CommitReviewModel.id == commit_review.id
+        removed = await reviewer_stats_rows(self.session, is_review, lock=True)
+        stmt = select(CommitReviewModel).where(is_review)
         result = await self.session.execute(stmt)
         model = result.scalar_one()
 
@@ -298,53 +320,65 @@ class SqlAlchemyCommitReviewRepository(CommitReviewRepository):
         model.reviewed_at = commit_review.reviewed_at
 
         await self.session.flush()
+        await refresh_review_summary(self.session, [model.commit_id])
+        added = await reviewer_stats_rows(self.session, is_review)
+        await apply_reviewer_stats(self.session, removed, added)
         await self.session.refresh(model)
 
         return self._model_to_entity(model)
 
     async def delete(self, review_id: int) -> bool:
         """Delete a commit review."""
-        stmt = delete(CommitReviewModel).where(CommitReviewModel.id == review_id)
+        stmt = (
+            delete(CommitReviewModel)
+            .where(CommitReviewModel.id == review_id)
+            .returning(
+                CommitReviewModel.commit_id,
+                *review_stats_columns(self.session.get_bind().dialect.name),
+            )
+        )
         result = await self.session.execute(stmt)
+        deleted = result.all()
+        await refresh_review_summary(self.session, [row.commit_id for row in deleted])
+        await apply_reviewer_stats(self.session, removed=deleted)
 
-        return result.rowcount > 0
+        return bool(deleted)
+
+    async def bulk_update_status(
+        self, commit_ids: Iterable[int], reviewer_id: int, status: str
+    ) -> dict[int, BulkReviewOutcome]:
+        """Set the status of a reviewer's reviews on many commits in one statement."""
+        return await bulk_update_review_status(self.session, commit_ids, reviewer_id, status)
 
     async def get_review_stats(self, reviewer_id: int | None = None) -> dict:
         """Get review statistics (count by status, average time, etc.)."""
-        # Base query
-        base_query = select(CommitReviewModel)
-        if reviewer_id:
-            base_query = base_query.where(CommitReviewModel.reviewer_id == reviewer_id)
-
-        # Count by status
-        status_counts = {}
-        for status in CommitReview.ReviewStatus.all_values():
-            stmt = base_query.where(CommitReviewModel.status == status)
-            result = await self.session.execute(select(func.count()).select_from(stmt.subquery()))
-            status_counts[status] = result.scalar()
-
-        # Average review time for completed reviews
-        completed_stmt = base_query.where(
-            CommitReviewModel.status.in_(
-                [CommitReview.ReviewStatus.APPROVED, CommitReview.ReviewStatus.NEEDS_REVISION]
-            )
-        ).where(CommitReviewModel.reviewed_at.is_not(None))
-
-        avg_time_stmt = select(
-            func.avg(
-                func.extract("epoch", CommitReviewModel.reviewed_at - CommitReviewModel.created_at)
-            )
-        ).select_from(completed_stmt.subquery())
-
-        result = await self.session.execute(avg_time_stmt)
-        avg_review_time_seconds = result.scalar()
-
-        return {
-            "status_counts": status_counts,
-            "total_reviews": sum(status_counts.values()),
-            "avg_review_time_seconds": avg_review_time_seconds or 0,
-            "avg_review_time_hours": (avg_review_time_seconds or 0) / 3600,
-        }
+        reviewer_ids = [reviewer_id] if reviewer_id else None
+        stmt = stats_query(self.session.get_bind().dialect.name, reviewer_ids)
+        result = await self.session.execute(stmt)
+        return stats_from_row(result.one())
+
+    async def get_reviewer_stats(self, from_rollup: bool = False) -> dict[int, dict]:
+        """
+        Get review statistics for every reviewer in one query.
+
+        Args:
+            from_rollup: Read the incrementally maintained ``reviewer_review_stats``
+                rollup instead of aggregating ``commit_reviews`` (without
+                percentiles)
+
+        Returns:
+            Statistics keyed by reviewer ID, shaped like ``get_review_stats``
+        """
+        if from_rollup:
+            stmt = select(ReviewerStatsModel)
+            result = await self.session.execute(stmt)
+            rows = result.scalars().all()
+        else:
+            stmt = stats_query(self.session.get_bind().dialect.name, by_reviewer=True)
+            result = await self.session.execute(stmt)
+            rows = result.all()
+
+        return {row.reviewer_id: stats_from_row(row) for row in rows}
 
     async def get_commits_needing_review(
         self, repository_id: int | None = None, limit: int | None = None
@@ -352,16 +386,16 @@ class SqlAlchemyCommitReviewRepository(CommitReviewRepository):
         """Get commit IDs that need review (no pending/completed reviews)."""
         from haven.infrastructure.database.models import CommitModel
 
-        # Subquery for commits that have reviews
-        reviewed_commits_subquery = select(distinct(CommitReviewModel.commit_id))
-
-        # Main query for commits without reviews
-        stmt = select(CommitModel.id).where(CommitModel.id.not_in(reviewed_commits_subquery))
+        # Reviewed commits have a summary row, so this is an anti-join on its primary key
+        reviewed = select(CommitReviewSummaryModel.commit_id).where(
+            CommitReviewSummaryModel.commit_id == CommitModel.id
+        )
+        stmt = select(CommitModel.id).where(~reviewed.exists())
 
         if repository_id:
             stmt = stmt.where(CommitModel.repository_id == repository_id)
 
-        stmt = stmt.order_by(CommitModel.committed_at.desc())
+        stmt = stmt.order_by(CommitModel.committed_at.desc(), CommitModel.id.desc())
 
         if limit:
             stmt = stmt.limit(limit)
@@ -0,0 +1,57 @@
+"""SQLAlchemy implementation of SyncStateRepository."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.domain.repositories.sync_state_repository import SyncStateRepository
+from haven.infrastructure.database.models import RepositorySyncStateModel
+
+
+class SyncStateRepositoryImpl(SyncStateRepository):
+    """SQLAlchemy implementation of SyncStateRepository."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_branch_tip(self, repository_id: int, branch: str) -> str | None:
+        """Get the last ingested tip hash of a branch, or None if never synced."""
+        stmt = select(RepositorySyncStateModel.tip_hash).where(
+            RepositorySyncStateModel.repository_id == repository_id,
+            RepositorySyncStateModel.branch == branch,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def set_branch_tip(self, repository_id: int, branch: str, tip_hash: str) -> None:
+        """Record the tip hash up to which a branch has been ingested."""
+        stmt = select(RepositorySyncStateModel).where(
+            RepositorySyncStateModel.repository_id == repository_id,
+            RepositorySyncStateModel.branch == branch,
+        )
+        result = await self.session.execute(stmt)
+        model = result.scalar_one_or_none()
+
+        synced_at = datetime.now(UTC)
+        if model is None:
+            model = RepositorySyncStateModel(
+                repository_id=repository_id,
+                branch=branch,
+                tip_hash=tip_hash,
+                synced_at=synced_at,
+            )
+            self.session.add(model)
+        else:
+            model.tip_hash = tip_hash
+            model.synced_at = synced_at
+
+        await self.session.flush()
+
+    async def get_branch_tips(self, repository_id: int) -> dict[str, str]:
+        """Get the last ingested tip hash of every synced branch."""
+        stmt = select(RepositorySyncStateModel.branch, RepositorySyncStateModel.tip_hash).where(
+            RepositorySyncStateModel.repository_id == repository_id
+        )
+        result = await self.session.execute(stmt)
+        return dict(result.tuples().all())
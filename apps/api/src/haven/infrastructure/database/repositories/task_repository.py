@@ -1,8 +1,9 @@
 """Task repository implementation using SQLAlchemy."""
 
+from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import and_, desc, func, or_
+from sqlalchemy import and_, desc, func, literal, or_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from haven.domain.entities.task import Task
@@ -43,6 +44,13 @@ class TaskRepositoryImpl(TaskRepository):
         result = await self.session.get(TaskModel, task_id)
         return self._model_to_entity(result) if result else None
 
+    async def get_many_by_ids(self, task_ids: Iterable[int]) -> list[Task]:
+        """Get the tasks with the given IDs."""
+        result = await self.session.execute(
+            TaskModel.__table__.select().where(TaskModel.id.in_(set(task_ids)))
+        )
+        return [self._model_to_entity(TaskModel(**row._mapping)) for row in result.fetchall()]
+
     async def get_all(self, limit: int = 100, offset: int = 0) -> list[Task]:
         """Get all tasks with pagination."""
         result = await self.session.execute(
@@ -148,6 +156,63 @@ class TaskRepositoryImpl(TaskRepository):
         )
         return [self._model_to_entity(TaskModel(**row._mapping)) for row in result.fetchall()]
 
+    async def get_after(
+        self,
+        limit: int = 100,
+        after: tuple[datetime, int] | None = None,
+        status: str | None = None,
+        assignee_id: int | None = None,
+        repository_id: int | None = None,
+        query: str | None = None,
+    ) -> list[Task]:
+        """Get filtered tasks newest first, seeking past ``after`` instead of using OFFSET."""
+        conditions = []
+        if status:
+            conditions.append(TaskModel.status == status)
+        if assignee_id:
+            conditions.append(TaskModel.assignee_id == assignee_id)
+        if repository_id:
+            conditions.append(TaskModel.repository_id == repository_id)
+        if query:
+            conditions.append(
+                or_(TaskModel.title.ilike(f"%{query}%"), TaskModel.description.ilike(f"%{query}%"))
+            )
+        if after is not None:
+            created_at, task_id = after
+            conditions.append(
+                tuple_(TaskModel.created_at, TaskModel.id)
+                < tuple_(literal(created_at), literal(task_id))
+            )
+
+        result = await self.session.execute(
+            TaskModel.__table__.select()
+            .where(*conditions)
+            .order_by(desc(TaskModel.created_at), desc(TaskModel.id))
+            .limit(limit)
+        )
+        return [self._model_to_entity(TaskModel(**row._mapping)) for row in result.fetchall()]
+
+    async def get_overdue_after(
+        self, limit: int = 100, after: tuple[datetime, int] | None = None
+    ) -> list[Task]:
+        """Get overdue tasks by due date, seeking past ``after`` instead of using OFFSET."""
+        now = datetime.utcnow()
+        conditions = [TaskModel.due_date < now, TaskModel.status != "completed"]
+        if after is not None:
+            due_date, task_id = after
+            conditions.append(
+                tuple_(TaskModel.due_date, TaskModel.id)
+                > tuple_(literal(due_date), literal(task_id))
+            )
+
+        result = await self.session.execute(
+            TaskModel.__table__.select()
+            .where(*conditions)
+            .order_by(TaskModel.due_date, TaskModel.id)
+            .limit(limit)
+        )
+        return [self._model_to_entity(TaskModel(**row._mapping)) for row in result.fetchall()]
+
     async def get_task_metrics(self, repository_id: int | None = None) -> dict:
         """Get task metrics and statistics."""
         base_query = TaskModel.__table__.select()
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -36,6 +38,12 @@ class UserRepositoryImpl(UserRepository):
         db_user = result.scalar_one_or_none()
         return self._to_entity(db_user) if db_user else None
 
+    async def get_many_by_ids(self, user_ids: Iterable[int]) -> list[User]:
+        """Get the users with the given IDs"""
+        stmt = select(UserModel).where(UserModel.id.in_(set(user_ids)))
+        result = await self.session.execute(stmt)
+        return [self._to_entity(db_user) for db_user in result.scalars().all()]
+
     async def get_by_username(self, username: str) -> User | None:
         """Get user by username"""
         stmt = select(UserModel).where(UserModel.username == username)
@@ -0,0 +1,168 @@
+"""
+Set-based bulk review writes.
+
+Approving or assigning a release branch touches hundreds of commits. Instead
+of a lookup and an update per commit, each operation here is one statement
+over the whole set of requested commit IDs: an ``UPDATE ... FROM unnest(...)
+RETURNING`` (or ``INSERT ... SELECT``) on PostgreSQL, an ``IN`` list
+elsewhere. The returned rows tell which commits were touched, the review
+summary is refreshed and the reviewer rollup moved for them in the same
+transaction, and the caller gets an outcome for every requested commit.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import ColumnElement, Integer, TableValuedAlias, func, literal, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.domain.repositories.commit_repository import BulkReviewOutcome
+from haven.infrastructure.database.models import CommitModel, CommitReviewModel
+from haven.infrastructure.database.review_stats import (
+    COMPLETED_STATUSES,
+    apply_reviewer_stats,
+    review_stats_columns,
+    reviewer_stats_rows,
+)
+from haven.infrastructure.database.review_summary import refresh_review_summary
+
+
+def _requested_ids(ids: list[int]) -> TableValuedAlias:
+    """The requested commit IDs as a one-column ``unnest`` table."""
+    # Derived column list, so the alias renders as anon_1(commit_id)
+    return (
+        func.unnest(literal(ids, postgresql.ARRAY(Integer)))
+        .table_valued("commit_id")
+        .render_derived()
+    )
+
+
+def _matches_requested(
+    dialect: str, column: ColumnElement[int], ids: list[int]
+) -> ColumnElement[bool]:
+    """Condition restricting ``column`` to the requested commit IDs."""
+    if dialect == "postgresql":
+        # One array parameter whatever the batch size, joined as UPDATE ... FROM
+        return column == _requested_ids(ids).c.commit_id
+    return column.in_(ids)
+
+
+async def bulk_update_review_status(
+    session: AsyncSession,
+    commit_ids: Iterable[int],
+    reviewer_id: int,
+    status: str,
+    notes: str | None = None,
+) -> dict[int, BulkReviewOutcome]:
+    """
+    Set the status of a reviewer's reviews on many commits in one statement.
+
+    Completing statuses also stamp ``reviewed_at``. Runs in the caller's
+    transaction.
+
+    Args:
+        session: Database session (the caller commits)
+        commit_ids: Commits whose reviews to update
+        reviewer_id: Reviewer owning the reviews
+        status: New review status value
+        notes: Replace the review notes when given
+
+    Returns:
+        Outcome per requested commit, in request order
+    """
+    ids = list(dict.fromkeys(commit_ids))
+    if not ids:
+        return {}
+
+    values: dict = {"status": status, "updated_at": func.now()}
+    if status in COMPLETED_STATUSES:
+        values["reviewed_at"] = func.now()
+    if notes is not None:
+        values["notes"] = notes
+
+    dialect = session.get_bind().dialect.name
+    requested = (
+        CommitReviewModel.reviewer_id == reviewer_id,
+        _matches_requested(dialect, CommitReviewModel.commit_id, ids),
+    )
+    removed = await reviewer_stats_rows(session, *requested, lock=True)
+    stmt = (
+        update(CommitReviewModel)
+        .where(*requested)
+        .values(**values)
+        .returning(CommitReviewModel.commit_id, *review_stats_columns(dialect))
+        .execution_options(synchronize_session=False)
+    )
+    added = (await session.execute(stmt)).all()
+    updated = {row.commit_id for row in added}
+
+    if updated:
+        await refresh_review_summary(session, updated)
+        await apply_reviewer_stats(session, removed, added)
+    return {
+        commit_id: (
+            BulkReviewOutcome.UPDATED if commit_id in updated else BulkReviewOutcome.NO_REVIEW
+        )
+        for commit_id in ids
+    }
+
+
+async def bulk_assign_reviewer(
+    session: AsyncSession, commit_ids: Iterable[int], reviewer_id: int, status: str
+) -> dict[int, BulkReviewOutcome]:
+    """
+    Create a review in ``status`` for a reviewer on many commits in one statement.
+
+    Commits the reviewer already has a review on are left alone. Runs in the
+    caller's transaction.
+
+    Args:
+        session: Database session (the caller commits)
+        commit_ids: Commits to assign
+        reviewer_id: Reviewer to assign
+        status: Status of the created reviews
+
+    Returns:
+        Outcome per requested commit, in request order
+    """
+    ids = list(dict.fromkeys(commit_ids))
+    if not ids:
+        return {}
+
+    dialect = session.get_bind().dialect.name
+    already_reviewed = (
+        select(CommitReviewModel.id)
+        .where(
+            CommitReviewModel.commit_id == CommitModel.id,
+            CommitReviewModel.reviewer_id == reviewer_id,
+        )
+        .exists()
+    )
+    existing = await session.execute(
+        select(CommitModel.id).where(_matches_requested(dialect, CommitModel.id, ids))
+    )
+    found = set(existing.scalars().all())
+
+    rows = select(CommitModel.id, literal(reviewer_id), literal(status)).where(
+        _matches_requested(dialect, CommitModel.id, ids), ~already_reviewed
+    )
+    result = await session.execute(
+        CommitReviewModel.__table__.insert()
+        .from_select(["commit_id", "reviewer_id", "status"], rows)
+        .returning(CommitReviewModel.commit_id, *review_stats_columns(dialect))
+    )
+    added = result.all()
+    assigned = {row.commit_id for row in added}
+
+    if assigned:
+        await refresh_review_summary(session, assigned)
+        await apply_reviewer_stats(session, added=added)
+
+    def outcome(commit_id: int) -> BulkReviewOutcome:
+        if commit_id in assigned:
+            return BulkReviewOutcome.ASSIGNED
+        if commit_id in found:
+            return BulkReviewOutcome.ALREADY_ASSIGNED
+        return BulkReviewOutcome.COMMIT_NOT_FOUND
+
+    return {commit_id: outcome(commit_id) for commit_id in ids}
@@ -0,0 +1,268 @@
+"""
+Review statistics computed in one aggregate pass over ``commit_reviews``.
+
+Status counts, the average review time and review time percentiles come from
+a single ``SELECT`` with ``count(*) FILTER (WHERE ...)`` columns, optionally
+grouped by reviewer so a dashboard over every reviewer is one query.
+Percentiles need ``percentile_cont`` and are only computed on PostgreSQL.
+
+The ``reviewer_review_stats`` rollup stores per-reviewer counters: review
+counts and the running total of review times the average is derived from.
+Review writes move the counters of the touched reviewer by the reviews they
+changed instead of re-aggregating, so readers that opt into the rollup skip
+the aggregation entirely. Percentiles cannot be maintained that way and are
+left to ``stats_query``. Reviews removed behind the repositories' back (a
+commit deleted with its reviews) drift the rollup until
+``rebuild_reviewer_stats`` runs.
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    null,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.domain.entities.review_comment import CommitReview
+from haven.infrastructure.database.models import (
+    CommitReviewModel,
+    ReviewerStatsModel,
+)
+
+STATUSES = tuple(CommitReview.ReviewStatus.all_values())
+COMPLETED_STATUSES = (CommitReview.ReviewStatus.APPROVED, CommitReview.ReviewStatus.NEEDS_REVISION)
+# Review time percentiles reported alongside the average
+PERCENTILES = {"p50": 0.5, "p90": 0.9}
+
+# Rollup columns moved by each review write
+COUNTERS = (
+    "review_count",
+    *(f"{status}_count" for status in STATUSES),
+    "completed_count",
+    "total_review_seconds",
+)
+ROLLUP_COLUMNS = (*COUNTERS, "avg_review_seconds")
+
+
+def review_seconds(dialect: str) -> ColumnElement[float]:
+    """Seconds from a review's creation until it was completed."""
+    if dialect == "postgresql":
+        return func.extract("epoch", CommitReviewModel.reviewed_at - CommitReviewModel.created_at)
+    return (
+        func.julianday(CommitReviewModel.reviewed_at) - func.julianday(CommitReviewModel.created_at)
+    ) * 86400
+
+
+def stats_query(
+    dialect: str, reviewer_ids: Iterable[int] | None = None, by_reviewer: bool = False
+) -> Select:
+    """
+    Build the single-pass statistics query.
+
+    Args:
+        dialect: Name of the database dialect in use
+        reviewer_ids: Only aggregate reviews by these reviewers
+        by_reviewer: Return one row per reviewer instead of one overall row
+
+    Returns:
+        SELECT with the ``ROLLUP_COLUMNS`` and percentile columns (plus
+        ``reviewer_id`` first when grouped)
+    """
+    status = CommitReviewModel.status
+    completed = _completed()
+    seconds = review_seconds(dialect)
+
+    columns: list[ColumnElement] = [func.count().label("review_count")]
+    columns.extend(
+        func.count().filter(status == value).label(f"{value}_count") for value in STATUSES
+    )
+    columns.append(func.count().filter(completed).label("completed_count"))
+    columns.append(
+        func.coalesce(func.sum(seconds).filter(completed), 0).label("total_review_seconds")
+    )
+    columns.append(func.avg(seconds).filter(completed).label("avg_review_seconds"))
+    for name, fraction in PERCENTILES.items():
+        if dialect == "postgresql":
+            percentile = func.percentile_cont(fraction).within_group(seconds).filter(completed)
+        else:
+            percentile = null()
+        columns.append(percentile.label(f"{name}_review_seconds"))
+
+    if by_reviewer:
+        stmt = select(CommitReviewModel.reviewer_id, *columns).group_by(
+            CommitReviewModel.reviewer_id
+        )
+    else:
+        stmt = select(*columns)
+    if reviewer_ids is not None:
+        stmt = stmt.where(CommitReviewModel.reviewer_id.in_(sorted(set(reviewer_ids))))
+    return stmt
+
+
+def stats_from_row(row: Any) -> dict:
+    """Convert a ``stats_query`` or rollup row into the review statistics dict."""
+    status_counts = {status: getattr(row, f"{status}_count") or 0 for status in STATUSES}
+    avg_seconds = row.avg_review_seconds or 0
+    return {
+        "status_counts": status_counts,
+        "total_reviews": sum(status_counts.values()),
+        "avg_review_time_seconds": avg_seconds,
+        "avg_review_time_hours": avg_seconds / 3600,
+        # Rollup rows leave percentiles to stats_query
+        **{
+            f"{name}_review_time_seconds": getattr(row, f"{name}_review_seconds", None)
+            for name in PERCENTILES
+        },
+    }
+
+
+def review_stats_columns(dialect: str) -> tuple[ColumnElement, ...]:
+    """Columns of a review that its share of the rollup is computed from."""
+    return (
+        CommitReviewModel.reviewer_id,
+        CommitReviewModel.status,
+        case((_completed(), review_seconds(dialect)), else_=null()).label("completed_seconds"),
+    )
+
+
+async def reviewer_stats_rows(
+    session: AsyncSession, *conditions: ColumnElement[bool], lock: bool = False
+) -> list[Row]:
+    """
+    Select ``review_stats_columns`` of the reviews matching ``conditions``.
+
+    Args:
+        session: Database session
+        conditions: WHERE clauses on ``commit_reviews``
+        lock: Lock the reviews until the transaction ends, for reading their
+            state before changing them
+    """
+    stmt = select(*review_stats_columns(session.get_bind().dialect.name)).where(*conditions)
+    if lock:
+        stmt = stmt.with_for_update(of=CommitReviewModel)
+    result = await session.execute(stmt)
+    return list(result.all())
+
+
+async def apply_reviewer_stats(
+    session: AsyncSession, removed: Iterable[Row] = (), added: Iterable[Row] = ()
+) -> None:
+    """
+    Move the rollup rows of reviewers by the reviews a write changed.
+
+    ``removed`` and ``added`` are ``review_stats_columns`` rows holding the
+    state of the changed reviews before and after the write. Runs in the
+    caller's transaction and costs as much as the number of changed reviews.
+    Reviewers left without reviews lose their row.
+    """
+    deltas: dict[int, dict[str, float]] = {}
+    for sign, rows in ((-1, removed), (1, added)):
+        for row in rows:
+            delta = deltas.setdefault(row.reviewer_id, dict.fromkeys(COUNTERS, 0))
+            delta["review_count"] += sign
+            if f"{row.status}_count" in delta:
+                delta[f"{row.status}_count"] += sign
+            if row.completed_seconds is not None:
+                delta["completed_count"] += sign
+                delta["total_review_seconds"] += sign * float(row.completed_seconds)
+    deltas = {reviewer_id: delta for reviewer_id, delta in deltas.items() if any(delta.values())}
+    if not deltas:
+        return
+
+    table = ReviewerStatsModel.__table__
+    dialect = session.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        # Sorted, so concurrent writes lock reviewer rows in the same order
+        upsert = dialect_insert(ReviewerStatsModel).values(
+            [
+                {"reviewer_id": reviewer_id, **delta, "avg_review_seconds": _average(delta)}
+                for reviewer_id, delta in sorted(deltas.items())
+            ]
+        )
+        completed = table.c.completed_count + upsert.excluded.completed_count
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["reviewer_id"],
+            set_={
+                **{name: table.c[name] + upsert.excluded[name] for name in COUNTERS},
+                "avg_review_seconds": (
+                    table.c.total_review_seconds + upsert.excluded.total_review_seconds
+                )
+                / func.nullif(completed, 0),
+                "updated_at": func.now(),
+            },
+        )
+        await session.execute(upsert)
+    else:
+        for reviewer_id, delta in sorted(deltas.items()):
+            completed = table.c.completed_count + delta["completed_count"]
+            result = await session.execute(
+                update(ReviewerStatsModel)
+                .where(ReviewerStatsModel.reviewer_id == reviewer_id)
+                .values(
+                    **{name: table.c[name] + delta[name] for name in COUNTERS},
+                    avg_review_seconds=(
+                        table.c.total_review_seconds + delta["total_review_seconds"]
+                    )
+                    / func.nullif(completed, 0),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if not result.rowcount:
+                await session.execute(
+                    insert(ReviewerStatsModel).values(
+                        reviewer_id=reviewer_id, **delta, avg_review_seconds=_average(delta)
+                    )
+                )
+
+    await session.execute(
+        delete(ReviewerStatsModel)
+        .where(
+            ReviewerStatsModel.reviewer_id.in_(sorted(deltas)),
+            ReviewerStatsModel.review_count <= 0,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _completed() -> ColumnElement[bool]:
+    """Condition matching reviews that count towards review times."""
+    return and_(
+        CommitReviewModel.status.in_(COMPLETED_STATUSES),
+        CommitReviewModel.reviewed_at.is_not(None),
+    )
+
+
+def _average(delta: Mapping[str, float]) -> float | None:
+    """Average review time of a new rollup row."""
+    if delta["completed_count"] <= 0:
+        return None
+    return delta["total_review_seconds"] / delta["completed_count"]
+
+
+async def rebuild_reviewer_stats(session: AsyncSession) -> int:
+    """
+    Recompute the whole rollup from ``commit_reviews``.
+
+    Returns:
+        Number of reviewer rows written
+    """
+    stats = stats_query(session.get_bind().dialect.name, by_reviewer=True).subquery()
+    rows = select(stats.c.reviewer_id, *(stats.c[name] for name in ROLLUP_COLUMNS))
+    await session.execute(delete(ReviewerStatsModel).execution_options(synchronize_session=False))
+    result = await session.execute(
+        insert(ReviewerStatsModel).from_select(["reviewer_id", *ROLLUP_COLUMNS], rows)
+    )
+    return result.rowcount
@@ -0,0 +1,135 @@
+"""
+Maintenance of the ``commit_review_summary`` projection.
+
+The review repositories call ``refresh_review_summary`` after every write to
+``commit_reviews`` so the summary row changes in the same transaction as the
+review. ``rebuild_review_summaries`` recomputes the table from scratch for
+backfills and repairs (``haven-cli reviews rebuild-summary``).
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import ColumnElement, Select, delete, exists, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.infrastructure.database.models import (
+    CommitModel,
+    CommitReviewModel,
+    CommitReviewSummaryModel,
+)
+
+# Latest statuses that leave a commit waiting on its reviewer ("pending_review" is
+# written by the commit review API, "pending" by the review workflow API)
+PENDING_STATUSES = ("pending_review", "pending")
+
+_COLUMNS = (
+    "commit_id",
+    "repository_id",
+    "committed_at",
+    "latest_status",
+    "review_count",
+    "last_reviewed_at",
+    "is_pending",
+)
+
+
+def _summary_rows(*conditions: ColumnElement[bool]) -> Select:
+    """Summary rows computed from ``commit_reviews`` for the matching reviewed commits."""
+    reviews = select(CommitReviewModel).where(CommitReviewModel.commit_id == CommitModel.id)
+    computed = (
+        select(
+            CommitModel.id.label("commit_id"),
+            CommitModel.repository_id,
+            CommitModel.committed_at,
+            reviews.with_only_columns(CommitReviewModel.status)
+            .order_by(CommitReviewModel.created_at.desc(), CommitReviewModel.id.desc())
+            .limit(1)
+            .scalar_subquery()
+            .label("latest_status"),
+            reviews.with_only_columns(func.count()).scalar_subquery().label("review_count"),
+            reviews.with_only_columns(func.max(CommitReviewModel.reviewed_at))
+            .scalar_subquery()
+            .label("last_reviewed_at"),
+        )
+        .where(*conditions)
+        .subquery()
+    )
+    # The WHERE also keeps SQLite from parsing a following ON CONFLICT as a join clause
+    return select(
+        *(computed.c[name] for name in _COLUMNS[:-1]),
+        computed.c.latest_status.in_(PENDING_STATUSES),
+    ).where(computed.c.review_count > 0)
+
+
+async def refresh_review_summary(session: AsyncSession, commit_ids: Iterable[int]) -> None:
+    """
+    Recompute the summary rows of commits whose reviews changed.
+
+    Commits left without reviews lose their summary row. Runs in the caller's
+    transaction, so the projection commits or rolls back with the review write.
+
+    Args:
+        session: Session holding the review write
+        commit_ids: Commits whose reviews were created, updated or deleted
+    """
+    ids = sorted(set(commit_ids))
+    if not ids:
+        return
+
+    # Concurrent review writes on a commit take turns: the later refresh waits
+    # here until the earlier transaction commits, then sees both reviews. NO KEY
+    # UPDATE does not conflict with the key-share locks the review inserts hold.
+    await session.execute(
+        select(CommitModel.id)
+        .where(CommitModel.id.in_(ids))
+        .order_by(CommitModel.id)
+        .with_for_update(key_share=True)
+    )
+
+    rows = _summary_rows(CommitModel.id.in_(ids))
+    stale = delete(CommitReviewSummaryModel).where(CommitReviewSummaryModel.commit_id.in_(ids))
+    dialect = session.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        upsert = dialect_insert(CommitReviewSummaryModel).from_select(_COLUMNS, rows)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["commit_id"],
+            set_={
+                **{name: upsert.excluded[name] for name in _COLUMNS[1:]},
+                "updated_at": func.now(),
+            },
+        )
+        await session.execute(upsert)
+        stale = stale.where(
+            ~exists().where(CommitReviewModel.commit_id == CommitReviewSummaryModel.commit_id)
+        )
+        await session.execute(stale.execution_options(synchronize_session=False))
+        return
+
+    await session.execute(stale.execution_options(synchronize_session=False))
+    await session.execute(insert(CommitReviewSummaryModel).from_select(_COLUMNS, rows))
+
+
+async def rebuild_review_summaries(session: AsyncSession, repository_id: int | None = None) -> int:
+    """
+    Recompute the summary table from ``commit_reviews``.
+
+    Args:
+        session: Database session (the caller commits)
+        repository_id: Only rebuild this repository's commits
+
+    Returns:
+        Number of summary rows written
+    """
+    clear = delete(CommitReviewSummaryModel)
+    conditions = [exists().where(CommitReviewModel.commit_id == CommitModel.id)]
+    if repository_id is not None:
+        clear = clear.where(CommitReviewSummaryModel.repository_id == repository_id)
+        conditions.append(CommitModel.repository_id == repository_id)
+
+    await session.execute(clear.execution_options(synchronize_session=False))
+    result = await session.execute(
+        insert(CommitReviewSummaryModel).from_select(_COLUMNS, _summary_rows(*conditions))
+    )
+    return result.rowcount
@@ -0,0 +1,90 @@
+"""
+Read-replica routing for read-only sessions.
+
+Read-only units of work and ``get_read_db`` sessions send plain SELECTs to
+the replica engine and everything else (flushes, DML, ``SELECT ... FOR
+UPDATE``, raw SQL) to the primary. Once a session has written, it stays on
+the primary so it reads its own writes.
+
+Stickiness also spans sessions: inside ``request_routing()`` (entered by the
+API middleware for every request), a write through any routing session pins
+the rest of the request, including sessions opened later, to the primary.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import CompoundSelect, Engine, Select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+
+@dataclass
+class RequestRouting:
+    """Routing state shared by the sessions of one request."""
+
+    wrote: bool = False
+
+
+_request_routing: ContextVar[RequestRouting | None] = ContextVar("request_routing", default=None)
+
+
+@contextmanager
+def request_routing() -> Iterator[RequestRouting]:
+    """Scope read-your-writes stickiness to a request."""
+    state = RequestRouting()
+    token = _request_routing.set(state)
+    try:
+        yield state
+    finally:
+        _request_routing.reset(token)
+
+
+def _is_plain_read(clause: Any) -> bool:
+    """Whether a statement can be served by a replica."""
+    if isinstance(clause, Select):
+        return clause._for_update_arg is None
+    return isinstance(clause, CompoundSelect)
+
+
+class RoutingSession(Session):
+    """Session that reads from a replica until it writes."""
+
+    def __init__(self, primary: Engine, replica: Engine, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = replica
+        self.wrote = False
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        request = _request_routing.get()
+        if self.wrote or (request is not None and request.wrote):
+            return self.primary
+        if not self._flushing and _is_plain_read(clause):
+            return self.replica
+        if clause is None and mapper is None and not self._flushing:
+            # A bare get_bind() looks up the dialect; it does not execute anything
+            return self.primary
+
+        self.wrote = True
+        if request is not None:
+            request.wrote = True
+        return self.primary
+
+
+def create_routing_session_factory(
+    primary: AsyncEngine, replica: AsyncEngine
+) -> async_sessionmaker[AsyncSession]:
+    """Create a session factory routing reads to ``replica``."""
+    return async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        primary=primary.sync_engine,
+        replica=replica.sync_engine,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
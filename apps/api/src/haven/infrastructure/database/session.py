@@ -3,28 +3,7 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from sqlalchemy.ext.asyncio import (
-    AsyncEngine,
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
-
-from haven.config import get_settings
-
-
-def create_engine() -> AsyncEngine:
-    """Create async SQLAlchemy engine."""
-    settings = get_settings()
-
-    return create_async_engine(
-        settings.database.dsn,
-        echo=settings.app.debug,
-        pool_size=settings.database.pool.size,
-        max_overflow=settings.database.pool.max_overflow,
-        pool_timeout=settings.database.pool.timeout,
-        pool_recycle=settings.database.pool.recycle,
-    )
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 
 def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
@@ -39,12 +18,16 @@ def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSessi
 
 
 @asynccontextmanager
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session context manager."""
-    engine = create_engine()
-    async_session = create_session_factory(engine)
+async def get_db_session(purpose: str = "api") -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get a database session that commits on success and rolls back on error.
+
+    Sessions come from the process-wide engine registry, so repeated calls
+    reuse pooled connections.
+    """
+    from haven.infrastructure.database.engines import engine_registry
 
-    async with async_session() as session:
+    async with engine_registry.session_factory(purpose)() as session:
         try:
             yield session
             await session.commit()
@@ -53,5 +36,3 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
-
-    await engine.dispose()
@@ -21,6 +21,11 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
         self._session = session
         self._transaction: AsyncSessionTransaction | None = None
 
+    @property
+    def session(self) -> AsyncSession:
+        """Session for repositories taking part in this unit of work."""
+        return self._session
+
     async def __aenter__(self) -> "SQLAlchemyUnitOfWork":
         """Enter the unit of work context."""
         # Check if a transaction is already active
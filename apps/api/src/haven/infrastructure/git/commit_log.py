@@ -0,0 +1,195 @@
+"""Streaming commit metadata extraction from a single ``git log`` process."""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+# Each record starts with an empty field, then these fields, all NUL separated.
+# Combined with `git log -z` this yields a flat NUL-delimited token stream in which
+# an empty token outside the fixed metadata fields marks the start of a record.
+_FIELDS = ("%H", "%h", "%an", "%ae", "%aI", "%cn", "%ce", "%ct", "%s")
+LOG_FORMAT = "%x00" + "%x00".join(_FIELDS)
+
+
+@dataclass(frozen=True)
+class CommitMetadata:
+    """Metadata for a single commit as reported by ``git log``."""
+
+    hash: str
+    short_hash: str
+    author_name: str
+    author_email: str
+    authored_at: datetime
+    committer_name: str
+    committer_email: str
+    committed_at: datetime
+    subject: str
+    files_changed: int = 0
+    insertions: int = 0
+    deletions: int = 0
+
+    @property
+    def date(self) -> str:
+        """Author date as YYYY-MM-DD in the author's timezone (``--date=short``)."""
+        return self.authored_at.date().isoformat()
+
+
+class CommitLogParser:
+    """Incremental parser for ``git log -z --format=LOG_FORMAT [--numstat]`` output."""
+
+    def __init__(self) -> None:
+        """Initialize parser state."""
+        self._buffer = b""
+        self._fields: list[str] = []
+        self._numstat: list[str] = []
+        self._in_record = False
+
+    def feed(self, data: bytes) -> list[CommitMetadata]:
+        """
+        Consume a chunk of output.
+
+        Returns:
+            Commits completed by this chunk
+        """
+        self._buffer += data
+        *tokens, self._buffer = self._buffer.split(b"\0")
+        return self._consume(tokens)
+
+    def finish(self) -> list[CommitMetadata]:
+        """Flush the final record once the stream has ended."""
+        tokens = [self._buffer] if self._buffer else []
+        self._buffer = b""
+        completed = self._consume(tokens)
+        if self._in_record and len(self._fields) == len(_FIELDS):
+            completed.append(self._build())
+        self._in_record = False
+        return completed
+
+    def _consume(self, tokens: list[bytes]) -> list[CommitMetadata]:
+        """Advance the state machine over complete tokens."""
+        completed = []
+        for raw in tokens:
+            token = raw.decode("utf-8", "replace")
+            if self._in_record and len(self._fields) < len(_FIELDS):
+                self._fields.append(token)
+            elif token == "":
+                if self._in_record:
+                    completed.append(self._build())
+                self._in_record = True
+                self._fields = []
+                self._numstat = []
+            elif self._in_record:
+                self._numstat.append(token)
+        return completed
+
+    def _build(self) -> CommitMetadata:
+        """Create a commit from the collected fields and numstat tokens."""
+        (
+            commit_hash,
+            short_hash,
+            author_name,
+            author_email,
+            authored_at,
+            committer_name,
+            committer_email,
+            committed_ts,
+            subject,
+        ) = self._fields
+
+        files_changed = insertions = deletions = 0
+        for entry in self._numstat:
+            # Renames emit "added\tdeleted\t" followed by old and new path tokens
+            parts = entry.lstrip("\n").split("\t")
+            if len(parts) < 3:
+                continue
+            files_changed += 1
+            if parts[0] != "-":
+                insertions += int(parts[0])
+            if parts[1] != "-":
+                deletions += int(parts[1])
+
+        return CommitMetadata(
+            hash=commit_hash,
+            short_hash=short_hash,
+            author_name=author_name,
+            author_email=author_email,
+            authored_at=datetime.fromisoformat(authored_at),
+            committer_name=committer_name,
+            committer_email=committer_email,
+            committed_at=datetime.fromtimestamp(int(committed_ts), tz=UTC),
+            subject=subject,
+            files_changed=files_changed,
+            insertions=insertions,
+            deletions=deletions,
+        )
+
+
+async def iter_commit_log(
+    repo_path: str | None,
+    revision: str = "HEAD",
+    *,
+    max_count: int | None = None,
+    reverse: bool = False,
+    since: datetime | None = None,
+    numstat: bool = False,
+    chunk_size: int = 64 * 1024,
+) -> AsyncIterator[CommitMetadata]:
+    """
+    Stream commits from one ``git log`` invocation.
+
+    Args:
+        repo_path: Repository working directory (None for the current directory)
+        revision: Revision or range, e.g. ``HEAD`` or ``main..feature``
+        max_count: Maximum number of commits (applied before ``reverse``, as in git)
+        reverse: Yield oldest commits first
+        since: Only include commits more recent than this date
+        numstat: Include per-commit file/insertion/deletion counts
+        chunk_size: Bytes read from the pipe per iteration
+
+    Yields:
+        CommitMetadata objects as soon as each record is complete
+
+    Raises:
+        RuntimeError: If git exits with a non-zero status
+    """
+    cmd = ["git", "log", "-z", f"--format={LOG_FORMAT}"]
+    if numstat:
+        cmd.append("--numstat")
+    if max_count is not None:
+        cmd.append(f"--max-count={max_count}")
+    if reverse:
+        cmd.append("--reverse")
+    if since is not None:
+        cmd.append(f"--since={since.isoformat()}")
+    cmd.extend([revision, "--"])
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=repo_path,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    assert process.stdout is not None and process.stderr is not None
+    stderr_task = asyncio.create_task(process.stderr.read())
+
+    parser = CommitLogParser()
+    try:
+        while chunk := await process.stdout.read(chunk_size):
+            for commit in parser.feed(chunk):
+                yield commit
+        for commit in parser.finish():
+            yield commit
+
+        stderr = await stderr_task
+        if await process.wait() != 0:
+            raise RuntimeError(f"git log failed: {stderr.decode().strip()}")
+    finally:
+        if process.returncode is None:
+            # Consumer stopped early; don't leave git running
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+            await process.wait()
+        if not stderr_task.done():
+            stderr_task.cancel()
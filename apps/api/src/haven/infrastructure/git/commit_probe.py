@@ -0,0 +1,117 @@
+"""
+Locate commits that are not in the database yet by probing repository clones.
+
+A global hash lookup that misses the ``commits`` table asks every clone
+whether it has the object, with a bounded number of repositories probed at
+once. Each probe is a short-lived ``git rev-parse`` rather than a pooled
+``cat-file`` worker: a miss touches every clone once, and a pooled worker per
+clone would then sit idle until the pool's timeout. Hashes found nowhere are
+remembered for a while, so repeated lookups of an unknown hash cost a
+database query and no git work.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+
+from haven.domain.entities.repository import Repository
+
+# Repositories probed concurrently for one lookup
+DEFAULT_PROBE_CONCURRENCY = 16
+# How long a hash found in no repository is reported missing without probing
+DEFAULT_MISS_TTL = 60.0
+DEFAULT_MISS_CACHE_SIZE = 4096
+
+
+class MissCache:
+    """Commit hashes recently found in no repository."""
+
+    def __init__(self, ttl: float = DEFAULT_MISS_TTL, size: int = DEFAULT_MISS_CACHE_SIZE):
+        self.ttl = ttl
+        self.size = size
+        self._expiry: OrderedDict[str, float] = OrderedDict()
+
+    def __contains__(self, commit_hash: str) -> bool:
+        expires_at = self._expiry.get(commit_hash)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._expiry[commit_hash]
+            return False
+        return True
+
+    def add(self, commit_hash: str) -> None:
+        """Remember that ``commit_hash`` was found nowhere."""
+        if self.ttl <= 0:
+            return
+        self._expiry[commit_hash] = time.monotonic() + self.ttl
+        self._expiry.move_to_end(commit_hash)
+        while len(self._expiry) > self.size:
+            self._expiry.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget all misses."""
+        self._expiry.clear()
+
+
+async def resolve_commit(repo_path: str, commit_hash: str) -> str | None:
+    """
+    Full hash of a commit in a clone, or None.
+
+    A prefix that is ambiguous within the clone, an object that is not a
+    commit and a path that is not a git repository all count as a miss.
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            "rev-parse",
+            "--verify",
+            "--quiet",
+            f"{commit_hash}^{{commit}}",
+            cwd=repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        # git is unavailable
+        return None
+    stdout, _ = await process.communicate()
+    oid = stdout.decode().strip()
+    return oid if process.returncode == 0 and oid else None
+
+
+async def probe_repositories(
+    repositories: Iterable[Repository],
+    commit_hash: str,
+    max_concurrent: int = DEFAULT_PROBE_CONCURRENCY,
+) -> tuple[Repository, str] | None:
+    """
+    Find a repository clone containing a commit.
+
+    Args:
+        repositories: Repositories to probe, in order of preference
+        commit_hash: Full or abbreviated commit hash
+        max_concurrent: Maximum number of git processes running at once
+
+    Returns:
+        The first repository (in the given order) holding the commit and the
+        commit's full hash, or None
+    """
+    candidates = [repository for repository in repositories if Path(repository.url).is_dir()]
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def probe(repository: Repository) -> str | None:
+        async with semaphore:
+            return await resolve_commit(repository.url, commit_hash)
+
+    found = await asyncio.gather(*(probe(repository) for repository in candidates))
+    for repository, oid in zip(candidates, found, strict=True):
+        if oid is not None:
+            return repository, oid
+    return None
+
+
+# Global miss cache instance
+missing_commits = MissCache()
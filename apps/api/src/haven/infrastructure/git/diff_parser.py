@@ -0,0 +1,255 @@
+"""In-process unified diff parser producing diff2html-compatible JSON structures."""
+
+import re
+import sys
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+_HUNK_HEADER = re.compile(r"^(@{2,}) ((?:-\d+(?:,\d+)? )+)\+(\d+)(?:,(\d+))? @{2,}")
+_INDEX_LINE = re.compile(r"^index ([0-9a-z,]+)\.\.([0-9a-z]+)(?: (\d+))?")
+_TIMESTAMP_SUFFIX = re.compile(r"\s+\d{4}-\d\d-\d\d\s+\d\d:\d\d:\d\d(?:\.\d+)?\s+[+-]\d{4}.*$")
+_PATH_PREFIXES = ("a/", "b/", "i/", "w/", "c/", "o/")
+_ESCAPES = {"a": 7, "b": 8, "t": 9, "n": 10, "v": 11, "f": 12, "r": 13, '"': 34, "\\": 92}
+
+DiffFile = dict[str, Any]
+
+
+class DiffParseError(ValueError):
+    """Raised when diff content cannot be parsed."""
+
+
+def _unquote(path: str) -> str:
+    """Decode a C-style quoted path as emitted by git for unusual characters."""
+    if len(path) < 2 or not (path.startswith('"') and path.endswith('"')):
+        return path
+    raw = bytearray()
+    body = path[1:-1]
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char != "\\" or i + 1 == len(body):
+            raw.extend(char.encode())
+            i += 1
+        elif body[i + 1] in _ESCAPES:
+            raw.append(_ESCAPES[body[i + 1]])
+            i += 2
+        else:
+            raw.append(int(body[i + 1 : i + 4], 8))
+            i += 4
+    return raw.decode("utf-8", "replace")
+
+
+def _clean_filename(value: str) -> str:
+    """Strip quoting, a/ b/ prefixes and trailing timestamps from a header path."""
+    filename = _unquote(value.split("\t", 1)[0].strip())
+    for prefix in _PATH_PREFIXES:
+        if filename.startswith(prefix):
+            filename = filename[len(prefix) :]
+            break
+    return _TIMESTAMP_SUFFIX.sub("", filename)
+
+
+def _split_git_header(value: str) -> tuple[str, str] | None:
+    """Split the ``a/old b/new`` part of a ``diff --git`` line."""
+    if value.startswith('"'):
+        end = value.find('" ', 1)
+        while end != -1 and value[end - 1] == "\\":
+            end = value.find('" ', end + 1)
+        if end == -1:
+            return None
+        return _clean_filename(value[: end + 1]), _clean_filename(value[end + 2 :])
+    # Unquoted paths: both sides are the same length when the file is not renamed
+    if value.startswith("a/") and " b/" in value:
+        middle = len(value) // 2
+        if value[middle] == " " and value[middle + 1 :].startswith("b/"):
+            return _clean_filename(value[:middle]), _clean_filename(value[middle + 1 :])
+        old, new = value.split(" b/", 1)
+        return _clean_filename(old), new
+    return None
+
+
+def _language(file: DiffFile) -> str:
+    """Guess the highlighting language from the file extension."""
+    name = file.get("newName") or file.get("oldName") or ""
+    if name == "/dev/null":
+        name = file.get("oldName") or ""
+    parts = name.rsplit("/", 1)[-1].split(".")
+    return parts[-1] if len(parts) > 1 else ""
+
+
+def iter_diff_files(lines: Iterable[str]) -> Iterator[DiffFile]:
+    """
+    Parse unified (and combined) diff lines into diff2html-shaped file dicts.
+
+    Each file is yielded as soon as the next file header is seen, so arbitrarily
+    large diffs can be processed line by line.
+
+    Args:
+        lines: Diff lines without trailing newlines
+
+    Yields:
+        Dicts with ``blocks``, ``addedLines``, ``deletedLines``, names and mode info
+    """
+    file: DiffFile | None = None
+    block: dict[str, Any] | None = None
+    old_line = new_line = 0
+    old_remaining = new_remaining = 0
+    prefix_width = 1
+
+    def finish() -> DiffFile | None:
+        if file is None:
+            return None
+        if not file.get("oldName") and not file.get("newName"):
+            return None
+        file.setdefault("oldName", file.get("newName"))
+        file.setdefault("newName", file.get("oldName"))
+        file["language"] = _language(file)
+        return file
+
+    def start_file(is_git: bool, is_combined: bool = False) -> DiffFile:
+        return {
+            "blocks": [],
+            "deletedLines": 0,
+            "addedLines": 0,
+            "isCombined": is_combined,
+            "isGitDiff": is_git,
+        }
+
+    for line in lines:
+        if line.startswith(("diff --git ", "diff --cc ", "diff --combined ")):
+            if (done := finish()) is not None:
+                yield done
+            block = None
+            if line.startswith("diff --git "):
+                file = start_file(is_git=True)
+                names = _split_git_header(line[len("diff --git ") :])
+                if names is not None:
+                    file["oldName"], file["newName"] = names
+            else:
+                file = start_file(is_git=True, is_combined=True)
+                file["oldName"] = file["newName"] = _clean_filename(line.split(" ", 2)[2])
+            continue
+
+        if block is not None and (old_remaining > 0 or new_remaining > 0) and line[:1] in " +-":
+            markers = line[:prefix_width]
+            entry: dict[str, Any] = {"content": line}
+            if "-" in markers:
+                entry["type"] = "delete"
+                entry["oldNumber"] = old_line
+                old_line += 1
+                old_remaining -= 1
+                file["deletedLines"] += 1
+            elif "+" in markers:
+                entry["type"] = "insert"
+                entry["newNumber"] = new_line
+                new_line += 1
+                new_remaining -= 1
+                file["addedLines"] += 1
+            else:
+                entry["type"] = "context"
+                entry["oldNumber"] = old_line
+                entry["newNumber"] = new_line
+                old_line += 1
+                new_line += 1
+                old_remaining -= 1
+                new_remaining -= 1
+            block["lines"].append(entry)
+            continue
+
+        if line.startswith("\\"):
+            # "\ No newline at end of file" annotates the previous line only
+            continue
+
+        if line.startswith("@@"):
+            match = _HUNK_HEADER.match(line)
+            if match is None:
+                raise DiffParseError(f"Invalid hunk header: {line!r}")
+            if file is None:
+                file = start_file(is_git=False)
+            old_starts = [
+                int(part.split(",")[0]) for part in match.group(2).lstrip("-").split(" -")
+            ]
+            prefix_width = len(match.group(1)) - 1
+            old_line = old_starts[0]
+            new_line = int(match.group(3))
+            if prefix_width > 1:
+                # Combined diffs only come from git, where the next file starts with "diff"
+                old_remaining = new_remaining = sys.maxsize
+            else:
+                old_count = match.group(2).strip().split(",")
+                old_remaining = int(old_count[1]) if len(old_count) > 1 else 1
+                new_remaining = int(match.group(4)) if match.group(4) is not None else 1
+            block = {
+                "lines": [],
+                "oldStartLine": old_line,
+                "oldStartLine2": old_starts[1] if len(old_starts) > 1 else None,
+                "newStartLine": new_line,
+                "header": line,
+            }
+            file["blocks"].append(block)
+            continue
+
+        if line.startswith("--- "):
+            if file is None or file["blocks"]:
+                # Plain (non-git) diffs start each file with the --- header
+                if (done := finish()) is not None:
+                    yield done
+                file = start_file(is_git=False)
+            block = None
+            file["oldName"] = _clean_filename(line[4:])
+            continue
+
+        if file is None:
+            continue
+        block = None
+
+        if line.startswith("+++ "):
+            file["newName"] = _clean_filename(line[4:])
+        elif line.startswith("new file mode "):
+            file["newFileMode"] = line[len("new file mode ") :]
+            file["isNew"] = True
+        elif line.startswith("deleted file mode "):
+            file["deletedFileMode"] = line[len("deleted file mode ") :]
+            file["isDeleted"] = True
+        elif line.startswith("old mode "):
+            file["oldMode"] = line[len("old mode ") :]
+        elif line.startswith("new mode "):
+            file["newMode"] = line[len("new mode ") :]
+        elif line.startswith(("rename from ", "copy from ")):
+            file["oldName"] = _unquote(line.split(" ", 2)[2])
+            file["isRename" if line.startswith("rename") else "isCopy"] = True
+        elif line.startswith(("rename to ", "copy to ")):
+            file["newName"] = _unquote(line.split(" ", 2)[2])
+        elif line.startswith("similarity index "):
+            file["unchangedPercentage"] = int(line[len("similarity index ") :].rstrip("%"))
+        elif line.startswith("dissimilarity index "):
+            file["changedPercentage"] = int(line[len("dissimilarity index ") :].rstrip("%"))
+        elif line.startswith(("Binary files ", "GIT binary patch")):
+            file["isBinary"] = True
+        elif match := _INDEX_LINE.match(line):
+            file["checksumBefore"] = match.group(1)
+            file["checksumAfter"] = match.group(2)
+            if match.group(3):
+                file["mode"] = match.group(3)
+
+    if (done := finish()) is not None:
+        yield done
+
+
+def split_diff_lines(diff: str) -> list[str]:
+    """
+    Split diff text into lines the way git delimits them.
+
+    Only ``\\n`` ends a line, with a trailing ``\\r`` dropped. ``str.splitlines``
+    would also break on form feeds, ``\\x1c``-``\\x1e``, ``\\x85`` and ``\\u2028``
+    inside content lines, throwing off hunk line counts.
+    """
+    lines = diff.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return [line[:-1] if line.endswith("\r") else line for line in lines]
+
+
+def parse_unified_diff(diff: str) -> list[DiffFile]:
+    """Parse a complete unified diff string."""
+    return list(iter_diff_files(split_diff_lines(diff)))
@@ -1,26 +1,45 @@
 """Git client for interacting with git repositories."""
 
 import asyncio
+from collections.abc import AsyncIterator
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime
+from typing import ClassVar, Optional
+
+from haven.infrastructure.git.commit_log import CommitMetadata, iter_commit_log
+from haven.infrastructure.git.object_pool import GitObjectPool, git_object_pool
+
+# Tree entry mode for subdirectories in a tree object
+_TREE_MODE = b"40000"
 
 
 class GitClient:
     """Client for interacting with git repositories."""
 
-    def __init__(self, repos_base_path: str = "/tmp/haven-repos"):
+    # Commit counts keyed by (repo path, tip oid); a tip's history never changes
+    _commit_counts: ClassVar[dict[tuple[str, str], int]] = {}
+    _commit_counts_max = 1024
+
+    def __init__(
+        self,
+        repos_base_path: str = "/tmp/haven-repos",
+        object_pool: GitObjectPool | None = None,
+    ):
         """Initialize git client with base path for repositories."""
         self.repos_base_path = Path(repos_base_path)
         self.repos_base_path.mkdir(parents=True, exist_ok=True)
+        self.object_pool = object_pool or git_object_pool
 
-    async def get_commit_diff(self, repo_path: str, commit_hash: str) -> str:
+    async def get_commit_diff(
+        self, repo_path: str, commit_hash: str, mock_on_error: bool = True
+    ) -> str:
         """
         Get the diff for a specific commit.
 
         Args:
             repo_path: Path to the repository
             commit_hash: Hash of the commit
+            mock_on_error: Return mock content instead of raising when git fails
 
         Returns:
             Unified diff content as string
@@ -51,6 +70,8 @@ class GitClient:
 
         except Exception as e:
             print(f"Error getting diff: {e}")
+            if not mock_on_error:
+                raise
             # Return mock diff on error
             return self._generate_mock_diff(commit_hash)
 
@@ -146,13 +167,108 @@ index 1234567..abcdefg 100644
 
     async def list_files(self, repo_path: str, ref: str = "HEAD") -> list[str]:
         """List all files in repository at given ref."""
-        result = await self._run_command(
-            ["git", "ls-tree", "-r", "--name-only", ref], cwd=repo_path
-        )
-        return result.strip().split("\n") if result.strip() else []
+        root = await self.object_pool.read_object(repo_path, f"{ref}^{{tree}}")
+        if root is None or root.content is None:
+            raise Exception(f"Command failed: unknown ref {ref}")
+
+        # Walk the tree level by level, fetching each level's subtrees in one round trip
+        oid_size = len(root.oid) // 2
+        files: list[bytes] = []
+        pending: list[tuple[bytes, bytes]] = [(b"", root.content)]
+        while pending:
+            subtrees: list[tuple[bytes, str]] = []
+            for prefix, content in pending:
+                for mode, name, oid in self._parse_tree(content, oid_size):
+                    if mode == _TREE_MODE:
+                        subtrees.append((prefix + name + b"/", oid))
+                    else:
+                        files.append(prefix + name)
+
+            objects = await self.object_pool.read_objects(repo_path, [oid for _, oid in subtrees])
+            pending = [
+                (prefix, obj.content)
+                for (prefix, _), obj in zip(subtrees, objects)
+                if obj is not None and obj.content is not None
+            ]
+
+        # Full-path byte order matches `git ls-tree -r` output
+        return [path.decode("utf-8", "replace") for path in sorted(files)]
+
+    @staticmethod
+    def _parse_tree(content: bytes, oid_size: int) -> list[tuple[bytes, bytes, str]]:
+        """Parse a raw tree object into (mode, name, oid) entries."""
+        entries = []
+        pos = 0
+        while pos < len(content):
+            space = content.index(b" ", pos)
+            nul = content.index(b"\0", space)
+            oid = content[nul + 1 : nul + 1 + oid_size].hex()
+            entries.append((content[pos:space], content[space + 1 : nul], oid))
+            pos = nul + 1 + oid_size
+        return entries
+
+    def _git_dirs(self, repo_path: str) -> tuple[Path, Path] | None:
+        """
+        Locate the git directory and common directory for a repository.
+
+        Returns:
+            Tuple of (git dir holding HEAD, common dir holding refs and config),
+            or None if the layout is not one we can read directly
+        """
+        dot_git = Path(repo_path) / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+        elif dot_git.is_file():
+            # Worktrees and submodules use a "gitdir: <path>" pointer file
+            pointer = dot_git.read_text().strip()
+            if not pointer.startswith("gitdir:"):
+                return None
+            git_dir = (Path(repo_path) / pointer[len("gitdir:") :].strip()).resolve()
+        elif (Path(repo_path) / "HEAD").is_file() and (Path(repo_path) / "objects").is_dir():
+            git_dir = Path(repo_path)
+        else:
+            return None
+
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            common_dir = (git_dir / commondir_file.read_text().strip()).resolve()
+
+        if (common_dir / "reftable").is_dir():
+            return None
+        return git_dir, common_dir
+
+    def _read_refs(self, common_dir: Path, prefixes: tuple[str, ...]) -> set[str]:
+        """Read loose and packed ref names under the given prefixes."""
+        refs: set[str] = set()
+        packed = common_dir / "packed-refs"
+        if packed.is_file():
+            for line in packed.read_text().splitlines():
+                if not line or line[0] in "#^":
+                    continue
+                _, _, name = line.partition(" ")
+                if name.startswith(prefixes):
+                    refs.add(name)
+        for prefix in prefixes:
+            base = common_dir / prefix
+            if base.is_dir():
+                refs.update(
+                    f"{prefix}{path.relative_to(base).as_posix()}"
+                    for path in base.rglob("*")
+                    if path.is_file() and not path.name.endswith(".lock")
+                )
+        return refs
 
     async def get_remote_url(self, repo_path: str, remote: str = "origin") -> str | None:
         """Get the remote URL for a repository."""
+        dirs = self._git_dirs(repo_path)
+        config = dirs[1] / "config" if dirs else None
+        if config is not None and config.is_file():
+            text = config.read_text()
+            # Included files can override remotes; leave those to git itself
+            if "[include" not in text:
+                return self._parse_remote_url(text, remote)
+
         try:
             result = await self._run_command(
                 ["git", "config", "--get", f"remote.{remote}.url"], cwd=repo_path
@@ -161,8 +277,34 @@ index 1234567..abcdefg 100644
         except Exception:
             return None
 
+    @staticmethod
+    def _parse_remote_url(config_text: str, remote: str) -> str | None:
+        """Extract remote.<name>.url from git config text."""
+        section = None
+        url = None
+        for raw in config_text.splitlines():
+            line = raw.strip()
+            if not line or line[0] in "#;":
+                continue
+            if line.startswith("["):
+                section = line[1 : line.index("]")].strip()
+                continue
+            key, sep, value = line.partition("=")
+            if sep and section == f'remote "{remote}"' and key.strip().lower() == "url":
+                # Last value wins, as with `git config --get`
+                url = value.strip().strip('"')
+        return url or None
+
     async def get_current_branch(self, repo_path: str) -> str | None:
         """Get the current branch name."""
+        dirs = self._git_dirs(repo_path)
+        if dirs and (dirs[0] / "HEAD").is_file():
+            head = (dirs[0] / "HEAD").read_text().strip()
+            if head.startswith("ref: refs/heads/"):
+                return head[len("ref: refs/heads/") :]
+            # Detached HEAD, matching `git rev-parse --abbrev-ref HEAD`
+            return "HEAD"
+
         try:
             result = await self._run_command(
                 ["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_path
@@ -173,6 +315,13 @@ index 1234567..abcdefg 100644
 
     async def get_branches(self, repo_path: str) -> list[str]:
         """Get all branch names."""
+        dirs = self._git_dirs(repo_path)
+        if dirs:
+            refs = self._read_refs(dirs[1], ("refs/heads/", "refs/remotes/"))
+            return sorted(
+                ref.removeprefix("refs/heads/").removeprefix("refs/remotes/") for ref in refs
+            )
+
         try:
             result = await self._run_command(
                 ["git", "branch", "-a", "--format=%(refname:short)"], cwd=repo_path
@@ -186,13 +335,54 @@ index 1234567..abcdefg 100644
     async def get_commit_count(self, repo_path: str, branch: str = "HEAD") -> int:
         """Get the total number of commits in a branch."""
         try:
-            result = await self._run_command(
-                ["git", "rev-list", "--count", branch], cwd=repo_path
-            )
-            return int(result.strip()) if result.strip() else 0
+            tip = await self.object_pool.resolve_ref(repo_path, branch)
+            if tip is None:
+                return 0
+
+            key = (str(Path(repo_path).resolve()), tip)
+            if key in self._commit_counts:
+                return self._commit_counts[key]
+
+            result = await self._run_command(["git", "rev-list", "--count", tip], cwd=repo_path)
+            count = int(result.strip()) if result.strip() else 0
+
+            if len(self._commit_counts) >= self._commit_counts_max:
+                self._commit_counts.pop(next(iter(self._commit_counts)))
+            self._commit_counts[key] = count
+            return count
         except Exception:
             return 0
 
+    async def get_merge_base(self, repo_path: str, first: str, second: str) -> str | None:
+        """
+        Get the best common ancestor of two commits.
+
+        Returns:
+            Commit hash, or None if the commits share no history or one of them
+            no longer exists (e.g. garbage collected after a force push)
+        """
+        try:
+            result = await self._run_command(["git", "merge-base", first, second], cwd=repo_path)
+            return result.strip() or None
+        except Exception:
+            return None
+
+    @staticmethod
+    def _commit_to_dict(commit: CommitMetadata) -> dict:
+        """Convert parsed commit metadata to the commit log dict shape."""
+        return {
+            "hash": commit.hash,
+            "author_name": commit.author_name,
+            "author_email": commit.author_email,
+            "committer_name": commit.committer_name,
+            "committer_email": commit.committer_email,
+            "committed_at": commit.committed_at,
+            "message": commit.subject,
+            "files_changed": commit.files_changed,
+            "insertions": commit.insertions,
+            "deletions": commit.deletions,
+        }
+
     async def get_commit_log(
         self,
         repo_path: str,
@@ -201,72 +391,53 @@ index 1234567..abcdefg 100644
         since_date: Optional[datetime] = None,
     ) -> list[dict]:
         """Get commit log from repository."""
-        cmd = [
-            "git",
-            "log",
-            branch,
-            "--format=%H|%an|%ae|%cn|%ce|%ct|%s",
-            "--numstat",
-        ]
-        
-        if limit:
-            cmd.append(f"-{limit}")
-        
-        if since_date:
-            cmd.append(f"--since={since_date.isoformat()}")
-        
         try:
-            result = await self._run_command(cmd, cwd=repo_path)
-            if not result.strip():
-                return []
-            
-            commits = []
-            lines = result.strip().split("\n")
-            i = 0
-            
-            while i < len(lines):
-                if "|" in lines[i]:
-                    # Parse commit info
-                    parts = lines[i].split("|", 6)
-                    if len(parts) >= 7:
-                        commit_hash, author_name, author_email, committer_name, committer_email, timestamp, message = parts
-                        
-                        # Parse numstat
-                        i += 1
-                        files_changed = 0
-                        insertions = 0
-                        deletions = 0
-                        
-                        while i < len(lines) and lines[i] and not "|" in lines[i]:
-                            if lines[i].strip():
-                                parts = lines[i].split("\t")
-                                if len(parts) >= 2:
-                                    files_changed += 1
-                                    if parts[0] != "-":
-                                        insertions += int(parts[0])
-                                    if parts[1] != "-":
-                                        deletions += int(parts[1])
-                            i += 1
-                        
-                        commits.append({
-                            "hash": commit_hash,
-                            "author_name": author_name,
-                            "author_email": author_email,
-                            "committer_name": committer_name,
-                            "committer_email": committer_email,
-                            "committed_at": datetime.fromtimestamp(int(timestamp), tz=timezone.utc),
-                            "message": message,
-                            "files_changed": files_changed,
-                            "insertions": insertions,
-                            "deletions": deletions,
-                        })
-                    else:
-                        i += 1
-                else:
-                    i += 1
-            
-            return commits
-            
+            return [
+                self._commit_to_dict(commit)
+                async for commit in iter_commit_log(
+                    repo_path, branch, max_count=limit or None, since=since_date, numstat=True
+                )
+            ]
+
         except Exception as e:
             print(f"Error getting commit log: {e}")
             return []
+
+    async def iter_commit_log_batches(
+        self,
+        repo_path: str,
+        branch: str = "HEAD",
+        limit: int | None = None,
+        since_date: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Stream the commit log in batches.
+
+        Unlike ``get_commit_log`` the history is never held in memory as a whole:
+        git's output is parsed as it arrives and at most ``batch_size`` commits
+        are buffered, so memory stays flat regardless of history size.
+
+        Args:
+            repo_path: Path to the repository
+            branch: Branch or revision to walk
+            limit: Maximum number of commits
+            since_date: Only include commits after this date
+            batch_size: Number of commits per yielded batch
+
+        Yields:
+            Lists of commit dicts in the same shape as ``get_commit_log``
+
+        Raises:
+            RuntimeError: If git log fails
+        """
+        batch = []
+        async for commit in iter_commit_log(
+            repo_path, branch, max_count=limit or None, since=since_date, numstat=True
+        ):
+            batch.append(self._commit_to_dict(commit))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
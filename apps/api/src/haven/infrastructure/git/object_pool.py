@@ -0,0 +1,295 @@
+"""Pool of long-lived ``git cat-file`` processes for object and ref lookups."""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+BATCH = "--batch"
+BATCH_CHECK = "--batch-check"
+
+
+@dataclass(frozen=True)
+class GitObject:
+    """A git object returned by ``cat-file``."""
+
+    oid: str
+    type: str
+    size: int
+    content: bytes | None = None
+
+
+class CatFileError(Exception):
+    """Raised when a ``cat-file`` worker cannot serve a request."""
+
+
+class CatFileProcess:
+    """A single ``git cat-file --batch``/``--batch-check`` process bound to a repository."""
+
+    def __init__(self, repo_path: str, mode: str = BATCH):
+        """Initialize the worker without starting the subprocess."""
+        if mode not in (BATCH, BATCH_CHECK):
+            raise ValueError(f"Unsupported cat-file mode: {mode}")
+        self.repo_path = repo_path
+        self.mode = mode
+        self.last_used = time.monotonic()
+        self._process: asyncio.subprocess.Process | None = None
+
+    @property
+    def alive(self) -> bool:
+        """Whether the underlying subprocess is running."""
+        return self._process is not None and self._process.returncode is None
+
+    async def start(self) -> None:
+        """Spawn the ``cat-file`` subprocess."""
+        self._process = await asyncio.create_subprocess_exec(
+            "git",
+            "cat-file",
+            self.mode,
+            cwd=self.repo_path,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+
+    async def request(self, spec: str) -> GitObject | None:
+        """
+        Look up a single object.
+
+        Args:
+            spec: Any revision expression understood by git (oid, ref, ``rev^{tree}``...)
+
+        Returns:
+            The object (with content in ``--batch`` mode), or None if it does not exist
+        """
+        if "\n" in spec:
+            raise ValueError("Object spec must not contain newlines")
+        if not self.alive:
+            await self.start()
+        assert self._process is not None and self._process.stdin and self._process.stdout
+
+        try:
+            self._process.stdin.write(spec.encode() + b"\n")
+            await self._process.stdin.drain()
+            return await self._read_response()
+        except (BrokenPipeError, ConnectionResetError, asyncio.IncompleteReadError) as e:
+            await self.close()
+            raise CatFileError(str(e)) from e
+        except BaseException:
+            # A cancelled read leaves the pipe out of sync; never reuse it.
+            self._abort()
+            raise
+        finally:
+            self.last_used = time.monotonic()
+
+    async def request_many(self, specs: list[str]) -> list[GitObject | None]:
+        """
+        Look up several objects with pipelined writes.
+
+        All specs are written while responses are being read, so cat-file never
+        blocks on a full stdout pipe.
+        """
+        if not specs:
+            return []
+        if any("\n" in spec for spec in specs):
+            raise ValueError("Object spec must not contain newlines")
+        if not self.alive:
+            await self.start()
+        assert self._process is not None and self._process.stdin and self._process.stdout
+        stdin = self._process.stdin
+
+        async def write_all() -> None:
+            stdin.write(b"".join(spec.encode() + b"\n" for spec in specs))
+            await stdin.drain()
+
+        writer = asyncio.create_task(write_all())
+        results: list[GitObject | None] = []
+        try:
+            for _ in specs:
+                results.append(await self._read_response())
+            await writer
+        except (BrokenPipeError, ConnectionResetError, asyncio.IncompleteReadError) as e:
+            writer.cancel()
+            await self.close()
+            raise CatFileError(str(e)) from e
+        except BaseException:
+            writer.cancel()
+            self._abort()
+            raise
+        finally:
+            self.last_used = time.monotonic()
+        return results
+
+    async def _read_response(self) -> GitObject | None:
+        """Read one response header (and payload in ``--batch`` mode)."""
+        assert self._process is not None and self._process.stdout
+        header = await self._process.stdout.readline()
+        if not header:
+            raise CatFileError("cat-file exited unexpectedly")
+
+        parts = header.decode().rstrip("\n").split(" ")
+        if parts[-1] in ("missing", "ambiguous"):
+            return None
+        oid, obj_type, size = parts[0], parts[1], int(parts[2])
+
+        content = None
+        if self.mode == BATCH:
+            # Payload is followed by a single LF terminator
+            content = (await self._process.stdout.readexactly(size + 1))[:-1]
+        return GitObject(oid=oid, type=obj_type, size=size, content=content)
+
+    def _abort(self) -> None:
+        """Kill the subprocess without waiting for it."""
+        process, self._process = self._process, None
+        if process is not None and process.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+
+    async def close(self) -> None:
+        """Terminate the subprocess."""
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+        if process.stdin:
+            process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=1.0)
+        except TimeoutError:
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+            await process.wait()
+
+
+@dataclass
+class _RepoWorkers:
+    """Idle workers and concurrency limit for one repository and mode."""
+
+    limit: asyncio.Semaphore
+    idle: list[CatFileProcess] = field(default_factory=list)
+    # Callers holding a worker or waiting on ``limit``; the entry is only evicted at 0
+    users: int = 0
+
+
+class GitObjectPool:
+    """
+    Keeps ``cat-file`` processes alive per repository to avoid fork/exec per lookup.
+
+    Each repository gets at most ``max_processes_per_repo`` workers per mode. Requests
+    on one worker are serialized; concurrent callers get additional workers up to the
+    cap, then wait. Workers unused for ``idle_timeout`` seconds are closed, and a
+    worker that dies mid-request is replaced and the request retried once.
+    """
+
+    def __init__(self, max_processes_per_repo: int = 4, idle_timeout: float = 300.0):
+        """Initialize an empty pool."""
+        self.max_processes_per_repo = max_processes_per_repo
+        self.idle_timeout = idle_timeout
+        self._workers: dict[tuple[str, str], _RepoWorkers] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reaper: asyncio.Task[None] | None = None
+
+    async def read_object(self, repo_path: str, spec: str) -> GitObject | None:
+        """Read an object with its content (``cat-file --batch``)."""
+        return await self._request(repo_path, BATCH, spec)
+
+    async def check_object(self, repo_path: str, spec: str) -> GitObject | None:
+        """Resolve an object or ref without reading content (``cat-file --batch-check``)."""
+        return await self._request(repo_path, BATCH_CHECK, spec)
+
+    async def read_objects(self, repo_path: str, specs: list[str]) -> list[GitObject | None]:
+        """Read several objects in one pipelined round trip."""
+        async with self._acquire(repo_path, BATCH) as worker:
+            try:
+                return await worker.request_many(specs)
+            except CatFileError:
+                return await worker.request_many(specs)
+
+    async def resolve_ref(self, repo_path: str, ref: str) -> str | None:
+        """Resolve a ref or revision expression to an object id."""
+        obj = await self.check_object(repo_path, ref)
+        return obj.oid if obj else None
+
+    async def _request(self, repo_path: str, mode: str, spec: str) -> GitObject | None:
+        """Run a request on a pooled worker, restarting it once on crash."""
+        async with self._acquire(repo_path, mode) as worker:
+            try:
+                return await worker.request(spec)
+            except CatFileError:
+                return await worker.request(spec)
+
+    @asynccontextmanager
+    async def _acquire(self, repo_path: str, mode: str) -> AsyncIterator[CatFileProcess]:
+        """Check out a worker for the repository, creating one if under the cap."""
+        self._bind_loop()
+        key = (str(Path(repo_path).resolve()), mode)
+        workers = self._workers.get(key)
+        if workers is None:
+            workers = _RepoWorkers(limit=asyncio.Semaphore(self.max_processes_per_repo))
+            self._workers[key] = workers
+
+        # Counted before waiting, so a woken waiter keeps the entry (and its semaphore)
+        # from being evicted before it gets to run
+        workers.users += 1
+        try:
+            async with workers.limit:
+                worker = workers.idle.pop() if workers.idle else CatFileProcess(key[0], mode)
+                try:
+                    yield worker
+                finally:
+                    if worker.alive:
+                        workers.idle.append(worker)
+        finally:
+            workers.users -= 1
+
+    def _bind_loop(self) -> None:
+        """Reset state when used from a new event loop and start the idle reaper."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Transports from a previous loop cannot be reused; drop them.
+            self._workers.clear()
+            self._loop = loop
+            self._reaper = None
+        if self._reaper is None or self._reaper.done():
+            self._reaper = loop.create_task(self._reap_idle())
+
+    async def _reap_idle(self) -> None:
+        """Periodically close idle workers."""
+        while True:
+            await asyncio.sleep(max(self.idle_timeout / 2, 1.0))
+            await self.evict_idle()
+
+    async def evict_idle(self) -> int:
+        """
+        Close workers idle for longer than ``idle_timeout``.
+
+        Returns:
+            Number of workers closed
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        evicted = 0
+        for key, workers in list(self._workers.items()):
+            stale = [w for w in workers.idle if w.last_used < cutoff]
+            for worker in stale:
+                workers.idle.remove(worker)
+                await worker.close()
+                evicted += 1
+            if not workers.idle and not workers.users and self._workers.get(key) is workers:
+                del self._workers[key]
+        return evicted
+
+    async def close(self) -> None:
+        """Close all workers and stop the reaper."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        for workers in self._workers.values():
+            for worker in workers.idle:
+                await worker.close()
+        self._workers.clear()
+
+
+# Global pool instance
+git_object_pool = GitObjectPool()
@@ -0,0 +1,13 @@
+"""Durable background job queue and workers."""
+
+from haven.infrastructure.jobs.queue import Job, JobQueue, JobStatus
+from haven.infrastructure.jobs.worker import JobHandler, JobWorker, run_worker_processes
+
+__all__ = [
+    "Job",
+    "JobHandler",
+    "JobQueue",
+    "JobStatus",
+    "JobWorker",
+    "run_worker_processes",
+]
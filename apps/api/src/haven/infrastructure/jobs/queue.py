@@ -0,0 +1,282 @@
+"""Durable job queue backed by the database."""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from haven.infrastructure.database.models import JobModel
+
+# Upper bound for the exponential retry backoff
+MAX_RETRY_DELAY = 300.0
+
+
+class JobStatus(Enum):
+    """Lifecycle state of a queued job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class Job:
+    """Snapshot of a job row."""
+
+    id: str
+    kind: str
+    payload: dict[str, Any]
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    leased_by: str | None = None
+    heartbeat_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    created_at: datetime | None = None
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
+class JobQueue:
+    """
+    Database-backed job queue with leases and heartbeats.
+
+    Workers claim runnable jobs with ``SELECT ... FOR UPDATE SKIP LOCKED``, so
+    any number of processes can poll the same table without blocking each other.
+    A claim takes a lease that the worker renews with heartbeats; if a worker
+    dies, its lease expires and the job is claimed again as a new attempt.
+    Every operation runs in its own short transaction.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+
+    async def enqueue(self, kind: str, payload: dict[str, Any], *, max_attempts: int = 3) -> Job:
+        """
+        Add a job to the queue.
+
+        Args:
+            kind: Job type, used to select the handler
+            payload: JSON-serializable job arguments
+            max_attempts: Attempts before the job is marked failed
+
+        Returns:
+            The queued job
+        """
+        model = JobModel(
+            id=str(uuid4()),
+            kind=kind,
+            payload=payload,
+            status=JobStatus.QUEUED.value,
+            attempts=0,
+            max_attempts=max_attempts,
+            run_after=_now(),
+        )
+        async with self.session_factory() as session, session.begin():
+            session.add(model)
+            await session.flush()
+            await session.refresh(model)
+        return self._model_to_job(model)
+
+    async def get(self, job_id: str) -> Job | None:
+        """Get a job by ID."""
+        async with self.session_factory() as session:
+            model = await session.get(JobModel, job_id)
+            return self._model_to_job(model) if model else None
+
+    async def list_jobs(
+        self, kind: str | None = None, status: JobStatus | None = None, limit: int = 50
+    ) -> list[Job]:
+        """List the most recent jobs, optionally filtered by kind and status."""
+        stmt = select(JobModel).order_by(JobModel.created_at.desc()).limit(limit)
+        if kind:
+            stmt = stmt.where(JobModel.kind == kind)
+        if status:
+            stmt = stmt.where(JobModel.status == status.value)
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            return [self._model_to_job(model) for model in result.scalars().all()]
+
+    async def delete(self, job_id: str) -> bool:
+        """Delete a job."""
+        async with self.session_factory() as session, session.begin():
+            result = await session.execute(delete(JobModel).where(JobModel.id == job_id))
+            return result.rowcount > 0
+
+    async def claim(
+        self, worker_id: str, lease_seconds: float, kinds: list[str] | None = None
+    ) -> Job | None:
+        """
+        Lease the next runnable job.
+
+        Runnable jobs are queued jobs that are due, and running jobs whose lease
+        expired because their worker stopped heartbeating. A job that runs out of
+        attempts that way is marked failed instead of being claimed.
+
+        Args:
+            worker_id: Identity of the claiming worker
+            lease_seconds: Lease duration; the worker must heartbeat before it ends
+            kinds: Only claim jobs of these kinds
+
+        Returns:
+            The claimed job, or None if nothing is runnable
+        """
+        async with self.session_factory() as session, session.begin():
+            while True:
+                now = _now()
+                stmt = (
+                    select(JobModel)
+                    .where(
+                        or_(
+                            and_(
+                                JobModel.status == JobStatus.QUEUED.value,
+                                JobModel.run_after <= now,
+                            ),
+                            and_(
+                                JobModel.status == JobStatus.RUNNING.value,
+                                JobModel.lease_expires_at < now,
+                            ),
+                        )
+                    )
+                    .order_by(JobModel.run_after, JobModel.created_at)
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                )
+                if kinds is not None:
+                    stmt = stmt.where(JobModel.kind.in_(kinds))
+                model = (await session.execute(stmt)).scalar_one_or_none()
+                if model is None:
+                    return None
+
+                if model.attempts >= model.max_attempts:
+                    values = {
+                        "status": JobStatus.FAILED.value,
+                        "error": f"Lease expired after {model.attempts} attempts",
+                        "leased_by": None,
+                        "lease_expires_at": None,
+                        "finished_at": now,
+                    }
+                else:
+                    values = {
+                        "status": JobStatus.RUNNING.value,
+                        "attempts": model.attempts + 1,
+                        "leased_by": worker_id,
+                        "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                        "heartbeat_at": now,
+                        "started_at": now,
+                        "finished_at": None,
+                    }
+
+                # Guard on the observed state as well, for databases without row locks
+                result = await session.execute(
+                    update(JobModel)
+                    .where(
+                        JobModel.id == model.id,
+                        JobModel.status == model.status,
+                        JobModel.attempts == model.attempts,
+                    )
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+                await session.refresh(model)
+                if result.rowcount and model.status == JobStatus.RUNNING.value:
+                    return self._model_to_job(model)
+
+    async def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """
+        Extend the lease on a running job.
+
+        Returns:
+            False if the lease was lost (expired and claimed by another worker)
+        """
+        now = _now()
+        return await self._update_leased(
+            job_id,
+            worker_id,
+            heartbeat_at=now,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+        )
+
+    async def complete(
+        self, job_id: str, worker_id: str, result: dict[str, Any] | None = None
+    ) -> bool:
+        """Mark a leased job as succeeded."""
+        return await self._update_leased(
+            job_id,
+            worker_id,
+            status=JobStatus.SUCCEEDED.value,
+            result=result,
+            error=None,
+            leased_by=None,
+            lease_expires_at=None,
+            finished_at=_now(),
+        )
+
+    async def fail(
+        self, job_id: str, worker_id: str, error: str, retry_backoff: float = 5.0
+    ) -> bool:
+        """
+        Record a failed attempt of a leased job.
+
+        The job is requeued with exponential backoff until it runs out of attempts,
+        after which it is marked failed.
+        """
+        async with self.session_factory() as session, session.begin():
+            model = await session.get(JobModel, job_id, with_for_update=True)
+            if model is None or model.leased_by != worker_id:
+                return False
+
+            now = _now()
+            if model.attempts >= model.max_attempts:
+                model.status = JobStatus.FAILED.value
+                model.finished_at = now
+            else:
+                delay = min(retry_backoff * 2 ** (model.attempts - 1), MAX_RETRY_DELAY)
+                model.status = JobStatus.QUEUED.value
+                model.run_after = now + timedelta(seconds=delay)
+            model.error = error
+            model.leased_by = None
+            model.lease_expires_at = None
+            return True
+
+    async def _update_leased(self, job_id: str, worker_id: str, **values: Any) -> bool:
+        """Update a running job only while ``worker_id`` still holds its lease."""
+        async with self.session_factory() as session, session.begin():
+            result = await session.execute(
+                update(JobModel)
+                .where(
+                    JobModel.id == job_id,
+                    JobModel.leased_by == worker_id,
+                    JobModel.status == JobStatus.RUNNING.value,
+                )
+                .values(**values)
+            )
+            return result.rowcount > 0
+
+    def _model_to_job(self, model: JobModel) -> Job:
+        """Convert SQLAlchemy model to a job snapshot."""
+        return Job(
+            id=model.id,
+            kind=model.kind,
+            payload=model.payload,
+            status=JobStatus(model.status),
+            attempts=model.attempts,
+            max_attempts=model.max_attempts,
+            result=model.result,
+            error=model.error,
+            leased_by=model.leased_by,
+            heartbeat_at=model.heartbeat_at,
+            started_at=model.started_at,
+            finished_at=model.finished_at,
+            created_at=model.created_at,
+        )
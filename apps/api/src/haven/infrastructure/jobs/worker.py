@@ -0,0 +1,211 @@
+"""Worker processes that run jobs from the durable job queue."""
+
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import suppress
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from haven.infrastructure.jobs.queue import Job, JobQueue
+
+# A handler runs one job in a fresh session and returns its JSON result
+JobHandler = Callable[[AsyncSession, Job], Awaitable[dict[str, Any] | None]]
+
+
+class JobWorker:
+    """
+    Runs jobs claimed from a ``JobQueue``.
+
+    Each job gets its own database session, so handlers never share the
+    request-scoped session of the API call that queued them. While a job runs
+    its lease is renewed in the background; if the lease is lost the job is
+    cancelled, since another worker has taken it over.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        session_factory: async_sessionmaker[AsyncSession],
+        handlers: Mapping[str, JobHandler],
+        *,
+        worker_id: str | None = None,
+        concurrency: int = 1,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 60.0,
+        heartbeat_interval: float = 15.0,
+        retry_backoff: float = 5.0,
+    ):
+        self.queue = queue
+        self.session_factory = session_factory
+        self.handlers = dict(handlers)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval
+        self.retry_backoff = retry_backoff
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Claim and run jobs until ``stop`` is set, then wait for running jobs."""
+        slots = asyncio.Semaphore(self.concurrency)
+        running: set[asyncio.Task] = set()
+
+        def _done(task: asyncio.Task) -> None:
+            running.discard(task)
+            slots.release()
+
+        while not stop.is_set():
+            await slots.acquire()
+            job = await self._claim()
+            if job is None:
+                slots.release()
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(stop.wait(), self.poll_interval)
+                continue
+
+            task = asyncio.create_task(self.execute(job))
+            running.add(task)
+            task.add_done_callback(_done)
+
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    async def run_once(self) -> bool:
+        """
+        Claim and run a single job.
+
+        Returns:
+            Whether a job was run
+        """
+        job = await self._claim()
+        if job is None:
+            return False
+        await self.execute(job)
+        return True
+
+    async def _claim(self) -> Job | None:
+        """Claim the next job this worker has a handler for."""
+        try:
+            return await self.queue.claim(
+                self.worker_id, self.lease_seconds, kinds=list(self.handlers)
+            )
+        except Exception as e:
+            print(f"Error claiming job: {e}")
+            return None
+
+    async def execute(self, job: Job) -> None:
+        """Run a claimed job and record its outcome."""
+        handler = self.handlers[job.kind]
+        lease_lost = asyncio.Event()
+        current = asyncio.current_task()
+        heartbeat = asyncio.create_task(self._heartbeat(job, current, lease_lost))
+
+        try:
+            async with self.session_factory() as session:
+                result = await handler(session, job)
+                await session.commit()
+        except asyncio.CancelledError:
+            if not lease_lost.is_set():
+                raise
+            current.uncancel()
+            print(f"Lost lease on job {job.id} ({job.kind}), abandoning attempt {job.attempts}")
+            return
+        except Exception as e:
+            print(f"Job {job.id} ({job.kind}) failed on attempt {job.attempts}: {e}")
+            await self.queue.fail(job.id, self.worker_id, str(e), self.retry_backoff)
+            return
+        finally:
+            heartbeat.cancel()
+            with suppress(asyncio.CancelledError):
+                await heartbeat
+
+        await self.queue.complete(job.id, self.worker_id, result)
+
+    async def _heartbeat(self, job: Job, task: asyncio.Task, lease_lost: asyncio.Event) -> None:
+        """Renew the job's lease periodically, cancelling ``task`` if it is lost."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                alive = await self.queue.heartbeat(job.id, self.worker_id, self.lease_seconds)
+            except Exception as e:
+                print(f"Error renewing lease on job {job.id}: {e}")
+                continue
+            if not alive:
+                lease_lost.set()
+                task.cancel()
+                return
+
+
+async def _serve(handlers: Mapping[str, JobHandler], options: dict[str, Any]) -> None:
+    """Run a worker in this process until SIGINT/SIGTERM."""
+    # Imported here so the parent process never opens database connections
+    from haven.infrastructure.database.engines import WORKER, engine_registry
+    from haven.infrastructure.git.object_pool import git_object_pool
+
+    session_factory = engine_registry.session_factory(WORKER)
+    worker = JobWorker(JobQueue(session_factory), session_factory, handlers, **options)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    print(f"Worker {worker.worker_id} started ({worker.concurrency} concurrent jobs)")
+    try:
+        await worker.run(stop)
+    finally:
+        await git_object_pool.close()
+        await engine_registry.dispose()
+    print(f"Worker {worker.worker_id} stopped")
+
+
+def _worker_process(handlers: Mapping[str, JobHandler], options: dict[str, Any]) -> None:
+    """Entry point of a worker process."""
+    asyncio.run(_serve(handlers, options))
+
+
+def run_worker_processes(
+    handlers: Mapping[str, JobHandler], processes: int = 1, **options: Any
+) -> None:
+    """
+    Run job workers in ``processes`` OS processes until interrupted.
+
+    Each process polls the queue independently, so CPU-heavy jobs spread across
+    cores. SIGTERM/SIGINT let running jobs finish before the processes exit.
+
+    Args:
+        handlers: Job handlers by kind (must be importable module-level functions)
+        processes: Number of worker processes
+        **options: ``JobWorker`` options (concurrency, poll_interval, ...)
+    """
+    if processes <= 1:
+        _worker_process(handlers, options)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    children = [
+        context.Process(target=_worker_process, args=(handlers, options), name=f"haven-worker-{i}")
+        for i in range(processes)
+    ]
+    for child in children:
+        child.start()
+
+    def _shutdown(signum: int, frame: object) -> None:
+        for child in children:
+            if child.is_alive():
+                child.terminate()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    try:
+        for child in children:
+            child.join()
+    except KeyboardInterrupt:
+        # Children received the same SIGINT from the terminal and are draining
+        for child in children:
+            child.join()
@@ -0,0 +1 @@
+"""File-based storage for generated artifacts."""
@@ -0,0 +1,187 @@
+"""Content-addressed store for generated diff artifacts."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 1024**3
+
+INDEX_SUFFIX = ".idx.json"
+
+# Hits only refresh the LRU timestamp when it is older than this, so a hot
+# artifact costs a single stat() rather than a stat() plus a utime() per request.
+_TOUCH_INTERVAL = 60.0
+
+# Leftovers of interrupted writes are removed by gc once they are this old
+_STALE_TEMP_AGE = 3600.0
+
+
+def default_artifact_root() -> Path:
+    """Artifact directory: /app/diff-output in Docker, ./diff-output locally."""
+    return Path("/app/diff-output" if os.path.exists("/app") else "diff-output")
+
+
+@dataclass(frozen=True)
+class GcResult:
+    """Outcome of a garbage collection pass."""
+
+    removed: int
+    freed_bytes: int
+    remaining: int
+    remaining_bytes: int
+
+
+class ArtifactStore:
+    """
+    Stores immutable artifacts under ``objects/<aa>/<key><suffix>``.
+
+    Keys are derived from the commit hash, renderer version and render options.
+    The repository is deliberately not part of the address: a commit hash fully
+    determines its diff, so forks of the same repository share artifacts.
+
+    Writes go to a temporary file that is renamed into place, so readers never see
+    partial artifacts. Hits refresh the file's mtime, which ``gc`` uses to evict
+    least recently used artifacts once the store exceeds ``max_bytes``. An artifact
+    may have an index sidecar (``<key>.idx.json``), written before the artifact and
+    evicted together with it.
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int = DEFAULT_MAX_BYTES, suffix: str = ".json"):
+        """Initialize the store rooted at ``root``."""
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self._written_since_gc = 0
+
+    @staticmethod
+    def key_for(commit_hash: str, renderer: str, options: dict | None = None) -> str:
+        """Compute the content address for a rendered commit diff."""
+        material = json.dumps(
+            {"commit": commit_hash, "renderer": renderer, "options": options or {}},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Location of the artifact for ``key`` (whether or not it exists)."""
+        return self.objects_dir / key[:2] / f"{key}{self.suffix}"
+
+    @staticmethod
+    def index_path(artifact_path: str | Path) -> Path:
+        """Location of the index sidecar belonging to an artifact file."""
+        path = Path(artifact_path)
+        return path.with_name(path.name.split(".", 1)[0] + INDEX_SUFFIX)
+
+    def lookup(self, key: str) -> Path | None:
+        """
+        Return the artifact path if present, refreshing its LRU timestamp.
+
+        Returns:
+            Path to the artifact, or None on a miss
+        """
+        path = self.path_for(key)
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        now = time.time()
+        if now - mtime > _TOUCH_INTERVAL:
+            try:
+                os.utime(path, (now, now))
+            except FileNotFoundError:
+                # Evicted between stat() and utime()
+                return None
+        return path
+
+    def write(self, key: str, data: bytes, index: bytes | None = None) -> Path:
+        """
+        Atomically store ``data`` (and optionally its index) under ``key``.
+
+        The index is written first, so an artifact that exists always has its index.
+
+        Returns:
+            Path to the stored artifact
+        """
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if index is not None:
+            self._write_atomic(self.index_path(path), index)
+        self._write_atomic(path, data)
+
+        self._written_since_gc += len(data) + len(index or b"")
+        if self._written_since_gc > self.max_bytes // 10:
+            self.gc()
+        return path
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write to a temporary file in the same directory and rename it into place."""
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def gc(self, max_bytes: int | None = None) -> GcResult:
+        """
+        Evict least recently used artifacts until the store fits in ``max_bytes``.
+
+        Args:
+            max_bytes: Size limit (defaults to the store's ``max_bytes``)
+
+        Returns:
+            Counts of removed and remaining artifacts
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        self._written_since_gc = 0
+        if not self.objects_dir.exists():
+            return GcResult(removed=0, freed_bytes=0, remaining=0, remaining_bytes=0)
+
+        now = time.time()
+        # key -> [mtime of the artifact, total size, files]
+        groups: dict[str, list] = {}
+        removed = freed = 0
+        for shard in self.objects_dir.iterdir():
+            if not shard.is_dir():
+                continue
+            for path in shard.iterdir():
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                if path.name.startswith(".tmp-"):
+                    if now - stat.st_mtime > _STALE_TEMP_AGE:
+                        path.unlink(missing_ok=True)
+                    continue
+                group = groups.setdefault(path.name.split(".", 1)[0], [0.0, 0, []])
+                if not path.name.endswith(INDEX_SUFFIX):
+                    group[0] = stat.st_mtime
+                group[1] += stat.st_size
+                group[2].append(path)
+
+        total = sum(size for _, size, _ in groups.values())
+        for _, size, paths in sorted(groups.values(), key=lambda group: group[0]):
+            if total <= limit:
+                break
+            # Remove the artifact before its index so lookups never see one without the other
+            for path in sorted(paths, key=lambda p: p.name.endswith(INDEX_SUFFIX)):
+                path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+            freed += size
+
+        return GcResult(
+            removed=removed,
+            freed_bytes=freed,
+            remaining=len(groups) - removed,
+            remaining_bytes=total,
+        )
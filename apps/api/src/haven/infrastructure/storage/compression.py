@@ -0,0 +1,183 @@
+"""Compression codecs for stored artifacts, named after their HTTP Content-Encoding."""
+
+import gzip
+import struct
+import zlib
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        from backports import zstd
+    except ImportError:
+        zstd = None
+
+
+class Decompressor(Protocol):
+    """Incremental decompressor interface shared by zlib and zstd."""
+
+    eof: bool
+    unused_data: bytes
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress a chunk."""
+        ...
+
+
+class _IdentityDecompressor:
+    """Pass-through decompressor for uncompressed artifacts."""
+
+    eof = False
+    unused_data = b""
+
+    def decompress(self, data: bytes) -> bytes:
+        """Return the data unchanged."""
+        return data
+
+
+class SegmentWriter:
+    """
+    Builds one compressed stream out of independently decodable segments.
+
+    The concatenated output decompresses like any other stream of the codec, while
+    the byte range returned for each segment can also be decoded on its own with
+    ``Codec.decompress_segment``, enabling random access into an artifact.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty stream."""
+        self._parts: list[bytes] = []
+        self._size = 0
+
+    def add(self, data: bytes) -> tuple[int, int]:
+        """
+        Append a segment.
+
+        Returns:
+            Offset and length of the segment within the compressed stream
+        """
+        encoded = self._encode(data)
+        offset = self._size
+        self._parts.append(encoded)
+        self._size += len(encoded)
+        return offset, len(encoded)
+
+    def finish(self) -> bytes:
+        """Return the complete compressed stream."""
+        return b"".join(self._parts) + self._trailer()
+
+    def _encode(self, data: bytes) -> bytes:
+        return data
+
+    def _trailer(self) -> bytes:
+        return b""
+
+
+class _GzipSegmentWriter(SegmentWriter):
+    """Single gzip member with a full flush (dictionary reset) after each segment."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+        self._crc = 0
+        self._length = 0
+        # Fixed header: no name, mtime 0, unknown OS
+        self._parts.append(b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff")
+        self._size = 10
+
+    def _encode(self, data: bytes) -> bytes:
+        self._crc = zlib.crc32(data, self._crc)
+        self._length += len(data)
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FULL_FLUSH)
+
+    def _trailer(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH) + struct.pack(
+            "<II", self._crc, self._length & 0xFFFFFFFF
+        )
+
+
+class _ZstdSegmentWriter(SegmentWriter):
+    """One zstd frame per segment; decoders process concatenated frames in order."""
+
+    def _encode(self, data: bytes) -> bytes:
+        return zstd.compress(data, level=3)
+
+
+@dataclass(frozen=True)
+class Codec:
+    """A compression format with its file suffix and HTTP content coding."""
+
+    encoding: str
+    suffix: str
+    compress: Callable[[bytes], bytes]
+    decompressor: Callable[[], Decompressor]
+    segment_writer: Callable[[], SegmentWriter]
+    decompress_segment: Callable[[bytes], bytes]
+
+
+IDENTITY = Codec(
+    "identity", "", lambda data: data, _IdentityDecompressor, SegmentWriter, lambda data: data
+)
+
+GZIP = Codec(
+    "gzip",
+    ".gz",
+    lambda data: gzip.compress(data, compresslevel=6, mtime=0),
+    lambda: zlib.decompressobj(wbits=zlib.MAX_WBITS | 16),
+    _GzipSegmentWriter,
+    lambda data: zlib.decompressobj(wbits=-zlib.MAX_WBITS).decompress(data),
+)
+
+ZSTD = (
+    Codec(
+        "zstd",
+        ".zst",
+        lambda data: zstd.compress(data, level=3),
+        zstd.ZstdDecompressor,
+        _ZstdSegmentWriter,
+        zstd.decompress,
+    )
+    if zstd is not None
+    else None
+)
+
+
+def default_codec() -> Codec:
+    """Best available codec: zstd when installed, gzip otherwise."""
+    return ZSTD or GZIP
+
+
+def codec_for_path(path: str | Path) -> Codec:
+    """Infer the codec from an artifact's file suffix."""
+    suffix = Path(path).suffix
+    if suffix == GZIP.suffix:
+        return GZIP
+    if suffix == ".zst":
+        if ZSTD is None:
+            raise RuntimeError("zstd support is not installed (pip install backports.zstd)")
+        return ZSTD
+    return IDENTITY
+
+
+def iter_decompressed(path: str | Path, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Stream the decompressed contents of an artifact without loading it whole.
+
+    Concatenated gzip members / zstd frames are decoded back to back, matching
+    what HTTP clients do with a multi-member body.
+    """
+    codec = codec_for_path(path)
+    decompressor = codec.decompressor()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            while chunk:
+                if data := decompressor.decompress(chunk):
+                    yield data
+                if not decompressor.eof:
+                    break
+                chunk = decompressor.unused_data
+                decompressor = codec.decompressor()
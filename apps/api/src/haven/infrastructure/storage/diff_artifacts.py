@@ -0,0 +1,134 @@
+"""Encoding of diff artifacts with a per-file index for random access."""
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from haven.infrastructure.storage.artifact_store import ArtifactStore
+from haven.infrastructure.storage.compression import Codec, codec_for_path, iter_decompressed
+
+INDEX_VERSION = 1
+
+
+def _dump_json(data: object) -> bytes:
+    """Serialize compactly; the files are read by machines, not people."""
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _file_path(file: dict[str, Any]) -> str:
+    """Display path of a diff file (the old name for deletions)."""
+    new_name = file.get("newName")
+    if not new_name or new_name == "/dev/null":
+        return file.get("oldName") or ""
+    return new_name
+
+
+def _file_status(file: dict[str, Any]) -> str:
+    """Git-style status of a diff file."""
+    if file.get("isNew"):
+        return "added"
+    if file.get("isDeleted"):
+        return "deleted"
+    if file.get("isRename"):
+        return "renamed"
+    if file.get("isCopy"):
+        return "copied"
+    return "modified"
+
+
+def _index_entry(file: dict[str, Any], offset: int | None, length: int | None) -> dict[str, Any]:
+    """Summary of a diff file and where its segment lives in the artifact."""
+    old_name = file.get("oldName")
+    return {
+        "path": _file_path(file),
+        "old_path": old_name if old_name not in (None, "/dev/null") else None,
+        "status": _file_status(file),
+        "is_binary": bool(file.get("isBinary")),
+        "added_lines": file.get("addedLines", 0),
+        "deleted_lines": file.get("deletedLines", 0),
+        "offset": offset,
+        "length": length,
+    }
+
+
+def encode_diff_artifact(
+    commit: dict[str, Any], files: Iterable[dict[str, Any]], codec: Codec
+) -> tuple[bytes, bytes]:
+    """
+    Encode a diff artifact and its per-file index.
+
+    The artifact is the usual ``{"commit": ..., "files": [...]}`` document, compressed
+    so that every file is a separately decodable segment. The index records each
+    file's summary and the byte range of its segment in the compressed artifact.
+
+    Args:
+        commit: Commit metadata embedded in the artifact
+        files: diff2html-shaped file dicts, consumed lazily
+        codec: Compression codec for the artifact
+
+    Returns:
+        Compressed artifact bytes and index JSON bytes
+    """
+    writer = codec.segment_writer()
+    writer.add(b'{"commit":' + _dump_json(commit) + b',"files":[')
+    entries = []
+    for i, file in enumerate(files):
+        offset, length = writer.add((b"," if i else b"") + _dump_json(file))
+        entries.append(_index_entry(file, offset, length))
+    writer.add(b"]}")
+
+    index = {"version": INDEX_VERSION, "encoding": codec.encoding, "files": entries}
+    return writer.finish(), _dump_json(index)
+
+
+def _load_artifact(artifact_path: Path) -> dict[str, Any]:
+    """Decode a whole artifact (for artifacts written without an index)."""
+    return json.loads(b"".join(iter_decompressed(artifact_path)))
+
+
+def read_file_index(artifact_path: str | Path) -> list[dict[str, Any]]:
+    """
+    Read the file list of an artifact without decoding any hunks.
+
+    Artifacts written before indexes existed are decoded once as a fallback.
+
+    Returns:
+        Index entries in diff order
+    """
+    try:
+        index = json.loads(ArtifactStore.index_path(artifact_path).read_bytes())
+        return index["files"]
+    except FileNotFoundError:
+        files = _load_artifact(Path(artifact_path))["files"]
+        return [_index_entry(file, None, None) for file in files]
+
+
+def read_file_diff(artifact_path: str | Path, path: str) -> bytes | None:
+    """
+    Read one file's diff2html JSON by seeking to its segment.
+
+    Args:
+        artifact_path: Artifact file
+        path: File path as listed in the index (old paths also match)
+
+    Returns:
+        JSON bytes of the file object, or None if the commit does not touch ``path``
+    """
+    entries = read_file_index(artifact_path)
+    position = next(
+        (i for i, entry in enumerate(entries) if path in (entry["path"], entry["old_path"])),
+        None,
+    )
+    if position is None:
+        return None
+
+    entry = entries[position]
+    if entry["offset"] is None:
+        files = _load_artifact(Path(artifact_path))["files"]
+        return _dump_json(files[position])
+
+    with open(artifact_path, "rb") as f:
+        f.seek(entry["offset"])
+        segment = f.read(entry["length"])
+    return codec_for_path(artifact_path).decompress_segment(segment).removeprefix(b",")
@@ -1,22 +1,33 @@
 """FastAPI application setup."""
 
+import asyncio
+import contextlib
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from strawberry.fastapi import GraphQLRouter
 
 from haven.config import get_settings
 from haven.domain.exceptions import DomainError, RecordNotFoundError
+from haven.infrastructure.database.engines import API, engine_registry
 from haven.infrastructure.database.factory import db_factory
+from haven.infrastructure.database.routing import request_routing
+from haven.infrastructure.git.object_pool import git_object_pool
 from haven.interface.api.commit_routes import router as commit_router
 from haven.interface.api.diff_routes import router as diff_router
+from haven.interface.api.job_routes import router as job_router
 from haven.interface.api.repository_routes import router as repository_router
 from haven.interface.api.repository_management_routes import router as repo_mgmt_router
 from haven.interface.api.routes import router as api_router
 from haven.interface.api.ttr_routes import router as ttr_router
+from haven.interface.graphql.context import get_context
+from haven.interface.graphql.persisted_queries import (
+    PersistedQueryMiddleware,
+    PersistedQueryStore,
+)
 from haven.interface.graphql.schema import schema
 
 
@@ -26,10 +37,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     settings = get_settings()
     app.state.settings = settings
+    # Fill the API pool in the background so startup never waits on the database
+    warm_up = asyncio.create_task(engine_registry.warm_up(API))
 
     yield
 
     # Shutdown
+    warm_up.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await warm_up
+    await git_object_pool.close()
     await db_factory.dispose()
 
 
@@ -54,6 +71,12 @@ def create_app() -> FastAPI:
         allow_headers=settings.cors.allow_headers,
     )
 
+    # Keep each request on the primary once it has written (read-your-writes)
+    @app.middleware("http")
+    async def route_database_reads(request: Request, call_next):
+        with request_routing():
+            return await call_next(request)
+
     # Include API routes
     app.include_router(api_router, prefix="/api/v1")
     app.include_router(diff_router, prefix="/api/v1")
@@ -61,10 +84,17 @@ def create_app() -> FastAPI:
     app.include_router(commit_router)
     app.include_router(repository_router)
     app.include_router(repo_mgmt_router)
+    app.include_router(job_router)
 
     # Add GraphQL endpoint
-    graphql_app = GraphQLRouter(schema)
+    graphql_app = GraphQLRouter(schema, context_getter=get_context)
     app.include_router(graphql_app, prefix="/graphql")
+    if settings.graphql.persisted_queries != "off":
+        app.add_middleware(
+            PersistedQueryMiddleware,
+            store=PersistedQueryStore.from_settings(settings.graphql),
+            path="/graphql",
+        )
 
     # Add exception handlers
     @app.exception_handler(RecordNotFoundError)
@@ -101,4 +131,9 @@ def create_app() -> FastAPI:
             "environment": settings.app.env,
         }
 
+    @app.get("/api/v1/health/db-pools", tags=["Health"])
+    async def database_pool_status():
+        """Report occupancy and checkout wait times of the database connection pools."""
+        return {"pools": engine_registry.pool_status()}
+
     return app
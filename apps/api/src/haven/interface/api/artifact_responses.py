@@ -0,0 +1,71 @@
+"""HTTP responses for stored (possibly compressed) artifacts."""
+
+from pathlib import Path
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+
+from haven.infrastructure.storage.compression import IDENTITY, codec_for_path, iter_decompressed
+
+
+def accepts_encoding(accept_encoding: str, encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows ``encoding`` (honouring q=0)."""
+    wildcard = False
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name == encoding:
+            return q > 0
+        if name == "*":
+            wildcard = q > 0
+    return wildcard
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def artifact_response(
+    request: Request, path: Path, etag: str, media_type: str = "application/json"
+) -> Response:
+    """
+    Serve an artifact without decoding it.
+
+    Compressed artifacts are sent as-is with a matching Content-Encoding when the
+    client accepts it, and decompressed on the fly otherwise. The ETag is weak
+    because the same artifact may be sent with different content codings.
+
+    Args:
+        request: Incoming request (for Accept-Encoding and If-None-Match)
+        path: Artifact file
+        etag: Entity tag identifying the artifact's content
+        media_type: Media type of the decoded content
+
+    Returns:
+        304, file or streaming response
+    """
+    headers = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    codec = codec_for_path(path)
+    if codec is IDENTITY:
+        return FileResponse(path, media_type=media_type, headers=headers)
+    if accepts_encoding(request.headers.get("accept-encoding", ""), codec.encoding):
+        headers["Content-Encoding"] = codec.encoding
+        return FileResponse(path, media_type=media_type, headers=headers)
+    return StreamingResponse(iter_decompressed(path), media_type=media_type, headers=headers)
@@ -1,39 +1,56 @@
 """API routes for commit management and diff generation."""
 
-import os
+import hashlib
+from collections.abc import Awaitable, Callable
 from pathlib import Path
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-
-from haven.application.services.diff_html_service import DiffHtmlService
-from haven.domain.entities.commit import Commit, CommitReview
-from haven.infrastructure.database.dependencies import get_db
+from sqlalchemy import Select
+
+from haven.application.services.diff_html_service import DiffHtmlService, plan_diff_batches
+from haven.domain.entities.commit import Commit, CommitReview, DiffStats, ReviewStatus
+from haven.domain.exceptions import AmbiguousCommitHashError
+from haven.domain.repositories.commit_repository import CommitKey
+from haven.infrastructure.database import commit_search
+from haven.infrastructure.database.counting import CountResult
+from haven.infrastructure.database.dependencies import get_db, get_read_db
 from haven.infrastructure.database.repositories.commit_repository import (
     SQLAlchemyCommitRepository,
     SQLAlchemyCommitReviewRepository,
 )
+from haven.infrastructure.git.commit_probe import missing_commits, probe_repositories
 from haven.infrastructure.git.git_client import GitClient
+from haven.infrastructure.storage.artifact_store import default_artifact_root
+from haven.infrastructure.storage.diff_artifacts import read_file_diff, read_file_index
+from haven.interface.api.artifact_responses import artifact_response, etag_matches
 from haven.interface.api.schemas.commit_schemas import (
+    BulkReviewRequest,
+    BulkReviewResponse,
+    BulkReviewStatusRequest,
     CommitCreate,
     CommitDiffResponse,
     CommitResponse,
     CommitWithReviewResponse,
     CommitReviewCreate,
     CommitReviewResponse,
+    DiffFileEntry,
+    DiffFileListResponse,
     PaginatedCommitResponse,
     PaginatedCommitWithReviewResponse,
     ReviewCommentCreate,
     ReviewCommentResponse,
 )
-from haven.domain.entities.commit import ReviewStatus
-from sqlalchemy import func, desc
-from datetime import datetime, timezone
+from haven.interface.cursors import InvalidCursorError, decode_commit_cursor, encode_commit_cursor
+from datetime import UTC, datetime, timezone
 
 router = APIRouter(prefix="/api/v1/commits", tags=["commits"])
 
+# Ordering of paginated commit searches
+CommitSort = Literal["date", "relevance"]
+
 
 async def _load_single_commit_from_git(repository, commit_hash: str, db: AsyncSession):
     """Load a single commit from git repository if it exists."""
@@ -48,7 +65,6 @@ async def _load_single_commit_from_git(repository, commit_hash: str, db: AsyncSe
             "show",
             "--format=%H|%an|%ae|%cn|%ce|%ct|%s",
             "--numstat",
-            "--no-patch",
             commit_hash
         ]
         
@@ -92,14 +108,14 @@ async def _load_single_commit_from_git(repository, commit_hash: str, db: AsyncSe
             committer_name=committer_name,
             committer_email=committer_email,
             committed_at=datetime.fromtimestamp(int(timestamp), tz=timezone.utc),
-            files_changed=files_changed,
-            insertions=insertions,
-            deletions=deletions,
+            diff_stats=DiffStats(
+                files_changed=files_changed, insertions=insertions, deletions=deletions
+            ),
         )
         
         # Save to database
         repo = SQLAlchemyCommitRepository(db)
-        await repo.create(commit)
+        commit = await repo.create(commit)
         await db.commit()
         
         return commit
@@ -142,7 +158,7 @@ async def list_commits(
     repository_id: int = Query(..., description="Repository ID"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[CommitResponse]:
     """List commits for a repository."""
     repo = SQLAlchemyCommitRepository(db)
@@ -151,174 +167,185 @@ async def list_commits(
     return [CommitResponse.from_entity(commit) for commit in commits]
 
 
+async def _list_commit_page(
+    repo: SQLAlchemyCommitRepository,
+    fetch: Callable[[Select], Awaitable[list]],
+    repository_id: int,
+    page: int,
+    page_size: int,
+    after: str | None,
+    before: str | None,
+    search: str | None,
+    author: str | None,
+    date_from: str | None,
+    date_to: str | None,
+    sort: CommitSort = "date",
+    review_status: ReviewStatus | None = None,
+) -> tuple[list, CountResult, str | None, str | None]:
+    """
+    Fetch one page of commits by cursor, or by page number for compatibility.
+
+    Cursor pages seek on ``(committed_at, id)`` so deep pages cost the same as
+    the first one; page numbers fall back to OFFSET. Both modes return cursors
+    for the neighbouring pages so clients can switch to cursors at any point.
+    Whether more pages exist is probed from the rows themselves, so it stays
+    correct when the total is an estimate. Relevance-sorted searches page by
+    number only, since cursors follow commit date order.
+
+    Args:
+        fetch: Runs the listing statement, e.g. ``repo.fetch_commits``
+
+    Returns:
+        Fetched commits, total matching commits, next cursor and previous cursor
+    """
+    filters = {
+        "search_query": search,
+        "author_filter": author,
+        "date_from": date_from,
+        "date_to": date_to,
+        "review_status": review_status.value if review_status else None,
+    }
+
+    if after and before:
+        raise HTTPException(status_code=400, detail="Use either 'after' or 'before', not both")
+
+    count = await repo.count_listing(repository_id, **filters)
+
+    if after or before:
+        try:
+            after_key = decode_commit_cursor(after) if after else None
+            before_key = decode_commit_cursor(before) if before else None
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+        result = await repo.get_page(
+            repository_id, page_size, after=after_key, before=before_key, fetch=fetch, **filters
+        )
+        commits = result.items
+        # Moving backwards, "more" lies before the page and the next page always exists
+        has_next = result.has_more if after else bool(commits)
+        has_prev = bool(commits) if after else result.has_more
+    else:
+        offset = (page - 1) * page_size
+        # Fetch one extra commit to learn whether another page exists
+        commits = await fetch(
+            repo.listing_statement(
+                repository_id,
+                page_size + 1,
+                offset,
+                order_by_relevance=sort == "relevance",
+                **filters,
+            )
+        )
+        has_next = len(commits) > page_size
+        commits = commits[:page_size]
+        has_prev = page > 1
+        if sort == "relevance" and search:
+            return commits, count, None, None
+
+    next_cursor = encode_commit_cursor(CommitKey.of(commits[-1])) if has_next and commits else None
+    prev_cursor = encode_commit_cursor(CommitKey.of(commits[0])) if has_prev and commits else None
+    return commits, count, next_cursor, prev_cursor
+
+
 @router.get("/paginated-with-reviews", response_model=PaginatedCommitWithReviewResponse)
 async def list_commits_paginated_with_reviews(
     repository_id: int = Query(..., description="Repository ID"),
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when a cursor is given)"),
     page_size: int = Query(20, ge=1, le=500, description="Items per page"),
+    after: str | None = Query(None, description="Cursor: return commits older than this one"),
+    before: str | None = Query(None, description="Cursor: return commits newer than this one"),
     search: str | None = Query(None, description="Search in commit message or hash"),
+    sort: CommitSort = Query("date", description="Order searches by date or relevance"),
     author: str | None = Query(None, description="Filter by author name or email"),
     date_from: str | None = Query(None, description="Filter commits from this date (ISO format)"),
     date_to: str | None = Query(None, description="Filter commits until this date (ISO format)"),
     branch: str | None = Query(None, description="Filter by branch name"),
-    db: AsyncSession = Depends(get_db),
+    review_status: ReviewStatus | None = Query(
+        None, description="Filter by the status of each commit's latest review"
+    ),
+    db: AsyncSession = Depends(get_read_db),
 ) -> PaginatedCommitWithReviewResponse:
     """List commits with review status for a repository."""
     repo = SQLAlchemyCommitRepository(db)
-    review_repo = SQLAlchemyCommitReviewRepository(db)
-
-    # Calculate offset from page number
-    offset = (page - 1) * page_size
-
-    # Check if we have any search/filter parameters
-    has_filters = any([search, author, date_from, date_to])
-
-    if has_filters:
-        # Use search method
-        commits = await repo.search_commits(
-            repository_id=repository_id,
-            search_query=search,
-            author_filter=author,
-            date_from=date_from,
-            date_to=date_to,
-            limit=page_size,
-            offset=offset,
-        )
-        total = await repo.count_search_results(
-            repository_id=repository_id,
-            search_query=search,
-            author_filter=author,
-            date_from=date_from,
-            date_to=date_to,
-        )
-    else:
-        # Use regular listing
-        commits = await repo.get_by_repository(repository_id, page_size, offset)
-        total = await repo.count_by_repository(repository_id)
-
-    # Get reviews for all commits
-    commit_ids = [c.id for c in commits]
-    from haven.infrastructure.database.models import CommitReviewModel
-    
-    if commit_ids:
-        # Get latest review status for each commit
-        subquery = (
-            select(
-                CommitReviewModel.commit_id,
-                func.max(CommitReviewModel.created_at).label("latest_created_at")
-            )
-            .filter(CommitReviewModel.commit_id.in_(commit_ids))
-            .group_by(CommitReviewModel.commit_id)
-            .subquery()
-        )
-        
-        reviews_stmt = (
-            select(
-                CommitReviewModel.commit_id,
-                CommitReviewModel.status,
-                func.count(CommitReviewModel.id).label("review_count"),
-                func.max(CommitReviewModel.reviewed_at).label("latest_review_at")
-            )
-            .join(
-                subquery,
-                (CommitReviewModel.commit_id == subquery.c.commit_id) &
-                (CommitReviewModel.created_at == subquery.c.latest_created_at)
-            )
-            .group_by(CommitReviewModel.commit_id, CommitReviewModel.status)
-        )
-        
-        reviews_query = await db.execute(reviews_stmt)
-        
-        review_map = {
-            row.commit_id: {
-                "status": ReviewStatus(row.status),
-                "count": row.review_count,
-                "latest_at": row.latest_review_at
-            }
-            for row in reviews_query
-        }
-    else:
-        review_map = {}
 
-    # Build response with reviews
-    items_with_reviews = []
-    for commit in commits:
-        commit_response = CommitResponse.from_entity(commit)
-        review_info = review_map.get(commit.id, {})
-        
-        items_with_reviews.append(
-            CommitWithReviewResponse(
-                **commit_response.model_dump(),
-                review_status=review_info.get("status"),
-                review_count=review_info.get("count", 0),
-                latest_review_at=review_info.get("latest_at")
-            )
-        )
+    rows, count, next_cursor, prev_cursor = await _list_commit_page(
+        repo,
+        repo.fetch_with_latest_review,
+        repository_id,
+        page,
+        page_size,
+        after,
+        before,
+        search,
+        author,
+        date_from,
+        date_to,
+        sort,
+        review_status,
+    )
 
     # Calculate total pages
+    total = count.total
     total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
     return PaginatedCommitWithReviewResponse(
-        items=items_with_reviews,
+        items=[CommitWithReviewResponse.from_row(row) for row in rows],
         total=total,
-        page=page,
+        total_is_estimate=count.is_estimate,
+        page=None if after or before else page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
     )
 
 
 @router.get("/paginated", response_model=PaginatedCommitResponse)
 async def list_commits_paginated(
     repository_id: int = Query(..., description="Repository ID"),
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when a cursor is given)"),
     page_size: int = Query(20, ge=1, le=500, description="Items per page"),
+    after: str | None = Query(None, description="Cursor: return commits older than this one"),
+    before: str | None = Query(None, description="Cursor: return commits newer than this one"),
     search: str | None = Query(None, description="Search in commit message or hash"),
+    sort: CommitSort = Query("date", description="Order searches by date or relevance"),
     author: str | None = Query(None, description="Filter by author name or email"),
     date_from: str | None = Query(None, description="Filter commits from this date (ISO format)"),
     date_to: str | None = Query(None, description="Filter commits until this date (ISO format)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> PaginatedCommitResponse:
     """List commits for a repository with pagination metadata and search/filter support."""
     repo = SQLAlchemyCommitRepository(db)
 
-    # Calculate offset from page number
-    offset = (page - 1) * page_size
-
-    # Check if we have any search/filter parameters
-    has_filters = any([search, author, date_from, date_to])
-
-    if has_filters:
-        # Use search method
-        commits = await repo.search_commits(
-            repository_id=repository_id,
-            search_query=search,
-            author_filter=author,
-            date_from=date_from,
-            date_to=date_to,
-            limit=page_size,
-            offset=offset,
-        )
-        total = await repo.count_search_results(
-            repository_id=repository_id,
-            search_query=search,
-            author_filter=author,
-            date_from=date_from,
-            date_to=date_to,
-        )
-    else:
-        # Use regular listing
-        commits = await repo.get_by_repository(repository_id, page_size, offset)
-        total = await repo.count_by_repository(repository_id)
+    commits, count, next_cursor, prev_cursor = await _list_commit_page(
+        repo,
+        repo.fetch_commits,
+        repository_id,
+        page,
+        page_size,
+        after,
+        before,
+        search,
+        author,
+        date_from,
+        date_to,
+        sort,
+    )
 
     # Calculate total pages
+    total = count.total
     total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
     return PaginatedCommitResponse(
         items=[CommitResponse.from_entity(commit) for commit in commits],
         total=total,
-        page=page,
+        total_is_estimate=count.is_estimate,
+        page=None if after or before else page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
     )
 
 
@@ -326,7 +353,7 @@ async def list_commits_paginated(
 async def get_commit_by_hash(
     commit_hash: str,
     repository_id: int = Query(..., description="Repository ID"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> CommitResponse:
     """Get a commit by hash."""
     repo = SQLAlchemyCommitRepository(db)
@@ -343,32 +370,45 @@ async def get_commit_by_hash_global(
     commit_hash: str,
     db: AsyncSession = Depends(get_db),
 ) -> CommitResponse:
-    """Get a commit by hash across all repositories."""
+    """Get a commit by full or abbreviated hash across all repositories."""
+    if (
+        not commit_search.is_hash_prefix(commit_hash)
+        or len(commit_hash) > max(commit_search.FULL_HASH_LENGTHS)
+    ):
+        raise HTTPException(status_code=404, detail="Commit not found")
+    commit_hash = commit_hash.lower()
+
+    # One indexed query resolves the hash to its repository
     repo = SQLAlchemyCommitRepository(db)
-    
-    # Try to find commit by hash across all repositories
+    try:
+        commit = await repo.resolve_hash(commit_hash)
+    except AmbiguousCommitHashError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    if commit:
+        return CommitResponse.from_entity(commit)
+
+    if commit_hash in missing_commits:
+        raise HTTPException(status_code=404, detail="Commit not found")
+
+    # If not found in database, probe the git repositories in parallel and load it
     from haven.infrastructure.database.repositories.repository_repository import RepositoryRepositoryImpl
     repo_impl = RepositoryRepositoryImpl(db)
-    repositories = await repo_impl.get_all()
-    
-    for repository in repositories:
-        commit = await repo.get_by_hash(repository.id, commit_hash)
-        if commit:
-            return CommitResponse.from_entity(commit)
-    
-    # If not found in database, try to load it from git repositories
-    for repository in repositories:
-        loaded_commit = await _load_single_commit_from_git(repository, commit_hash, db)
+    repositories = sorted(await repo_impl.get_all(), key=lambda repository: repository.id)
+    found = await probe_repositories(repositories, commit_hash)
+    if found:
+        repository, full_hash = found
+        loaded_commit = await _load_single_commit_from_git(repository, full_hash, db)
         if loaded_commit:
             return CommitResponse.from_entity(loaded_commit)
-    
+
+    missing_commits.add(commit_hash)
     raise HTTPException(status_code=404, detail="Commit not found")
 
 
 @router.get("/{commit_id}", response_model=CommitResponse)
 async def get_commit(
     commit_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> CommitResponse:
     """Get a commit by ID."""
     repo = SQLAlchemyCommitRepository(db)
@@ -394,9 +434,7 @@ async def generate_commit_diff(
 
     # Initialize services
     git_client = GitClient()
-    # Use local diff output directory when running locally
-    output_dir = "/app/diff-output" if os.path.exists("/app") else "diff-output"
-    diff_service = DiffHtmlService(git_client, repo, output_dir)
+    diff_service = DiffHtmlService(git_client, repo, str(default_artifact_root()))
 
     # Get repository information
     from haven.infrastructure.database.repositories.repository_repository import RepositoryRepositoryImpl
@@ -406,19 +444,19 @@ async def generate_commit_diff(
     if not repository:
         raise HTTPException(status_code=404, detail="Repository not found")
     
-    # Generate diff HTML
+    # Generate diff HTML (a cache hit costs a stat() and no git work)
     html_path = await diff_service.generate_diff_html(commit, repository.url)
 
-    # Commit changes
-    await db.commit()
-
-    # Get updated commit
-    updated_commit = await repo.get_by_id(commit_id)
+    if commit.diff_html_path != html_path:
+        commit.diff_html_path = html_path
+        commit.diff_generated_at = datetime.now(UTC)
+        await repo.update(commit)
+        await db.commit()
 
     return CommitDiffResponse(
         commit_id=commit_id,
         diff_html_path=html_path,
-        diff_generated_at=updated_commit.diff_generated_at,
+        diff_generated_at=commit.diff_generated_at,
     )
 
 
@@ -427,49 +465,45 @@ async def generate_batch_diffs(
     commit_ids: list[int],
     db: AsyncSession = Depends(get_db),
 ) -> dict:
-    """Generate HTML diffs for multiple commits in parallel."""
+    """Generate HTML diffs for multiple commits, from any repositories, in parallel."""
     repo = SQLAlchemyCommitRepository(db)
-
-    # Get all commits
-    commits = []
-    for commit_id in commit_ids:
-        commit = await repo.get_by_id(commit_id)
-        if commit:
-            commits.append(commit)
+    commits = await repo.get_many_by_ids(commit_ids)
 
     if not commits:
         raise HTTPException(status_code=404, detail="No valid commits found")
 
     # Initialize services
     git_client = GitClient()
-    # Use local diff output directory when running locally
-    output_dir = "/app/diff-output" if os.path.exists("/app") else "diff-output"
-    diff_service = DiffHtmlService(git_client, repo, output_dir)
+    diff_service = DiffHtmlService(git_client, repo, str(default_artifact_root()))
 
-    # Get repository information from first commit
+    # Resolve every involved repository in one query and group commits per repository
     from haven.infrastructure.database.repositories.repository_repository import RepositoryRepositoryImpl
     repo_impl = RepositoryRepositoryImpl(db)
-    repository = await repo_impl.get_by_id(commits[0].repository_id)
-    
-    if not repository:
+    repositories = await repo_impl.get_many_by_ids({commit.repository_id for commit in commits})
+    plan = plan_diff_batches(commits, repositories)
+
+    if not plan.batches:
         raise HTTPException(status_code=404, detail="Repository not found")
-    
-    # Process commits in parallel
-    results = await diff_service.process_commits_batch(commits, repository.url, max_concurrent=5)
+
+    # Process repositories in parallel, each with its own concurrency limit
+    results = await diff_service.process_batch_plan(plan, max_concurrent_per_repo=5)
 
     # Commit changes
     await db.commit()
 
+    found = {commit.id for commit in commits}
     return {
         "processed": len(results),
         "results": results,
+        "not_found": [commit_id for commit_id in commit_ids if commit_id not in found],
+        "repository_not_found": [commit.id for commit in plan.unresolved],
     }
 
 
 @router.get("/{commit_id}/diff-html")
 async def get_commit_diff_html(
     commit_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get the HTML diff file for a commit (legacy)."""
     repo = SQLAlchemyCommitRepository(db)
@@ -493,12 +527,8 @@ async def get_commit_diff_html(
     )
 
 
-@router.get("/{commit_id}/diff-json")
-async def get_commit_diff_json(
-    commit_id: int,
-    db: AsyncSession = Depends(get_db),
-):
-    """Get the JSON diff data for a commit."""
+async def _get_diff_artifact(commit_id: int, db: AsyncSession) -> tuple[Commit, Path]:
+    """Load a commit and the path of its generated diff artifact."""
     repo = SQLAlchemyCommitRepository(db)
     commit = await repo.get_by_id(commit_id)
 
@@ -513,15 +543,118 @@ async def get_commit_diff_json(
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Diff file not found")
 
-    # Read and return JSON content
-    import json
-    with open(file_path, 'r') as f:
-        diff_data = json.load(f)
-    
-    return diff_data
+    return commit, file_path
+
+
+def _diff_etag(commit: Commit, artifact_path: Path, suffix: str = "") -> str:
+    """Weak ETag for a diff artifact (or part of it)."""
+    # Commits are immutable; the artifact name distinguishes renderer versions
+    artifact_id = artifact_path.name.split(".", 1)[0]
+    return f'W/"{commit.commit_hash}-{artifact_id[:12]}{suffix}"'
+
+
+@router.get("/{commit_id}/diff-json")
+async def get_commit_diff_json(
+    commit_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    """Get the JSON diff data for a commit, served from the stored artifact as-is."""
+    commit, file_path = await _get_diff_artifact(commit_id, db)
+    return artifact_response(request, file_path, _diff_etag(commit, file_path))
+
+
+@router.get("/{commit_id}/diff-files", response_model=DiffFileListResponse)
+async def get_commit_diff_files(
+    commit_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """List the files changed by a commit without loading their hunks."""
+    commit, file_path = await _get_diff_artifact(commit_id, db)
+
+    etag = _diff_etag(commit, file_path, "-files")
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+    entries = read_file_index(file_path)
+    return DiffFileListResponse(
+        commit_id=commit_id,
+        commit_hash=commit.commit_hash,
+        total_files=len(entries),
+        files=[DiffFileEntry(**entry) for entry in entries],
+    )
+
+
+@router.get("/{commit_id}/diff-files/{path:path}")
+async def get_commit_diff_file(
+    commit_id: int,
+    path: str,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    """Get the diff JSON (blocks and lines) for a single file of a commit."""
+    commit, file_path = await _get_diff_artifact(commit_id, db)
+
+    etag = _diff_etag(commit, file_path, f"-{hashlib.sha1(path.encode()).hexdigest()[:8]}")
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    content = read_file_diff(file_path, path)
+    if content is None:
+        raise HTTPException(status_code=404, detail="File not changed in this commit")
+
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 # Review endpoints
+@router.post("/reviews/bulk/approve", response_model=BulkReviewResponse)
+async def bulk_approve_commits(
+    request: BulkReviewStatusRequest,
+    db: AsyncSession = Depends(get_db),
+) -> BulkReviewResponse:
+    """Approve a reviewer's reviews on many commits in one transaction."""
+    return await _bulk_update_review_status(request, ReviewStatus.APPROVED, db)
+
+
+@router.post("/reviews/bulk/request-changes", response_model=BulkReviewResponse)
+async def bulk_request_changes(
+    request: BulkReviewStatusRequest,
+    db: AsyncSession = Depends(get_db),
+) -> BulkReviewResponse:
+    """Request changes on a reviewer's reviews of many commits in one transaction."""
+    return await _bulk_update_review_status(request, ReviewStatus.NEEDS_REVISION, db)
+
+
+async def _bulk_update_review_status(
+    request: BulkReviewStatusRequest, status: ReviewStatus, db: AsyncSession
+) -> BulkReviewResponse:
+    review_repo = SQLAlchemyCommitReviewRepository(db)
+    outcomes = await review_repo.bulk_update_status(
+        request.commit_ids, request.reviewer_id, status, request.notes
+    )
+    await db.commit()
+
+    return BulkReviewResponse.from_outcomes(outcomes)
+
+
+@router.post("/reviews/bulk/assign", response_model=BulkReviewResponse)
+async def bulk_assign_reviewer(
+    request: BulkReviewRequest,
+    db: AsyncSession = Depends(get_db),
+) -> BulkReviewResponse:
+    """Create pending reviews for a reviewer on many commits in one transaction."""
+    review_repo = SQLAlchemyCommitReviewRepository(db)
+    outcomes = await review_repo.bulk_assign(request.commit_ids, request.reviewer_id)
+    await db.commit()
+
+    return BulkReviewResponse.from_outcomes(outcomes)
+
+
 @router.post("/{commit_id}/reviews", response_model=CommitReviewResponse)
 async def create_commit_review(
     commit_id: int,
@@ -554,7 +687,7 @@ async def create_commit_review(
 @router.get("/{commit_id}/reviews", response_model=list[CommitReviewResponse])
 async def list_commit_reviews(
     commit_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[CommitReviewResponse]:
     """List all reviews for a commit."""
     review_repo = SQLAlchemyCommitReviewRepository(db)
@@ -610,7 +743,7 @@ async def create_review_comment(
 @router.get("/{commit_id}/comments", response_model=list[ReviewCommentResponse])
 async def list_review_comments(
     commit_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[ReviewCommentResponse]:
     """List all inline comments for a commit."""
     from haven.infrastructure.database.repositories.review_repository import SqlAlchemyReviewCommentRepository
@@ -3,14 +3,21 @@
 import asyncio
 from datetime import datetime
 from pathlib import Path
-from uuid import uuid4
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import FileResponse, HTMLResponse
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.infrastructure.database.dependencies import get_job_queue
+from haven.infrastructure.git.commit_log import iter_commit_log
+from haven.infrastructure.jobs import Job, JobQueue, JobStatus
 
 router = APIRouter(tags=["Diffs"])
 
+# Job kind handled by `haven worker`
+GENERATE_BRANCH_DIFFS_JOB = "generate_branch_diffs"
+
 
 class DiffRequest(BaseModel):
     """Request model for diff generation."""
@@ -41,8 +48,13 @@ class DiffGenerationStatus(BaseModel):
     commit_count: int | None = None
 
 
-# Store for background tasks status
-diff_tasks = {}
+# Task statuses reported by the status endpoint, by job status
+TASK_STATUSES = {
+    JobStatus.QUEUED: "pending",
+    JobStatus.RUNNING: "processing",
+    JobStatus.SUCCEEDED: "completed",
+    JobStatus.FAILED: "failed",
+}
 
 
 async def run_command(cmd: list[str], cwd: str | None = None) -> tuple[str, str, int]:
@@ -76,112 +88,86 @@ async def check_diff2html():
             raise RuntimeError(f"Failed to install diff2html: {stderr}")
 
 
-async def generate_diffs_task(task_id: str, branch: str, base_branch: str, max_commits: int):
-    """Background task to generate diffs."""
-    try:
-        diff_tasks[task_id]["status"] = "processing"
-
-        # Create output directory in .tmp
-        # Use /app/.tmp in Docker, or ../../.tmp locally
-        if Path("/app/.tmp").exists():
-            tmp_base = Path("/app/.tmp/diff-output")
-        else:
-            tmp_base = Path("../../.tmp/diff-output")
-        tmp_base.mkdir(parents=True, exist_ok=True)
-        output_dir = tmp_base / f"diff-out-{task_id}"
-        output_dir.mkdir(exist_ok=True)
-        diff_tasks[task_id]["output_dir"] = str(output_dir)
-
-        # Check diff2html
-        await check_diff2html()
-
-        # Get list of commits
-        cmd = [
-            "git",
-            "rev-list",
-            "--reverse",
-            f"--max-count={max_commits}",
-            f"{base_branch}..{branch}",
+async def generate_diffs_task(
+    task_id: str, branch: str, base_branch: str, max_commits: int
+) -> dict:
+    """Generate diffs for the commits of ``branch`` that are not in ``base_branch``."""
+    # Create output directory in .tmp
+    # Use /app/.tmp in Docker, or ../../.tmp locally
+    if Path("/app/.tmp").exists():
+        tmp_base = Path("/app/.tmp/diff-output")
+    else:
+        tmp_base = Path("../../.tmp/diff-output")
+    tmp_base.mkdir(parents=True, exist_ok=True)
+    output_dir = tmp_base / f"diff-out-{task_id}"
+    output_dir.mkdir(exist_ok=True)
+
+    # Check diff2html
+    await check_diff2html()
+
+    # Stream commit metadata from a single git log process
+    repo_path = "/repo" if Path("/repo").exists() else None
+    commit_infos = []
+    async for commit in iter_commit_log(
+        repo_path, f"{base_branch}..{branch}", max_count=max_commits, reverse=True
+    ):
+        i = len(commit_infos) + 1
+
+        # Generate filename
+        filename = f"{i}-{commit.short_hash}-{sanitize_filename(commit.subject)}.html"
+
+        commit_infos.append(
+            CommitInfo(
+                number=i,
+                hash=commit.short_hash,
+                message=commit.subject,
+                author=commit.author_name,
+                date=commit.date,
+                filename=filename,
+            )
+        )
+
+        # Generate diff HTML
+        diff_cmd = [
+            "diff2html",
+            "-s",
+            "side",
+            "-f",
+            "html",
+            "-F",
+            str(output_dir / filename),
+            "-t",
+            f"{commit.short_hash}: {commit.subject}",
+            "--summary",
+            "open",
+            "--highlightCode",
+            "--",
+            f"{commit.hash}^..{commit.hash}",
         ]
-        stdout, stderr, returncode = await run_command(cmd)
+
+        _, stderr, returncode = await run_command(diff_cmd)
         if returncode != 0:
-            raise RuntimeError(f"Failed to get commits: {stderr}")
-
-        commits = stdout.strip().split("\n") if stdout.strip() else []
-        if not commits:
-            diff_tasks[task_id]["status"] = "completed"
-            diff_tasks[task_id]["message"] = "No commits to diff"
-            diff_tasks[task_id]["commit_count"] = 0
-            return
-
-        # Arrays to store commit info
-        commit_infos = []
-
-        # Generate diff for each commit
-        for i, commit in enumerate(commits, 1):
-            # Get commit info
-            hash_cmd = ["git", "rev-parse", "--short", commit]
-            hash_stdout, _, _ = await run_command(hash_cmd)
-            commit_hash = hash_stdout.strip()
-
-            msg_cmd = ["git", "log", "-1", "--pretty=format:%s", commit]
-            msg_stdout, _, _ = await run_command(msg_cmd)
-            message = msg_stdout.strip()
-
-            author_cmd = ["git", "log", "-1", "--pretty=format:%an", commit]
-            author_stdout, _, _ = await run_command(author_cmd)
-            author = author_stdout.strip()
-
-            date_cmd = ["git", "log", "-1", "--pretty=format:%ad", "--date=short", commit]
-            date_stdout, _, _ = await run_command(date_cmd)
-            date = date_stdout.strip()
-
-            # Generate filename
-            filename = f"{i}-{commit_hash}-{sanitize_filename(message)}.html"
-
-            commit_infos.append(
-                CommitInfo(
-                    number=i,
-                    hash=commit_hash,
-                    message=message,
-                    author=author,
-                    date=date,
-                    filename=filename,
-                )
-            )
+            print(f"Warning: Could not generate diff for {commit.short_hash}: {stderr}")
 
-            # Generate diff HTML
-            diff_cmd = [
-                "diff2html",
-                "-s",
-                "side",
-                "-f",
-                "html",
-                "-F",
-                str(output_dir / filename),
-                "-t",
-                f"{commit_hash}: {message}",
-                "--summary",
-                "open",
-                "--highlightCode",
-                "--",
-                f"{commit}^..{commit}",
-            ]
-
-            _, stderr, returncode = await run_command(diff_cmd)
-            if returncode != 0:
-                print(f"Warning: Could not generate diff for {commit_hash}: {stderr}")
-
-        # Generate index.html
-        await generate_index_html(output_dir, commit_infos, branch, base_branch)
-
-        diff_tasks[task_id]["status"] = "completed"
-        diff_tasks[task_id]["commit_count"] = len(commit_infos)
-        diff_tasks[task_id]["message"] = f"Generated {len(commit_infos)} diff files"
-
-    except Exception as e:
-        diff_tasks[task_id]["status"] = "failed"
-        diff_tasks[task_id]["message"] = str(e)
+    if not commit_infos:
+        return {"output_dir": str(output_dir), "commit_count": 0, "message": "No commits to diff"}
+
+    # Generate index.html
+    await generate_index_html(output_dir, commit_infos, branch, base_branch)
+
+    return {
+        "output_dir": str(output_dir),
+        "commit_count": len(commit_infos),
+        "message": f"Generated {len(commit_infos)} diff files",
+    }
+
+
+async def generate_branch_diffs_job(session: AsyncSession, job: Job) -> dict:
+    """Job handler for `GENERATE_BRANCH_DIFFS_JOB`."""
+    payload = job.payload
+    return await generate_diffs_task(
+        job.id, payload["branch"], payload["base_branch"], payload["max_commits"]
+    )
 
 
 async def generate_index_html(
@@ -422,58 +408,69 @@ async def generate_index_html(
         f.write(html_content)
 
 
+async def _get_task(queue: JobQueue, task_id: str) -> Job:
+    """Get a diff generation job, raising 404 if it does not exist."""
+    job = await queue.get(task_id)
+    if job is None or job.kind != GENERATE_BRANCH_DIFFS_JOB:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return job
+
+
+async def _get_output_dir(queue: JobQueue, task_id: str) -> Path:
+    """Get the output directory of a completed diff generation job."""
+    job = await _get_task(queue, task_id)
+    if job.status != JobStatus.SUCCEEDED:
+        raise HTTPException(status_code=400, detail=f"Task is {TASK_STATUSES[job.status]}")
+    return Path(job.result["output_dir"])
+
+
 @router.post("/diffs/generate", response_model=DiffGenerationStatus)
 async def generate_diffs(
-    request: DiffRequest, background_tasks: BackgroundTasks
+    request: DiffRequest, queue: JobQueue = Depends(get_job_queue)
 ) -> DiffGenerationStatus:
     """Generate diff files for commits in a branch."""
-    task_id = str(uuid4())
-
-    # Initialize task status
-    diff_tasks[task_id] = {
-        "status": "pending",
-        "message": "Task queued",
-        "output_dir": None,
-        "commit_count": None,
-    }
-
-    # Queue the background task
-    background_tasks.add_task(
-        generate_diffs_task, task_id, request.branch, request.base_branch, request.max_commits
+    job = await queue.enqueue(
+        GENERATE_BRANCH_DIFFS_JOB,
+        {
+            "branch": request.branch,
+            "base_branch": request.base_branch,
+            "max_commits": request.max_commits,
+        },
     )
 
-    return DiffGenerationStatus(
-        task_id=task_id, status="pending", message="Diff generation started"
-    )
+    return DiffGenerationStatus(task_id=job.id, status="pending", message="Diff generation queued")
 
 
 @router.get("/diffs/status/{task_id}", response_model=DiffGenerationStatus)
-async def get_diff_status(task_id: str) -> DiffGenerationStatus:
+async def get_diff_status(
+    task_id: str, queue: JobQueue = Depends(get_job_queue)
+) -> DiffGenerationStatus:
     """Get the status of a diff generation task."""
-    if task_id not in diff_tasks:
-        raise HTTPException(status_code=404, detail="Task not found")
+    job = await _get_task(queue, task_id)
+    result = job.result or {}
+
+    if job.status == JobStatus.SUCCEEDED:
+        message = result.get("message")
+    elif job.error:
+        message = job.error
+    elif job.status == JobStatus.RUNNING:
+        message = "Generating diffs"
+    else:
+        message = "Task queued"
 
-    task = diff_tasks[task_id]
     return DiffGenerationStatus(
-        task_id=task_id,
-        status=task["status"],
-        message=task["message"],
-        output_dir=task["output_dir"],
-        commit_count=task["commit_count"],
+        task_id=job.id,
+        status=TASK_STATUSES[job.status],
+        message=message,
+        output_dir=result.get("output_dir"),
+        commit_count=result.get("commit_count"),
     )
 
 
 @router.get("/diffs/{task_id}/index.html", response_class=HTMLResponse)
-async def get_diff_index(task_id: str):
+async def get_diff_index(task_id: str, queue: JobQueue = Depends(get_job_queue)):
     """Get the generated index.html file."""
-    if task_id not in diff_tasks:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    task = diff_tasks[task_id]
-    if task["status"] != "completed":
-        raise HTTPException(status_code=400, detail=f"Task is {task['status']}")
-
-    output_dir = Path(task["output_dir"])
+    output_dir = await _get_output_dir(queue, task_id)
     index_file = output_dir / "index.html"
 
     if not index_file.exists():
@@ -483,16 +480,9 @@ async def get_diff_index(task_id: str):
 
 
 @router.get("/diffs/{task_id}/files/{filename}", response_class=HTMLResponse)
-async def get_diff_file(task_id: str, filename: str):
+async def get_diff_file(task_id: str, filename: str, queue: JobQueue = Depends(get_job_queue)):
     """Get a specific diff HTML file."""
-    if task_id not in diff_tasks:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    task = diff_tasks[task_id]
-    if task["status"] != "completed":
-        raise HTTPException(status_code=400, detail=f"Task is {task['status']}")
-
-    output_dir = Path(task["output_dir"])
+    output_dir = await _get_output_dir(queue, task_id)
     diff_file = output_dir / filename
 
     if not diff_file.exists() or not diff_file.is_file():
@@ -502,22 +492,20 @@ async def get_diff_file(task_id: str, filename: str):
 
 
 @router.delete("/diffs/{task_id}")
-async def cleanup_diff_task(task_id: str):
+async def cleanup_diff_task(task_id: str, queue: JobQueue = Depends(get_job_queue)):
     """Clean up generated diff files and task data."""
-    if task_id not in diff_tasks:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    task = diff_tasks[task_id]
+    job = await _get_task(queue, task_id)
 
     # Clean up files if they exist
-    if task["output_dir"]:
-        output_dir = Path(task["output_dir"])
+    output_dir = (job.result or {}).get("output_dir")
+    if output_dir:
+        output_dir = Path(output_dir)
         if output_dir.exists():
             import shutil
 
             shutil.rmtree(output_dir)
 
-    # Remove from tasks
-    del diff_tasks[task_id]
+    # Remove from the queue
+    await queue.delete(task_id)
 
     return {"message": "Task cleaned up successfully"}
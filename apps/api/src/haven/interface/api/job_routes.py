@@ -0,0 +1,65 @@
+"""API routes for background job status."""
+
+from datetime import datetime
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+
+from haven.infrastructure.database.dependencies import get_job_queue
+from haven.infrastructure.jobs import Job, JobQueue, JobStatus
+
+router = APIRouter(prefix="/api/v1/jobs", tags=["jobs"])
+
+
+class JobResponse(BaseModel):
+    """Status of a queued background job."""
+
+    id: str
+    kind: str
+    status: str
+    attempts: int
+    max_attempts: int
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    heartbeat_at: datetime | None = None
+
+
+def _job_to_response(job: Job) -> JobResponse:
+    return JobResponse(
+        id=job.id,
+        kind=job.kind,
+        status=job.status.value,
+        attempts=job.attempts,
+        max_attempts=job.max_attempts,
+        result=job.result,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        heartbeat_at=job.heartbeat_at,
+    )
+
+
+@router.get("", response_model=list[JobResponse])
+async def list_jobs(
+    kind: str | None = None,
+    status: JobStatus | None = None,
+    limit: int = Query(50, ge=1, le=500),
+    queue: JobQueue = Depends(get_job_queue),
+) -> list[JobResponse]:
+    """List recent jobs, newest first."""
+    jobs = await queue.list_jobs(kind=kind, status=status, limit=limit)
+    return [_job_to_response(job) for job in jobs]
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, queue: JobQueue = Depends(get_job_queue)) -> JobResponse:
+    """Get the status of a job."""
+    job = await queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _job_to_response(job)
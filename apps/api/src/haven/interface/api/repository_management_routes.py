@@ -1,28 +1,34 @@
 """API routes for repository management operations."""
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
 
-from haven.infrastructure.database.dependencies import get_db
+from haven.infrastructure.database.dependencies import get_db, get_job_queue, get_read_db
 from haven.infrastructure.database.repositories.repository_repository import RepositoryRepositoryImpl
 from haven.infrastructure.database.repositories.commit_repository import SQLAlchemyCommitRepository
+from haven.infrastructure.database.repositories.sync_state_repository import SyncStateRepositoryImpl
 from haven.infrastructure.git.git_client import GitClient
+from haven.infrastructure.jobs import Job, JobQueue
 from haven.domain.entities.commit import Commit, DiffStats
 from haven.application.services.diff_html_service import DiffHtmlService
-import hashlib
 import asyncio
 
 router = APIRouter(prefix="/api/v1/repository-management", tags=["repository-management"])
 
+# Job kinds handled by `haven worker`
+LOAD_COMMITS_JOB = "load_commits"
+GENERATE_REPOSITORY_DIFFS_JOB = "generate_repository_diffs"
+
 
 class LoadCommitsRequest(BaseModel):
     """Request to load commits from repository."""
     branch: str = "main"
     limit: Optional[int] = None  # None means load all commits
     since_date: Optional[datetime] = None  # Load commits since this date
+    batch_size: int = Field(default=1000, ge=1, le=5000)  # Rows per INSERT statement
 
 
 class LoadCommitsResponse(BaseModel):
@@ -32,95 +38,124 @@ class LoadCommitsResponse(BaseModel):
     task_id: Optional[str] = None
 
 
+async def _incremental_revision(
+    git_client: GitClient, repo_path: str, last_tip: str, tip: str
+) -> str:
+    """
+    Revision range containing the commits added to a branch since ``last_tip``.
+
+    A fast-forward yields ``last_tip..tip``. After a force push the old tip is
+    no longer an ancestor, so the walk starts from the merge base instead; if
+    the histories are unrelated the whole branch is walked.
+    """
+    merge_base = await git_client.get_merge_base(repo_path, last_tip, tip)
+    if merge_base == last_tip:
+        return f"{last_tip}..{tip}"
+    if merge_base:
+        print(f"History rewritten since {last_tip[:8]}, resyncing from merge base {merge_base[:8]}")
+        return f"{merge_base}..{tip}"
+    print(f"History rewritten since {last_tip[:8]}, resyncing the whole branch")
+    return tip
+
+
 async def _load_commits_task(
     repository_id: int,
     branch: str,
     limit: Optional[int],
     since_date: Optional[datetime],
     db_session: AsyncSession,
-):
-    """Background task to load commits from repository."""
+    batch_size: int = 1000,
+) -> dict:
+    """Load commits from a repository branch into the database."""
     repo_impl = RepositoryRepositoryImpl(db_session)
     commit_repo = SQLAlchemyCommitRepository(db_session)
     
     # Get repository
     repository = await repo_impl.get_by_id(repository_id)
     if not repository:
-        return
-    
-    # If no since_date specified, find latest commit date to avoid duplicates
-    if not since_date:
-        existing_commits = await commit_repo.get_by_repository(repository.id)
-        if existing_commits:
-            # Find the latest commit date
-            latest_commit = max(existing_commits, key=lambda c: c.committed_at)
-            since_date = latest_commit.committed_at
-            print(f"Loading commits since: {since_date}")
+        raise ValueError(f"Repository {repository_id} not found")
     
-    # Get commits from git
     git_client = GitClient()
+    sync_repo = SyncStateRepositoryImpl(db_session)
     try:
-        # Get commit log
-        commits_data = await git_client.get_commit_log(
-            repository.url,
-            branch=branch,
-            limit=limit,
-            since_date=since_date
-        )
+        tip = await git_client.object_pool.resolve_ref(repository.url, branch)
+        if tip is None:
+            raise ValueError(f"Branch '{branch}' not found in {repository.name}")
+        
+        # Without an explicit window, only walk commits added since the last synced tip
+        revision = tip
+        if not since_date:
+            last_tip = await sync_repo.get_branch_tip(repository.id, branch)
+            if last_tip == tip:
+                print(f"Branch '{branch}' of repository {repository.name} is up to date")
+                return {"loaded": 0, "skipped": 0, "tip": tip}
+            if last_tip:
+                revision = await _incremental_revision(git_client, repository.url, last_tip, tip)
         
-        # Process each commit
+        # Stream the log in batches so memory stays flat on large histories;
+        # commits that already exist are skipped by the database
         loaded_count = 0
         skipped_count = 0
         
-        for commit_data in commits_data:
-            # Check if commit already exists
-            existing = await commit_repo.get_by_hash(repository.id, commit_data["hash"])
-            if existing:
-                skipped_count += 1
-                continue
-            
-            # Create commit entity
-            commit = Commit(
-                repository_id=repository.id,
-                commit_hash=commit_data["hash"],
-                message=commit_data["message"],
-                author_name=commit_data["author_name"],
-                author_email=commit_data["author_email"],
-                committer_name=commit_data["committer_name"],
-                committer_email=commit_data["committer_email"],
-                committed_at=commit_data["committed_at"],
-                diff_stats=DiffStats(
-                    files_changed=commit_data.get("files_changed", 0),
-                    insertions=commit_data.get("insertions", 0),
-                    deletions=commit_data.get("deletions", 0),
-                ),
-            )
-            
-            # Save commit
-            await commit_repo.create(commit)
-            loaded_count += 1
+        async for commits_data in git_client.iter_commit_log_batches(
+            repository.url,
+            branch=revision,
+            limit=limit,
+            since_date=since_date,
+            batch_size=batch_size,
+        ):
+            commits = [
+                Commit(
+                    repository_id=repository.id,
+                    commit_hash=commit_data["hash"],
+                    message=commit_data["message"],
+                    author_name=commit_data["author_name"],
+                    author_email=commit_data["author_email"],
+                    committer_name=commit_data["committer_name"],
+                    committer_email=commit_data["committer_email"],
+                    committed_at=commit_data["committed_at"],
+                    diff_stats=DiffStats(
+                        files_changed=commit_data.get("files_changed", 0),
+                        insertions=commit_data.get("insertions", 0),
+                        deletions=commit_data.get("deletions", 0),
+                    ),
+                )
+                for commit_data in commits_data
+            ]
+            result = await commit_repo.bulk_insert(commits, batch_size=batch_size)
+            loaded_count += result.inserted
+            skipped_count += result.skipped
+        
+        # Only a complete walk may advance the watermark
+        if not limit and not since_date:
+            await sync_repo.set_branch_tip(repository.id, branch, tip)
         
         await db_session.commit()
+        if loaded_count:
+            # Counts taken while the load was still uncommitted are stale now
+            SQLAlchemyCommitRepository.invalidate_listing_counts(repository.id)
         print(f"Loaded {loaded_count} new commits, skipped {skipped_count} existing commits for repository {repository.name}")
+        return {"loaded": loaded_count, "skipped": skipped_count, "tip": tip}
         
     except Exception as e:
         print(f"Error loading commits: {str(e)}")
         await db_session.rollback()
+        raise
 
 
 async def _generate_all_diffs_task(
     repository_id: int,
     db_session: AsyncSession,
     max_concurrent: int = 5,
-):
-    """Background task to generate HTML diffs for all commits in parallel."""
+) -> dict:
+    """Generate HTML diffs for all commits of a repository in parallel."""
     repo_impl = RepositoryRepositoryImpl(db_session)
     commit_repo = SQLAlchemyCommitRepository(db_session)
     
     # Get repository
     repository = await repo_impl.get_by_id(repository_id)
     if not repository:
-        return
+        raise ValueError(f"Repository {repository_id} not found")
     
     # Get all commits without diffs
     commits = await commit_repo.get_by_repository(repository_id, limit=10000)
@@ -130,7 +165,7 @@ async def _generate_all_diffs_task(
     
     if not commits_without_diffs:
         print("All commits already have diffs generated")
-        return
+        return {"generated": 0, "failed": 0}
     
     # Initialize diff service
     git_client = GitClient()
@@ -138,6 +173,8 @@ async def _generate_all_diffs_task(
     
     # Create semaphore to limit concurrent operations
     semaphore = asyncio.Semaphore(max_concurrent)
+    # Diffs render concurrently, but an AsyncSession must not be used concurrently
+    session_lock = asyncio.Lock()
     
     async def generate_diff_for_commit(commit: Commit):
         async with semaphore:
@@ -148,7 +185,8 @@ async def _generate_all_diffs_task(
                     # Update commit with diff path
                     commit.diff_html_path = diff_html
                     commit.diff_generated_at = datetime.utcnow()
-                    await commit_repo.update(commit)
+                    async with session_lock:
+                        await commit_repo.update(commit)
                     print(f"Generated diff for commit {commit.commit_hash[:8]} - {commit.message[:50]}...")
                     return True
                 else:
@@ -170,16 +208,39 @@ async def _generate_all_diffs_task(
     await db_session.commit()
     
     print(f"Diff generation completed: {successful} successful, {failed} failed")
+    return {"generated": successful, "failed": failed}
+
+
+async def load_commits_job(session: AsyncSession, job: Job) -> dict:
+    """Job handler for `LOAD_COMMITS_JOB`."""
+    payload = job.payload
+    since_date = payload.get("since_date")
+    return await _load_commits_task(
+        payload["repository_id"],
+        payload["branch"],
+        payload.get("limit"),
+        datetime.fromisoformat(since_date) if since_date else None,
+        session,
+        payload.get("batch_size", 1000),
+    )
+
+
+async def generate_repository_diffs_job(session: AsyncSession, job: Job) -> dict:
+    """Job handler for `GENERATE_REPOSITORY_DIFFS_JOB`."""
+    payload = job.payload
+    return await _generate_all_diffs_task(
+        payload["repository_id"], session, payload.get("max_concurrent", 5)
+    )
 
 
 @router.post("/{repository_identifier}/load-commits", response_model=LoadCommitsResponse)
 async def load_commits(
     repository_identifier: str,
     request: LoadCommitsRequest,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
+    queue: JobQueue = Depends(get_job_queue),
 ) -> LoadCommitsResponse:
-    """Load commits from repository into database."""
+    """Queue loading commits from repository into database."""
     repo_impl = RepositoryRepositoryImpl(db)
     
     # Try to get by slug first, then by hash
@@ -190,34 +251,32 @@ async def load_commits(
     if not repository:
         raise HTTPException(status_code=404, detail="Repository not found")
     
-    # Generate task ID
-    task_id = hashlib.sha256(f"{repository.id}-{datetime.utcnow()}".encode()).hexdigest()[:16]
-    
-    # Start background task
-    background_tasks.add_task(
-        _load_commits_task,
-        repository.id,
-        request.branch,
-        request.limit,
-        request.since_date,
-        db,
+    job = await queue.enqueue(
+        LOAD_COMMITS_JOB,
+        {
+            "repository_id": repository.id,
+            "branch": request.branch,
+            "limit": request.limit,
+            "since_date": request.since_date.isoformat() if request.since_date else None,
+            "batch_size": request.batch_size,
+        },
     )
     
     return LoadCommitsResponse(
-        status="started",
-        message=f"Started loading commits from branch '{request.branch}'",
-        task_id=task_id,
+        status=job.status.value,
+        message=f"Queued loading commits from branch '{request.branch}'",
+        task_id=job.id,
     )
 
 
 @router.post("/{repository_identifier}/generate-diffs", response_model=LoadCommitsResponse)
 async def generate_all_diffs(
     repository_identifier: str,
-    background_tasks: BackgroundTasks,
     max_concurrent: int = 5,
     db: AsyncSession = Depends(get_db),
+    queue: JobQueue = Depends(get_job_queue),
 ) -> LoadCommitsResponse:
-    """Generate HTML diffs for all commits in parallel."""
+    """Queue generating HTML diffs for all commits in parallel."""
     repo_impl = RepositoryRepositoryImpl(db)
     
     # Try to get by slug first, then by hash
@@ -228,21 +287,15 @@ async def generate_all_diffs(
     if not repository:
         raise HTTPException(status_code=404, detail="Repository not found")
     
-    # Generate task ID
-    task_id = hashlib.sha256(f"diffs-{repository.id}-{datetime.utcnow()}".encode()).hexdigest()[:16]
-    
-    # Start background task
-    background_tasks.add_task(
-        _generate_all_diffs_task,
-        repository.id,
-        db,
-        max_concurrent,
+    job = await queue.enqueue(
+        GENERATE_REPOSITORY_DIFFS_JOB,
+        {"repository_id": repository.id, "max_concurrent": max_concurrent},
     )
     
     return LoadCommitsResponse(
-        status="started",
-        message=f"Started generating diffs for all commits (max {max_concurrent} concurrent)",
-        task_id=task_id,
+        status=job.status.value,
+        message=f"Queued generating diffs for all commits (max {max_concurrent} concurrent)",
+        task_id=job.id,
     )
 
 
@@ -257,7 +310,7 @@ class RepositoryStatsResponse(BaseModel):
 @router.get("/{repository_identifier}/stats", response_model=RepositoryStatsResponse)
 async def get_repository_stats(
     repository_identifier: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> RepositoryStatsResponse:
     """Get repository statistics."""
     repo_impl = RepositoryRepositoryImpl(db)
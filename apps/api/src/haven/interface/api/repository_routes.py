@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from datetime import datetime
 
-from haven.infrastructure.database.dependencies import get_db
+from haven.infrastructure.database.dependencies import get_db, get_read_db
 from haven.infrastructure.database.repositories.repository_repository import RepositoryRepositoryImpl
 from haven.infrastructure.git.git_client import GitClient
 
@@ -93,7 +93,7 @@ async def get_repository_by_identifier(
 
 @router.get("/", response_model=list[RepositoryResponse])
 async def list_repositories(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[RepositoryResponse]:
     """List all repositories."""
     repo_impl = RepositoryRepositoryImpl(db)
@@ -121,7 +121,7 @@ async def list_repositories(
 @router.get("/{repository_identifier}/branches", response_model=list[str])
 async def get_repository_branches(
     repository_identifier: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[str]:
     """Get all branches for a repository."""
     repo_impl = RepositoryRepositoryImpl(db)
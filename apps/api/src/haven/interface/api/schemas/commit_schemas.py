@@ -1,10 +1,12 @@
 """Pydantic schemas for commit API endpoints."""
 
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel, Field
 
 from haven.domain.entities.commit import Commit, CommitReview, DiffStats, ReviewStatus
+from haven.domain.repositories.commit_repository import BulkReviewOutcome
 
 
 class DiffStatsSchema(BaseModel):
@@ -87,6 +89,26 @@ class CommitDiffResponse(BaseModel):
     diff_generated_at: datetime | None
 
 
+class DiffFileEntry(BaseModel):
+    """Summary of one file in a commit diff."""
+
+    path: str
+    old_path: str | None = None
+    status: str
+    is_binary: bool = False
+    added_lines: int = 0
+    deleted_lines: int = 0
+
+
+class DiffFileListResponse(BaseModel):
+    """Files touched by a commit, without their hunks."""
+
+    commit_id: int
+    commit_hash: str
+    total_files: int
+    files: list[DiffFileEntry]
+
+
 class CommitReviewBase(BaseModel):
     """Base schema for commit review."""
 
@@ -130,6 +152,48 @@ class CommitReviewResponse(CommitReviewBase):
         )
 
 
+class BulkReviewRequest(BaseModel):
+    """Schema for assigning a reviewer to many commits."""
+
+    commit_ids: list[int] = Field(..., min_length=1, max_length=1000)
+    reviewer_id: int = Field(..., gt=0)
+
+
+class BulkReviewStatusRequest(BulkReviewRequest):
+    """Schema for changing a reviewer's review status on many commits."""
+
+    notes: str | None = None
+
+
+class BulkReviewResult(BaseModel):
+    """Outcome of a bulk review operation for one commit."""
+
+    commit_id: int
+    outcome: BulkReviewOutcome
+
+
+class BulkReviewResponse(BaseModel):
+    """Schema for bulk review operation response."""
+
+    results: list[BulkReviewResult]
+    # Number of commits the operation changed
+    applied: int
+
+    @classmethod
+    def from_outcomes(cls, outcomes: dict[int, BulkReviewOutcome]) -> "BulkReviewResponse":
+        """Create from per-commit outcomes."""
+        return cls(
+            results=[
+                BulkReviewResult(commit_id=commit_id, outcome=outcome)
+                for commit_id, outcome in outcomes.items()
+            ],
+            applied=sum(
+                outcome in (BulkReviewOutcome.UPDATED, BulkReviewOutcome.ASSIGNED)
+                for outcome in outcomes.values()
+            ),
+        )
+
+
 class CommitWithReviewResponse(CommitResponse):
     """Commit response with review status."""
     
@@ -137,15 +201,47 @@ class CommitWithReviewResponse(CommitResponse):
     review_count: int = 0
     latest_review_at: datetime | None = None
 
+    @classmethod
+    def from_row(cls, row: Any) -> "CommitWithReviewResponse":
+        """Create from a commit listing row carrying the latest review columns."""
+        return cls(
+            id=row.id,
+            repository_id=row.repository_id,
+            commit_hash=row.commit_hash,
+            message=row.message,
+            author_name=row.author_name,
+            author_email=row.author_email,
+            committer_name=row.committer_name,
+            committer_email=row.committer_email,
+            committed_at=row.committed_at,
+            diff_stats=DiffStatsSchema(
+                files_changed=row.files_changed,
+                insertions=row.insertions,
+                deletions=row.deletions,
+            ),
+            diff_html_path=row.diff_html_path,
+            diff_generated_at=row.diff_generated_at,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            review_status=row.review_status,
+            review_count=row.review_count,
+            latest_review_at=row.latest_review_at,
+        )
+
 
 class PaginatedCommitResponse(BaseModel):
     """Paginated response for commit listings."""
 
     items: list[CommitResponse]
     total: int
-    page: int
+    # True when ``total`` is a query planner estimate for a large table
+    total_is_estimate: bool = False
+    # None when the page was requested by cursor
+    page: int | None
     page_size: int
     total_pages: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
 
 
 class PaginatedCommitWithReviewResponse(BaseModel):
@@ -153,9 +249,14 @@ class PaginatedCommitWithReviewResponse(BaseModel):
 
     items: list[CommitWithReviewResponse]
     total: int
-    page: int
+    # True when ``total`` is a query planner estimate for a large table
+    total_is_estimate: bool = False
+    # None when the page was requested by cursor
+    page: int | None
     page_size: int
     total_pages: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
 
 
 class ReviewCommentBase(BaseModel):
@@ -27,12 +27,26 @@ async def get_unit_of_work() -> UnitOfWork:
         yield uow
 
 
+async def get_read_only_unit_of_work() -> UnitOfWork:
+    """Dependency to get a unit of work that reads from the replica."""
+    async for uow in db_factory.get_unit_of_work(read_only=True):
+        yield uow
+
+
 async def get_task_service(uow: UnitOfWork = Depends(get_unit_of_work)) -> TaskService:
     """Dependency to get task service."""
     task_repo = TaskRepositoryImpl(uow.session)
     return TaskService(task_repo)
 
 
+async def get_read_task_service(
+    uow: UnitOfWork = Depends(get_read_only_unit_of_work),
+) -> TaskService:
+    """Dependency to get task service for read-only endpoints."""
+    task_repo = TaskRepositoryImpl(uow.session)
+    return TaskService(task_repo)
+
+
 def task_to_response(task: Task) -> TaskResponse:
     """Convert domain entity to response DTO."""
     return TaskResponse(
@@ -86,7 +100,7 @@ async def get_tasks(
     status_filter: str | None = Query(None, description="Filter by task status"),
     assignee_id: int | None = Query(None, description="Filter by assignee ID"),
     repository_id: int | None = Query(None, description="Filter by repository ID"),
-    service: TaskService = Depends(get_task_service),
+    service: TaskService = Depends(get_read_task_service),
 ) -> TaskListResponse:
     """Get tasks with optional filters."""
     try:
@@ -112,7 +126,7 @@ async def get_tasks(
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: int,
-    service: TaskService = Depends(get_task_service),
+    service: TaskService = Depends(get_read_task_service),
 ) -> TaskResponse:
     """Get a specific task by ID."""
     task = await service.get_task_by_id(task_id)
@@ -162,7 +176,7 @@ async def delete_task(
 @router.post("/tasks/search", response_model=TaskListResponse)
 async def search_tasks(
     request: TaskSearchRequest,
-    service: TaskService = Depends(get_task_service),
+    service: TaskService = Depends(get_read_task_service),
 ) -> TaskListResponse:
     """Search tasks by title or description."""
     try:
@@ -226,7 +240,7 @@ async def log_time_on_task(
 async def get_overdue_tasks(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of tasks to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
-    service: TaskService = Depends(get_task_service),
+    service: TaskService = Depends(get_read_task_service),
 ) -> TaskListResponse:
     """Get overdue tasks."""
     try:
@@ -245,7 +259,7 @@ async def get_overdue_tasks(
 @router.get("/metrics", response_model=TaskMetricsResponse)
 async def get_task_metrics(
     repository_id: int | None = Query(None, description="Filter metrics by repository ID"),
-    service: TaskService = Depends(get_task_service),
+    service: TaskService = Depends(get_read_task_service),
 ) -> TaskMetricsResponse:
     """Get task metrics and statistics."""
     try:
@@ -263,7 +277,7 @@ async def get_task_metrics(
 @router.get("/ttr-stats", response_model=TimeToResolutionStatsResponse)
 async def get_ttr_statistics(
     repository_id: int | None = Query(None, description="Filter stats by repository ID"),
-    service: TaskService = Depends(get_task_service),
+    service: TaskService = Depends(get_read_task_service),
 ) -> TimeToResolutionStatsResponse:
     """Get time-to-resolution statistics."""
     try:
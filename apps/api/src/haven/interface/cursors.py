@@ -0,0 +1,89 @@
+"""Opaque keyset pagination cursors shared by the REST and GraphQL APIs."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from haven.domain.repositories.commit_repository import CommitKey
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client sends a cursor that was not issued by this API."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode a sort key as an opaque, URL-safe cursor.
+
+    Args:
+        values: JSON-serializable sort key values; datetimes are stored as ISO strings
+
+    Returns:
+        Base64url cursor string without padding
+    """
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string
+        size: Expected number of sort key values
+
+    Returns:
+        The sort key values
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError("Invalid cursor")
+    return values
+
+
+def encode_key_cursor(sort_value: datetime, row_id: Any) -> str:
+    """Encode a ``(timestamp sort key, id)`` keyset position."""
+    return encode_cursor(sort_value, row_id)
+
+
+def decode_key_cursor(cursor: str) -> tuple[datetime, Any]:
+    """
+    Decode a cursor produced by ``encode_key_cursor``.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    sort_value, row_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(sort_value), row_id
+    except (TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def encode_commit_cursor(key: CommitKey) -> str:
+    """Encode a commit's ``(committed_at, id)`` position."""
+    return encode_key_cursor(key.committed_at, key.id)
+
+
+def decode_commit_cursor(cursor: str) -> CommitKey:
+    """
+    Decode a commit cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    committed_at, commit_id = decode_key_cursor(cursor)
+    if not isinstance(commit_id, int):
+        raise InvalidCursorError("Invalid cursor")
+    return CommitKey(committed_at=committed_at, id=commit_id)
@@ -0,0 +1,101 @@
+"""
+Per-request GraphQL context.
+
+A GraphQL request gets one database session for all of its resolvers,
+instead of a connection and transaction per field. The session is a
+read-only routing session: queries read from the replica, and a mutation
+pins the rest of the request to the primary.
+
+Strawberry resolves sibling fields concurrently, but an ``AsyncSession``
+runs one statement at a time, so resolvers and DataLoader batches take the
+session through ``database()`` or ``unit_of_work()``, which serialize
+access. Neither may be held while awaiting a DataLoader.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.dataloader import DataLoader
+from strawberry.fastapi import BaseContext
+
+from haven.domain.entities.commit import Commit, CommitReview
+from haven.domain.entities.repository import Repository
+from haven.domain.entities.task import Task
+from haven.domain.entities.user import User
+from haven.infrastructure.database.dependencies import get_read_db
+from haven.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from haven.interface.graphql import loaders
+
+BatchLoad = Callable[[AsyncSession, list[int]], Awaitable[list[Any]]]
+LoadFn = Callable[[list[int]], Awaitable[list[Any]]]
+
+
+class Loaders:
+    """DataLoaders of one request."""
+
+    def __init__(self, batch: Callable[[BatchLoad], LoadFn]):
+        self.tasks: DataLoader[int, Task | None] = DataLoader(batch(loaders.load_tasks))
+        self.users: DataLoader[int, User | None] = DataLoader(batch(loaders.load_users))
+        self.repositories: DataLoader[int, Repository | None] = DataLoader(
+            batch(loaders.load_repositories)
+        )
+        self.commits: DataLoader[int, Commit | None] = DataLoader(batch(loaders.load_commits))
+        self.commit_reviews: DataLoader[int, list[CommitReview]] = DataLoader(
+            batch(loaders.load_commit_reviews)
+        )
+
+    def clear(self) -> None:
+        """Forget loaded values, e.g. after a mutation changed them."""
+        for loader in vars(self).values():
+            loader.clear_all()
+
+
+class GraphQLContext(BaseContext):
+    """Session and DataLoaders shared by the resolvers of one request."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__()
+        self.session = session
+        self._lock = asyncio.Lock()
+        self.loaders = Loaders(self._batch)
+
+    @asynccontextmanager
+    async def database(self) -> AsyncIterator[AsyncSession]:
+        """Use the request's session for reads."""
+        async with self._lock:
+            yield self.session
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[SQLAlchemyUnitOfWork]:
+        """
+        Run writes in their own transaction on the request's session.
+
+        Commits on success and rolls back on error. Loaded values are dropped
+        afterwards, so fields resolved later see the changes.
+        """
+        async with self._lock:
+            # Close the transaction earlier reads opened so the unit of work owns its own
+            await self.session.commit()
+            try:
+                async with SQLAlchemyUnitOfWork(self.session) as uow:
+                    yield uow
+            finally:
+                self.loaders.clear()
+
+    def _batch(self, load: BatchLoad) -> LoadFn:
+        """Bind a batch function to the request's session."""
+
+        async def load_batch(keys: list[int]) -> list[Any]:
+            async with self.database() as session:
+                return await load(session, list(keys))
+
+        return load_batch
+
+
+async def get_context(session: AsyncSession = Depends(get_read_db)) -> GraphQLContext:
+    """Build the GraphQL context for a request."""
+    return GraphQLContext(session)
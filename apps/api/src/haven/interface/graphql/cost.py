@@ -0,0 +1,297 @@
+"""
+Query cost analysis for the GraphQL endpoint.
+
+Before an operation runs, its cost is estimated from the document: every
+object field costs 1 (scalars are free) unless ``FIELD_COSTS`` says
+otherwise, and the selections under a field taking ``first`` are charged
+``first`` times. ``tasks(first: 100) { edges { node { assignee { id } } } }``
+therefore costs 1 + 100 * 3. The estimate is an upper bound; the actual cost
+is counted the same way over the rows that came back.
+
+Operations estimated above ``graphql.max_query_cost`` are rejected without
+running a resolver. With ``graphql.cost_budget_per_minute`` set, each client
+also draws from a bucket of cost points refilled at that rate: the estimate
+is taken up front, the unused part refunded afterwards, and operations the
+bucket cannot cover are refused with a ``retryAfter`` hint.
+
+Both costs and the limit are reported under ``extensions.cost`` of the
+response.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLNamedType,
+    GraphQLSchema,
+    IntValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    VariableNode,
+    get_named_type,
+    get_operation_ast,
+    is_abstract_type,
+    is_leaf_type,
+)
+from graphql import ExecutionResult as GraphQLExecutionResult
+from strawberry.extensions import SchemaExtension
+
+from haven.config.settings import get_settings
+
+QUERY_TOO_COSTLY = "QUERY_TOO_COSTLY"
+QUERY_COST_THROTTLED = "QUERY_COST_THROTTLED"
+
+# Fields costing more than a row lookup, by "Type.field"
+FIELD_COSTS: dict[str, int] = {
+    # Aggregates over every task of a repository
+    "Query.taskMetrics": 20,
+    "Query.ttrStats": 20,
+    # Substring match that cannot use an index
+    "Query.searchTasks": 10,
+}
+
+
+class QueryCost:
+    """Cost of operations in one document."""
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        variables: Mapping[str, Any] | None = None,
+        field_costs: Mapping[str, int] = FIELD_COSTS,
+    ):
+        self.schema = schema
+        self.document = document
+        self.variables = dict(variables or {})
+        self.field_costs = field_costs
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+    def requested(self, operation_name: str | None = None) -> int:
+        """Estimated cost of an operation, with lists as long as they may get."""
+        operation = get_operation_ast(self.document, operation_name)
+        if operation is None:
+            return 0
+        return self._requested(self._root_type(operation), operation.selection_set)
+
+    def actual(self, data: Any, operation_name: str | None = None) -> int:
+        """Cost of an operation given the ``data`` it returned."""
+        operation = get_operation_ast(self.document, operation_name)
+        if operation is None:
+            return 0
+        return self._actual(self._root_type(operation), operation.selection_set, data)
+
+    def _root_type(self, operation: OperationDefinitionNode) -> GraphQLNamedType:
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            raise GraphQLError(f"Schema does not support {operation.operation.value} operations")
+        return root_type
+
+    def _requested(self, parent_type: GraphQLNamedType, selection_set: SelectionSetNode) -> int:
+        total = 0
+        for field_type, node in self._fields(parent_type, selection_set):
+            field = getattr(field_type, "fields", {}).get(node.name.value)
+            if field is None:
+                # __typename and other introspection fields
+                continue
+            named_type = get_named_type(field.type)
+            children = self._requested(named_type, node.selection_set) if node.selection_set else 0
+            total += self._field_cost(field_type, node, named_type)
+            total += self._page_size(field, node) * children
+        return total
+
+    def _actual(
+        self, parent_type: GraphQLNamedType, selection_set: SelectionSetNode, data: Any
+    ) -> int:
+        if not isinstance(data, dict):
+            return 0
+        total = 0
+        for field_type, node in self._fields(parent_type, selection_set):
+            key = node.alias.value if node.alias else node.name.value
+            field = getattr(field_type, "fields", {}).get(node.name.value)
+            if field is None or data.get(key) is None:
+                continue
+            named_type = get_named_type(field.type)
+            total += self._field_cost(field_type, node, named_type)
+            if node.selection_set:
+                total += self._actual_value(named_type, node.selection_set, data[key])
+        return total
+
+    def _actual_value(
+        self, field_type: GraphQLNamedType, selection_set: SelectionSetNode, value: Any
+    ) -> int:
+        if isinstance(value, list):
+            return sum(self._actual_value(field_type, selection_set, item) for item in value)
+        return self._actual(field_type, selection_set, value)
+
+    def _fields(
+        self, parent_type: GraphQLNamedType, selection_set: SelectionSetNode
+    ) -> Iterator[tuple[GraphQLNamedType, FieldNode]]:
+        """Fields selected on ``parent_type``, with fragments spread in place."""
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                yield parent_type, selection
+                continue
+            if isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments.get(selection.name.value)
+                if fragment is None:
+                    continue
+                condition, selections = fragment.type_condition, fragment.selection_set
+            else:
+                condition, selections = selection.type_condition, selection.selection_set
+
+            fragment_type = parent_type
+            if condition is not None and is_abstract_type(parent_type):
+                fragment_type = self.schema.get_type(condition.name.value) or parent_type
+            yield from self._fields(fragment_type, selections)
+
+    def _field_cost(
+        self, parent_type: GraphQLNamedType, node: FieldNode, named_type: GraphQLNamedType
+    ) -> int:
+        default = 0 if is_leaf_type(named_type) else 1
+        return self.field_costs.get(f"{parent_type.name}.{node.name.value}", default)
+
+    def _page_size(self, field: Any, node: FieldNode) -> int:
+        """How many times a field's selections are charged."""
+        argument = field.args.get("first")
+        if argument is None:
+            return 1
+        default = argument.default_value
+        first = default
+        for argument_node in node.arguments:
+            if argument_node.name.value != "first":
+                continue
+            value = argument_node.value
+            if isinstance(value, VariableNode):
+                first = self.variables.get(value.name.value, default)
+            elif isinstance(value, IntValueNode):
+                first = int(value.value)
+        if isinstance(first, int) and not isinstance(first, bool):
+            return max(first, 0)
+        # Execution reports a bad argument; charge the default page meanwhile
+        return default if isinstance(default, int) and not isinstance(default, bool) else 1
+
+
+class CostBudget:
+    """Per-client buckets of query cost points, refilled continuously."""
+
+    def __init__(self, size: int = 10000):
+        """
+        Initialize the budget.
+
+        Args:
+            size: Clients tracked, least recently seen forgotten first
+        """
+        self.size = size
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def spend(self, client: str, cost: int, per_minute: int) -> float:
+        """
+        Take ``cost`` points from a client's bucket.
+
+        A bucket holds at most ``per_minute`` points, so a client can spend a
+        minute's budget in a burst.
+
+        Returns:
+            0 if the points were taken, else the seconds until they are available
+        """
+        points = self._points(client, per_minute)
+        cost = min(cost, per_minute)
+        if points < cost:
+            return (cost - points) * 60 / per_minute
+        self._store(client, points - cost)
+        return 0
+
+    def refund(self, client: str, points: int, per_minute: int) -> None:
+        """Give back points an operation was charged but did not use."""
+        if points > 0:
+            self._store(client, min(self._points(client, per_minute) + points, per_minute))
+
+    def _points(self, client: str, per_minute: int) -> float:
+        now = time.monotonic()
+        points, updated_at = self._buckets.get(client, (per_minute, now))
+        return min(points + (now - updated_at) * per_minute / 60, per_minute)
+
+    def _store(self, client: str, points: float) -> None:
+        self._buckets[client] = (points, time.monotonic())
+        self._buckets.move_to_end(client)
+        while len(self._buckets) > self.size:
+            self._buckets.popitem(last=False)
+
+
+def _client_key(context: Any) -> str | None:
+    """The address a request came from, if the context carries one."""
+    client = getattr(getattr(context, "request", None), "client", None)
+    return client.host if client is not None else None
+
+
+class QueryCostLimiter(SchemaExtension):
+    """Reject or throttle operations by cost, and report their cost."""
+
+    cost: dict[str, int] | None = None
+
+    def on_execute(self) -> Iterator[None]:
+        settings = get_settings().graphql
+        execution_context = self.execution_context
+        query_cost = QueryCost(
+            execution_context.schema._schema,
+            execution_context.graphql_document,
+            execution_context.variables,
+        )
+        requested = query_cost.requested(execution_context.operation_name)
+        self.cost = {"requested": requested, "maximum": settings.max_query_cost}
+
+        if requested > settings.max_query_cost:
+            self._reject(
+                f"Query cost {requested} exceeds the maximum of {settings.max_query_cost}",
+                QUERY_TOO_COSTLY,
+            )
+            yield
+            return
+
+        per_minute = settings.cost_budget_per_minute
+        client = _client_key(execution_context.context) if per_minute else None
+        if client is not None:
+            wait = query_cost_budget.spend(client, requested, per_minute)
+            if wait:
+                self._reject(
+                    "Query cost budget exhausted", QUERY_COST_THROTTLED, retryAfter=math.ceil(wait)
+                )
+                yield
+                return
+
+        yield
+
+        result = execution_context.result
+        actual = query_cost.actual(
+            result.data if result is not None else None, execution_context.operation_name
+        )
+        self.cost["actual"] = actual
+        if client is not None:
+            query_cost_budget.refund(client, requested - actual, per_minute)
+
+    def get_results(self) -> dict[str, Any]:
+        return {"cost": self.cost} if self.cost is not None else {}
+
+    def _reject(self, message: str, code: str, **extensions: Any) -> None:
+        """Answer with an error instead of executing the operation."""
+        self.execution_context.result = GraphQLExecutionResult(
+            data=None,
+            errors=[GraphQLError(message, extensions={"code": code, **extensions})],
+        )
+
+
+# Global cost budget instance
+query_cost_budget = CostBudget()
@@ -0,0 +1,65 @@
+"""
+Batch functions behind the GraphQL DataLoaders.
+
+Each takes every key requested while one level of a query resolves and
+answers with one ``IN`` query, so nested selections cost a round trip per
+level rather than per row. Results line up with the keys, with None (or an
+empty list) for keys that match nothing.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.domain.entities.commit import Commit, CommitReview
+from haven.domain.entities.repository import Repository
+from haven.domain.entities.task import Task
+from haven.domain.entities.user import User
+from haven.infrastructure.database.repositories.commit_repository import (
+    SQLAlchemyCommitRepository,
+    SQLAlchemyCommitReviewRepository,
+)
+from haven.infrastructure.database.repositories.repository_repository import (
+    RepositoryRepositoryImpl,
+)
+from haven.infrastructure.database.repositories.task_repository import TaskRepositoryImpl
+from haven.infrastructure.database.repositories.user_repository import UserRepositoryImpl
+
+
+def _by_key(keys: list[int], items: Iterable[Any]) -> list[Any]:
+    """Line loaded entities up with the requested IDs."""
+    by_id = {item.id: item for item in items}
+    return [by_id.get(key) for key in keys]
+
+
+async def load_tasks(session: AsyncSession, task_ids: list[int]) -> list[Task | None]:
+    """Load tasks by ID."""
+    return _by_key(task_ids, await TaskRepositoryImpl(session).get_many_by_ids(task_ids))
+
+
+async def load_users(session: AsyncSession, user_ids: list[int]) -> list[User | None]:
+    """Load users by ID."""
+    return _by_key(user_ids, await UserRepositoryImpl(session).get_many_by_ids(user_ids))
+
+
+async def load_repositories(
+    session: AsyncSession, repository_ids: list[int]
+) -> list[Repository | None]:
+    """Load repositories by ID."""
+    repositories = await RepositoryRepositoryImpl(session).get_many_by_ids(repository_ids)
+    return _by_key(repository_ids, repositories)
+
+
+async def load_commits(session: AsyncSession, commit_ids: list[int]) -> list[Commit | None]:
+    """Load commits by ID."""
+    commits = await SQLAlchemyCommitRepository(session).get_many_by_ids(commit_ids)
+    return _by_key(commit_ids, commits)
+
+
+async def load_commit_reviews(
+    session: AsyncSession, commit_ids: list[int]
+) -> list[list[CommitReview]]:
+    """Load the reviews of each commit, newest first."""
+    reviews = await SQLAlchemyCommitReviewRepository(session).get_by_commits(commit_ids)
+    return [reviews[commit_id] for commit_id in commit_ids]
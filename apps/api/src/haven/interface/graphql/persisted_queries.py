@@ -0,0 +1,267 @@
+"""
+Persisted queries for the GraphQL endpoint.
+
+Clients following the automatic persisted query protocol send only
+``extensions.persistedQuery.sha256Hash``. An unknown hash is answered with
+``PERSISTED_QUERY_NOT_FOUND``, and the client retries once with the full
+document, which is then remembered under its hash. Dashboards repeating the
+same large queries send a hash per request rather than the document.
+
+In allow-list mode the documents come from a file instead, and only those
+run: unknown hashes and unlisted documents are rejected.
+
+``PersistedQueryMiddleware`` swaps the hash for its document before the
+request reaches the GraphQL router. Parsing and validating that document is
+cached by the schema.
+"""
+
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from haven.config.settings import GraphQLSettings
+
+PERSISTED_QUERY_NOT_FOUND = "PERSISTED_QUERY_NOT_FOUND"
+PERSISTED_QUERY_NOT_ALLOWED = "PERSISTED_QUERY_NOT_ALLOWED"
+PERSISTED_QUERY_INVALID = "PERSISTED_QUERY_INVALID"
+
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")
+
+
+class PersistedQueryError(Exception):
+    """Raised when a persisted query request cannot be served."""
+
+    def __init__(self, message: str, code: str):
+        super().__init__(message)
+        self.code = code
+
+    @property
+    def status_code(self) -> int:
+        # Clients treat a 200 "not found" as the cue to resend the document
+        return 200 if self.code == PERSISTED_QUERY_NOT_FOUND else 400
+
+
+def document_hash(document: str) -> str:
+    """The sha256 hex digest identifying a document."""
+    return hashlib.sha256(document.encode()).hexdigest()
+
+
+class PersistedQueryStore:
+    """Documents by sha256 hash, registered by clients or from an allow-list."""
+
+    def __init__(self, size: int = 1000, allow_list: Mapping[str, str] | None = None):
+        """
+        Initialize the store.
+
+        Args:
+            size: Automatically persisted documents kept, least recently used evicted first
+            allow_list: Only run these documents, by hash (disables registration)
+        """
+        self.size = size
+        self.allow_list = dict(allow_list) if allow_list is not None else None
+        self._documents: OrderedDict[str, str] = OrderedDict()
+
+    @classmethod
+    def load_allow_list(cls, path: str | Path) -> dict[str, str]:
+        """
+        Read an allow-list file.
+
+        Raises:
+            ValueError: If the file is not a JSON object of hashes to their documents
+        """
+        allow_list = json.loads(Path(path).read_text())
+        if not isinstance(allow_list, dict):
+            raise ValueError(f"{path}: expected a JSON object mapping sha256 hashes to documents")
+        for sha256_hash, document in allow_list.items():
+            if not isinstance(document, str) or document_hash(document) != sha256_hash:
+                raise ValueError(f"{path}: {sha256_hash} is not the hash of its document")
+        return allow_list
+
+    @classmethod
+    def from_settings(cls, settings: GraphQLSettings) -> "PersistedQueryStore":
+        """Create the store configured for the GraphQL endpoint."""
+        if settings.persisted_queries == "allow_list":
+            if not settings.allow_list_path:
+                raise ValueError("graphql.allow_list_path is required in allow_list mode")
+            return cls(allow_list=cls.load_allow_list(settings.allow_list_path))
+        return cls(size=settings.persisted_query_cache_size)
+
+    def resolve(self, query: str | None, extensions: Any) -> str | None:
+        """
+        Find the document a request should run.
+
+        Args:
+            query: Document sent with the request, if any
+            extensions: The request's ``extensions`` object
+
+        Returns:
+            The document to run (None when the request has none)
+
+        Raises:
+            PersistedQueryError: If the hash is unknown or malformed, does not
+                match the document, or the document is not allowed
+        """
+        persisted = extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+        if persisted is None:
+            unchecked = self.allow_list is None or query is None
+            if not unchecked and document_hash(query) not in self.allow_list:
+                raise PersistedQueryError(
+                    "Query is not in the allow-list", PERSISTED_QUERY_NOT_ALLOWED
+                )
+            return query
+
+        if not isinstance(persisted, dict) or persisted.get("version") != 1:
+            raise PersistedQueryError("Unsupported persisted query", PERSISTED_QUERY_INVALID)
+        sha256_hash = persisted.get("sha256Hash")
+        if not isinstance(sha256_hash, str) or not _SHA256_HEX.fullmatch(sha256_hash):
+            raise PersistedQueryError("Invalid persisted query hash", PERSISTED_QUERY_INVALID)
+
+        if query is not None:
+            if document_hash(query) != sha256_hash:
+                raise PersistedQueryError(
+                    "Provided sha256Hash does not match query", PERSISTED_QUERY_INVALID
+                )
+            if self.allow_list is None:
+                self._remember(sha256_hash, query)
+            elif sha256_hash not in self.allow_list:
+                raise PersistedQueryError(
+                    "Query is not in the allow-list", PERSISTED_QUERY_NOT_ALLOWED
+                )
+            return query
+
+        document = self._lookup(sha256_hash)
+        if document is None:
+            raise PersistedQueryError("PersistedQueryNotFound", PERSISTED_QUERY_NOT_FOUND)
+        return document
+
+    def _lookup(self, sha256_hash: str) -> str | None:
+        if self.allow_list is not None:
+            return self.allow_list.get(sha256_hash)
+        document = self._documents.get(sha256_hash)
+        if document is not None:
+            self._documents.move_to_end(sha256_hash)
+        return document
+
+    def _remember(self, sha256_hash: str, document: str) -> None:
+        self._documents[sha256_hash] = document
+        self._documents.move_to_end(sha256_hash)
+        while len(self._documents) > self.size:
+            self._documents.popitem(last=False)
+
+
+class PersistedQueryMiddleware:
+    """ASGI middleware resolving persisted queries for the GraphQL endpoint."""
+
+    def __init__(self, app: ASGIApp, store: PersistedQueryStore, path: str = "/graphql"):
+        self.app = app
+        self.store = store
+        self.path = path.rstrip("/")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].rstrip("/") != self.path:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            if scope["method"] == "GET":
+                scope = self._resolve_query_string(scope)
+            elif scope["method"] == "POST" and _is_json(scope):
+                scope, receive = await self._resolve_body(scope, receive)
+            elif scope["method"] == "POST" and self.store.allow_list is not None:
+                # Never let a document the allow-list was not checked against through
+                raise PersistedQueryError("Unsupported content type", PERSISTED_QUERY_NOT_ALLOWED)
+        except PersistedQueryError as e:
+            response = JSONResponse(
+                {"errors": [{"message": str(e), "extensions": {"code": e.code}}]},
+                status_code=e.status_code,
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    def _resolve_query_string(self, scope: Scope) -> Scope:
+        """Put the document of a GET request into its ``query`` parameter."""
+        params = dict(parse_qsl(scope["query_string"].decode()))
+        if "query" not in params and "extensions" not in params:
+            # The GraphiQL page
+            return scope
+        extensions = _json_or_invalid(params.get("extensions", "{}"))
+        document = self.store.resolve(params.get("query"), extensions)
+        if document is None or document == params.get("query"):
+            return scope
+        params["query"] = document
+        return {**scope, "query_string": urlencode(params).encode()}
+
+    async def _resolve_body(self, scope: Scope, receive: Receive) -> tuple[Scope, Receive]:
+        """Put the document of a JSON POST request into its ``query`` field."""
+        body = await _read_body(receive)
+        payload = _json_or_invalid(body)
+        if not isinstance(payload, dict):
+            if self.store.allow_list is not None:
+                raise PersistedQueryError(
+                    "Batched queries are not allowed", PERSISTED_QUERY_NOT_ALLOWED
+                )
+            # Batched operations are left to the router
+            return scope, _replay(body, receive)
+
+        document = self.store.resolve(payload.get("query"), payload.get("extensions"))
+        if document is None or document == payload.get("query"):
+            return scope, _replay(body, receive)
+
+        body = json.dumps({**payload, "query": document}).encode()
+        scope = dict(scope)
+        headers = MutableHeaders(scope=scope)
+        headers["content-length"] = str(len(body))
+        return scope, _replay(body, receive)
+
+
+def _is_json(scope: Scope) -> bool:
+    """Whether the GraphQL router would parse the body as JSON."""
+    for name, value in scope["headers"]:
+        if name == b"content-type":
+            # Strawberry accepts any content type mentioning application/json
+            return b"application/json" in value.lower()
+    return False
+
+
+def _json_or_invalid(raw: str | bytes) -> Any:
+    try:
+        return json.loads(raw)
+    except ValueError as e:
+        raise PersistedQueryError("Invalid JSON", PERSISTED_QUERY_INVALID) from e
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay(body: bytes, receive: Receive) -> Receive:
+    """A ``receive`` that delivers ``body``, then defers to the client's ``receive``."""
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
@@ -1,18 +1,34 @@
 """GraphQL schema definition."""
 
+from collections.abc import Callable
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 import strawberry
+from strawberry.extensions import ParserCache, ValidationCache
 from strawberry.scalars import JSON
 from strawberry.types import Info
 
 from haven.application.services import RecordService
 from haven.application.services.task_service import TaskService
 from haven.domain.entities import Record
+from haven.domain.entities.commit import Commit, CommitReview
+from haven.domain.entities.repository import Repository
 from haven.domain.entities.task import Task
-from haven.infrastructure.database.factory import db_factory
+from haven.domain.entities.user import User
+from haven.domain.repositories.commit_repository import CommitKey
+from haven.infrastructure.database.repositories.commit_repository import (
+    SQLAlchemyCommitRepository,
+)
 from haven.infrastructure.database.repositories.task_repository import TaskRepositoryImpl
+from haven.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from haven.interface.cursors import InvalidCursorError, decode_key_cursor, encode_key_cursor
+from haven.interface.graphql.context import GraphQLContext
+from haven.interface.graphql.cost import QueryCostLimiter
+
+# Resolver info carrying the per-request context
+ContextInfo = Info[GraphQLContext, None]
 
 
 @strawberry.type
@@ -66,6 +82,154 @@ class RecordInput:
     data: JSON
 
 
+@strawberry.type
+class UserType:
+    """GraphQL type for User."""
+
+    id: int
+    username: str
+    email: str
+    display_name: str
+    avatar_url: str | None
+
+    @classmethod
+    def from_entity(cls, user: User) -> "UserType":
+        """Create GraphQL type from domain entity."""
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            display_name=user.display_name,
+            avatar_url=user.avatar_url,
+        )
+
+
+@strawberry.type
+class RepositoryType:
+    """GraphQL type for Repository."""
+
+    id: int
+    name: str
+    full_name: str
+    branch: str
+    slug: str | None
+    remote_url: str | None
+    description: str | None
+
+    @classmethod
+    def from_entity(cls, repository: Repository) -> "RepositoryType":
+        """Create GraphQL type from domain entity."""
+        return cls(
+            id=repository.id,
+            name=repository.name,
+            full_name=repository.full_name,
+            branch=repository.branch,
+            slug=repository.slug,
+            remote_url=repository.remote_url,
+            description=repository.description,
+        )
+
+
+async def _load_user(info: ContextInfo, user_id: int | None) -> UserType | None:
+    """Resolve a user reference through the request's DataLoader."""
+    if user_id is None:
+        return None
+    user = await info.context.loaders.users.load(user_id)
+    return UserType.from_entity(user) if user else None
+
+
+async def _load_repository(info: ContextInfo, repository_id: int | None) -> RepositoryType | None:
+    """Resolve a repository reference through the request's DataLoader."""
+    if repository_id is None:
+        return None
+    repository = await info.context.loaders.repositories.load(repository_id)
+    return RepositoryType.from_entity(repository) if repository else None
+
+
+@strawberry.type
+class CommitReviewType:
+    """GraphQL type for a commit review."""
+
+    id: int
+    commit_id: int
+    reviewer_id: int
+    status: str
+    notes: str | None
+    reviewed_at: datetime | None
+    created_at: datetime | None
+
+    @classmethod
+    def from_entity(cls, review: CommitReview) -> "CommitReviewType":
+        """Create GraphQL type from domain entity."""
+        return cls(
+            id=review.id,
+            commit_id=review.commit_id,
+            reviewer_id=review.reviewer_id,
+            status=review.status.value,
+            notes=review.notes,
+            reviewed_at=review.reviewed_at,
+            created_at=review.created_at,
+        )
+
+    @strawberry.field
+    async def reviewer(self, info: ContextInfo) -> UserType | None:
+        """The reviewing user."""
+        return await _load_user(info, self.reviewer_id)
+
+
+@strawberry.type
+class CommitType:
+    """GraphQL type for Commit."""
+
+    id: int
+    repository_id: int
+    commit_hash: str
+    message: str
+    author_name: str
+    author_email: str
+    committed_at: datetime
+
+    @classmethod
+    def from_entity(cls, commit: Commit) -> "CommitType":
+        """Create GraphQL type from domain entity."""
+        return cls(
+            id=commit.id,
+            repository_id=commit.repository_id,
+            commit_hash=commit.commit_hash,
+            message=commit.message,
+            author_name=commit.author_name,
+            author_email=commit.author_email,
+            committed_at=commit.committed_at,
+        )
+
+    @strawberry.field
+    async def repository(self, info: ContextInfo) -> RepositoryType | None:
+        """The repository the commit belongs to."""
+        return await _load_repository(info, self.repository_id)
+
+    @strawberry.field
+    async def reviews(self, info: ContextInfo) -> list[CommitReviewType]:
+        """Reviews of the commit, newest first."""
+        reviews = await info.context.loaders.commit_reviews.load(self.id)
+        return [CommitReviewType.from_entity(review) for review in reviews]
+
+
+@strawberry.type
+class CommitConnection:
+    """Relay-style connection for commits."""
+
+    edges: list["CommitEdge"]
+    page_info: "PageInfo"
+
+
+@strawberry.type
+class CommitEdge:
+    """Edge in commit connection."""
+
+    cursor: str
+    node: CommitType
+
+
 @strawberry.type
 class TaskType:
     """GraphQL type for Task."""
@@ -113,6 +277,16 @@ class TaskType:
             progress_percentage=task.get_progress_percentage(),
         )
 
+    @strawberry.field
+    async def assignee(self, info: ContextInfo) -> UserType | None:
+        """The user the task is assigned to."""
+        return await _load_user(info, self.assignee_id)
+
+    @strawberry.field
+    async def repository(self, info: ContextInfo) -> RepositoryType | None:
+        """The repository the task belongs to."""
+        return await _load_repository(info, self.repository_id)
+
 
 @strawberry.type
 class TaskConnection:
@@ -182,84 +356,108 @@ class TaskUpdateInput:
     due_date: datetime | None = None
 
 
+def _decode_after(after: str | None, id_type: Callable[[Any], Any]) -> tuple[datetime, Any] | None:
+    """
+    Decode an ``after`` cursor into a keyset position.
+
+    Args:
+        after: Cursor from a previous page, if any
+        id_type: Converts the cursor's id to the column's type
+
+    Returns:
+        ``(sort value, id)`` of the last row already seen, or None for the first page
+
+    Raises:
+        InvalidCursorError: If the cursor was not issued by this API
+    """
+    if not after:
+        return None
+    sort_value, row_id = decode_key_cursor(after)
+    try:
+        return sort_value, id_type(row_id)
+    except (AttributeError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def _page_info(edges: list[Any], has_next: bool) -> PageInfo:
+    """Build page info for a page of edges."""
+    return PageInfo(has_next_page=has_next, end_cursor=edges[-1].cursor if edges else None)
+
+
+def _task_connection(
+    tasks: list[Task], first: int, sort_value: Callable[[Task], datetime]
+) -> TaskConnection:
+    """
+    Build a task connection from up to ``first + 1`` tasks.
+
+    Args:
+        tasks: Tasks in listing order, including the extra probe row if one exists
+        first: Page size
+        sort_value: Returns the task's sort key for its cursor
+
+    Returns:
+        The page of tasks with keyset cursors
+    """
+    edges = [
+        TaskEdge(
+            cursor=encode_key_cursor(sort_value(task), task.id),
+            node=TaskType.from_entity(task),
+        )
+        for task in tasks[:first]
+    ]
+    return TaskConnection(edges=edges, page_info=_page_info(edges, len(tasks) > first))
+
+
 @strawberry.type
 class Query:
     """Root query type."""
 
     @strawberry.field
-    async def record(self, info: Info, id: UUID) -> RecordType | None:
+    async def record(self, info: ContextInfo, id: UUID) -> RecordType | None:
         """Get a single record by ID."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                service = RecordService(uow)
-                try:
-                    record = await service.get_record(id)
-                    return RecordType.from_entity(record)
-                except Exception:
-                    return None
+        async with info.context.database() as session:
+            service = RecordService(SQLAlchemyUnitOfWork(session))
+            try:
+                record = await service.get_record(id)
+                return RecordType.from_entity(record)
+            except Exception:
+                return None
 
     @strawberry.field
     async def records(
         self,
-        info: Info,
+        info: ContextInfo,
         first: int = 25,
         after: str | None = None,
     ) -> RecordConnection:
         """List records with cursor-based pagination."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                service = RecordService(uow)
-
-                # Decode cursor to offset
-                offset = 0
-                if after:
-                    try:
-                        offset = int(after)
-                    except ValueError:
-                        offset = 0
-
-                # Get records
-                records, total = await service.list_records(limit=first + 1, offset=offset)
-
-                # Check if there are more records
-                has_next = len(records) > first
-                if has_next:
-                    records = records[:first]
-
-                # Create edges
-                edges = []
-                for i, record in enumerate(records):
-                    cursor = str(offset + i)
-                    edges.append(
-                        RecordEdge(
-                            cursor=cursor,
-                            node=RecordType.from_entity(record),
-                        )
-                    )
-
-                # Create page info
-                end_cursor = edges[-1].cursor if edges else None
-                page_info = PageInfo(
-                    has_next_page=has_next,
-                    end_cursor=end_cursor,
-                )
-
-                return RecordConnection(edges=edges, page_info=page_info)
+        after_key = _decode_after(after, UUID)
+        async with info.context.database() as session:
+            service = RecordService(SQLAlchemyUnitOfWork(session))
+
+            # Fetch one extra record to learn whether another page exists
+            records = await service.list_records_after(limit=first + 1, after=after_key)
+        has_next = len(records) > first
+
+        edges = [
+            RecordEdge(
+                cursor=encode_key_cursor(record.created_at, str(record.id)),
+                node=RecordType.from_entity(record),
+            )
+            for record in records[:first]
+        ]
+        return RecordConnection(edges=edges, page_info=_page_info(edges, has_next))
 
     @strawberry.field
-    async def task(self, info: Info, id: int) -> TaskType | None:
+    async def task(self, info: ContextInfo, id: int) -> TaskType | None:
         """Get a single task by ID."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                task_repo = TaskRepositoryImpl(uow.session)
-                service = TaskService(task_repo)
-                task = await service.get_task_by_id(id)
-                return TaskType.from_entity(task) if task else None
+        task = await info.context.loaders.tasks.load(id)
+        return TaskType.from_entity(task) if task else None
 
     @strawberry.field
     async def tasks(
         self,
-        info: Info,
+        info: ContextInfo,
         first: int = 25,
         after: str | None = None,
         status: str | None = None,
@@ -267,202 +465,118 @@ class Query:
         repository_id: int | None = None,
     ) -> TaskConnection:
         """List tasks with optional filters and cursor-based pagination."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                task_repo = TaskRepositoryImpl(uow.session)
-                service = TaskService(task_repo)
-
-                # Decode cursor to offset
-                offset = 0
-                if after:
-                    try:
-                        offset = int(after)
-                    except ValueError:
-                        offset = 0
-
-                # Get tasks with filters
-                if status:
-                    tasks = await service.get_tasks_by_status(
-                        status, limit=first + 1, offset=offset
-                    )
-                elif assignee_id:
-                    tasks = await service.get_tasks_by_assignee(
-                        assignee_id, limit=first + 1, offset=offset
-                    )
-                elif repository_id:
-                    tasks = await service.get_tasks_by_repository(
-                        repository_id, limit=first + 1, offset=offset
-                    )
-                else:
-                    tasks = await service.get_all_tasks(limit=first + 1, offset=offset)
-
-                # Check if there are more tasks
-                has_next = len(tasks) > first
-                if has_next:
-                    tasks = tasks[:first]
-
-                # Create edges
-                edges = []
-                for i, task in enumerate(tasks):
-                    cursor = str(offset + i)
-                    edges.append(
-                        TaskEdge(
-                            cursor=cursor,
-                            node=TaskType.from_entity(task),
-                        )
-                    )
-
-                # Create page info
-                end_cursor = edges[-1].cursor if edges else None
-                page_info = PageInfo(
-                    has_next_page=has_next,
-                    end_cursor=end_cursor,
-                )
-
-                return TaskConnection(edges=edges, page_info=page_info)
+        after_key = _decode_after(after, int)
+        async with info.context.database() as session:
+            service = TaskService(TaskRepositoryImpl(session))
+
+            # Fetch one extra task to learn whether another page exists
+            tasks = await service.list_tasks_after(
+                limit=first + 1,
+                after=after_key,
+                status=status,
+                assignee_id=assignee_id,
+                repository_id=repository_id,
+            )
+        return _task_connection(tasks, first, lambda task: task.created_at)
 
     @strawberry.field
     async def overdue_tasks(
         self,
-        info: Info,
+        info: ContextInfo,
         first: int = 25,
         after: str | None = None,
     ) -> TaskConnection:
         """List overdue tasks with cursor-based pagination."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                task_repo = TaskRepositoryImpl(uow.session)
-                service = TaskService(task_repo)
-
-                # Decode cursor to offset
-                offset = 0
-                if after:
-                    try:
-                        offset = int(after)
-                    except ValueError:
-                        offset = 0
-
-                # Get overdue tasks
-                tasks = await service.get_overdue_tasks(limit=first + 1, offset=offset)
-
-                # Check if there are more tasks
-                has_next = len(tasks) > first
-                if has_next:
-                    tasks = tasks[:first]
-
-                # Create edges
-                edges = []
-                for i, task in enumerate(tasks):
-                    cursor = str(offset + i)
-                    edges.append(
-                        TaskEdge(
-                            cursor=cursor,
-                            node=TaskType.from_entity(task),
-                        )
-                    )
-
-                # Create page info
-                end_cursor = edges[-1].cursor if edges else None
-                page_info = PageInfo(
-                    has_next_page=has_next,
-                    end_cursor=end_cursor,
-                )
-
-                return TaskConnection(edges=edges, page_info=page_info)
+        after_key = _decode_after(after, int)
+        async with info.context.database() as session:
+            service = TaskService(TaskRepositoryImpl(session))
+            tasks = await service.get_overdue_tasks_after(limit=first + 1, after=after_key)
+        return _task_connection(tasks, first, lambda task: task.due_date)
 
     @strawberry.field
     async def search_tasks(
         self,
-        info: Info,
+        info: ContextInfo,
         query: str,
         first: int = 25,
         after: str | None = None,
     ) -> TaskConnection:
         """Search tasks by title or description."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                task_repo = TaskRepositoryImpl(uow.session)
-                service = TaskService(task_repo)
-
-                # Decode cursor to offset
-                offset = 0
-                if after:
-                    try:
-                        offset = int(after)
-                    except ValueError:
-                        offset = 0
-
-                # Search tasks
-                tasks = await service.search_tasks(query, limit=first + 1, offset=offset)
-
-                # Check if there are more tasks
-                has_next = len(tasks) > first
-                if has_next:
-                    tasks = tasks[:first]
-
-                # Create edges
-                edges = []
-                for i, task in enumerate(tasks):
-                    cursor = str(offset + i)
-                    edges.append(
-                        TaskEdge(
-                            cursor=cursor,
-                            node=TaskType.from_entity(task),
-                        )
-                    )
-
-                # Create page info
-                end_cursor = edges[-1].cursor if edges else None
-                page_info = PageInfo(
-                    has_next_page=has_next,
-                    end_cursor=end_cursor,
-                )
-
-                return TaskConnection(edges=edges, page_info=page_info)
+        after_key = _decode_after(after, int)
+        async with info.context.database() as session:
+            service = TaskService(TaskRepositoryImpl(session))
+            tasks = await service.list_tasks_after(limit=first + 1, after=after_key, query=query)
+        return _task_connection(tasks, first, lambda task: task.created_at)
 
     @strawberry.field
     async def task_metrics(
         self,
-        info: Info,
+        info: ContextInfo,
         repository_id: int | None = None,
     ) -> TaskMetrics:
         """Get task metrics and statistics."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                task_repo = TaskRepositoryImpl(uow.session)
-                service = TaskService(task_repo)
-
-                metrics = await service.get_task_metrics(repository_id=repository_id)
-
-                return TaskMetrics(
-                    status_distribution=metrics.get("status_distribution", {}),
-                    priority_distribution=metrics.get("priority_distribution", {}),
-                    average_resolution_time_hours=metrics.get("average_resolution_time_hours", 0.0),
-                )
+        async with info.context.database() as session:
+            service = TaskService(TaskRepositoryImpl(session))
+            metrics = await service.get_task_metrics(repository_id=repository_id)
+
+        return TaskMetrics(
+            status_distribution=metrics.get("status_distribution", {}),
+            priority_distribution=metrics.get("priority_distribution", {}),
+            average_resolution_time_hours=metrics.get("average_resolution_time_hours", 0.0),
+        )
 
     @strawberry.field
     async def ttr_stats(
         self,
-        info: Info,
+        info: ContextInfo,
         repository_id: int | None = None,
     ) -> TimeToResolutionStats:
         """Get time-to-resolution statistics."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                task_repo = TaskRepositoryImpl(uow.session)
-                service = TaskService(task_repo)
+        async with info.context.database() as session:
+            service = TaskService(TaskRepositoryImpl(session))
+            stats = await service.get_time_to_resolution_stats(repository_id=repository_id)
+
+        return TimeToResolutionStats(
+            total_completed_tasks=stats["total_completed_tasks"],
+            average_resolution_time_hours=stats["average_resolution_time_hours"],
+            median_resolution_time_hours=stats["median_resolution_time_hours"],
+            min_resolution_time_hours=stats["min_resolution_time_hours"],
+            max_resolution_time_hours=stats["max_resolution_time_hours"],
+            status_distribution=stats["status_distribution"],
+            priority_distribution=stats["priority_distribution"],
+        )
 
-                stats = await service.get_time_to_resolution_stats(repository_id=repository_id)
+    @strawberry.field
+    async def commit(self, info: ContextInfo, id: int) -> CommitType | None:
+        """Get a single commit by ID."""
+        commit = await info.context.loaders.commits.load(id)
+        return CommitType.from_entity(commit) if commit else None
 
-                return TimeToResolutionStats(
-                    total_completed_tasks=stats["total_completed_tasks"],
-                    average_resolution_time_hours=stats["average_resolution_time_hours"],
-                    median_resolution_time_hours=stats["median_resolution_time_hours"],
-                    min_resolution_time_hours=stats["min_resolution_time_hours"],
-                    max_resolution_time_hours=stats["max_resolution_time_hours"],
-                    status_distribution=stats["status_distribution"],
-                    priority_distribution=stats["priority_distribution"],
-                )
+    @strawberry.field
+    async def commits(
+        self,
+        info: ContextInfo,
+        repository_id: int,
+        first: int = 25,
+        after: str | None = None,
+    ) -> CommitConnection:
+        """List a repository's commits, newest first, with cursor-based pagination."""
+        after_key = _decode_after(after, int)
+        async with info.context.database() as session:
+            page = await SQLAlchemyCommitRepository(session).get_page(
+                repository_id,
+                limit=first,
+                after=CommitKey(*after_key) if after_key else None,
+            )
+
+        edges = [
+            CommitEdge(
+                cursor=encode_key_cursor(commit.committed_at, commit.id),
+                node=CommitType.from_entity(commit),
+            )
+            for commit in page.items
+        ]
+        return CommitConnection(edges=edges, page_info=_page_info(edges, page.has_more))
 
 
 @strawberry.type
@@ -470,118 +584,111 @@ class Mutation:
     """Root mutation type."""
 
     @strawberry.mutation
-    async def create_record(self, info: Info, input: RecordInput) -> RecordType:
+    async def create_record(self, info: ContextInfo, input: RecordInput) -> RecordType:
         """Create a new record."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                service = RecordService(uow)
-                record = await service.create_record(input.data)
-                return RecordType.from_entity(record)
+        async with info.context.unit_of_work() as uow:
+            service = RecordService(uow)
+            record = await service.create_record(input.data)
+        return RecordType.from_entity(record)
 
     @strawberry.mutation
-    async def update_record(self, info: Info, id: UUID, input: RecordInput) -> RecordType:
+    async def update_record(self, info: ContextInfo, id: UUID, input: RecordInput) -> RecordType:
         """Update an existing record."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                service = RecordService(uow)
-                record = await service.update_record(id, input.data)
-                return RecordType.from_entity(record)
+        async with info.context.unit_of_work() as uow:
+            service = RecordService(uow)
+            record = await service.update_record(id, input.data)
+        return RecordType.from_entity(record)
 
     @strawberry.mutation
-    async def delete_record(self, info: Info, id: UUID) -> bool:
+    async def delete_record(self, info: ContextInfo, id: UUID) -> bool:
         """Delete a record by ID."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                service = RecordService(uow)
-                return await service.delete_record(id)
+        async with info.context.unit_of_work() as uow:
+            service = RecordService(uow)
+            return await service.delete_record(id)
 
     @strawberry.mutation
-    async def create_task(self, info: Info, input: TaskInput) -> TaskType:
+    async def create_task(self, info: ContextInfo, input: TaskInput) -> TaskType:
         """Create a new task."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                task_repo = TaskRepositoryImpl(uow.session)
-                service = TaskService(task_repo)
-
-                task = await service.create_task(
-                    title=input.title,
-                    description=input.description,
-                    priority=input.priority,
-                    task_type=input.task_type,
-                    assignee_id=input.assignee_id,
-                    repository_id=input.repository_id,
-                    estimated_hours=input.estimated_hours,
-                    due_date=input.due_date,
-                )
-
-                return TaskType.from_entity(task)
+        async with info.context.unit_of_work() as uow:
+            service = TaskService(TaskRepositoryImpl(uow.session))
+
+            task = await service.create_task(
+                title=input.title,
+                description=input.description,
+                priority=input.priority,
+                task_type=input.task_type,
+                assignee_id=input.assignee_id,
+                repository_id=input.repository_id,
+                estimated_hours=input.estimated_hours,
+                due_date=input.due_date,
+            )
+
+        return TaskType.from_entity(task)
 
     @strawberry.mutation
-    async def update_task(self, info: Info, id: int, input: TaskUpdateInput) -> TaskType:
+    async def update_task(self, info: ContextInfo, id: int, input: TaskUpdateInput) -> TaskType:
         """Update an existing task."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                task_repo = TaskRepositoryImpl(uow.session)
-                service = TaskService(task_repo)
-
-                task = await service.update_task(
-                    task_id=id,
-                    title=input.title,
-                    description=input.description,
-                    status=input.status,
-                    priority=input.priority,
-                    task_type=input.task_type,
-                    assignee_id=input.assignee_id,
-                    repository_id=input.repository_id,
-                    estimated_hours=input.estimated_hours,
-                    actual_hours=input.actual_hours,
-                    due_date=input.due_date,
-                )
-
-                return TaskType.from_entity(task)
+        async with info.context.unit_of_work() as uow:
+            service = TaskService(TaskRepositoryImpl(uow.session))
+
+            task = await service.update_task(
+                task_id=id,
+                title=input.title,
+                description=input.description,
+                status=input.status,
+                priority=input.priority,
+                task_type=input.task_type,
+                assignee_id=input.assignee_id,
+                repository_id=input.repository_id,
+                estimated_hours=input.estimated_hours,
+                actual_hours=input.actual_hours,
+                due_date=input.due_date,
+            )
+
+        return TaskType.from_entity(task)
 
     @strawberry.mutation
-    async def delete_task(self, info: Info, id: int) -> bool:
+    async def delete_task(self, info: ContextInfo, id: int) -> bool:
         """Delete a task by ID."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                task_repo = TaskRepositoryImpl(uow.session)
-                service = TaskService(task_repo)
-                return await service.delete_task(id)
+        async with info.context.unit_of_work() as uow:
+            service = TaskService(TaskRepositoryImpl(uow.session))
+            return await service.delete_task(id)
 
     @strawberry.mutation
-    async def start_task(self, info: Info, id: int) -> TaskType:
+    async def start_task(self, info: ContextInfo, id: int) -> TaskType:
         """Start working on a task."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                task_repo = TaskRepositoryImpl(uow.session)
-                service = TaskService(task_repo)
-
-                task = await service.start_task(id)
-                return TaskType.from_entity(task)
+        async with info.context.unit_of_work() as uow:
+            service = TaskService(TaskRepositoryImpl(uow.session))
+            task = await service.start_task(id)
+        return TaskType.from_entity(task)
 
     @strawberry.mutation
-    async def complete_task(self, info: Info, id: int) -> TaskType:
+    async def complete_task(self, info: ContextInfo, id: int) -> TaskType:
         """Mark a task as completed."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                task_repo = TaskRepositoryImpl(uow.session)
-                service = TaskService(task_repo)
-
-                task = await service.complete_task(id)
-                return TaskType.from_entity(task)
+        async with info.context.unit_of_work() as uow:
+            service = TaskService(TaskRepositoryImpl(uow.session))
+            task = await service.complete_task(id)
+        return TaskType.from_entity(task)
 
     @strawberry.mutation
-    async def log_time_on_task(self, info: Info, id: int, hours: float) -> TaskType:
+    async def log_time_on_task(self, info: ContextInfo, id: int, hours: float) -> TaskType:
         """Log time worked on a task."""
-        async for uow in db_factory.get_unit_of_work():
-            async with uow:
-                task_repo = TaskRepositoryImpl(uow.session)
-                service = TaskService(task_repo)
+        async with info.context.unit_of_work() as uow:
+            service = TaskService(TaskRepositoryImpl(uow.session))
+            task = await service.log_time_on_task(id, hours)
+        return TaskType.from_entity(task)
 
-                task = await service.log_time_on_task(id, hours)
-                return TaskType.from_entity(task)
 
+# Parsed and validated documents kept per distinct query string
+DOCUMENT_CACHE_SIZE = 256
 
 # Create the schema
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[
+        ParserCache(maxsize=DOCUMENT_CACHE_SIZE),
+        ValidationCache(maxsize=DOCUMENT_CACHE_SIZE),
+        QueryCostLimiter,
+    ],
+)
@@ -0,0 +1,37 @@
+"""Job handlers served by ``haven worker`` processes."""
+
+from haven.config import get_settings
+from haven.infrastructure.jobs import JobHandler, run_worker_processes
+from haven.interface.api.diff_routes import GENERATE_BRANCH_DIFFS_JOB, generate_branch_diffs_job
+from haven.interface.api.repository_management_routes import (
+    GENERATE_REPOSITORY_DIFFS_JOB,
+    LOAD_COMMITS_JOB,
+    generate_repository_diffs_job,
+    load_commits_job,
+)
+
+JOB_HANDLERS: dict[str, JobHandler] = {
+    LOAD_COMMITS_JOB: load_commits_job,
+    GENERATE_REPOSITORY_DIFFS_JOB: generate_repository_diffs_job,
+    GENERATE_BRANCH_DIFFS_JOB: generate_branch_diffs_job,
+}
+
+
+def run_workers(processes: int | None = None, concurrency: int | None = None) -> None:
+    """
+    Run job worker processes until interrupted.
+
+    Args:
+        processes: Number of worker processes (default from settings)
+        concurrency: Concurrent jobs per process (default from settings)
+    """
+    settings = get_settings().worker
+    run_worker_processes(
+        JOB_HANDLERS,
+        processes or settings.processes,
+        concurrency=concurrency or settings.concurrency,
+        poll_interval=settings.poll_interval,
+        lease_seconds=settings.lease_seconds,
+        heartbeat_interval=settings.heartbeat_interval,
+        retry_backoff=settings.retry_backoff,
+    )
@@ -1,5 +1,8 @@
 """Main entry point for Haven application."""
 
+import argparse
+import sys
+
 import uvicorn
 
 from haven.config import get_settings
@@ -9,8 +12,8 @@ from haven.interface.api.app import create_app
 app = create_app()
 
 
-def main() -> None:
-    """Run the Haven application."""
+def serve() -> None:
+    """Run the Haven API server."""
     settings = get_settings()
 
     # Use import string when reload is enabled
@@ -31,5 +34,22 @@ def main() -> None:
     )
 
 
+def main() -> None:
+    """Run the Haven application, or its background job workers with ``haven worker``."""
+    # Anything else, such as Hydra overrides like +environment=prod, is left to settings
+    if sys.argv[1:2] != ["worker"]:
+        serve()
+        return
+
+    parser = argparse.ArgumentParser(prog="haven worker")
+    parser.add_argument("-n", "--processes", type=int, help="Number of worker processes")
+    parser.add_argument("-c", "--concurrency", type=int, help="Concurrent jobs per process")
+    args = parser.parse_args(sys.argv[2:])
+
+    from haven.interface.worker import run_workers
+
+    run_workers(args.processes, args.concurrency)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,139 @@
+"""Tests for DiffHtmlService."""
+
+import json
+from dataclasses import replace
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from haven.application.services.diff_html_service import DiffHtmlService, plan_diff_batches
+from haven.domain.entities.commit import Commit, DiffStats
+from haven.domain.entities.repository import Repository
+from haven.infrastructure.storage.compression import iter_decompressed
+
+SAMPLE_DIFF = """\
+diff --git a/app.py b/app.py
+index 1111111..2222222 100644
+--- a/app.py
++++ b/app.py
+@@ -1 +1,2 @@
+ print("hi")
++print("there")
+"""
+
+
+class TestDiffHtmlService:
+    """Tests for DiffHtmlService."""
+
+    @pytest.fixture
+    def mock_git_client(self):
+        """Create mock git client."""
+        client = AsyncMock()
+        client.get_commit_diff.return_value = SAMPLE_DIFF
+        return client
+
+    @pytest.fixture
+    def diff_service(self, mock_git_client, tmp_path):
+        """Create diff service writing into a temporary directory."""
+        return DiffHtmlService(mock_git_client, AsyncMock(), str(tmp_path / "diffs"))
+
+    @pytest.fixture
+    def sample_commit(self):
+        """Create sample commit for testing."""
+        return Commit(
+            id=1,
+            repository_id=1,
+            commit_hash="abc123def456",
+            message="Add greeting",
+            author_name="John Doe",
+            author_email="john@example.com",
+            committer_name="John Doe",
+            committer_email="john@example.com",
+            committed_at=datetime.now(UTC),
+            diff_stats=DiffStats(files_changed=1, insertions=1, deletions=0),
+        )
+
+    @pytest.mark.asyncio
+    async def test_generate_writes_compact_json(self, diff_service, sample_commit, tmp_path):
+        """Test the artifact contains commit metadata and parsed files."""
+        path = await diff_service.generate_diff_html(sample_commit, str(tmp_path))
+
+        raw = b"".join(iter_decompressed(path))
+        data = json.loads(raw)
+        assert b"\n" not in raw
+        assert data["commit"]["hash"] == "abc123def456"
+        assert data["files"][0]["newName"] == "app.py"
+        assert data["files"][0]["addedLines"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_git(
+        self, diff_service, mock_git_client, sample_commit, tmp_path
+    ):
+        """Test regenerating an existing artifact does no git work."""
+        first = await diff_service.generate_diff_html(sample_commit, str(tmp_path))
+        second = await diff_service.generate_diff_html(sample_commit, str(tmp_path))
+
+        assert first == second
+        assert mock_git_client.get_commit_diff.await_count == 1
+        assert diff_service.get_cached_diff(sample_commit, str(tmp_path)) == first
+
+    @pytest.mark.asyncio
+    async def test_forks_share_artifacts(
+        self, diff_service, mock_git_client, sample_commit, tmp_path
+    ):
+        """Test the same commit in another repository reuses the artifact."""
+        first = await diff_service.generate_diff_html(sample_commit, str(tmp_path))
+        sample_commit.repository_id = 2
+
+        assert await diff_service.generate_diff_html(sample_commit, str(tmp_path)) == first
+        assert mock_git_client.get_commit_diff.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_git_failure_is_not_cached(
+        self, diff_service, mock_git_client, sample_commit, tmp_path
+    ):
+        """Test a failed diff leaves no artifact behind."""
+        mock_git_client.get_commit_diff.side_effect = Exception("bad object")
+
+        with pytest.raises(Exception, match="bad object"):
+            await diff_service.generate_diff_html(sample_commit, str(tmp_path))
+
+        assert diff_service.get_cached_diff(sample_commit, str(tmp_path)) is None
+
+    @pytest.mark.asyncio
+    async def test_batch_plan_groups_commits_per_repository(
+        self, diff_service, mock_git_client, sample_commit, tmp_path
+    ):
+        """Test a cross-repository batch renders each commit against its own repository."""
+        commits = [
+            sample_commit,
+            replace(sample_commit, id=2, repository_id=2, commit_hash="def456abc123"),
+            replace(sample_commit, id=3, commit_hash="123abc456def"),
+            replace(sample_commit, id=4, repository_id=3, commit_hash="456def123abc"),
+        ]
+        repositories = [
+            Repository(
+                id=repository_id,
+                name=name,
+                full_name=f"haven/{name}",
+                url=str(tmp_path / name),
+                branch="main",
+            )
+            for repository_id, name in ((1, "one"), (2, "two"))
+        ]
+
+        plan = plan_diff_batches(commits, repositories)
+
+        assert [
+            (batch.repository_id, [commit.id for commit in batch.commits]) for batch in plan.batches
+        ] == [(1, [1, 3]), (2, [2])]
+        assert [commit.id for commit in plan.unresolved] == [4]
+
+        results = await diff_service.process_batch_plan(plan, max_concurrent_per_repo=1)
+
+        assert results.keys() == {1, 2, 3}
+        calls = mock_git_client.get_commit_diff.await_args_list
+        repo_paths = {call.args[1]: call.args[0] for call in calls}
+        assert repo_paths["def456abc123"] == str(tmp_path / "two")
+        assert repo_paths["123abc456def"] == str(tmp_path / "one")
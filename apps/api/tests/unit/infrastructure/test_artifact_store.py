@@ -0,0 +1,45 @@
+"""Tests for the content-addressed artifact store."""
+
+import os
+
+from haven.infrastructure.storage.artifact_store import ArtifactStore
+
+
+def test_key_depends_on_renderer_and_options():
+    """Test keys change with the renderer version and options, not their order."""
+    key = ArtifactStore.key_for("abc", "native/1", {"a": 1, "b": 2})
+
+    assert key == ArtifactStore.key_for("abc", "native/1", {"b": 2, "a": 1})
+    assert key != ArtifactStore.key_for("abc", "native/2", {"a": 1, "b": 2})
+    assert key != ArtifactStore.key_for("abd", "native/1", {"a": 1, "b": 2})
+
+
+def test_write_and_lookup(tmp_path):
+    """Test written artifacts are found and leave no temporary files."""
+    store = ArtifactStore(tmp_path)
+    key = store.key_for("abc", "native/1")
+
+    assert store.lookup(key) is None
+    path = store.write(key, b"{}")
+
+    assert store.lookup(key) == path
+    assert path.read_bytes() == b"{}"
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+
+def test_gc_evicts_least_recently_used(tmp_path):
+    """Test gc removes the oldest artifacts first and honours lookups."""
+    store = ArtifactStore(tmp_path, max_bytes=10**6)
+    keys = [store.key_for(str(i), "native/1") for i in range(3)]
+    for age, key in zip((300, 200, 100), keys, strict=True):
+        path = store.write(key, b"x" * 100)
+        os.utime(path, (path.stat().st_mtime - age,) * 2)
+
+    # Touch the oldest artifact so it becomes the most recently used
+    store.lookup(keys[0])
+    result = store.gc(max_bytes=150)
+
+    assert (result.removed, result.remaining, result.remaining_bytes) == (2, 1, 100)
+    assert store.lookup(keys[0]) is not None
+    assert store.lookup(keys[1]) is None
+    assert store.lookup(keys[2]) is None
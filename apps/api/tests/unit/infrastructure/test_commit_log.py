@@ -0,0 +1,100 @@
+"""Tests for the streaming git log reader."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from haven.infrastructure.git.commit_log import CommitLogParser, iter_commit_log
+
+
+def _git(repo: Path, *args: str) -> str:
+    """Run a git command in the test repository."""
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """Create a repository with awkward subjects, a rename and a binary file."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    (repo / "a.txt").write_text("one\ntwo\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "Add a | with pipe")
+    _git(repo, "mv", "a.txt", "b.txt")
+    (repo / "blob.bin").write_bytes(b"\0\1\2")
+    (repo / "b.txt").write_text("one\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "Rename and add binary")
+    _git(repo, "commit", "-q", "--allow-empty", "--allow-empty-message", "-m", "")
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_iter_commit_log_with_numstat(git_repo: Path):
+    """Test metadata and numstat parsing, including renames and binary files."""
+    commits = [c async for c in iter_commit_log(str(git_repo), numstat=True)]
+
+    assert [c.subject for c in commits] == ["", "Rename and add binary", "Add a | with pipe"]
+    assert commits[0].files_changed == 0
+    assert (commits[1].files_changed, commits[1].insertions, commits[1].deletions) == (2, 0, 1)
+    assert (commits[2].files_changed, commits[2].insertions) == (1, 2)
+    assert commits[2].author_email == "test@example.com"
+    assert commits[2].date == _git(git_repo, "log", "-1", "--format=%ad", "--date=short").strip()
+
+
+@pytest.mark.asyncio
+async def test_iter_commit_log_range_reverse_and_limit(git_repo: Path):
+    """Test max-count is applied before reversing, matching git semantics."""
+    commits = [
+        c async for c in iter_commit_log(str(git_repo), "HEAD~2..HEAD", max_count=2, reverse=True)
+    ]
+
+    assert [c.subject for c in commits] == ["Rename and add binary", ""]
+    assert commits[0].short_hash == commits[0].hash[: len(commits[0].short_hash)]
+
+
+@pytest.mark.asyncio
+async def test_iter_commit_log_unknown_revision(git_repo: Path):
+    """Test git failures surface as RuntimeError."""
+    with pytest.raises(RuntimeError):
+        [c async for c in iter_commit_log(str(git_repo), "does-not-exist")]
+
+
+def test_parser_handles_tokens_split_across_chunks():
+    """Test the parser yields identical results regardless of chunk boundaries."""
+    record = b"\0" + b"\0".join(
+        [
+            b"a" * 40,
+            b"aaaaaaa",
+            b"An",
+            b"a@x",
+            b"2024-01-02T03:04:05+02:00",
+            b"Cn",
+            b"c@x",
+            b"1700000000",
+            b"S",
+        ]
+    )
+    stream = record + b"\0\n3\t1\tf.py\0" + record + b"\0"
+
+    whole = CommitLogParser()
+    expected = whole.feed(stream) + whole.finish()
+
+    chunked = CommitLogParser()
+    result = []
+    for i in range(len(stream)):
+        result.extend(chunked.feed(stream[i : i + 1]))
+    result.extend(chunked.finish())
+
+    assert result == expected
+    assert len(result) == 2
+    assert (result[0].insertions, result[0].deletions) == (3, 1)
+    assert result[0].date == "2024-01-02"
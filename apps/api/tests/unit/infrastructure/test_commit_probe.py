@@ -0,0 +1,80 @@
+"""Tests for probing repository clones for commits missing from the database."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from haven.domain.entities.repository import Repository
+from haven.infrastructure.git.commit_probe import MissCache, probe_repositories
+
+
+def _git(repo: Path, *args: str) -> str:
+    """Run a git command in a test repository."""
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _repository(repository_id: int, path: Path) -> Repository:
+    return Repository(
+        id=repository_id,
+        name=path.name,
+        full_name=f"haven/{path.name}",
+        url=str(path),
+        branch="main",
+    )
+
+
+@pytest.mark.asyncio
+async def test_probe_finds_first_repository_with_commit(tmp_path: Path):
+    """Test the probe returns the preferred repository holding the commit and its full hash."""
+    repositories = []
+    for name in ("empty", "other", "clone"):
+        repo = tmp_path / name
+        repo.mkdir()
+        _git(repo, "init", "-q", "-b", "main")
+        repositories.append(repo)
+    (repositories[1] / "a.txt").write_text("a\n")
+    _git(repositories[1], "add", ".")
+    _git(repositories[1], "commit", "-q", "-m", "Other commit")
+    _git(repositories[2], "fetch", "-q", str(repositories[1]), "main")
+    head = _git(repositories[1], "rev-parse", "HEAD")
+    blob = _git(repositories[1], "rev-parse", "HEAD:a.txt")
+
+    candidates = [
+        _repository(1, tmp_path / "missing"),
+        _repository(2, tmp_path),  # not a repository
+        *(_repository(i, repo) for i, repo in enumerate(repositories, start=3)),
+    ]
+    found = await probe_repositories(candidates, head[:8], max_concurrent=2)
+
+    assert found is not None
+    repository, full_hash = found
+    assert (repository.id, full_hash) == (4, head)
+    # Only commits count
+    assert await probe_repositories(candidates, blob) is None
+    assert await probe_repositories(candidates, "deadbeef") is None
+
+
+def test_miss_cache_expires_and_evicts():
+    """Test misses are forgotten after the TTL and beyond the size limit."""
+    cache = MissCache(ttl=60, size=2)
+    for commit_hash in ("aaaa", "bbbb", "cccc"):
+        cache.add(commit_hash)
+
+    assert "aaaa" not in cache
+    assert "bbbb" in cache and "cccc" in cache
+
+    cache.ttl = 0
+    cache.add("dddd")
+    assert "dddd" not in cache
+
+    cache._expiry["bbbb"] = 0
+    assert "bbbb" not in cache
+    cache.clear()
+    assert "cccc" not in cache
@@ -6,10 +6,14 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from haven.domain.entities.commit import Commit, CommitReview, DiffStats, ReviewStatus
+from haven.domain.exceptions import AmbiguousCommitHashError
+from haven.domain.repositories.commit_repository import CommitKey
+from haven.infrastructure.database.models import CommitReviewModel
 from haven.infrastructure.database.repositories.commit_repository import (
     SQLAlchemyCommitRepository,
     SQLAlchemyCommitReviewRepository,
 )
+from haven.infrastructure.database.review_summary import refresh_review_summary
 
 
 class TestSQLAlchemyCommitRepository:
@@ -70,6 +74,21 @@ class TestSQLAlchemyCommitRepository:
 
         assert retrieved_commit is None
 
+    @pytest.mark.asyncio
+    async def test_get_many_by_ids(self, commit_repository, sample_commit):
+        """Test getting several commits by ID in one call keeps request order."""
+        first = await commit_repository.create(sample_commit)
+        sample_commit.repository_id = 2
+        second = await commit_repository.create(sample_commit)
+
+        commits = await commit_repository.get_many_by_ids([second.id, 999, first.id, second.id])
+
+        assert [(commit.id, commit.repository_id) for commit in commits] == [
+            (second.id, 2),
+            (first.id, 1),
+        ]
+        assert await commit_repository.get_many_by_ids([]) == []
+
     @pytest.mark.asyncio
     async def test_get_commit_by_hash(self, commit_repository, sample_commit):
         """Test getting a commit by repository and hash."""
@@ -90,6 +109,24 @@ class TestSQLAlchemyCommitRepository:
 
         assert retrieved_commit is None
 
+    @pytest.mark.asyncio
+    async def test_resolve_hash_across_repositories(self, commit_repository, sample_commit):
+        """Test resolving full and abbreviated hashes without a repository ID."""
+        sample_commit.commit_hash = "abc123" + "0" * 34
+        sample_commit.repository_id = 2
+        fork_copy = await commit_repository.create(sample_commit)
+        sample_commit.repository_id = 1
+        original = await commit_repository.create(sample_commit)
+        sample_commit.commit_hash = "abd456" + "0" * 34
+        await commit_repository.create(sample_commit)
+
+        assert (await commit_repository.resolve_hash("ABC123" + "0" * 34)).id == original.id
+        assert (await commit_repository.resolve_hash("abc1")).id == original.id
+        assert fork_copy.id != original.id
+        assert await commit_repository.resolve_hash("abe1") is None
+        with pytest.raises(AmbiguousCommitHashError):
+            await commit_repository.resolve_hash("ab")
+
     @pytest.mark.asyncio
     async def test_get_commits_by_repository(self, commit_repository, sample_commit):
         """Test getting commits for a repository."""
@@ -192,6 +229,166 @@ class TestSQLAlchemyCommitRepository:
 
         assert exists is False
 
+    @pytest.mark.asyncio
+    async def test_bulk_insert_skips_existing_commits(self, commit_repository, sample_commit):
+        """Test bulk insert reports inserted and skipped commits across batches."""
+        await commit_repository.create(sample_commit)
+        commits = [
+            Commit(
+                repository_id=1,
+                commit_hash=f"hash{i:04d}",
+                message=f"Commit {i}",
+                author_name="John Doe",
+                author_email="john@example.com",
+                committer_name="John Doe",
+                committer_email="john@example.com",
+                committed_at=datetime.now(UTC),
+                diff_stats=DiffStats(files_changed=1, insertions=i, deletions=0),
+            )
+            for i in range(5)
+        ]
+
+        result = await commit_repository.bulk_insert(
+            [sample_commit, *commits, commits[0]], batch_size=2
+        )
+
+        assert (result.inserted, result.skipped) == (5, 2)
+        assert await commit_repository.count_by_repository(1) == 6
+        stored = await commit_repository.get_by_hash(1, "hash0003")
+        assert stored.diff_stats.insertions == 3
+
+        result = await commit_repository.bulk_insert(commits)
+        assert (result.inserted, result.skipped) == (0, 5)
+
+    @pytest.mark.asyncio
+    async def test_get_page_walks_keyset_in_both_directions(self, commit_repository):
+        """Test keyset pages are stable across commits sharing a timestamp."""
+        committed_at = datetime(2025, 1, 1, tzinfo=UTC)
+        await commit_repository.bulk_insert(
+            Commit(
+                repository_id=1,
+                commit_hash=f"hash{i:04d}",
+                message="Fix bug" if i % 2 else "Add feature",
+                author_name="John Doe",
+                author_email="john@example.com",
+                committer_name="John Doe",
+                committer_email="john@example.com",
+                # Pairs of commits share a timestamp, so ordering relies on the id tiebreak
+                committed_at=committed_at.replace(day=1 + i // 2),
+                diff_stats=DiffStats(),
+            )
+            for i in range(5)
+        )
+        newest_first = await commit_repository.get_by_repository(1)
+
+        first = await commit_repository.get_page(1, limit=2)
+        second = await commit_repository.get_page(1, limit=2, after=CommitKey.of(first.items[-1]))
+        last = await commit_repository.get_page(1, limit=2, after=CommitKey.of(second.items[-1]))
+
+        assert [c.id for c in first.items + second.items + last.items] == [
+            c.id for c in newest_first
+        ]
+        assert (first.has_more, second.has_more, last.has_more) == (True, True, False)
+
+        back = await commit_repository.get_page(1, limit=2, before=CommitKey.of(last.items[0]))
+        assert [c.id for c in back.items] == [c.id for c in second.items]
+        assert back.has_more is True
+
+        fixes = await commit_repository.get_page(1, limit=10, search_query="fix")
+        assert [c.commit_hash for c in fixes.items] == ["hash0003", "hash0001"]
+        assert fixes.has_more is False
+
+    @pytest.mark.asyncio
+    async def test_fetch_with_latest_review(self, commit_repository, test_session):
+        """Test listing rows carry each commit's review summary, one row per commit."""
+        await commit_repository.bulk_insert(
+            Commit(
+                repository_id=1,
+                commit_hash=f"hash{i:04d}",
+                message="Add feature",
+                author_name="John Doe",
+                author_email="john@example.com",
+                committer_name="John Doe",
+                committer_email="john@example.com",
+                committed_at=datetime(2025, 1, 1 + i, tzinfo=UTC),
+                diff_stats=DiffStats(),
+            )
+            for i in range(3)
+        )
+        newest, middle, oldest = await commit_repository.get_by_repository(1)
+        reviewed_at = datetime(2025, 2, 1, tzinfo=UTC)
+        test_session.add_all(
+            [
+                CommitReviewModel(
+                    commit_id=newest.id,
+                    reviewer_id=1,
+                    status=ReviewStatus.NEEDS_REVISION.value,
+                    created_at=reviewed_at.replace(day=1),
+                ),
+                # Tied on created_at: the later id is the latest review
+                CommitReviewModel(
+                    commit_id=newest.id,
+                    reviewer_id=2,
+                    status=ReviewStatus.PENDING_REVIEW.value,
+                    created_at=reviewed_at.replace(day=2),
+                ),
+                CommitReviewModel(
+                    commit_id=newest.id,
+                    reviewer_id=3,
+                    status=ReviewStatus.APPROVED.value,
+                    reviewed_at=reviewed_at,
+                    created_at=reviewed_at.replace(day=2),
+                ),
+                CommitReviewModel(
+                    commit_id=oldest.id,
+                    reviewer_id=1,
+                    status=ReviewStatus.APPROVED.value,
+                    created_at=reviewed_at,
+                ),
+            ]
+        )
+        await test_session.flush()
+        await refresh_review_summary(test_session, [newest.id, middle.id, oldest.id])
+
+        page = await commit_repository.get_page(
+            1, limit=2, fetch=commit_repository.fetch_with_latest_review
+        )
+        rest = await commit_repository.fetch_with_latest_review(
+            commit_repository.listing_statement(1, limit=10, offset=2)
+        )
+
+        rows = page.items + rest
+        assert [row.id for row in rows] == [newest.id, middle.id, oldest.id]
+        assert [(row.review_status, row.review_count) for row in rows] == [
+            (ReviewStatus.APPROVED.value, 3),
+            (None, 0),
+            (ReviewStatus.APPROVED.value, 1),
+        ]
+        assert rows[0].latest_review_at.replace(tzinfo=UTC) == reviewed_at
+        assert page.has_more is True
+
+    @pytest.mark.asyncio
+    async def test_listing_filters_by_latest_review_status(
+        self, commit_repository, sample_commit, test_session
+    ):
+        """Test review status filters match each commit's latest review only."""
+        commit = await commit_repository.create(sample_commit)
+        review_repository = SQLAlchemyCommitReviewRepository(test_session)
+        await review_repository.create(
+            CommitReview(commit_id=commit.id, reviewer_id=1, status=ReviewStatus.APPROVED)
+        )
+
+        approved = await commit_repository.get_page(1, review_status="approved")
+        pending = await commit_repository.get_page(1, review_status="pending_review")
+        rows = await commit_repository.fetch_with_latest_review(
+            commit_repository.listing_statement(1, limit=20, review_status="approved")
+        )
+        count = await commit_repository.count_listing(1, review_status="approved")
+
+        assert [c.id for c in approved.items] == [row.id for row in rows] == [commit.id]
+        assert pending.items == []
+        assert count.total == 1
+
 
 class TestSQLAlchemyCommitReviewRepository:
     """Tests for SQLAlchemy CommitReview repository."""
@@ -0,0 +1,85 @@
+"""Tests for commit search conditions."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.domain.entities.commit import Commit, DiffStats
+from haven.infrastructure.database import commit_search
+from haven.infrastructure.database.models import CommitModel
+from haven.infrastructure.database.repositories.commit_repository import (
+    SQLAlchemyCommitRepository,
+)
+
+
+def _postgres_sql(condition) -> str:
+    stmt = select(CommitModel.id).where(condition)
+    dialect = postgresql.asyncpg.dialect()
+    return str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [("abc1", True), ("ABCDEF1234", True), ("abc", False), ("fix bug", False), ("g123", False)],
+)
+def test_is_hash_prefix(query, expected):
+    """Test which queries are routed to hash prefix matching."""
+    assert commit_search.is_hash_prefix(query) is expected
+
+
+def test_prefix_tsquery_strips_operators():
+    """Test user text becomes a safe tsquery with the last word as a prefix."""
+    assert commit_search.prefix_tsquery("Fix parser refac") == "fix & parser & refac:*"
+    assert commit_search.prefix_tsquery("a|b & !c") == "a & b & c:*"
+    assert commit_search.prefix_tsquery("  !? ") is None
+
+
+def test_postgres_hex_queries_match_hashes_and_messages():
+    """Test long hex strings match hash prefixes as well as message words like "deadbeef"."""
+    sql = _postgres_sql(commit_search.message_condition("DeadBeef", "postgresql"))
+
+    assert "commits.commit_hash LIKE 'deadbeef%'" in sql
+    assert "commits.search_vector @@ to_tsquery('english', 'deadbeef:*')" in sql
+    assert "commits.message ILIKE '%DeadBeef%'" in sql
+
+
+def test_postgres_text_search_uses_tsvector_and_trigram():
+    """Test text searches combine full-text and substring matching."""
+    sql = _postgres_sql(commit_search.message_condition("beef 50%", "postgresql"))
+
+    assert "commits.search_vector @@ to_tsquery('english', 'beef & 50:*')" in sql
+    assert "commits.message ILIKE '%beef 50\\%%'" in sql
+    assert "commit_hash" not in sql
+
+    short_hash = _postgres_sql(commit_search.message_condition("beef", "postgresql"))
+    assert "commits.commit_hash LIKE 'beef%'" in short_hash
+    assert "@@" in short_hash
+
+
+@pytest.mark.asyncio
+async def test_sqlite_falls_back_to_ilike(test_session: AsyncSession):
+    """Test SQLite keeps substring matching on message and hash."""
+    repo = SQLAlchemyCommitRepository(test_session)
+    await repo.bulk_insert(
+        Commit(
+            repository_id=1,
+            commit_hash=commit_hash,
+            message=message,
+            author_name="John Doe",
+            author_email="john@example.com",
+            committer_name="John Doe",
+            committer_email="john@example.com",
+            committed_at=datetime.now(UTC),
+            diff_stats=DiffStats(),
+        )
+        for commit_hash, message in [("a1b2c3d4", "Refactor parser"), ("ffee0011", "Add docs")]
+    )
+
+    by_message = await repo.search_commits(1, search_query="factor", order_by_relevance=True)
+    by_hash = await repo.search_commits(1, search_query="ee00")
+
+    assert [c.commit_hash for c in by_message] == ["a1b2c3d4"]
+    assert [c.commit_hash for c in by_hash] == ["ffee0011"]
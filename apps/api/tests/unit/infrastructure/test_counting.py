@@ -0,0 +1,81 @@
+"""Tests for listing row counts."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.domain.entities.commit import Commit, DiffStats
+from haven.infrastructure.database.counting import RowCounter, row_counter
+from haven.infrastructure.database.repositories.commit_repository import (
+    SQLAlchemyCommitRepository,
+)
+
+
+def _commits(messages: list[str]) -> list[Commit]:
+    return [
+        Commit(
+            repository_id=1,
+            commit_hash=f"{message.replace(' ', '')}{i:04d}",
+            message=message,
+            author_name="John Doe",
+            author_email="john@example.com",
+            committer_name="John Doe",
+            committer_email="john@example.com",
+            committed_at=datetime.now(UTC),
+            diff_stats=DiffStats(),
+        )
+        for i, message in enumerate(messages)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_exact_counts_are_cached_by_normalized_filters(test_session: AsyncSession):
+    """Test exact counts are reused for equivalent filters until invalidated."""
+    repo = SQLAlchemyCommitRepository(test_session)
+    counter = RowCounter(cache_ttl=60)
+    await repo.bulk_insert(_commits(["Fix parser", "Fix lexer", "Add docs"]))
+
+    first = await repo.count_listing(1, search_query="fix", counter=counter)
+    assert (first.total, first.is_estimate) == (2, False)
+
+    await repo.bulk_insert(_commits(["Fix tests"]))
+    cached = await repo.count_listing(1, search_query="  FIX ", counter=counter)
+    assert cached.total == 2
+    assert (await repo.count_listing(1, counter=counter)).total == 4
+
+    counter.invalidate(("commits", 1))
+    assert (await repo.count_listing(1, search_query="fix", counter=counter)).total == 3
+
+
+@pytest.mark.asyncio
+async def test_counts_match_stripped_filters_and_reset_on_insert(test_session: AsyncSession):
+    """Test whitespace-padded filters count the rows they list, and inserts drop stale counts."""
+    repo = SQLAlchemyCommitRepository(test_session)
+    await repo.bulk_insert(_commits(["Fix parser", "Add docs"]))
+
+    padded = await repo.count_listing(1, author_filter=" John ", counter=row_counter)
+    listed = await repo.fetch_commits(repo.listing_statement(1, 20, author_filter=" John "))
+    assert padded.total == len(listed) == 2
+
+    await repo.bulk_insert(_commits(["Fix lexer"]))
+    await repo.create(_commits(["Fix tests"])[0])
+    assert (await repo.count_listing(1, author_filter="john", counter=row_counter)).total == 4
+    row_counter.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_and_bounded(test_session: AsyncSession):
+    """Test a zero TTL disables caching and the cache evicts oldest keys."""
+    repo = SQLAlchemyCommitRepository(test_session)
+    await repo.bulk_insert(_commits(["Fix parser"]))
+
+    uncached = RowCounter(cache_ttl=0)
+    await repo.count_listing(1, counter=uncached)
+    await repo.bulk_insert(_commits(["Fix lexer", "Fix tests"]))
+    assert (await repo.count_listing(1, counter=uncached)).total == 3
+
+    bounded = RowCounter(cache_size=2)
+    for repository_id in (1, 2, 3):
+        await repo.count_listing(repository_id, counter=bounded)
+    assert [key[1] for key in bounded._cache] == [2, 3]
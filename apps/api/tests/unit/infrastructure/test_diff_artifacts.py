@@ -0,0 +1,61 @@
+"""Tests for indexed diff artifacts."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from haven.infrastructure.storage.artifact_store import ArtifactStore
+from haven.infrastructure.storage.compression import GZIP, IDENTITY, ZSTD, iter_decompressed
+from haven.infrastructure.storage.diff_artifacts import (
+    encode_diff_artifact,
+    read_file_diff,
+    read_file_index,
+)
+
+COMMIT = {"hash": "abc123", "summary": "Change things"}
+FILES = [
+    {"oldName": "a.py", "newName": "a.py", "addedLines": 2, "deletedLines": 1, "blocks": []},
+    {
+        "oldName": "/dev/null",
+        "newName": "docs/new.md",
+        "isNew": True,
+        "addedLines": 5,
+        "blocks": [],
+    },
+    {"oldName": "old.txt", "newName": "new.txt", "isRename": True, "blocks": []},
+]
+
+CODECS = [codec for codec in (IDENTITY, GZIP, ZSTD) if codec is not None]
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.encoding)
+def test_indexed_artifact_round_trip(tmp_path: Path, codec):
+    """Test the artifact decodes whole and each file can be read on its own."""
+    store = ArtifactStore(tmp_path, suffix=".json" + codec.suffix)
+    data, index = encode_diff_artifact(COMMIT, iter(FILES), codec)
+    path = store.write(store.key_for("abc123", "test"), data, index)
+
+    assert json.loads(b"".join(iter_decompressed(path))) == {"commit": COMMIT, "files": FILES}
+
+    entries = read_file_index(path)
+    assert [(e["path"], e["status"]) for e in entries] == [
+        ("a.py", "modified"),
+        ("docs/new.md", "added"),
+        ("new.txt", "renamed"),
+    ]
+    assert entries[1]["old_path"] is None
+    assert (entries[0]["added_lines"], entries[0]["deleted_lines"]) == (2, 1)
+
+    assert json.loads(read_file_diff(path, "docs/new.md")) == FILES[1]
+    assert json.loads(read_file_diff(path, "old.txt")) == FILES[2]
+    assert read_file_diff(path, "missing.py") is None
+
+
+def test_artifact_without_index_falls_back_to_full_decode(tmp_path: Path):
+    """Test artifacts written before indexes existed are still readable per file."""
+    path = tmp_path / "abc123.json.gz"
+    path.write_bytes(GZIP.compress(json.dumps({"commit": COMMIT, "files": FILES}).encode()))
+
+    assert [e["path"] for e in read_file_index(path)] == ["a.py", "docs/new.md", "new.txt"]
+    assert json.loads(read_file_diff(path, "a.py")) == FILES[0]
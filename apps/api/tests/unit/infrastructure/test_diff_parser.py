@@ -0,0 +1,133 @@
+"""Tests for the native unified diff parser."""
+
+import pytest
+
+from haven.infrastructure.git.diff_parser import DiffParseError, parse_unified_diff
+
+GIT_DIFF = """\
+diff --git a/src/app.py b/src/app.py
+index 1111111..2222222 100644
+--- a/src/app.py
++++ b/src/app.py
+@@ -1,3 +1,3 @@ def main():
+ keep
+--- removed line that looks like a header
++++ added line that looks like a header
+ tail
+diff --git a/new.txt b/new.txt
+new file mode 100644
+index 0000000..3333333
+--- /dev/null
++++ b/new.txt
+@@ -0,0 +1,2 @@
++first
++second
+\\ No newline at end of file
+diff --git a/old name.md b/new name.md
+similarity index 90%
+rename from old name.md
+rename to new name.md
+diff --git a/logo.png b/logo.png
+index 4444444..5555555 100644
+Binary files a/logo.png and b/logo.png differ
+"""
+
+
+def test_parse_git_diff_shape():
+    """Test files, blocks and line numbering match the diff2html JSON layout."""
+    files = parse_unified_diff(GIT_DIFF)
+
+    assert [f["newName"] for f in files] == ["src/app.py", "new.txt", "new name.md", "logo.png"]
+
+    app = files[0]
+    assert (app["addedLines"], app["deletedLines"]) == (1, 1)
+    assert app["isGitDiff"] is True and app["isCombined"] is False
+    assert app["language"] == "py"
+    assert (app["checksumBefore"], app["checksumAfter"], app["mode"]) == (
+        "1111111",
+        "2222222",
+        "100644",
+    )
+    block = app["blocks"][0]
+    assert block["header"] == "@@ -1,3 +1,3 @@ def main():"
+    assert (block["oldStartLine"], block["oldStartLine2"], block["newStartLine"]) == (1, None, 1)
+    assert block["lines"] == [
+        {"content": " keep", "type": "context", "oldNumber": 1, "newNumber": 1},
+        {"content": "--- removed line that looks like a header", "type": "delete", "oldNumber": 2},
+        {"content": "+++ added line that looks like a header", "type": "insert", "newNumber": 2},
+        {"content": " tail", "type": "context", "oldNumber": 3, "newNumber": 3},
+    ]
+
+    new = files[1]
+    assert new["isNew"] is True and new["oldName"] == "/dev/null"
+    assert [line["newNumber"] for line in new["blocks"][0]["lines"]] == [1, 2]
+
+    renamed = files[2]
+    assert (renamed["oldName"], renamed["isRename"], renamed["unchangedPercentage"]) == (
+        "old name.md",
+        True,
+        90,
+    )
+    assert renamed["blocks"] == []
+
+    assert files[3]["isBinary"] is True
+
+
+def test_parse_combined_diff():
+    """Test merge commit (combined) diffs use two marker columns."""
+    diff = """\
+diff --cc file.txt
+index 1111111,2222222..3333333
+--- a/file.txt
++++ b/file.txt
+@@@ -1,2 -1,2 +1,2 @@@
+  shared
+- ours
+ +theirs
+"""
+    (file,) = parse_unified_diff(diff)
+
+    assert file["isCombined"] is True
+    assert file["blocks"][0]["oldStartLine2"] == 1
+    assert [line["type"] for line in file["blocks"][0]["lines"]] == ["context", "delete", "insert"]
+
+
+def test_parse_plain_diff_and_quoted_paths():
+    """Test non-git diffs and C-quoted paths."""
+    diff = """\
+--- "a/caf\\303\\251.txt"\t2024-01-01 00:00:00.000000000 +0000
++++ "b/caf\\303\\251.txt"\t2024-01-02 00:00:00.000000000 +0000
+@@ -1 +1 @@
+-old
++new
+--- a/other.txt
++++ b/other.txt
+@@ -1 +1,2 @@
+ same
++more
+"""
+    files = parse_unified_diff(diff)
+
+    assert [f["newName"] for f in files] == ["café.txt", "other.txt"]
+    assert files[0]["isGitDiff"] is False
+    assert (files[1]["addedLines"], files[1]["deletedLines"]) == (1, 0)
+
+
+def test_only_newlines_end_lines():
+    """Test form feeds and Unicode line separators stay inside their diff line."""
+    diff = "--- a/x\r\n+++ b/x\r\n@@ -1 +1,2 @@\n-page\x0cbreak\n+page\x0cbreak\n+a\u2028b\x85c\n"
+    files = parse_unified_diff(diff)
+
+    lines = files[0]["blocks"][0]["lines"]
+    assert [line["content"] for line in lines] == [
+        "-page\x0cbreak",
+        "+page\x0cbreak",
+        "+a\u2028b\x85c",
+    ]
+    assert (files[0]["addedLines"], files[0]["deletedLines"]) == (2, 1)
+
+
+def test_invalid_hunk_header():
+    """Test malformed hunk headers raise a parse error."""
+    with pytest.raises(DiffParseError):
+        parse_unified_diff("--- a/x\n+++ b/x\n@@ nonsense @@\n")
@@ -0,0 +1,138 @@
+"""Tests for the process-wide engine registry."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from haven.config.settings import (
+    AppInfo,
+    AppSettings,
+    CorsSettings,
+    DatabaseSettings,
+    LoggingSettings,
+    ServerSettings,
+)
+from haven.infrastructure.database.engines import (
+    API,
+    REPLICA,
+    WORKER,
+    EngineRegistry,
+    InstrumentedQueuePool,
+    create_engine,
+)
+
+
+def _settings(dsn: str, **database) -> AppSettings:
+    return AppSettings(
+        app=AppInfo(),
+        server=ServerSettings(),
+        database=DatabaseSettings(
+            driver="sqlite", host="", port=0, name="", user="", password="", dsn=dsn, **database
+        ),
+        logging=LoggingSettings(),
+        cors=CorsSettings(),
+    )
+
+
+def _file_dsn(path: Path) -> str:
+    return f"sqlite+aiosqlite:///{path / 'haven.db'}"
+
+
+@pytest.mark.asyncio
+async def test_registry_shares_engines_per_purpose(tmp_path: Path):
+    """Test each purpose gets one shared engine and session factory."""
+    registry = EngineRegistry(lambda: _settings(_file_dsn(tmp_path)))
+
+    assert registry.engine(API) is registry.engine(API)
+    assert registry.session_factory(API) is registry.session_factory(API)
+    assert registry.engine(WORKER) is not registry.engine(API)
+
+    async with registry.session_factory(WORKER)() as session:
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
+
+    await registry.dispose()
+    assert registry.pool_status() == {}
+
+
+def test_create_engine_uses_purpose_settings():
+    """Test queue pools are sized per purpose and replicas use the replica DSN."""
+    settings = _settings(
+        "postgresql+asyncpg://haven@primary/haven",
+        replica_dsn="postgresql+asyncpg://haven@replica/haven",
+        pool=DatabaseSettings.PoolSettings(size=7, max_overflow=3),
+        pools={WORKER: DatabaseSettings.PoolSettings(size=2, max_overflow=1, pre_ping=False)},
+    )
+
+    api = create_engine(API, settings)
+    worker = create_engine(WORKER, settings)
+    replica = create_engine(REPLICA, settings)
+
+    assert isinstance(api.pool, InstrumentedQueuePool)
+    assert (api.pool.size(), api.pool._max_overflow, api.pool._pre_ping) == (7, 3, True)
+    assert (worker.pool.size(), worker.pool._max_overflow, worker.pool._pre_ping) == (2, 1, False)
+    assert api.url.host == "primary" and replica.url.host == "replica"
+    with pytest.raises(ValueError):
+        create_engine("reporting", settings)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_and_pool_status(tmp_path: Path):
+    """Test warm-up fills the pool and the status reports occupancy and waits."""
+    settings = _settings(
+        _file_dsn(tmp_path), pool=DatabaseSettings.PoolSettings(size=3, max_overflow=1, warmup=2)
+    )
+    registry = EngineRegistry(lambda: settings)
+    engine = registry.engine(API)
+    # Queue pools are reserved for server databases; exercise one against SQLite
+    engine.sync_engine.pool = InstrumentedQueuePool(
+        engine.pool._creator, pool_size=3, max_overflow=1, dialect=engine.dialect
+    )
+
+    assert await registry.warm_up(API) == 2
+    async with engine.connect():
+        status = registry.pool_status()[API]
+
+    assert status["pool"] == "InstrumentedQueuePool"
+    assert (status["size"], status["checked_out"], status["checked_in"]) == (3, 1, 1)
+    assert status["overflow"] == 0
+    assert status["checkouts"] == 3
+    assert status["timeouts"] == 0
+    assert status["wait_seconds_max"] >= status["wait_seconds_avg"] >= 0
+    await registry.dispose()
+
+
+def test_registry_recreates_engines_for_new_event_loops(tmp_path: Path):
+    """Test engines opened under a finished event loop are not reused."""
+    registry = EngineRegistry(lambda: _settings(_file_dsn(tmp_path)))
+
+    async def query():
+        async with registry.session_factory()() as session:
+            await session.execute(text("SELECT 1"))
+        engine = registry.engine()
+        # Release the pooled connection with its loop; the engine stays registered
+        await engine.dispose()
+        return engine
+
+    first = asyncio.run(query())
+    second = asyncio.run(query())
+
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_read_only_sessions_need_a_replica(tmp_path: Path):
+    """Test read-only sessions are plain API sessions unless a replica is configured."""
+    primary = _file_dsn(tmp_path)
+    registry = EngineRegistry(lambda: _settings(primary))
+    assert registry.read_only_session_factory() is registry.session_factory(API)
+
+    routed = EngineRegistry(lambda: _settings(primary, replica_dsn=primary))
+    factory = routed.read_only_session_factory()
+
+    assert factory is routed.read_only_session_factory()
+    assert factory.kw["replica"] is routed.engine(REPLICA).sync_engine
+    assert factory.kw["primary"] is routed.engine(API).sync_engine
+    await registry.dispose()
+    await routed.dispose()
@@ -0,0 +1,147 @@
+"""Tests for the git client and its cat-file object pool."""
+
+import asyncio
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from haven.infrastructure.git.git_client import GitClient
+from haven.infrastructure.git.object_pool import BATCH, GitObjectPool
+
+
+def _git(repo: Path, *args: str) -> str:
+    """Run a git command in the test repository."""
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """Create a small git repository with nested files and two branches."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    (repo / "src" / "pkg").mkdir(parents=True)
+    (repo / "README.md").write_text("hello\n")
+    (repo / "src" / "app.py").write_text("print('hi')\n")
+    (repo / "src" / "pkg" / "mod.py").write_text("x = 1\n")
+    (repo / "src.txt").write_text("sorted before src/\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "Initial commit")
+    (repo / "README.md").write_text("hello again\n")
+    _git(repo, "commit", "-q", "-am", "Update readme")
+    _git(repo, "branch", "feature")
+    _git(repo, "remote", "add", "origin", "https://example.com/repo.git")
+    return repo
+
+
+@pytest.fixture
+async def git_client(tmp_path: Path):
+    """Create a git client with its own object pool."""
+    pool = GitObjectPool(max_processes_per_repo=2)
+    yield GitClient(repos_base_path=str(tmp_path / "repos"), object_pool=pool)
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_list_files_matches_ls_tree(git_client: GitClient, git_repo: Path):
+    """Test that the tree walk returns the same paths and order as ls-tree."""
+    expected = _git(git_repo, "ls-tree", "-r", "--name-only", "HEAD").splitlines()
+
+    files = await git_client.list_files(str(git_repo))
+
+    assert files == expected
+
+
+@pytest.mark.asyncio
+async def test_ref_metadata_without_subprocess(git_client: GitClient, git_repo: Path):
+    """Test branch, HEAD and remote lookups read from the git directory."""
+    assert await git_client.get_current_branch(str(git_repo)) == "main"
+    assert await git_client.get_branches(str(git_repo)) == ["feature", "main"]
+    assert await git_client.get_remote_url(str(git_repo)) == "https://example.com/repo.git"
+
+
+@pytest.mark.asyncio
+async def test_get_commit_count(git_client: GitClient, git_repo: Path):
+    """Test commit counting for existing and unknown refs."""
+    assert await git_client.get_commit_count(str(git_repo), "main") == 2
+    assert await git_client.get_commit_count(str(git_repo), "does-not-exist") == 0
+
+
+@pytest.mark.asyncio
+async def test_iter_commit_log_batches(git_client: GitClient, git_repo: Path):
+    """Test the streamed log yields the same commits as get_commit_log, in batches."""
+    (git_repo / "README.md").write_text("a | b\n")
+    _git(git_repo, "commit", "-q", "-am", "Pipe | in subject")
+
+    batches = [
+        batch async for batch in git_client.iter_commit_log_batches(str(git_repo), batch_size=2)
+    ]
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [c for batch in batches for c in batch] == await git_client.get_commit_log(str(git_repo))
+    assert batches[0][0]["message"] == "Pipe | in subject"
+    assert batches[0][0]["files_changed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_restarts_crashed_worker(git_client: GitClient, git_repo: Path):
+    """Test that a killed cat-file worker is replaced transparently."""
+    pool = git_client.object_pool
+    head = await pool.resolve_ref(str(git_repo), "HEAD")
+
+    for workers in pool._workers.values():
+        for worker in workers.idle:
+            assert worker._process is not None
+            worker._process.kill()
+            await worker._process.wait()
+
+    obj = await pool.read_object(str(git_repo), "HEAD")
+
+    assert obj is not None
+    assert obj.oid == head
+    assert obj.type == "commit"
+    assert await pool.read_object(str(git_repo), "missing-ref") is None
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_idle_workers(git_client: GitClient, git_repo: Path):
+    """Test idle eviction closes workers and forgets the repository."""
+    pool = git_client.object_pool
+    await pool.read_object(str(git_repo), "HEAD")
+    pool.idle_timeout = 0
+
+    evicted = await pool.evict_idle()
+
+    assert evicted == 1
+    assert pool._workers == {}
+
+
+@pytest.mark.asyncio
+async def test_pool_keeps_repositories_with_waiters(git_repo: Path):
+    """Test eviction never drops the semaphore a woken waiter is about to run under."""
+    pool = GitObjectPool(max_processes_per_repo=1, idle_timeout=0)
+    holder = pool._acquire(str(git_repo), BATCH)
+    await holder.__aenter__()
+    (workers,) = pool._workers.values()
+    waiter = asyncio.create_task(pool.read_object(str(git_repo), "HEAD"))
+    try:
+        await asyncio.sleep(0)
+        # Wakes the waiter, which has not run yet when eviction comes around
+        await holder.__aexit__(None, None, None)
+        await pool.evict_idle()
+        kept = dict(pool._workers)
+
+        assert (await waiter) is not None
+        assert kept == {(str(git_repo.resolve()), BATCH): workers}
+    finally:
+        await waiter
+        for worker in workers.idle:
+            await worker.close()
+        await pool.close()
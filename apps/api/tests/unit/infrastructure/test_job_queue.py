@@ -0,0 +1,147 @@
+"""Tests for the database-backed job queue and worker."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from haven.infrastructure.database.models import JobModel
+from haven.infrastructure.database.session import create_session_factory
+from haven.infrastructure.jobs import JobQueue, JobStatus, JobWorker
+
+
+@pytest.fixture
+def session_factory(test_engine: AsyncEngine):
+    """Create a session factory on the test database."""
+    return create_session_factory(test_engine)
+
+
+@pytest.fixture
+def queue(session_factory) -> JobQueue:
+    """Create a job queue on the test database."""
+    return JobQueue(session_factory)
+
+
+async def _expire_lease(queue: JobQueue, job_id: str) -> None:
+    """Simulate a worker that stopped heartbeating."""
+    async with queue.session_factory() as session, session.begin():
+        await session.execute(
+            update(JobModel)
+            .where(JobModel.id == job_id)
+            .values(lease_expires_at=datetime.now(UTC) - timedelta(seconds=1))
+        )
+
+
+@pytest.mark.asyncio
+async def test_claim_complete(queue: JobQueue):
+    """Test a job is claimed once, leased, and completed with its result."""
+    job = await queue.enqueue("load_commits", {"repository_id": 1})
+    assert job.status == JobStatus.QUEUED
+
+    claimed = await queue.claim("worker-1", lease_seconds=60)
+    assert (claimed.id, claimed.status, claimed.attempts) == (job.id, JobStatus.RUNNING, 1)
+    assert claimed.payload == {"repository_id": 1}
+    assert await queue.claim("worker-2", lease_seconds=60) is None
+
+    assert await queue.heartbeat(job.id, "worker-1", lease_seconds=60)
+    assert not await queue.heartbeat(job.id, "worker-2", lease_seconds=60)
+    assert await queue.complete(job.id, "worker-1", {"loaded": 3})
+
+    done = await queue.get(job.id)
+    assert (done.status, done.result, done.leased_by) == (JobStatus.SUCCEEDED, {"loaded": 3}, None)
+
+
+@pytest.mark.asyncio
+async def test_claim_filters_by_kind(queue: JobQueue):
+    """Test workers only claim kinds they have handlers for."""
+    await queue.enqueue("generate_branch_diffs", {})
+
+    assert await queue.claim("worker-1", lease_seconds=60, kinds=["load_commits"]) is None
+    assert await queue.claim("worker-1", lease_seconds=60, kinds=["generate_branch_diffs"])
+
+
+@pytest.mark.asyncio
+async def test_failed_attempts_retry_with_backoff(queue: JobQueue):
+    """Test failures requeue the job until it runs out of attempts."""
+    job = await queue.enqueue("load_commits", {}, max_attempts=2)
+
+    await queue.claim("worker-1", lease_seconds=60)
+    assert await queue.fail(job.id, "worker-1", "boom", retry_backoff=0)
+    retrying = await queue.get(job.id)
+    assert (retrying.status, retrying.error) == (JobStatus.QUEUED, "boom")
+
+    claimed = await queue.claim("worker-1", lease_seconds=60)
+    assert claimed.attempts == 2
+    await queue.fail(job.id, "worker-1", "boom again")
+    assert (await queue.get(job.id)).status == JobStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_reclaimed(queue: JobQueue):
+    """Test a job whose worker died is taken over by another worker."""
+    job = await queue.enqueue("load_commits", {}, max_attempts=2)
+    await queue.claim("worker-1", lease_seconds=60)
+    await _expire_lease(queue, job.id)
+
+    reclaimed = await queue.claim("worker-2", lease_seconds=60)
+    assert (reclaimed.id, reclaimed.attempts, reclaimed.leased_by) == (job.id, 2, "worker-2")
+    # The original worker can no longer record an outcome
+    assert not await queue.complete(job.id, "worker-1")
+
+    await _expire_lease(queue, job.id)
+    assert await queue.claim("worker-3", lease_seconds=60) is None
+    failed = await queue.get(job.id)
+    assert failed.status == JobStatus.FAILED
+    assert failed.error == "Lease expired after 2 attempts"
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_handlers_in_fresh_sessions(queue: JobQueue, session_factory):
+    """Test the worker records handler results and failures."""
+    sessions = []
+
+    async def succeed(session, job):
+        sessions.append(session)
+        return {"echo": job.payload["value"]}
+
+    async def crash(session, job):
+        raise RuntimeError("handler crashed")
+
+    worker = JobWorker(
+        queue, session_factory, {"succeed": succeed, "crash": crash}, retry_backoff=0
+    )
+    ok = await queue.enqueue("succeed", {"value": 42})
+    bad = await queue.enqueue("crash", {}, max_attempts=1)
+
+    assert await worker.run_once()
+    assert await worker.run_once()
+    assert not await worker.run_once()
+
+    assert (await queue.get(ok.id)).result == {"echo": 42}
+    failed = await queue.get(bad.id)
+    assert (failed.status, failed.error) == (JobStatus.FAILED, "handler crashed")
+    assert len(sessions) == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_abandons_job_when_lease_is_lost(queue: JobQueue, session_factory):
+    """Test a job is cancelled once another worker has taken over its lease."""
+    started = asyncio.Event()
+
+    async def slow(session, job):
+        started.set()
+        await asyncio.sleep(10)
+
+    worker = JobWorker(queue, session_factory, {"slow": slow}, heartbeat_interval=0.05)
+    job = await queue.enqueue("slow", {})
+    run = asyncio.create_task(worker.run_once())
+    await started.wait()
+
+    await _expire_lease(queue, job.id)
+    await queue.claim("other-worker", lease_seconds=60)
+
+    assert await asyncio.wait_for(run, timeout=2)
+    current = await queue.get(job.id)
+    assert (current.status, current.leased_by) == (JobStatus.RUNNING, "other-worker")
@@ -1,9 +1,11 @@
 """Unit tests for repository pattern implementation."""
 
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from haven.domain.entities import Record
 from haven.infrastructure.database.models import RecordModel
@@ -176,3 +178,24 @@ class TestSQLAlchemyRecordRepository:
 
         # Assert
         assert result == 42
+
+    @pytest.mark.asyncio
+    async def test_get_after_pages_by_keyset(self, test_session: AsyncSession) -> None:
+        """Test keyset pages return each record once, newest first."""
+        # Arrange
+        repository = SQLAlchemyRecordRepository(test_session)
+        created_at = datetime(2025, 1, 1, tzinfo=UTC)
+        records = [
+            Record(data={"n": i}, created_at=created_at + timedelta(hours=i // 2)) for i in range(5)
+        ]
+        for record in records:
+            await repository.save(record)
+
+        # Act
+        first = await repository.get_after(limit=3)
+        rest = await repository.get_after(limit=3, after=(first[-1].created_at, first[-1].id))
+
+        # Assert
+        assert len(first + rest) == 5
+        assert {r.id for r in first + rest} == {r.id for r in records}
+        assert [r.data["n"] // 2 for r in first + rest] == [2, 1, 1, 0, 0]
@@ -0,0 +1,137 @@
+"""Tests for set-based bulk review writes."""
+
+import re
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.domain.entities import review_comment
+from haven.domain.entities.commit import Commit, CommitReview, DiffStats, ReviewStatus
+from haven.domain.repositories.commit_repository import BulkReviewOutcome
+from haven.infrastructure.database.models import (
+    CommitModel,
+    CommitReviewModel,
+    CommitReviewSummaryModel,
+)
+from haven.infrastructure.database.repositories.commit_repository import (
+    SQLAlchemyCommitRepository,
+    SQLAlchemyCommitReviewRepository,
+)
+from haven.infrastructure.database.repositories.review_repository import (
+    SqlAlchemyCommitReviewRepository,
+)
+from haven.infrastructure.database.review_bulk import _matches_requested
+
+
+async def _create_commits(session: AsyncSession, count: int) -> list[int]:
+    """Create commits in repository 1 and return their IDs, oldest first."""
+    repository = SQLAlchemyCommitRepository(session)
+    await repository.bulk_insert(
+        Commit(
+            repository_id=1,
+            commit_hash=f"hash{i:04d}",
+            message="Add feature",
+            author_name="John Doe",
+            author_email="john@example.com",
+            committer_name="John Doe",
+            committer_email="john@example.com",
+            committed_at=datetime(2025, 1, 1 + i, tzinfo=UTC),
+            diff_stats=DiffStats(),
+        )
+        for i in range(count)
+    )
+    return [commit.id for commit in reversed(await repository.get_by_repository(1))]
+
+
+@pytest.mark.asyncio
+async def test_bulk_assign_and_approve(test_session: AsyncSession):
+    """Test assigning and approving many commits reports an outcome per commit."""
+    first, second, third = await _create_commits(test_session, 3)
+    repository = SQLAlchemyCommitReviewRepository(test_session)
+    await repository.create(CommitReview(commit_id=first, reviewer_id=1, status=ReviewStatus.DRAFT))
+
+    assigned = await repository.bulk_assign([first, second, 999, second], reviewer_id=1)
+
+    assert assigned == {
+        first: BulkReviewOutcome.ALREADY_ASSIGNED,
+        second: BulkReviewOutcome.ASSIGNED,
+        999: BulkReviewOutcome.COMMIT_NOT_FOUND,
+    }
+    assert [review.status for review in await repository.get_by_commit(second)] == [
+        ReviewStatus.PENDING_REVIEW
+    ]
+
+    approved = await repository.bulk_update_status(
+        [first, second, third], reviewer_id=1, status=ReviewStatus.APPROVED, notes="LGTM"
+    )
+
+    assert approved == {
+        first: BulkReviewOutcome.UPDATED,
+        second: BulkReviewOutcome.UPDATED,
+        third: BulkReviewOutcome.NO_REVIEW,
+    }
+    test_session.expire_all()
+    for commit_id in (first, second):
+        (review,) = await repository.get_by_commit(commit_id)
+        assert review.status == ReviewStatus.APPROVED
+        assert review.notes == "LGTM"
+        assert review.reviewed_at is not None
+        summary = await test_session.get(CommitReviewSummaryModel, commit_id)
+        assert (summary.latest_status, summary.is_pending) == ("approved", False)
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_only_touches_the_reviewer(test_session: AsyncSession):
+    """Test the workflow repository updates only the given reviewer's reviews."""
+    (commit_id,) = await _create_commits(test_session, 1)
+    repository = SqlAlchemyCommitReviewRepository(test_session)
+    Status = review_comment.CommitReview.ReviewStatus
+    for reviewer_id in (1, 2):
+        await repository.create(
+            review_comment.CommitReview(
+                commit_id=commit_id, reviewer_id=reviewer_id, status=Status.PENDING
+            )
+        )
+
+    outcomes = await repository.bulk_update_status([commit_id], 2, Status.NEEDS_REVISION)
+
+    assert outcomes == {commit_id: BulkReviewOutcome.UPDATED}
+    test_session.expire_all()
+    assert (await repository.get_by_commit_and_reviewer(commit_id, 1)).status == Status.PENDING
+    assert (
+        await repository.get_by_commit_and_reviewer(commit_id, 2)
+    ).status == Status.NEEDS_REVISION
+    rollup = await repository.get_reviewer_stats(from_rollup=True)
+    assert rollup[2]["status_counts"][Status.NEEDS_REVISION] == 1
+    assert await repository.bulk_update_status([], 2, Status.APPROVED) == {}
+
+
+def test_bulk_update_joins_unnest_on_postgresql():
+    """Test PostgreSQL bulk updates bind the commit IDs as one array."""
+    stmt = (
+        update(CommitReviewModel)
+        .where(_matches_requested("postgresql", CommitReviewModel.commit_id, [3, 1, 2]))
+        .values(status="approved")
+        .returning(CommitReviewModel.commit_id)
+    )
+    compiled = stmt.compile(dialect=postgresql.asyncpg.dialect())
+
+    # The unnest alias must name its column for the join condition to resolve
+    match = re.search(r"FROM unnest\(\S+\) AS (\w+)\(commit_id\)", str(compiled))
+    assert match is not None
+    assert f"commit_reviews.commit_id = {match.group(1)}.commit_id" in str(compiled)
+    assert "RETURNING commit_reviews.commit_id" in str(compiled)
+    assert [3, 1, 2] in compiled.params.values()
+
+
+def test_bulk_assign_selects_from_unnest_on_postgresql():
+    """Test PostgreSQL bulk assigns name the unnest column they filter on."""
+    stmt = select(CommitModel.id).where(_matches_requested("postgresql", CommitModel.id, [3, 1, 2]))
+    compiled = str(stmt.compile(dialect=postgresql.dialect()))
+
+    match = re.search(r"unnest\(\S+\) AS (\w+)\(commit_id\)", compiled)
+    assert match is not None
+    assert f"commits.id = {match.group(1)}.commit_id" in compiled
@@ -0,0 +1,150 @@
+"""Tests for single-pass review statistics and the reviewer rollup."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from haven.domain.entities import commit
+from haven.domain.entities.review_comment import CommitReview
+from haven.infrastructure.database.models import CommitReviewModel
+from haven.infrastructure.database.repositories.commit_repository import (
+    SQLAlchemyCommitReviewRepository,
+)
+from haven.infrastructure.database.repositories.review_repository import (
+    SqlAlchemyCommitReviewRepository,
+)
+from haven.infrastructure.database.review_stats import rebuild_reviewer_stats, stats_query
+
+Status = CommitReview.ReviewStatus
+
+
+def _review(reviewer_id: int, status: str, hours: float | None = None) -> CommitReviewModel:
+    created_at = datetime(2025, 1, 1, tzinfo=UTC)
+    return CommitReviewModel(
+        commit_id=1,
+        reviewer_id=reviewer_id,
+        status=status,
+        created_at=created_at,
+        reviewed_at=created_at + timedelta(hours=hours) if hours is not None else None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_review_stats_single_pass(test_session: AsyncSession):
+    """Test overall and per-reviewer statistics come from one aggregate query."""
+    test_session.add_all(
+        [
+            _review(1, Status.APPROVED, hours=2),
+            _review(1, Status.NEEDS_REVISION, hours=4),
+            _review(1, Status.PENDING),
+            _review(2, Status.APPROVED, hours=6),
+            _review(2, Status.DRAFT),
+        ]
+    )
+    await test_session.flush()
+    repository = SqlAlchemyCommitReviewRepository(test_session)
+
+    overall = await repository.get_review_stats()
+    reviewer = await repository.get_review_stats(reviewer_id=1)
+    by_reviewer = await repository.get_reviewer_stats()
+
+    assert overall["status_counts"] == {
+        Status.DRAFT: 1,
+        Status.PENDING: 1,
+        Status.APPROVED: 2,
+        Status.NEEDS_REVISION: 1,
+    }
+    assert overall["total_reviews"] == 5
+    assert overall["avg_review_time_hours"] == pytest.approx(4)
+    # Percentiles need PostgreSQL
+    assert overall["p50_review_time_seconds"] is None
+
+    assert reviewer["total_reviews"] == 3
+    assert reviewer["avg_review_time_hours"] == pytest.approx(3)
+    assert by_reviewer.keys() == {1, 2}
+    assert by_reviewer[1]["status_counts"] == reviewer["status_counts"]
+    assert by_reviewer[2]["avg_review_time_hours"] == pytest.approx(6)
+
+
+@pytest.mark.asyncio
+async def test_empty_review_stats(test_session: AsyncSession):
+    """Test statistics without reviews are zeroed."""
+    repository = SqlAlchemyCommitReviewRepository(test_session)
+
+    stats = await repository.get_review_stats()
+
+    assert stats["total_reviews"] == 0
+    assert stats["avg_review_time_seconds"] == 0
+    assert await repository.get_reviewer_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_review_writes_maintain_reviewer_rollup(test_session: AsyncSession):
+    """Test the rollup matches live statistics after creates, updates and deletes."""
+    repository = SqlAlchemyCommitReviewRepository(test_session)
+
+    first = await repository.create(CommitReview(commit_id=1, reviewer_id=1, status=Status.PENDING))
+    second = await repository.create(
+        CommitReview(commit_id=2, reviewer_id=1, status=Status.PENDING)
+    )
+    await repository.create(CommitReview(commit_id=1, reviewer_id=2, status=Status.DRAFT))
+    await repository.update(first.complete_review(Status.APPROVED))
+    await repository.delete(second.id)
+
+    rollup = await repository.get_reviewer_stats(from_rollup=True)
+    assert rollup == await repository.get_reviewer_stats()
+    assert rollup[1]["status_counts"][Status.APPROVED] == 1
+    assert rollup[1]["total_reviews"] == 1
+
+    await test_session.execute(CommitReviewModel.__table__.delete())
+    assert await rebuild_reviewer_stats(test_session) == 0
+    assert await repository.get_reviewer_stats(from_rollup=True) == {}
+
+
+@pytest.mark.asyncio
+async def test_review_writes_move_rollup_without_aggregating(
+    test_engine: AsyncEngine, test_session: AsyncSession
+):
+    """Test review writes move the rollup by the reviews they change instead of re-aggregating."""
+    statements: list[str] = []
+    event.listen(
+        test_engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    repository = SqlAlchemyCommitReviewRepository(test_session)
+    commit_reviews = SQLAlchemyCommitReviewRepository(test_session)
+
+    first = await repository.create(CommitReview(commit_id=1, reviewer_id=1, status=Status.PENDING))
+    second = await repository.create(
+        CommitReview(commit_id=2, reviewer_id=1, status=Status.PENDING)
+    )
+    await repository.update(first.complete_review(Status.APPROVED))
+    await repository.update(second.complete_review(Status.NEEDS_REVISION))
+    await repository.update(second.complete_review(Status.APPROVED))
+    # Statuses outside the statistics still give the reviewer a row
+    assigned = await commit_reviews.create(
+        commit.CommitReview(commit_id=1, reviewer_id=2, status=commit.ReviewStatus.PENDING_REVIEW)
+    )
+    await commit_reviews.update(assigned)
+
+    assert not any("GROUP BY commit_reviews.reviewer_id" in statement for statement in statements)
+    rollup = await repository.get_reviewer_stats(from_rollup=True)
+    assert rollup == await repository.get_reviewer_stats()
+    assert rollup[1]["status_counts"][Status.APPROVED] == 2
+    assert rollup[2]["total_reviews"] == 0
+
+    await commit_reviews.delete(assigned.id)
+    assert (await repository.get_reviewer_stats(from_rollup=True)).keys() == {1}
+
+
+def test_stats_query_uses_filtered_aggregates_on_postgresql():
+    """Test PostgreSQL statistics use FILTER clauses and percentiles in one SELECT."""
+    sql = str(stats_query("postgresql", by_reviewer=True).compile(dialect=postgresql.dialect()))
+
+    assert sql.count("count(*) FILTER (WHERE commit_reviews.status = ") == 4
+    assert "percentile_cont(" in sql and "WITHIN GROUP (ORDER BY EXTRACT(epoch FROM" in sql
+    assert "GROUP BY commit_reviews.reviewer_id" in sql
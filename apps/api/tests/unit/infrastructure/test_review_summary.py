@@ -0,0 +1,146 @@
+"""Tests for the commit review summary projection."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.domain.entities import review_comment
+from haven.domain.entities.commit import Commit, CommitReview, DiffStats, ReviewStatus
+from haven.infrastructure.database.models import CommitReviewModel, CommitReviewSummaryModel
+from haven.infrastructure.database.repositories.commit_repository import (
+    SQLAlchemyCommitRepository,
+    SQLAlchemyCommitReviewRepository,
+)
+from haven.infrastructure.database.repositories.review_repository import (
+    SqlAlchemyCommitReviewRepository,
+)
+from haven.infrastructure.database.review_summary import rebuild_review_summaries
+
+
+async def _create_commits(session: AsyncSession, count: int) -> list[Commit]:
+    """Create commits in repository 1, returned newest first."""
+    repository = SQLAlchemyCommitRepository(session)
+    await repository.bulk_insert(
+        Commit(
+            repository_id=1,
+            commit_hash=f"hash{i:04d}",
+            message="Add feature",
+            author_name="John Doe",
+            author_email="john@example.com",
+            committer_name="John Doe",
+            committer_email="john@example.com",
+            committed_at=datetime(2025, 1, 1 + i, tzinfo=UTC),
+            diff_stats=DiffStats(),
+        )
+        for i in range(count)
+    )
+    return await repository.get_by_repository(1)
+
+
+async def _summaries(session: AsyncSession) -> dict[int, tuple[str, int, bool]]:
+    result = await session.execute(select(CommitReviewSummaryModel))
+    return {
+        row.commit_id: (row.latest_status, row.review_count, row.is_pending)
+        for row in result.scalars().all()
+    }
+
+
+@pytest.mark.asyncio
+async def test_review_writes_maintain_summary(test_session: AsyncSession):
+    """Test creating, updating and deleting reviews keeps the summary current."""
+    commit, _ = await _create_commits(test_session, 2)
+    repository = SQLAlchemyCommitReviewRepository(test_session)
+
+    first = await repository.create(
+        CommitReview(commit_id=commit.id, reviewer_id=1, status=ReviewStatus.PENDING_REVIEW)
+    )
+    assert await _summaries(test_session) == {commit.id: ("pending_review", 1, True)}
+
+    second = await repository.create(
+        CommitReview(commit_id=commit.id, reviewer_id=2, status=ReviewStatus.PENDING_REVIEW)
+    )
+    second.status = ReviewStatus.APPROVED
+    second.reviewed_at = datetime.now(UTC)
+    await repository.update(second)
+    assert await _summaries(test_session) == {commit.id: ("approved", 2, False)}
+
+    await repository.delete(second.id)
+    assert await _summaries(test_session) == {commit.id: ("pending_review", 1, True)}
+
+    await repository.delete(first.id)
+    assert await _summaries(test_session) == {}
+
+
+@pytest.mark.asyncio
+async def test_workflow_review_writes_maintain_summary(test_session: AsyncSession):
+    """Test the review workflow repository also maintains the summary."""
+    newest, oldest = await _create_commits(test_session, 2)
+    repository = SqlAlchemyCommitReviewRepository(test_session)
+
+    assert await repository.get_commits_needing_review(repository_id=1) == [
+        newest.id,
+        oldest.id,
+    ]
+
+    review = await repository.create(
+        review_comment.CommitReview(
+            commit_id=oldest.id,
+            reviewer_id=1,
+            status=review_comment.CommitReview.ReviewStatus.PENDING,
+        )
+    )
+    assert await _summaries(test_session) == {oldest.id: ("pending", 1, True)}
+    assert await repository.get_commits_needing_review(repository_id=1) == [newest.id]
+
+    assert await repository.delete(review.id) is True
+    assert await _summaries(test_session) == {}
+    assert await repository.delete(review.id) is False
+
+
+@pytest.mark.asyncio
+async def test_rebuild_review_summaries(test_session: AsyncSession):
+    """Test rebuilding recomputes the summary from reviews written directly."""
+    newest, middle, oldest = await _create_commits(test_session, 3)
+    reviewed_at = datetime(2025, 2, 1, tzinfo=UTC)
+    test_session.add_all(
+        [
+            CommitReviewModel(
+                commit_id=newest.id,
+                reviewer_id=1,
+                status="approved",
+                reviewed_at=reviewed_at,
+                created_at=reviewed_at,
+            ),
+            CommitReviewModel(
+                commit_id=newest.id,
+                reviewer_id=2,
+                status="needs_revision",
+                created_at=reviewed_at.replace(day=2),
+            ),
+            CommitReviewModel(
+                commit_id=oldest.id,
+                reviewer_id=1,
+                status="pending_review",
+                created_at=reviewed_at,
+            ),
+        ]
+    )
+    await test_session.flush()
+
+    assert await rebuild_review_summaries(test_session) == 2
+    assert await _summaries(test_session) == {
+        newest.id: ("needs_revision", 2, False),
+        oldest.id: ("pending_review", 1, True),
+    }
+    summary = await test_session.get(CommitReviewSummaryModel, newest.id)
+    assert summary.last_reviewed_at.replace(tzinfo=UTC) == reviewed_at
+    assert summary.committed_at == newest.committed_at
+
+    # Repairs drift, limited to one repository
+    await test_session.delete(summary)
+    await test_session.flush()
+    assert await rebuild_review_summaries(test_session, repository_id=2) == 0
+    assert await rebuild_review_summaries(test_session, repository_id=1) == 2
+    assert middle.id not in await _summaries(test_session)
@@ -0,0 +1,73 @@
+"""Tests for read-replica routing sessions."""
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from haven.infrastructure.database.models import Base, RecordModel
+from haven.infrastructure.database.routing import create_routing_session_factory, request_routing
+
+
+async def _database(path: Path, record_id: str) -> AsyncEngine:
+    """Create a database holding one record identifying it."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(RecordModel.__table__.insert().values(id=record_id, data={}))
+    return engine
+
+
+@pytest_asyncio.fixture
+async def routed(tmp_path: Path) -> AsyncGenerator[async_sessionmaker, None]:
+    """Routing session factory over a primary and a replica database."""
+    primary = await _database(tmp_path / "primary.db", "primary")
+    replica = await _database(tmp_path / "replica.db", "replica")
+    yield create_routing_session_factory(primary, replica)
+    await primary.dispose()
+    await replica.dispose()
+
+
+async def _record_ids(session) -> list[str]:
+    return list((await session.execute(select(RecordModel.id))).scalars())
+
+
+@pytest.mark.asyncio
+async def test_reads_use_replica_until_session_writes(routed: async_sessionmaker):
+    """Test reads go to the replica, writes to the primary, then reads stick to it."""
+    async with routed() as session:
+        assert await _record_ids(session) == ["replica"]
+        locked = await session.execute(select(RecordModel.id).with_for_update())
+        assert list(locked.scalars()) == ["primary"]
+        assert await _record_ids(session) == ["primary"]
+        await session.rollback()
+
+    async with routed() as session:
+        session.add(RecordModel(id="written", data={}))
+        await session.commit()
+        assert sorted(await _record_ids(session)) == ["primary", "written"]
+
+    async with routed() as session:
+        assert await _record_ids(session) == ["replica"]
+
+
+@pytest.mark.asyncio
+async def test_request_write_pins_later_sessions_to_primary(routed: async_sessionmaker):
+    """Test a write in a request sends that request's later reads to the primary."""
+    with request_routing() as state:
+        async with routed() as session:
+            assert await _record_ids(session) == ["replica"]
+            session.add(RecordModel(id="written", data={}))
+            await session.commit()
+
+        assert state.wrote
+        async with routed() as session:
+            assert sorted(await _record_ids(session)) == ["primary", "written"]
+
+    with request_routing():
+        async with routed() as session:
+            assert await _record_ids(session) == ["replica"]
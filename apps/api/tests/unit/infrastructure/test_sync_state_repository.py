@@ -0,0 +1,24 @@
+"""Tests for SQLAlchemy sync state repository implementation."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.infrastructure.database.repositories.sync_state_repository import (
+    SyncStateRepositoryImpl,
+)
+
+
+@pytest.mark.asyncio
+async def test_branch_tips_are_upserted(test_session: AsyncSession):
+    """Test setting a branch tip creates and then updates its sync state."""
+    repo = SyncStateRepositoryImpl(test_session)
+
+    assert await repo.get_branch_tip(1, "main") is None
+
+    await repo.set_branch_tip(1, "main", "a" * 40)
+    await repo.set_branch_tip(1, "develop", "b" * 40)
+    await repo.set_branch_tip(1, "main", "c" * 40)
+    await repo.set_branch_tip(2, "main", "d" * 40)
+
+    assert await repo.get_branch_tip(1, "main") == "c" * 40
+    assert await repo.get_branch_tips(1) == {"main": "c" * 40, "develop": "b" * 40}
@@ -0,0 +1,62 @@
+"""Tests for the SQLAlchemy Task repository implementation."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.domain.entities.task import Task
+from haven.infrastructure.database.models import TaskModel
+from haven.infrastructure.database.repositories.task_repository import TaskRepositoryImpl
+
+
+@pytest.fixture
+def task_repository(test_session: AsyncSession) -> TaskRepositoryImpl:
+    """Create task repository for testing."""
+    return TaskRepositoryImpl(test_session)
+
+
+@pytest.mark.asyncio
+async def test_get_after_pages_by_keyset(
+    test_session: AsyncSession, task_repository: TaskRepositoryImpl
+):
+    """Test keyset pages cover every matching task exactly once, including ties."""
+    created_at = datetime(2025, 1, 1, tzinfo=UTC)
+    test_session.add_all(
+        TaskModel(
+            title=f"Task {i}",
+            status="open" if i % 2 else "in_progress",
+            # Tasks share timestamps in pairs, so paging relies on the id tiebreak
+            created_at=created_at + timedelta(hours=i // 2),
+            updated_at=created_at,
+        )
+        for i in range(7)
+    )
+    await test_session.flush()
+
+    seen = []
+    after = None
+    while page := await task_repository.get_after(limit=2, after=after):
+        seen.extend(task.title for task in page)
+        after = (page[-1].created_at, page[-1].id)
+
+    assert seen == [f"Task {i}" for i in reversed(range(7))]
+    open_tasks = await task_repository.get_after(limit=10, status="open")
+    assert [t.title for t in open_tasks] == ["Task 5", "Task 3", "Task 1"]
+    assert [t.title for t in await task_repository.get_after(query="task 6")] == ["Task 6"]
+
+
+@pytest.mark.asyncio
+async def test_get_overdue_after_orders_by_due_date(task_repository: TaskRepositoryImpl):
+    """Test the overdue queue pages oldest due date first."""
+    now = datetime.now(UTC)
+    for i, days in enumerate([3, 1, 5, 1]):
+        await task_repository.create(Task(title=f"Task {i}", due_date=now - timedelta(days=days)))
+    await task_repository.create(Task(title="Future", due_date=now + timedelta(days=1)))
+
+    first = await task_repository.get_overdue_after(limit=2)
+    rest = await task_repository.get_overdue_after(
+        limit=10, after=(first[-1].due_date, first[-1].id)
+    )
+
+    assert [t.title for t in first + rest] == ["Task 2", "Task 0", "Task 1", "Task 3"]
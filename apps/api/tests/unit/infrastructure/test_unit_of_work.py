@@ -69,3 +69,7 @@ class TestSQLAlchemyUnitOfWork:
             assert hasattr(uow.records, "get")
             assert hasattr(uow.records, "save")
             assert hasattr(uow.records, "delete")
+
+    def test_session_access(self, uow: SQLAlchemyUnitOfWork, mock_session: AsyncMock) -> None:
+        """Test repositories outside the unit of work can share its session."""
+        assert uow.session is mock_session
@@ -0,0 +1,64 @@
+"""Tests for serving stored artifacts over HTTP."""
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from haven.infrastructure.storage.compression import GZIP
+from haven.interface.api.artifact_responses import accepts_encoding, artifact_response
+
+PAYLOAD = {"commit": {"hash": "abc"}, "files": [{"newName": "a.py"}] * 50}
+ETAG = 'W/"abc-123"'
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> TestClient:
+    """Serve a gzip-compressed artifact from a minimal app."""
+    path = tmp_path / "artifact.json.gz"
+    path.write_bytes(GZIP.compress(json.dumps(PAYLOAD).encode()))
+
+    app = FastAPI()
+
+    @app.get("/artifact")
+    async def get_artifact(request: Request):
+        return artifact_response(request, path, ETAG)
+
+    return TestClient(app)
+
+
+def test_compressed_artifact_served_as_is(client: TestClient):
+    """Test clients accepting gzip receive the stored bytes with Content-Encoding."""
+    response = client.get("/artifact", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == ETAG
+    assert response.json() == PAYLOAD
+
+
+def test_artifact_decompressed_for_other_clients(client: TestClient):
+    """Test clients without gzip support get a decompressed stream."""
+    response = client.get("/artifact", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.json() == PAYLOAD
+
+
+def test_if_none_match_returns_not_modified(client: TestClient):
+    """Test revalidation with a matching ETag returns 304 without a body."""
+    response = client.get("/artifact", headers={"If-None-Match": '"abc-123"'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_accepts_encoding_quality_values():
+    """Test q=0 and wildcard handling in Accept-Encoding."""
+    assert accepts_encoding("gzip, br", "gzip")
+    assert not accepts_encoding("gzip;q=0, *", "gzip")
+    assert accepts_encoding("br, *;q=0.5", "zstd")
+    assert not accepts_encoding("", "gzip")
@@ -0,0 +1,41 @@
+"""Tests for opaque pagination cursors."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from haven.domain.repositories.commit_repository import CommitKey
+from haven.interface.cursors import (
+    InvalidCursorError,
+    decode_commit_cursor,
+    decode_cursor,
+    encode_commit_cursor,
+    encode_cursor,
+)
+
+
+def test_commit_cursor_round_trip():
+    """Test a commit key survives encoding as an opaque cursor."""
+    key = CommitKey(committed_at=datetime(2025, 7, 16, 19, 3, tzinfo=UTC), id=42)
+
+    cursor = encode_commit_cursor(key)
+
+    assert "=" not in cursor
+    assert decode_commit_cursor(cursor) == key
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not a cursor", encode_cursor(1, 2, 3), encode_cursor("yesterday", 1), encode_cursor("x")],
+)
+def test_invalid_commit_cursor(cursor):
+    """Test malformed cursors are rejected."""
+    with pytest.raises(InvalidCursorError):
+        decode_commit_cursor(cursor)
+
+
+def test_decode_cursor_checks_size():
+    """Test generic cursors must carry the expected number of values."""
+    assert decode_cursor(encode_cursor("a", 1), 2) == ["a", 1]
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor("a"), 2)
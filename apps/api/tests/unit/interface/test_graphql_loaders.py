@@ -0,0 +1,94 @@
+"""Tests for the batch functions behind the GraphQL DataLoaders."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from haven.domain.entities.commit import Commit, CommitReview, DiffStats, ReviewStatus
+from haven.infrastructure.database.models import RepositoryModel, TaskModel, UserModel
+from haven.infrastructure.database.repositories.commit_repository import (
+    SQLAlchemyCommitRepository,
+    SQLAlchemyCommitReviewRepository,
+)
+from haven.interface.graphql import loaders
+
+
+def _count_queries(engine: AsyncEngine) -> list[str]:
+    """Record the statements executed on ``engine``."""
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_task_relations_load_in_one_query_each(
+    test_engine: AsyncEngine, test_session: AsyncSession
+):
+    """Test tasks, users and repositories load in key order with one IN query per batch."""
+    test_session.add_all(
+        [
+            UserModel(id=1, username="ada", email="ada@example.com", display_name="Ada"),
+            UserModel(id=2, username="bob", email="bob@example.com", display_name="Bob"),
+            RepositoryModel(id=1, name="haven", full_name="jazzydog/haven", url="/tmp/haven"),
+            TaskModel(id=1, title="First", assignee_id=2, repository_id=1),
+            TaskModel(id=2, title="Second", assignee_id=1),
+        ]
+    )
+    await test_session.flush()
+    statements = _count_queries(test_engine)
+
+    tasks = await loaders.load_tasks(test_session, [2, 99, 1])
+    users = await loaders.load_users(test_session, [task.assignee_id for task in tasks if task])
+    repositories = await loaders.load_repositories(test_session, [1, 5])
+
+    assert [task.title if task else None for task in tasks] == ["Second", None, "First"]
+    assert [user.username for user in users] == ["ada", "bob"]
+    assert [repository.name if repository else None for repository in repositories] == [
+        "haven",
+        None,
+    ]
+    assert len(statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_commit_reviews_load_in_one_query(
+    test_engine: AsyncEngine, test_session: AsyncSession
+):
+    """Test reviews of many commits come from one query, grouped per commit."""
+    await SQLAlchemyCommitRepository(test_session).bulk_insert(
+        Commit(
+            repository_id=1,
+            commit_hash=f"hash{i:04d}",
+            message="Add feature",
+            author_name="John Doe",
+            author_email="john@example.com",
+            committer_name="John Doe",
+            committer_email="john@example.com",
+            committed_at=datetime(2025, 1, 1 + i, tzinfo=UTC),
+            diff_stats=DiffStats(),
+        )
+        for i in range(2)
+    )
+    first, second = sorted(
+        commit.id for commit in await SQLAlchemyCommitRepository(test_session).get_by_repository(1)
+    )
+    review_repo = SQLAlchemyCommitReviewRepository(test_session)
+    for reviewer_id in (1, 2):
+        await review_repo.create(
+            CommitReview(commit_id=first, reviewer_id=reviewer_id, status=ReviewStatus.DRAFT)
+        )
+    statements = _count_queries(test_engine)
+
+    commits = await loaders.load_commits(test_session, [second, first])
+    reviews = await loaders.load_commit_reviews(test_session, [second, first, 404])
+
+    assert [commit.id for commit in commits] == [second, first]
+    assert reviews[0] == [] and reviews[2] == []
+    assert sorted(review.reviewer_id for review in reviews[1]) == [1, 2]
+    assert len(statements) == 2
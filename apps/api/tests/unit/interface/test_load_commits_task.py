@@ -0,0 +1,91 @@
+"""Tests for incremental commit loading from git."""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from haven.domain.entities.repository import Repository
+from haven.infrastructure.database.repositories.commit_repository import (
+    SQLAlchemyCommitRepository,
+)
+from haven.infrastructure.database.repositories.repository_repository import (
+    RepositoryRepositoryImpl,
+)
+from haven.infrastructure.database.repositories.sync_state_repository import (
+    SyncStateRepositoryImpl,
+)
+from haven.interface.api.repository_management_routes import _load_commits_task
+
+
+def _git(repo: Path, *args: str, env: dict[str, str] | None = None) -> str:
+    """Run a git command in the test repository."""
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+    ).stdout.strip()
+
+
+def _commit(repo: Path, message: str, date: str = "2025-01-01T12:00:00+00:00") -> str:
+    """Create a commit with a fixed date and return its hash."""
+    (repo / "file.txt").write_text(message)
+    _git(repo, "add", ".")
+    _git(
+        repo,
+        "commit",
+        "-q",
+        "-m",
+        message,
+        env={"GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date},
+    )
+    return _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """Create a git repository with two commits on main."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    _commit(repo, "first")
+    _commit(repo, "second")
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_sync_only_walks_new_commits(test_session: AsyncSession, git_repo: Path, capsys):
+    """Test syncs advance the branch watermark and survive force pushes."""
+    repository = await RepositoryRepositoryImpl(test_session).create(
+        Repository(name="repo", full_name="repo", url=str(git_repo), branch="main")
+    )
+    await test_session.commit()
+    commit_repo = SQLAlchemyCommitRepository(test_session)
+    sync_repo = SyncStateRepositoryImpl(test_session)
+
+    async def sync() -> str:
+        await _load_commits_task(repository.id, "main", None, None, test_session)
+        return capsys.readouterr().out
+
+    assert "Loaded 2 new commits, skipped 0" in await sync()
+    head = _git(git_repo, "rev-parse", "HEAD")
+    assert await sync_repo.get_branch_tip(repository.id, "main") == head
+    assert "is up to date" in await sync()
+
+    # A backdated commit is still picked up because the walk follows the graph
+    _commit(git_repo, "backdated", date="2000-01-01T00:00:00+00:00")
+    assert "Loaded 1 new commits, skipped 0" in await sync()
+
+    # Force push: drop the backdated commit and add another on top of "second"
+    _git(git_repo, "reset", "-q", "--hard", "HEAD~1")
+    rewritten = _commit(git_repo, "rewritten")
+    output = await sync()
+    assert "resyncing from merge base" in output
+    assert "Loaded 1 new commits, skipped 0" in output
+    assert await sync_repo.get_branch_tip(repository.id, "main") == rewritten
+    assert await commit_repo.count_by_repository(repository.id) == 4
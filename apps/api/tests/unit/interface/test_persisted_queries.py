@@ -0,0 +1,104 @@
+"""Tests for persisted GraphQL queries."""
+
+import json
+from pathlib import Path
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from haven.config.settings import GraphQLSettings
+from haven.interface.graphql.persisted_queries import (
+    PERSISTED_QUERY_NOT_ALLOWED,
+    PERSISTED_QUERY_NOT_FOUND,
+    PersistedQueryError,
+    PersistedQueryMiddleware,
+    PersistedQueryStore,
+    document_hash,
+)
+
+QUERY = "{ tasks { edges { node { id } } } }"
+HASH = document_hash(QUERY)
+
+
+def _persisted(sha256_hash: str = HASH) -> dict:
+    return {"persistedQuery": {"version": 1, "sha256Hash": sha256_hash}}
+
+
+def _client(store: PersistedQueryStore) -> TestClient:
+    """Client for an app echoing the document the GraphQL route receives."""
+
+    async def graphql(request: Request) -> JSONResponse:
+        if request.method == "GET":
+            return JSONResponse({"query": request.query_params.get("query")})
+        return JSONResponse({"query": (await request.json()).get("query")})
+
+    app = Starlette(routes=[Route("/graphql", graphql, methods=["GET", "POST"])])
+    return TestClient(PersistedQueryMiddleware(app, store))
+
+
+def test_automatic_persisted_queries_over_post_and_get():
+    """Test a hash is unknown until sent with its document, then resolves alone."""
+    client = _client(PersistedQueryStore())
+
+    missing = client.post("/graphql", json={"extensions": _persisted()})
+    assert missing.status_code == 200
+    assert missing.json()["errors"][0]["extensions"]["code"] == PERSISTED_QUERY_NOT_FOUND
+
+    registered = client.post("/graphql", json={"query": QUERY, "extensions": _persisted()})
+    assert registered.json() == {"query": QUERY}
+
+    assert client.post("/graphql", json={"extensions": _persisted()}).json() == {"query": QUERY}
+    params = {"extensions": json.dumps(_persisted())}
+    assert client.get("/graphql", params=params).json() == {"query": QUERY}
+
+    mismatch = client.post("/graphql", json={"query": "{ records }", "extensions": _persisted()})
+    assert mismatch.status_code == 400
+
+
+def test_store_evicts_least_recently_used_documents():
+    """Test the automatic store keeps only the most recently used documents."""
+    store = PersistedQueryStore(size=2)
+    documents = ["{ a }", "{ b }", "{ c }"]
+    for document in documents[:2]:
+        store.resolve(document, _persisted(document_hash(document)))
+    store.resolve(None, _persisted(document_hash("{ a }")))
+    store.resolve("{ c }", _persisted(document_hash("{ c }")))
+
+    assert store.resolve(None, _persisted(document_hash("{ a }"))) == "{ a }"
+    with pytest.raises(PersistedQueryError):
+        store.resolve(None, _persisted(document_hash("{ b }")))
+
+
+def test_allow_list_runs_only_listed_documents(tmp_path: Path):
+    """Test allow-list mode rejects unlisted documents and never registers new ones."""
+    allow_list = tmp_path / "allow-list.json"
+    allow_list.write_text(json.dumps({HASH: QUERY}))
+    store = PersistedQueryStore.from_settings(
+        GraphQLSettings(persisted_queries="allow_list", allow_list_path=str(allow_list))
+    )
+    client = _client(store)
+
+    assert client.post("/graphql", json={"extensions": _persisted()}).json() == {"query": QUERY}
+    assert client.post("/graphql", json={"query": QUERY}).json() == {"query": QUERY}
+
+    other = "{ records { edges { cursor } } }"
+    other_persisted = _persisted(document_hash(other))
+    for body in ({"query": other}, {"query": other, "extensions": other_persisted}):
+        rejected = client.post("/graphql", json=body)
+        assert rejected.status_code == 400
+        assert rejected.json()["errors"][0]["extensions"]["code"] == PERSISTED_QUERY_NOT_ALLOWED
+
+    for content_type in ("application/jsonx", "text/plain"):
+        rejected = client.post(
+            "/graphql", content=json.dumps({"query": other}), headers={"content-type": content_type}
+        )
+        assert rejected.status_code == 400
+    assert client.post("/graphql", json=[{"query": other}]).status_code == 400
+
+    allow_list.write_text(json.dumps({HASH: other}))
+    with pytest.raises(ValueError):
+        PersistedQueryStore.load_allow_list(allow_list)
@@ -0,0 +1,62 @@
+"""Tests for GraphQL query cost analysis."""
+
+import pytest
+
+pytest.importorskip("strawberry")
+
+from graphql import parse
+
+from haven.interface.graphql.cost import CostBudget, QueryCost
+from haven.interface.graphql.schema import schema
+
+TASKS_QUERY = """
+query Tasks($first: Int!) {
+  tasks(first: $first) {
+    edges { node { id title ...People } }
+  }
+}
+
+fragment People on TaskType {
+  assignee { id username }
+}
+"""
+
+
+def test_requested_cost_multiplies_pages():
+    """Selections under a paginated field are charged ``first`` times."""
+    cost = QueryCost(schema._schema, parse(TASKS_QUERY), {"first": 100})
+
+    # tasks + 100 * (edges + node + assignee)
+    assert cost.requested() == 1 + 100 * 3
+
+    metrics = QueryCost(schema._schema, parse("{ taskMetrics { statusDistribution } }"))
+    assert metrics.requested() == 20
+
+
+def test_actual_cost_counts_returned_rows():
+    """The actual cost follows the rows returned, not the page size asked for."""
+    cost = QueryCost(schema._schema, parse(TASKS_QUERY), {"first": 100})
+    data = {
+        "tasks": {
+            "edges": [
+                {"node": {"id": 1, "title": "a", "assignee": {"id": 7, "username": "x"}}},
+                {"node": {"id": 2, "title": "b", "assignee": None}},
+            ]
+        }
+    }
+
+    # tasks + edges + 2 nodes + 1 assignee
+    assert cost.actual(data) == 5
+
+
+def test_cost_budget_throttles_and_refunds():
+    """Clients spending more than their budget wait for it to refill."""
+    budget = CostBudget()
+
+    assert budget.spend("10.0.0.1", 50, per_minute=60) == 0
+    wait = budget.spend("10.0.0.1", 50, per_minute=60)
+    assert wait == pytest.approx(40, abs=1)
+    assert budget.spend("10.0.0.2", 50, per_minute=60) == 0
+
+    budget.refund("10.0.0.1", 40, per_minute=60)
+    assert budget.spend("10.0.0.1", 50, per_minute=60) == 0
@@ -29,6 +29,7 @@ interface CommitInfo {
 interface PaginatedResponse {
   items: CommitInfo[];
   total: number;
+  total_is_estimate?: boolean;
   page: number;
   page_size: number;
   total_pages: number;
@@ -57,6 +58,7 @@ export const CommitList: React.FC<CommitListProps> = ({
   const [pageSize] = useState(500);
   const [totalPages, setTotalPages] = useState(0);
   const [total, setTotal] = useState(0);
+  const [totalIsEstimate, setTotalIsEstimate] = useState(false);
   const [searchMatches, setSearchMatches] = useState<Map<number, any>>(new Map()); // Store search match details
   const [isSearching, setIsSearching] = useState(false);
 
@@ -120,6 +122,7 @@ export const CommitList: React.FC<CommitListProps> = ({
       setAllCommits(data.items);
       setCommits(data.items);
       setTotal(data.total);
+      setTotalIsEstimate(data.total_is_estimate ?? false);
       setTotalPages(data.total_pages);
     } catch (err) {
       setError(err instanceof Error ? err.message : "Failed to load commits");
@@ -290,7 +293,7 @@ export const CommitList: React.FC<CommitListProps> = ({
           ) : searchQuery ? (
             <span>{commits.length} results found</span>
           ) : (
-            <span>{total} total commits{hasActiveFilters && " (filtered)"}</span>
+            <span>{totalIsEstimate && "~"}{total} total commits{hasActiveFilters && " (filtered)"}</span>
           )}
         </div>
       </div>